@@ -0,0 +1 @@
+"""Benchmarks for pyVIN hot paths. Run a module with python -m benchmarks.<name>."""
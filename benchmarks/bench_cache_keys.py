@@ -0,0 +1,79 @@
+"""
+Cache hit rate with raw-input keys versus normalized-VIN keys.
+
+Simulates a dealer feed where popular VINs arrive repeatedly with mixed
+case and stray whitespace, then counts upstream calls for:
+
+- raw: functools.lru_cache around decode (the previous behaviour)
+- normalized: the client cache, looked up after validate_and_normalize_vin
+
+No network is used; upstream calls are answered in-process.
+
+Run: python -m benchmarks.bench_cache_keys
+"""
+
+import random
+import string
+import time
+from functools import lru_cache
+from typing import Dict, List
+
+from benchmarks.harness import CountingClient
+from src.cache.memory import MemoryCache
+from src.config import CACHE_SIZE
+
+VIN_CHARS = "".join(c for c in string.ascii_uppercase + string.digits if c not in "IOQ")
+
+
+def _variant(vin: str, rng: random.Random) -> str:
+    """Format a VIN the way dealer feeds do: odd case and stray whitespace"""
+    roll = rng.random()
+    if roll < 0.3:
+        vin = vin.lower()
+    elif roll < 0.5:
+        vin = "".join(c.lower() if rng.random() < 0.5 else c for c in vin)
+    if rng.random() < 0.25:
+        vin = rng.choice([" ", "\t", "  "]) + vin + rng.choice(["", " ", "\n"])
+    return vin
+
+
+def dealer_feed(distinct: int = 200, rows: int = 20_000, seed: int = 7) -> List[str]:
+    """Rows drawn from a skewed popularity distribution over distinct VINs"""
+    rng = random.Random(seed)
+    vins = ["".join(rng.choices(VIN_CHARS, k=17)) for _ in range(distinct)]
+    weights = [1 / (rank + 1) for rank in range(distinct)]
+    return [_variant(vin, rng) for vin in rng.choices(vins, weights, k=rows)]
+
+
+def run(distinct: int = 200, rows: int = 20_000) -> Dict[str, float]:
+    """Decode the same feed with both strategies and report hit rates"""
+    feed = dealer_feed(distinct, rows)
+
+    raw_client = CountingClient()
+    raw_decode = lru_cache(maxsize=CACHE_SIZE)(raw_client.decode)
+    start = time.perf_counter()
+    for vin in feed:
+        raw_decode(vin)
+    raw_seconds = time.perf_counter() - start
+
+    normalized_client = CountingClient(cache=MemoryCache(CACHE_SIZE))
+    start = time.perf_counter()
+    for vin in feed:
+        normalized_client.decode(vin)
+    normalized_seconds = time.perf_counter() - start
+
+    return {
+        "rows": float(rows),
+        "distinct_vins": float(distinct),
+        "raw_upstream_calls": float(raw_client.upstream_calls),
+        "raw_hit_rate": 1 - raw_client.upstream_calls / rows,
+        "raw_us_per_row": raw_seconds / rows * 1e6,
+        "normalized_upstream_calls": float(normalized_client.upstream_calls),
+        "normalized_hit_rate": normalized_client.cache.stats().hit_rate,
+        "normalized_us_per_row": normalized_seconds / rows * 1e6,
+    }
+
+
+if __name__ == "__main__":
+    for name, value in run().items():
+        print(f"{name:>28}: {value:,.3f}")
@@ -0,0 +1,122 @@
+"""
+Holding many decode results: memory of a list of results vs DecodedFleet.
+
+Generates count vPIC results for a fleet with realistic repetition (a
+handful of makes, models, years, plants and body classes, unique VINs)
+and parses them from one JSON document, so every string is its own
+object as it is after a real batch decode. Then it reports the bytes
+still allocated per result once the parsed dicts are dropped, when the
+results are held as:
+
+- model: a list of VINDecodeResult
+- lean: a list of LeanResult (which keep their raw dict alive)
+- fleet: a DecodedFleet, one dictionary-encoded column per field
+
+and the time to build each, in microseconds per result.
+
+Run: python -m benchmarks.bench_fleet [count]
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from benchmarks.bench_hot_paths import RAW_RESULT
+from benchmarks.harness import positive_int
+from src.api.fleet import DecodedFleet
+from src.api.results import build_lean, build_result
+
+# (Make, Model, Manufacturer, BodyClass, PlantCountry) combinations
+VEHICLES = [
+    ("BMW", "X3", "BMW MANUFACTURER CORPORATION",
+     "Sport Utility Vehicle (SUV)/Multi-Purpose Vehicle (MPV)", "UNITED STATES (USA)"),
+    ("BMW", "328i", "BMW AG", "Sedan/Saloon", "GERMANY"),
+    ("TOYOTA", "Camry", "TOYOTA MOTOR MANUFACTURING, KENTUCKY, INC.",
+     "Sedan/Saloon", "UNITED STATES (USA)"),
+    ("HONDA", "CR-V", "HONDA OF AMERICA MFG., INC.",
+     "Sport Utility Vehicle (SUV)/Multi-Purpose Vehicle (MPV)", "UNITED STATES (USA)"),
+    ("FORD", "F-150", "FORD MOTOR COMPANY, USA", "Pickup", "UNITED STATES (USA)"),
+]  # fmt: skip
+
+COLLECTIONS: Dict[str, Callable[[List[Dict[str, Any]]], Any]] = {
+    "model": lambda raws: [build_result(raw) for raw in raws],
+    "lean": lambda raws: [build_lean(raw) for raw in raws],
+    "fleet": DecodedFleet,
+}
+
+
+def fleet_payload(count: int) -> str:
+    """JSON array of count vPIC results"""
+    rows = []
+    for i in range(count):
+        make, model, manufacturer, body, country = VEHICLES[i % len(VEHICLES)]
+        rows.append(
+            {
+                **RAW_RESULT,
+                "VIN": f"{i:017d}",
+                "Make": make,
+                "Model": model,
+                "ModelYear": str(2005 + i % 15),
+                "Manufacturer": manufacturer,
+                "BodyClass": body,
+                "PlantCountry": country,
+            }
+        )
+    return json.dumps(rows)
+
+
+def measure_collection(
+    build: Callable[[List[Dict[str, Any]]], Any], payload: str
+) -> Dict[str, float]:
+    """Bytes retained and seconds taken to parse payload into a collection"""
+    count = payload.count('"VIN"')
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        raws = json.loads(payload)
+        started = time.perf_counter()
+        collection = build(raws)
+        elapsed = time.perf_counter() - started
+        del raws
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del collection
+    return {
+        "bytes_per_result": (after - before) / count,
+        "us_per_result": elapsed / count * 1e6,
+    }
+
+
+def run(count: int = 100_000) -> None:
+    payload = fleet_payload(count)
+    print(f"{count:,} results, {len(VEHICLES)} vehicle types, unique VINs")
+    baseline = None
+    for name, build in COLLECTIONS.items():
+        result = measure_collection(build, payload)
+        memory = result["bytes_per_result"]
+        baseline = baseline or memory
+        print(
+            f"{name:>6}: {memory:8,.0f} bytes/result ({memory / baseline:6.1%}), "
+            f"{result['us_per_result']:6.2f} us/result to build"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_fleet")
+    parser.add_argument(
+        "count", nargs="?", type=positive_int, default=100_000, help="results to hold"
+    )
+    args = parser.parse_args()
+    run(args.count)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+"""
+Decode pipeline hot paths, with a JSON report and a baseline check.
+
+Times, in microseconds per operation:
+
+- validate: validate_and_normalize_vin on dealer-feed formatted VINs
+- build_result: VINDecodeResult from a raw vPIC result, with error checks
+- build_lean: LeanResult from the same raw result (result_type="lean")
+- filter_non_null: dropping empty fields from a full result
+- results_table_html: the web interface's results table
+- cache_hit / cache_miss: client.decode served from / filling a MemoryCache
+- default_hit / default_hit_metrics: decode_vin_values_extended served from
+  the default client's cache, with metrics off (the default) and with
+  PYVIN_METRICS=1
+- stub_decode / stub_decode_batch: end to end over HTTP against a local
+  vPIC stub (per VIN; sequential single decodes and 50-VIN batches)
+
+The run is compared with benchmarks/baseline.json (when present) and
+exits with status 1 if any benchmark is slower than the baseline by more
+than --tolerance. Baselines are machine specific: refresh with
+--save-baseline after intended changes or on new hardware.
+
+Run: python -m benchmarks.bench_hot_paths [--json out.json] [--quick]
+"""
+
+import argparse
+import json
+import os
+import sys
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from benchmarks.bench_cache_keys import dealer_feed
+from benchmarks.harness import (
+    CountingClient,
+    Measurement,
+    compare,
+    load_report,
+    measure,
+    print_table,
+    report,
+    save_report,
+)
+from src.api.client import (
+    VINDecoderClient,
+    decode_vin_values_extended,
+    get_default_client,
+    set_default_client,
+)
+from src.api.ratelimit import RateLimiter
+from src.api.results import build_lean, build_result
+from src.cache.memory import MemoryCache
+from src.config import METRICS_ENV
+from src.formatting.response import filter_non_null
+from src.formatting.table import results_table_html
+from src.testing.stub import StubVPICServer
+from src.validation.vin import compute_check_digit, validate_and_normalize_vin
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# A full DecodeVinValuesExtended result, as vPIC returns it
+RAW_RESULT: Dict[str, Any] = {
+    "VIN": "5UXWX7C50BA123456",
+    "Make": "BMW",
+    "Model": "X3",
+    "ModelYear": "2011",
+    "Manufacturer": "BMW MANUFACTURER CORPORATION",
+    "BodyClass": "Sport Utility Vehicle (SUV)/Multi-Purpose Vehicle (MPV)",
+    "VehicleType": "MULTIPURPOSE PASSENGER VEHICLE (MPV)",
+    "Doors": "4",
+    "EngineModel": "N52 B30",
+    "EngineCylinders": "6",
+    "DisplacementL": "3.0",
+    "DisplacementCC": "2996",
+    "DisplacementCI": "182.8",
+    "FuelTypePrimary": "Gasoline",
+    "TransmissionStyle": "Automatic",
+    "DriveType": "AWD/4-Wheel Drive/4x4",
+    "ABS": "Standard",
+    "ESC": "Standard",
+    "PlantCity": "Spartanburg",
+    "PlantCountry": "UNITED STATES (USA)",
+    "PlantState": "South Carolina",
+    "ErrorCode": "0",
+    "ErrorText": "0 - VIN decoded clean. Check Digit (9th position) is correct",
+    "AdditionalErrorText": "",
+    "Trim": "",
+    "MakeID": "",
+}
+
+Case = Tuple[str, Callable[[], Any], int]
+
+
+def _fleet(count: int) -> List[str]:
+    """Distinct VINs with correct check digits"""
+    vins = [f"1GCHK23U04F{serial:06d}" for serial in range(count)]
+    return [vin[:8] + compute_check_digit(vin) + vin[9:] for vin in vins]
+
+
+def _unlimited(base_url: str = "http://stub") -> VINDecoderClient:
+    """Client without the upstream rate limit, so only the code path is timed"""
+    return VINDecoderClient(base_url=base_url, limiter=RateLimiter(rate=None))
+
+
+@contextmanager
+def _default_client(metrics: bool) -> Iterator[None]:
+    """A fresh default client holding RAW_RESULT, with or without metrics"""
+    saved = os.environ.pop(METRICS_ENV, None)
+    if metrics:
+        os.environ[METRICS_ENV] = "1"
+    set_default_client(None)
+    try:
+        get_default_client().cache.set(RAW_RESULT["VIN"], RAW_RESULT)
+        yield
+    finally:
+        set_default_client(None)
+        os.environ.pop(METRICS_ENV, None)
+        if saved is not None:
+            os.environ[METRICS_ENV] = saved
+
+
+def _default_hit() -> None:
+    decode_vin_values_extended(RAW_RESULT["VIN"])
+
+
+def _local_cases() -> List[Case]:
+    feed = dealer_feed(distinct=1000, rows=1000)
+
+    def validate() -> None:
+        for vin in feed:
+            validate_and_normalize_vin(vin)
+
+    result = build_result(RAW_RESULT)
+    populated = filter_non_null(result)
+
+    hit_client = CountingClient(cache=MemoryCache(), limiter=RateLimiter(rate=None))
+    hit_client.decode(RAW_RESULT["VIN"])
+
+    # One-entry cache over distinct VINs: every lookup misses and refills
+    misses = _fleet(1000)
+    miss_client = CountingClient(cache=MemoryCache(1), limiter=RateLimiter(rate=None))
+
+    def cache_miss() -> None:
+        for vin in misses:
+            miss_client.decode(vin)
+
+    return [
+        ("validate", validate, len(feed)),
+        ("build_result", lambda: build_result(RAW_RESULT), 1),
+        ("build_lean", lambda: build_lean(RAW_RESULT), 1),
+        ("filter_non_null", lambda: filter_non_null(result), 1),
+        ("results_table_html", lambda: results_table_html(populated), 1),
+        ("cache_hit", lambda: hit_client.decode(RAW_RESULT["VIN"]), 1),
+        ("cache_miss", cache_miss, len(misses)),
+    ]
+
+
+def _stub_cases(stub: StubVPICServer) -> List[Case]:
+    single_vins, batch_vins = _fleet(50), _fleet(500)
+    client = _unlimited(stub.base_url)
+
+    def decode() -> None:
+        for vin in single_vins:
+            client.decode(vin)
+
+    return [
+        ("stub_decode", decode, len(single_vins)),
+        ("stub_decode_batch", lambda: client.decode_batch(batch_vins), len(batch_vins)),
+    ]
+
+
+def run(min_time: float = 0.2, repeat: int = 5) -> List[Measurement]:
+    """Time every benchmark"""
+    measurements = [
+        measure(name, func, ops, min_time, repeat) for name, func, ops in _local_cases()
+    ]
+    for name, metrics in (("default_hit", False), ("default_hit_metrics", True)):
+        with _default_client(metrics):
+            measurements.append(measure(name, _default_hit, 1, min_time, repeat))
+    with StubVPICServer() as stub:
+        measurements += [
+            measure(name, func, ops, min_time, repeat)
+            for name, func, ops in _stub_cases(stub)
+        ]
+    return measurements
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_hot_paths")
+    parser.add_argument("--json", help="write the report to this file ('-': stdout)")
+    parser.add_argument("--baseline", default=BASELINE, help="report to compare with")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="allowed slowdown (0.25: 25%%)"
+    )
+    parser.add_argument("--quick", action="store_true", help="shorter, noisier run")
+    args = parser.parse_args()
+
+    current = report(run(min_time=0.05, repeat=3) if args.quick else run())
+    baseline = load_report(args.baseline) if os.path.exists(args.baseline) else {}
+    print_table(current, baseline)
+
+    if args.json == "-":
+        print(json.dumps(current, indent=2, sort_keys=True))
+    elif args.json:
+        save_report(current, args.json)
+    if args.save_baseline:
+        save_report(current, args.baseline)
+        return 0
+
+    regressions = compare(current, baseline, args.tolerance) if baseline else []
+    for line in regressions:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+Decode result types: construction cost and memory per object.
+
+Builds results from a full-width vPIC result (the declared fields plus
+the ~120 mostly blank keys DecodeVinValuesExtended also returns) with:
+
+- model: build_result, the Pydantic VINDecodeResult (decode_batch default)
+- lean: build_lean, the slotted tuple-backed LeanResult
+- raw: build_raw, a copy of the vPIC dict after error classification
+- model[4], lean[4]: the same, projected onto PROJECTED_FIELDS (fields=)
+
+and reports microseconds per result and bytes allocated per result while
+holding count of them. The raw dict is shared, as it is when results come
+from a cache, so only the result objects themselves are counted.
+
+Run: python -m benchmarks.bench_results [count]
+"""
+
+import argparse
+import sys
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from benchmarks.bench_hot_paths import RAW_RESULT
+from benchmarks.harness import measure, positive_int
+from src.api.results import build_lean, build_raw, build_result, result_builder
+
+# RAW_RESULT padded to the width of a real DecodeVinValuesExtended result
+FULL_RESULT: Dict[str, Any] = {
+    **RAW_RESULT,
+    **{f"Unused{i:03d}": "" for i in range(120)},
+}
+
+# A typical fields= projection
+PROJECTED_FIELDS = ["make", "model", "model_year", "body_class"]
+
+BUILDERS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "model": build_result,
+    "lean": build_lean,
+    "raw": build_raw,
+    "model[4]": result_builder("model", PROJECTED_FIELDS),
+    "lean[4]": result_builder("lean", PROJECTED_FIELDS),
+}
+
+
+def bytes_per_result(build: Callable[[Dict[str, Any]], Any], count: int) -> float:
+    """Memory allocated per result while count of them are alive"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        results: List[Any] = [build(FULL_RESULT) for _ in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del results
+    return (after - before) / count
+
+
+def run(count: int = 10_000) -> None:
+    print(f"{len(FULL_RESULT)} vPIC keys per result, {count:,} results held")
+    for name, build in BUILDERS.items():
+        timing = measure(name, lambda: build(FULL_RESULT))
+        memory = bytes_per_result(build, count)
+        print(
+            f"{name:>8}: {timing.us_per_op:8.2f} us/result, {memory:8,.0f} bytes/result"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_results")
+    parser.add_argument(
+        "count", nargs="?", type=positive_int, default=10_000, help="results to hold"
+    )
+    args = parser.parse_args()
+    run(args.count)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Bulk VIN validation: per-row validate_and_normalize_vin versus validate_many.
+
+Builds a column shaped like historical dealer records (mixed case, stray
+whitespace, a share of truncated, mistyped, empty and wrong check digit
+rows) and times:
+
+- loop: validate_and_normalize_vin per row, catching InvalidVINError
+- vectorized: validate_many over the whole column
+
+Both run in strict mode so check digits are verified too.
+
+Run: python -m benchmarks.bench_validate_many [rows]
+"""
+
+import argparse
+import random
+import sys
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from benchmarks.bench_cache_keys import VIN_CHARS, _variant
+from benchmarks.harness import positive_int
+from src.exceptions import InvalidVINError
+from src.validation.bulk import validate_many
+from src.validation.vin import compute_check_digit, validate_and_normalize_vin
+
+
+def historical_records(rows: int = 1_000_000, seed: int = 7) -> List[str]:
+    """VIN column with roughly 10% malformed rows"""
+    rng = random.Random(seed)
+    records = []
+    for _ in range(rows):
+        vin = "".join(rng.choices(VIN_CHARS, k=17))
+        vin = vin[:8] + compute_check_digit(vin) + vin[9:]
+        roll = rng.random()
+        if roll < 0.03:
+            vin = vin[: rng.randrange(17)]
+        elif roll < 0.06:
+            vin = vin[:5] + rng.choice("IOQ-") + vin[6:]
+        elif roll < 0.08:
+            vin = ""
+        elif roll < 0.10:
+            vin = vin[:12] + rng.choice(VIN_CHARS) + vin[13:]
+        records.append(_variant(vin, rng))
+    return records
+
+
+def _loop(records: List[str]) -> int:
+    """Per-row validation; returns the number of valid rows"""
+    valid = 0
+    for vin in records:
+        try:
+            validate_and_normalize_vin(vin, strict=True)
+            valid += 1
+        except InvalidVINError:
+            pass
+    return valid
+
+
+def run(rows: int = 1_000_000) -> Dict[str, float]:
+    """Validate the same column both ways and report rows per second"""
+    records = historical_records(rows)
+
+    start = time.perf_counter()
+    loop_valid = _loop(records)
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = validate_many(np.array(records), strict=True)
+    vectorized_seconds = time.perf_counter() - start
+
+    assert int(result.valid.sum()) == loop_valid
+    return {
+        "rows": float(rows),
+        "valid_rows": float(loop_valid),
+        "loop_rows_per_s": rows / loop_seconds,
+        "vectorized_rows_per_s": rows / vectorized_seconds,
+        "speedup": loop_seconds / vectorized_seconds,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_validate_many")
+    parser.add_argument(
+        "rows", nargs="?", type=positive_int, default=1_000_000, help="rows to validate"
+    )
+    args = parser.parse_args()
+    for name, value in run(args.rows).items():
+        print(f"{name:>24}: {value:,.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
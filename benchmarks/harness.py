@@ -0,0 +1,147 @@
+"""
+Timing, JSON reports and baseline comparison for the benchmark suite.
+
+Every benchmark reports microseconds per operation, so lower is always
+better and a regression is a time above baseline * (1 + tolerance).
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from dataclasses import asdict, dataclass
+from statistics import median
+from typing import Any, Callable, Dict, Iterator, List
+
+from src.api.client import VINDecoderClient
+
+REPORT_VERSION = 1
+
+
+@dataclass
+class Measurement:
+    """Timing of one benchmark"""
+
+    name: str
+    us_per_op: float  # median over repeats
+    best_us_per_op: float  # fastest repeat
+    ops: int  # operations timed per repeat
+
+
+def measure(
+    name: str,
+    func: Callable[[], Any],
+    ops: int = 1,
+    min_time: float = 0.2,
+    repeat: int = 5,
+) -> Measurement:
+    """
+    Time func, which performs ops operations per call.
+
+    Like timeit, the number of calls per repeat grows (1, 2, 5, 10, ...)
+    until a repeat takes at least min_time seconds; the median repeat is
+    reported, which is steadier than the best for baseline comparisons.
+    """
+    for calls in _call_counts():
+        elapsed = _time_calls(func, calls)
+        if elapsed >= min_time:
+            break
+    timings = [elapsed] + [_time_calls(func, calls) for _ in range(repeat - 1)]
+    per_op = [t / (calls * ops) * 1e6 for t in timings]
+    return Measurement(name, median(per_op), min(per_op), calls * ops)
+
+
+def positive_int(text: str) -> int:
+    """argparse type for counts of results or rows"""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+class CountingClient(VINDecoderClient):
+    """Client whose upstream requests are answered locally and counted"""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.upstream_calls = 0
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> Dict[str, Any]:
+        self.upstream_calls += 1
+        vin = url.rsplit("/", 1)[-1]
+        return {"Results": [{"VIN": vin, "Make": "BMW", "ErrorCode": "0"}]}
+
+
+def _call_counts() -> Iterator[int]:
+    """1, 2, 5, 10, 20, 50, ..."""
+    scale = 1
+    while True:
+        for step in (1, 2, 5):
+            yield step * scale
+        scale *= 10
+
+
+def _time_calls(func: Callable[[], Any], calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return time.perf_counter() - start
+
+
+def report(measurements: List[Measurement]) -> Dict[str, Any]:
+    """Machine-readable report of a run"""
+    return {
+        "version": REPORT_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {m.name: asdict(m) for m in measurements},
+    }
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != REPORT_VERSION:
+        raise ValueError(f"Unsupported report version: {data.get('version')}")
+    return data
+
+
+def save_report(data: Dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """
+    Benchmarks slower than the baseline by more than tolerance.
+
+    Returns:
+        One line per regression; benchmarks missing from either report
+        are skipped
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        ratio = result["us_per_op"] / base["us_per_op"]
+        if ratio > 1 + tolerance:
+            regressions.append(
+                f"{name}: {result['us_per_op']:,.2f} us/op vs "
+                f"{base['us_per_op']:,.2f} baseline ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def print_table(current: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    """Human-readable results, with the change against the baseline"""
+    for name, result in current["results"].items():
+        line = f"{name:>28}: {result['us_per_op']:>12,.2f} us/op"
+        base = baseline.get("results", {}).get(name)
+        if base:
+            line += f"  ({result['us_per_op'] / base['us_per_op'] - 1:+.0%})"
+        print(line, file=sys.stderr)
@@ -1,7 +1,31 @@
-from src.api.client import decode_vin_values_extended
+from src.api.async_client import (
+    AsyncVINDecoderClient,
+    async_decode_vin_values_extended,
+    async_decode_vins_batch,
+)
+from src.api.batcher import MicroBatcher
+from src.api.client import (
+    VINDecoderClient,
+    decode_vin_values_extended,
+    decode_vins_batch,
+    get_default_client,
+    set_default_client,
+)
+from src.api.fleet import DecodedFleet
+from src.api.lean import LeanResult
 from src.api.models import VINDecodeResult
 
 __all__ = [
+    "VINDecoderClient",
     "decode_vin_values_extended",
+    "decode_vins_batch",
+    "get_default_client",
+    "set_default_client",
+    "MicroBatcher",
+    "AsyncVINDecoderClient",
+    "async_decode_vin_values_extended",
+    "async_decode_vins_batch",
     "VINDecodeResult",
+    "LeanResult",
+    "DecodedFleet",
 ]
@@ -0,0 +1,647 @@
+"""Asyncio client for the NHTSA vPIC API with bounded concurrency."""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from src.api.breaker import CircuitBreaker
+from src.api.cache_layers import CacheLayers
+from src.api.coalesce import AsyncSingleFlight
+from src.api.hedge import Hedger
+from src.api.metrics import ClientMetrics
+from src.api.models import VINDecodeResult
+from src.api.ratelimit import AsyncRateLimiter, is_overload_status
+from src.api.retry import RetryPolicy, TransientError, parse_retry_after
+from src.api.results import (
+    Builder,
+    Outcome,
+    build_result,
+    chunked,
+    decode_chunk,
+    distinct,
+    index_batch_results,
+    normalize_many,
+    raise_first_error,
+    projection,
+    raise_for_error_code,
+    raw_from_response,
+    result_builder,
+)
+from src.api.stats import ClientStats
+from src.api.timing import DecodeTimings, StageTimer, cache_outcome
+from src.cache.base import DecodeCache
+from src.cache.pattern import PatternCache
+from src.config import (
+    DECODE_VIN_BATCH_ENDPOINT,
+    DECODE_VIN_EXT_ENDPOINT,
+    DEFAULT_FORMAT,
+    MAX_CONCURRENCY,
+    NHTSA_BASE_URL,
+    REQUEST_TIMEOUT,
+)
+from src.exceptions import APIError, NetworkError, VINDecoderError
+from src.validation.vin import validate_and_normalize_vin
+
+
+async def _gather_or_cancel(aws: List[Awaitable[Any]]) -> List[Any]:
+    """Run awaitables concurrently, cancelling the rest if any of them fails"""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def _charge_traced(
+    timer: StageTimer, sent: float, now: float, marks: Dict[str, float]
+) -> None:
+    """Split the time from sent to now into connect, request and download"""
+    connect = 0.0
+    if "connection.connect_tcp.started" in marks:
+        connected = marks.get(
+            "connection.start_tls.complete",
+            marks.get("connection.connect_tcp.complete", now),
+        )
+        connect = connected - marks["connection.connect_tcp.started"]
+        timer.add("connect", connect)
+    headers = marks.get(
+        "http11.receive_response_headers.complete",
+        marks.get("http2.receive_response_headers.complete"),
+    )
+    if headers is None:
+        timer.add("request", now - sent - connect)
+        return
+    timer.add("request", headers - sent - connect)
+    timer.add("download", now - headers)
+
+
+class AsyncVINDecoderClient:
+    """
+    Async VIN decode client.
+
+    Owns an httpx.AsyncClient and an AsyncRateLimiter that caps the request
+    rate and adapts the number of in-flight requests to upstream overload.
+    Use as an async context manager (or call aclose()). Results and
+    exceptions match the synchronous client, and the optional DecodeCache,
+    PatternCache and negative cache are consulted the same way. Retries and
+    the circuit breaker work as in the synchronous client, as does optional
+    hedging, except that the losing attempt is cancelled. Concurrent
+    decodes of the same normalized VIN share one upstream request.
+
+    With DecodeTimings, each decode() call is timed by stage as in the
+    synchronous client; connection setup is reported separately ("connect")
+    from httpx trace events. ClientMetrics work as in the synchronous
+    client.
+    """
+
+    def __init__(
+        self,
+        base_url: str = NHTSA_BASE_URL,
+        max_concurrency: int = MAX_CONCURRENCY,
+        timeout: float = REQUEST_TIMEOUT,
+        http_client: Optional["httpx.AsyncClient"] = None,
+        cache: Optional[DecodeCache] = None,
+        pattern_cache: Optional[PatternCache] = None,
+        negative_cache: Optional[DecodeCache] = None,
+        strict: bool = False,
+        limiter: Optional[AsyncRateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        hedge: Optional[Hedger] = None,
+        timings: Optional[DecodeTimings] = None,
+        metrics: Optional[ClientMetrics] = None,
+    ) -> None:
+        """
+        Args:
+            base_url: vPIC API base URL (override to point at a stub server)
+            max_concurrency: Maximum number of concurrent upstream requests
+                (the default limiter's ceiling)
+            timeout: Default timeout in seconds for each request attempt
+            http_client: Optional pre-configured httpx.AsyncClient to use
+            cache: Optional cache backend for raw results
+            pattern_cache: Optional pattern-level cache (opt-in)
+            negative_cache: Optional cache of critical API errors
+            strict: Reject VINs with a wrong check digit before any request
+            limiter: Rate and concurrency limiter (a private one by default)
+            retry: Retry policy for transient failures
+            breaker: Circuit breaker (a private one by default)
+            hedge: Optional Hedger that duplicates slow requests
+            timings: Optional per-stage timing of decode() calls
+            metrics: Optional decode, cache and upstream metrics
+        """
+        if httpx is None:  # pragma: no cover - optional dependency
+            raise ImportError(
+                "The async client requires httpx: pip install 'pyVIN-UI[async]'"
+            )
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.strict = strict
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self.hedge = hedge
+        self.timings = timings
+        self.metrics = metrics
+        self._caches = CacheLayers(cache, pattern_cache, negative_cache)
+        self._inflight = AsyncSingleFlight()
+        self.limiter = limiter or AsyncRateLimiter(max_concurrency=max_concurrency)
+        self._owns_http_client = http_client is None
+        self._http = http_client or httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_concurrency)
+        )
+        if metrics is not None:
+            metrics.bind(self)
+
+    async def __aenter__(self) -> "AsyncVINDecoderClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client if this instance created it"""
+        if self._owns_http_client:
+            await self._http.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        timeout: Optional[float],
+        timer: Optional[StageTimer] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        Send one request and return the JSON body.
+
+        Each attempt is bounded by timeout; transient failures are retried
+        as the retry policy allows.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        attempt = 0
+        while True:
+            try:
+                return await self._hedged(method, url, timeout, timer, **kwargs)
+            except TransientError as e:
+                if attempt >= self.retry.retries:
+                    raise
+                pause = self.retry.delay(attempt, e.retry_after)
+                await asyncio.sleep(pause)
+                if timer is not None:
+                    timer.add("backoff", pause)
+                attempt += 1
+
+    async def _hedged(
+        self,
+        method: str,
+        url: str,
+        timeout: float,
+        timer: Optional[StageTimer],
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Make one attempt, duplicating it if it is slower than the hedge delay"""
+        delay = self.hedge.begin() if self.hedge else None
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        if delay is None:
+            data = await self._attempt(method, url, timeout, timer, **kwargs)
+            if self.hedge:
+                self.hedge.observe(loop.time() - started)
+            return data
+
+        def observe(task: "asyncio.Task[Dict[str, Any]]") -> None:
+            if not task.cancelled() and task.exception() is None:
+                self.hedge.observe(loop.time() - started)
+
+        # Each attempt times itself; only the one whose outcome is used counts
+        timers: Dict["asyncio.Task[Dict[str, Any]]", Optional[StageTimer]] = {}
+
+        def start() -> "asyncio.Task[Dict[str, Any]]":
+            child = timer.child() if timer is not None else None
+            task = asyncio.ensure_future(
+                self._attempt(method, url, timeout, child, **kwargs)
+            )
+            timers[task] = child
+            return task
+
+        primary = start()
+        primary.add_done_callback(observe)
+        attempts = [primary]
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if not done and self.hedge.try_hedge():
+                attempts.append(start())
+            pending = set(attempts)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.hedge.won()
+                        if timer is not None:
+                            timer.merge(timers[task])
+                        return task.result()
+            if timer is not None:
+                timer.merge(timers[primary])
+            raise primary.exception()
+        finally:
+            # Cancel the losing attempt and wait for it to release its permit
+            for task in attempts:
+                task.cancel()
+            await asyncio.gather(*attempts, return_exceptions=True)
+
+    async def _attempt(
+        self,
+        method: str,
+        url: str,
+        timeout: float,
+        timer: Optional[StageTimer] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Send one request through the circuit breaker and rate limiter"""
+        measured = timer is not None or self.metrics is not None
+        started = time.perf_counter() if timer is not None else 0.0
+        self.breaker.check()
+        ticket = await self.limiter.acquire()
+        if measured:
+            sent = time.perf_counter()
+        if timer is not None:
+            timer.add("queue", sent - started)
+            marks: Dict[str, float] = {}
+
+            async def trace(event: str, info: Dict[str, Any]) -> None:
+                marks[event] = time.perf_counter()
+
+            kwargs["extensions"] = {"trace": trace}
+        failed: Optional[bool] = None  # unknown until vPIC answers or fails
+        resp: Optional["httpx.Response"] = None
+        try:
+            resp = await asyncio.wait_for(
+                self._http.request(method, url, timeout=timeout, **kwargs),
+                timeout,
+            )
+            failed = is_overload_status(resp.status_code)
+            resp.raise_for_status()
+        except asyncio.TimeoutError:
+            failed = True
+            raise TransientError(
+                f"Failed to reach NHTSA API: timed out after {timeout}s"
+            )
+        except (httpx.TimeoutException, httpx.NetworkError) as e:
+            failed = True
+            raise TransientError(f"Failed to reach NHTSA API: {e}")
+        except httpx.HTTPStatusError as e:
+            message = f"Failed to reach NHTSA API: {e}"
+            if resp.status_code in self.retry.statuses:
+                retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                raise TransientError(message, retry_after)
+            raise NetworkError(message)
+        except httpx.HTTPError as e:
+            raise NetworkError(f"Failed to reach NHTSA API: {e}")
+        finally:
+            await self.limiter.release(ticket, bool(failed))
+            if failed is not None:
+                self.breaker.record(failed)
+            if measured:
+                now = time.perf_counter()
+                if timer is not None:
+                    _charge_traced(timer, sent, now, marks)
+                if self.metrics is not None:
+                    self.metrics.upstream(method, resp, now - sent)
+        if timer is None:
+            return resp.json()
+        parsing = time.perf_counter()
+        data = resp.json()
+        timer.add("parse", time.perf_counter() - parsing)
+        return data
+
+    async def decode(
+        self,
+        vin: str,
+        timeout: Optional[float] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> VINDecodeResult:
+        """
+        Decode a single VIN. Async counterpart of decode_vin_values_extended.
+
+        Args:
+            vin: 17-character VIN (use * for wildcards)
+            timeout: Per-attempt timeout in seconds (defaults to the client timeout)
+            fields: Only parse and keep these VINDecodeResult fields (the
+                others are None); the cache still stores the full result
+
+        Returns:
+            VINDecodeResult with decoded data (may include warnings in error_text)
+
+        Raises:
+            ValueError: Unknown field name
+            InvalidVINError: VIN format is invalid
+            NetworkError: Network/connection error or timeout
+            APIError: Critical API error (400+ error codes)
+        """
+        projected = projection(fields) if fields is not None else None
+        if self.timings is None and self.metrics is None:
+            return await self._decode(vin, timeout, None, projected)
+        timer = self.timings.start(vin) if self.timings is not None else None
+        try:
+            result = await self._decode(vin, timeout, timer, projected)
+        except BaseException as e:
+            self._finish(timer, e)
+            raise
+        self._finish(timer, None, result.error_code)
+        return result
+
+    def _finish(
+        self,
+        timer: Optional[StageTimer],
+        error: Optional[BaseException],
+        error_code: Optional[str] = None,
+    ) -> None:
+        """Record a finished decode() call"""
+        if timer is not None and self.timings is not None:
+            self.timings.finish(timer, error, error_code)
+        if self.metrics is not None:
+            self.metrics.decoded(error)
+
+    async def _decode(
+        self,
+        vin: str,
+        timeout: Optional[float],
+        timer: Optional[StageTimer],
+        fields: Optional[Tuple[str, ...]] = None,
+    ) -> VINDecodeResult:
+        normalized_vin = validate_and_normalize_vin(vin, self.strict)
+        if timer is not None:
+            timer.mark("validate")
+
+        build = build_result if fields is None else result_builder(fields=fields)
+        cached = self._caches.lookup([normalized_vin], build)
+        if timer is not None:
+            timer.mark("cache")
+        if cached:
+            if timer is not None:
+                timer.cache = cache_outcome(cached[normalized_vin])
+            raise_first_error(cached, return_exceptions=False)
+            return cached[normalized_vin]
+
+        # Only calls with the same projection can share a result
+        key = normalized_vin if fields is None else f"{normalized_vin}:{fields}"
+        result, shared = await self._inflight.do(
+            key, lambda: self._fetch(normalized_vin, timeout, timer, build)
+        )
+        if shared and timer is not None:
+            timer.cache = "coalesced"
+            timer.mark("coalesced")
+        # Each caller gets its own model instance
+        return result.model_copy() if shared else result
+
+    async def _fetch(
+        self,
+        normalized_vin: str,
+        timeout: Optional[float],
+        timer: Optional[StageTimer] = None,
+        build: Builder = build_result,
+    ) -> VINDecodeResult:
+        """Decode a normalized VIN upstream and cache the raw result"""
+        url = f"{self.base_url}/{DECODE_VIN_EXT_ENDPOINT}/{normalized_vin}"
+        data = await self._request(
+            "GET", url, timeout, timer, params={"format": DEFAULT_FORMAT}
+        )
+        if timer is not None:
+            timer.lap()  # the request stages were charged by _attempt
+        try:
+            raw = raw_from_response(data)
+            result = VINDecodeResult(**raw) if build is build_result else build(raw)
+            if timer is not None:
+                timer.mark("build")
+            raise_for_error_code(result)
+            if timer is not None:
+                timer.mark("error_check")
+        except APIError as e:
+            if timer is not None:
+                timer.mark("error_check")
+            self._caches.store_error(normalized_vin, e)
+            raise
+        self._caches.store(normalized_vin, raw)
+        if timer is not None:
+            timer.mark("store")
+        return result
+
+    @property
+    def cache(self) -> Optional[DecodeCache]:
+        return self._caches.cache
+
+    @property
+    def pattern_cache(self) -> Optional[PatternCache]:
+        return self._caches.pattern_cache
+
+    @property
+    def negative_cache(self) -> Optional[DecodeCache]:
+        return self._caches.negative_cache
+
+    def stats(self) -> ClientStats:
+        """Snapshot of coalescing, cache, limiter, breaker and hedge statistics"""
+        return ClientStats.collect(
+            self._inflight, self._caches, self.limiter, self.breaker, self.hedge
+        )
+
+    async def decode_many(
+        self,
+        vins: Iterable[str],
+        return_exceptions: bool = False,
+        timeout: Optional[float] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> List[Outcome]:
+        """
+        Decode many VINs concurrently with one single-VIN request each.
+
+        Distinct normalized VINs are requested once; at most max_concurrency
+        requests are in flight. If any lookup fails and return_exceptions is
+        False, the remaining lookups are cancelled and the error is raised.
+
+        Args:
+            vins: VINs to decode
+            return_exceptions: Return per-VIN failures in place instead of raising
+            timeout: Per-request timeout in seconds
+            fields: Only parse and keep these VINDecodeResult fields
+
+        Returns:
+            One result (or error) per input VIN, in input order
+        """
+        projected = projection(fields) if fields is not None else None
+        outcomes = normalize_many(vins, return_exceptions, self.strict)
+        unique = list(dict.fromkeys(o for o in outcomes if isinstance(o, str)))
+
+        async def decode_one(vin: str) -> Outcome:
+            try:
+                return await self.decode(vin, timeout, projected)
+            except VINDecoderError as e:
+                if not return_exceptions:
+                    raise
+                return e
+
+        results = await _gather_or_cancel([decode_one(vin) for vin in unique])
+        decoded = dict(zip(unique, results))
+        return [decoded[o] if isinstance(o, str) else o for o in outcomes]
+
+    async def decode_batch(
+        self,
+        vins: Iterable[str],
+        return_exceptions: bool = False,
+        timeout: Optional[float] = None,
+        result_type: str = "model",
+        fields: Optional[Iterable[str]] = None,
+    ) -> List[Outcome]:
+        """
+        Decode many VINs via the batch endpoint, sending chunks concurrently.
+
+        Async counterpart of decode_vins_batch.
+
+        Args:
+            vins: VINs to decode
+            return_exceptions: Return per-VIN failures in place instead of raising
+            timeout: Per-request timeout in seconds
+            result_type: "model" (VINDecodeResult), "lean" (LeanResult) or
+                "raw" (the vPIC result dict)
+            fields: Only parse and keep these VINDecodeResult fields
+
+        Returns:
+            One result (or error) per input VIN, in input order
+        """
+        build = result_builder(result_type, fields)
+        if self.metrics is None:
+            return await self._decode_batch(vins, return_exceptions, timeout, build)
+        try:
+            results = await self._decode_batch(vins, return_exceptions, timeout, build)
+        except BaseException as e:
+            self.metrics.decoded(e)
+            raise
+        self.metrics.decoded_many(results)
+        return results
+
+    async def _decode_batch(
+        self,
+        vins: Iterable[str],
+        return_exceptions: bool,
+        timeout: Optional[float],
+        build: Builder,
+    ) -> List[Outcome]:
+        outcomes = normalize_many(vins, return_exceptions, self.strict)
+        vins = distinct(outcomes)
+
+        decoded = self._caches.lookup(vins, build)
+        raise_first_error(decoded, return_exceptions)
+
+        send, followers = self._caches.plan([v for v in vins if v not in decoded])
+        await self._send_batches(send, decoded, return_exceptions, timeout, build)
+        if followers:
+            shared = self._caches.lookup_shared(followers, build)
+            raise_first_error(shared, return_exceptions)
+            decoded.update(shared)
+            await self._send_batches(
+                [v for v in followers if v not in decoded],
+                decoded,
+                return_exceptions,
+                timeout,
+                build,
+            )
+
+        return [decoded[o] if isinstance(o, str) else o for o in outcomes]
+
+    async def _send_batches(
+        self,
+        vins: List[str],
+        decoded: Dict[str, Outcome],
+        return_exceptions: bool,
+        timeout: Optional[float],
+        build: Builder,
+    ) -> None:
+        """Decode uncached VINs via the batch endpoint, chunks concurrently"""
+        url = f"{self.base_url}/{DECODE_VIN_BATCH_ENDPOINT}/"
+
+        async def send_chunk(chunk: List[str]) -> Dict[str, Outcome]:
+            body = {"format": DEFAULT_FORMAT, "data": ";".join(chunk)}
+            try:
+                data = await self._request("POST", url, timeout, data=body)
+            except NetworkError as e:
+                if not return_exceptions:
+                    raise
+                return {vin: e for vin in chunk}
+            raw_by_vin = index_batch_results(data.get("Results") or [])
+            chunk_decoded = decode_chunk(chunk, raw_by_vin, build)
+            self._caches.store_decoded(chunk_decoded, raw_by_vin)
+            raise_first_error(chunk_decoded, return_exceptions)
+            return chunk_decoded
+
+        for chunk_decoded in await _gather_or_cancel(
+            [send_chunk(chunk) for chunk in chunked(vins)]
+        ):
+            decoded.update(chunk_decoded)
+
+
+async def async_decode_vin_values_extended(
+    vin: str,
+    client: Optional[AsyncVINDecoderClient] = None,
+    timeout: Optional[float] = None,
+    fields: Optional[Iterable[str]] = None,
+) -> VINDecodeResult:
+    """
+    Decode VIN using NHTSA API without blocking the event loop.
+
+    Uses the given client, or a short-lived one if none is provided. Pass a
+    shared AsyncVINDecoderClient to reuse connections across calls. fields
+    works as in decode_vin_values_extended.
+
+    Raises:
+        ValueError: Unknown field name
+        InvalidVINError: VIN format is invalid
+        NetworkError: Network/connection error or timeout
+        APIError: Critical API error (400+ error codes)
+    """
+    if client is not None:
+        return await client.decode(vin, timeout, fields)
+    async with AsyncVINDecoderClient() as owned:
+        return await owned.decode(vin, timeout, fields)
+
+
+async def async_decode_vins_batch(
+    vins: Iterable[str],
+    max_concurrency: int = MAX_CONCURRENCY,
+    return_exceptions: bool = False,
+    timeout: Optional[float] = None,
+    result_type: str = "model",
+    fields: Optional[Iterable[str]] = None,
+) -> List[Outcome]:
+    """
+    Decode many VINs via the batch endpoint with bounded concurrency.
+
+    result_type and fields work as in decode_vins_batch.
+
+    Raises:
+        InvalidVINError: VIN format is invalid
+        NetworkError: Network/connection error or timeout
+        APIError: Critical API error (400+ error codes) or missing result
+    """
+    async with AsyncVINDecoderClient(max_concurrency=max_concurrency) as client:
+        return await client.decode_batch(
+            vins, return_exceptions, timeout, result_type, fields
+        )
+
+
+__all__ = [
+    "AsyncVINDecoderClient",
+    "async_decode_vin_values_extended",
+    "async_decode_vins_batch",
+]
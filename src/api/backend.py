@@ -0,0 +1,45 @@
+"""Interface shared by the synchronous decode backends."""
+
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional
+
+from src.api.models import VINDecodeResult
+from src.api.results import Outcome
+from src.cache.base import DecodeCache
+
+
+class DecoderBackend(ABC):
+    """
+    A synchronous VIN decoder: the HTTP client or a local snapshot.
+
+    Any backend can serve the module-level decode functions through
+    set_default_client. fields projects results onto some VINDecodeResult
+    fields and result_type picks "model", "lean" or "raw" results, as in
+    VINDecoderClient. Backends without caches leave cache and
+    negative_cache as None.
+    """
+
+    cache: Optional[DecodeCache] = None
+    negative_cache: Optional[DecodeCache] = None
+
+    @abstractmethod
+    def decode(
+        self, vin: str, fields: Optional[Iterable[str]] = None
+    ) -> VINDecodeResult:
+        """Decode a single VIN, keeping only fields if given"""
+
+    @abstractmethod
+    def decode_batch(
+        self,
+        vins: Iterable[str],
+        return_exceptions: bool = False,
+        result_type: str = "model",
+        fields: Optional[Iterable[str]] = None,
+    ) -> List[Outcome]:
+        """Decode many VINs as result_type objects, in input order"""
+
+    def close(self) -> None:
+        """Release any resources held by the backend"""
+
+
+__all__ = ["DecoderBackend"]
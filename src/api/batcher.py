@@ -0,0 +1,204 @@
+"""Micro-batching: coalesce concurrent single-VIN decodes into batch calls."""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Deque, Iterable, List, Optional, Tuple
+
+from src.api.backend import DecoderBackend
+from src.api.models import VINDecodeResult
+from src.api.results import Builder, Outcome, result_builder
+from src.cache.base import DecodeCache
+from src.config import BATCH_SIZE, MAX_CONCURRENCY, MICRO_BATCH_WAIT
+from src.validation.vin import validate_and_normalize_vin
+
+# (normalized VIN, arrival time, caller's result builder, caller's future)
+_Pending = Tuple[str, float, Builder, "Future[VINDecodeResult]"]
+
+
+@dataclass
+class BatcherStats:
+    """Snapshot of a micro-batcher's counters"""
+
+    calls: int  # single-VIN decodes submitted
+    batches: int  # batch calls sent to the backend
+    queued: int  # decodes waiting for the next batch
+
+    @property
+    def mean_batch_size(self) -> float:
+        """Average VINs per batch sent so far"""
+        return (self.calls - self.queued) / self.batches if self.batches else 0.0
+
+
+class MicroBatcher(DecoderBackend):
+    """
+    Turns concurrent single-VIN decodes into batch requests.
+
+    decode() queues the VIN and blocks until its result is ready. A
+    background thread collects queued VINs for up to max_wait seconds after
+    the first one arrives, or until max_batch are waiting, and decodes them
+    with one backend.decode_batch call for raw results, which each caller's
+    own result is then built from. Each caller gets its own result or
+    exception, exactly as backend.decode would have produced it (fields
+    included), so callers of decode_vin_values_extended need no changes:
+
+        set_default_client(MicroBatcher(VINDecoderClient(cache=...)))
+
+    Up to max_concurrency batches are decoded at a time. decode_batch calls
+    go straight to the backend. Closing the batcher decodes what is still
+    queued, then closes the backend.
+
+    Args:
+        backend: Decoder whose decode_batch serves the batches
+        max_wait: Seconds the first VIN of a batch waits for company
+        max_batch: Maximum VINs per batch (vPIC accepts at most 50)
+        max_concurrency: Batches decoded concurrently
+    """
+
+    def __init__(
+        self,
+        backend: DecoderBackend,
+        max_wait: float = MICRO_BATCH_WAIT,
+        max_batch: int = BATCH_SIZE,
+        max_concurrency: int = MAX_CONCURRENCY,
+    ):
+        if max_wait < 0:
+            raise ValueError("max_wait must not be negative")
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.backend = backend
+        self.max_wait = max_wait
+        self.max_batch = max_batch
+        self._strict = getattr(backend, "strict", False)
+        self._queue: Deque[_Pending] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._calls = 0
+        self._batches = 0
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="pyvin-batch"
+        )
+        self._collector = threading.Thread(
+            target=self._collect, name="pyvin-batcher", daemon=True
+        )
+        self._collector.start()
+
+    def __enter__(self) -> "MicroBatcher":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def cache(self) -> Optional[DecodeCache]:
+        return self.backend.cache
+
+    @property
+    def negative_cache(self) -> Optional[DecodeCache]:
+        return self.backend.negative_cache
+
+    def decode(
+        self, vin: str, fields: Optional[Iterable[str]] = None
+    ) -> VINDecodeResult:
+        """
+        Decode a single VIN as part of the next batch.
+
+        Raises:
+            ValueError: Unknown field name (raised before queueing)
+            InvalidVINError: VIN format is invalid (raised before queueing)
+            NetworkError: Network/connection error
+            APIError: Critical API error (400+ error codes)
+            RuntimeError: The batcher is closed
+        """
+        return self.submit(vin, fields).result()
+
+    def submit(
+        self, vin: str, fields: Optional[Iterable[str]] = None
+    ) -> "Future[VINDecodeResult]":
+        """Queue a VIN for the next batch without waiting for its result"""
+        build = result_builder(fields=fields)
+        normalized_vin = validate_and_normalize_vin(vin, self._strict)
+        future: "Future[VINDecodeResult]" = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("MicroBatcher is closed")
+            self._queue.append((normalized_vin, time.monotonic(), build, future))
+            self._calls += 1
+            self._cond.notify()
+        return future
+
+    def decode_batch(
+        self,
+        vins: Iterable[str],
+        return_exceptions: bool = False,
+        result_type: str = "model",
+        fields: Optional[Iterable[str]] = None,
+    ) -> List[Outcome]:
+        """Decode many VINs directly with the backend"""
+        return self.backend.decode_batch(vins, return_exceptions, result_type, fields)
+
+    def _collect(self) -> None:
+        """Cut the queue into batches and hand them to the pool"""
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                deadline = self._queue[0][1] + self.max_wait
+                while len(self._queue) < self.max_batch and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                size = min(self.max_batch, len(self._queue))
+                batch = [self._queue.popleft() for _ in range(size)]
+                self._batches += 1
+            self._pool.submit(self._send, batch)
+
+    def _send(self, batch: List[_Pending]) -> None:
+        """Decode one batch and resolve its callers' futures"""
+        try:
+            outcomes = self.backend.decode_batch(
+                [vin for vin, _, _, _ in batch],
+                return_exceptions=True,
+                result_type="raw",
+            )
+        except BaseException as e:
+            # Callers block on their futures, so even KeyboardInterrupt or
+            # SystemExit must reach them before it propagates
+            for _, _, _, future in batch:
+                future.set_exception(e)
+            if isinstance(e, Exception):
+                return
+            raise
+        # Each caller, duplicates included, gets a result built for it alone
+        for (_, _, build, future), outcome in zip(batch, outcomes):
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+                continue
+            try:
+                future.set_result(build(outcome))
+            except Exception as e:
+                future.set_exception(e)
+
+    def stats(self) -> BatcherStats:
+        """Snapshot of submitted calls, batches sent and queue depth"""
+        with self._cond:
+            return BatcherStats(
+                calls=self._calls, batches=self._batches, queued=len(self._queue)
+            )
+
+    def close(self) -> None:
+        """Decode the queued VINs, stop the batcher and close the backend"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._collector.join()
+        self._pool.shutdown(wait=True)
+        self.backend.close()
+
+
+__all__ = ["BatcherStats", "MicroBatcher"]
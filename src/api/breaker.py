@@ -0,0 +1,154 @@
+"""Circuit breaker that fails fast while the upstream API is unhealthy."""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Optional
+
+from src.config import (
+    BREAKER_FAILURE_RATE,
+    BREAKER_MIN_CALLS,
+    BREAKER_RESET_TIMEOUT,
+    BREAKER_WINDOW,
+)
+from src.exceptions import CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass
+class BreakerStats:
+    """Snapshot of a circuit breaker's state"""
+
+    state: str  # closed, open or half_open
+    failure_rate: float  # failure share of the recent calls in the window
+    calls: int  # calls currently in the window
+    opened: int  # times the circuit opened
+    rejected: int  # requests failed fast without being sent
+
+
+class CircuitBreaker:
+    """
+    Rolling-window circuit breaker shared by the sync and async clients.
+
+    Closed, every request is sent and its outcome recorded. Once at least
+    min_calls of the last window calls were made and the failure share
+    reaches failure_rate, the circuit opens: requests fail immediately with
+    CircuitOpenError instead of waiting on a dead upstream. After
+    reset_timeout seconds one probe request is let through (half open); its
+    success closes the circuit, its failure opens it again.
+
+    Callers report failed=True only for upstream health problems (429, 5xx,
+    timeouts and connection errors), not for invalid input. The lock is
+    only held for bookkeeping, so one instance can serve threads and an
+    event loop alike.
+
+    Args:
+        failure_rate: Failure share (0-1] that opens the circuit
+        window: Number of recent calls the failure rate covers
+        min_calls: Calls needed in the window before the circuit may open
+        reset_timeout: Seconds to stay open before probing
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = BREAKER_FAILURE_RATE,
+        window: int = BREAKER_WINDOW,
+        min_calls: int = BREAKER_MIN_CALLS,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 0 < failure_rate <= 1:
+            raise ValueError("failure_rate must be in (0, 1]")
+        if not 1 <= min_calls <= window:
+            raise ValueError("need 1 <= min_calls <= window")
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probe_at: Optional[float] = None
+        self._opened = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def check(self) -> None:
+        """
+        Admit a request or fail fast.
+
+        Raises:
+            CircuitOpenError: The circuit is open, or half open with a probe
+                already in flight
+        """
+        with self._lock:
+            now = self._clock()
+            if self._state == OPEN and now - self._opened_at >= self.reset_timeout:
+                self._state = HALF_OPEN
+                self._probe_at = None
+            if self._state == HALF_OPEN and (
+                # A probe that never reported back (e.g. cancelled) expires
+                self._probe_at is None or now - self._probe_at >= self.reset_timeout
+            ):
+                self._probe_at = now
+                return
+            if self._state == CLOSED:
+                return
+            self._rejected += 1
+            if self._state == HALF_OPEN:
+                message = "NHTSA API is failing; recovery probe in progress"
+            else:
+                retry_in = self._opened_at + self.reset_timeout - now
+                message = (
+                    f"NHTSA API is failing; requests suspended for {retry_in:.0f}s"
+                )
+        raise CircuitOpenError(message)
+
+    def record(self, failed: bool) -> None:
+        """Record the outcome of an admitted request"""
+        with self._lock:
+            if self._state == HALF_OPEN:
+                if failed:
+                    self._open()
+                else:
+                    self._state = CLOSED
+                    self._outcomes.clear()
+                return
+            if self._state == OPEN:
+                return  # a straggler admitted before the circuit opened
+            self._outcomes.append(failed)
+            calls = len(self._outcomes)
+            if (
+                calls >= self.min_calls
+                and sum(self._outcomes) >= self.failure_rate * calls
+            ):
+                self._open()
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._opened += 1
+        self._outcomes.clear()
+
+    def stats(self) -> BreakerStats:
+        with self._lock:
+            calls = len(self._outcomes)
+            return BreakerStats(
+                state=self._state,
+                failure_rate=sum(self._outcomes) / calls if calls else 0.0,
+                calls=calls,
+                opened=self._opened,
+                rejected=self._rejected,
+            )
+
+
+__all__ = ["BreakerStats", "CircuitBreaker"]
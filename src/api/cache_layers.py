@@ -0,0 +1,116 @@
+"""The cache tiers consulted by the decode clients."""
+
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from src.api.results import (
+    Builder,
+    Outcome,
+    RawResult,
+    build_result,
+    decode_chunk,
+    is_critical_error_code,
+)
+from src.cache.base import DecodeCache
+from src.cache.pattern import PatternCache
+from src.exceptions import APIError
+
+
+class CacheLayers:
+    """
+    Cache tiers for a decode client, consulted in order:
+
+    - negative: recent critical API errors, re-raised without a request
+    - exact: raw results keyed by normalized VIN
+    - pattern: clean decodes shared by VINs with the same squish key
+
+    Every tier is optional.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[DecodeCache] = None,
+        pattern_cache: Optional[PatternCache] = None,
+        negative_cache: Optional[DecodeCache] = None,
+    ) -> None:
+        self.cache = cache
+        self.pattern_cache = pattern_cache
+        self.negative_cache = negative_cache
+
+    def lookup(
+        self, vins: List[str], build: Builder = build_result
+    ) -> Dict[str, Outcome]:
+        """Resolve whatever the caches can answer, as results or APIErrors"""
+        found: Dict[str, Outcome] = {}
+        if self.negative_cache is not None:
+            for vin, entry in self.negative_cache.get_many(vins).items():
+                found[vin] = APIError(entry["message"], entry.get("error_code"))
+        raw: Dict[str, RawResult] = {}
+        if self.cache is not None:
+            raw.update(self.cache.get_many([v for v in vins if v not in found]))
+        found.update(decode_chunk(list(raw), raw, build))
+        found.update(self.lookup_shared([v for v in vins if v not in found], build))
+        return found
+
+    def lookup_shared(
+        self, vins: List[str], build: Builder = build_result
+    ) -> Dict[str, Outcome]:
+        """Resolve VINs from the pattern cache only"""
+        if self.pattern_cache is None:
+            return {}
+        raw = self.pattern_cache.get_many(vins)
+        return decode_chunk(list(raw), raw, build)
+
+    def store(self, vin: str, raw: RawResult) -> None:
+        """Store a raw result that decoded without a critical error"""
+        if self.cache is not None:
+            self.cache.set(vin, raw)
+        if self.pattern_cache is not None:
+            self.pattern_cache.set(vin, raw)
+
+    def store_error(self, vin: str, error: APIError) -> None:
+        """
+        Remember a critical API error for the negative cache TTL.
+
+        Only errors carrying a critical (400+) vPIC error code are stored;
+        others, such as a VIN missing from a batch response, say nothing
+        lasting about the VIN and are retried on the next decode.
+        """
+        if self.negative_cache is not None and is_critical_error_code(error.error_code):
+            self.negative_cache.set(
+                vin, {"message": str(error), "error_code": error.error_code}
+            )
+
+    def store_decoded(
+        self, decoded: Mapping[str, Outcome], raw_by_vin: Mapping[str, RawResult]
+    ) -> None:
+        """Store each decoded outcome in the positive or negative tier"""
+        for vin, outcome in decoded.items():
+            if isinstance(outcome, APIError):
+                self.store_error(vin, outcome)
+            elif vin in raw_by_vin:
+                self.store(vin, raw_by_vin[vin])
+
+    def plan(self, vins: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        Split uncached VINs into ones to send and ones that may share a decode.
+
+        With a pattern cache, only the first VIN of each squish pattern is sent;
+        the rest ("followers") are resolved from the pattern cache once the
+        representative has been decoded, and sent themselves only if that fails.
+        """
+        if self.pattern_cache is None:
+            return vins, []
+        send: List[str] = []
+        followers: List[str] = []
+        seen = set()
+        for vin in vins:
+            key = self.pattern_cache.key_for(vin)
+            if key is not None and key in seen:
+                followers.append(vin)
+            else:
+                send.append(vin)
+                seen.add(key)
+        return send, followers
+
+
+__all__ = ["CacheLayers"]
@@ -1,19 +1,597 @@
-from functools import lru_cache
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
 import requests
+from requests.adapters import HTTPAdapter
+from src.api.backend import DecoderBackend
+from src.api.breaker import CircuitBreaker
+from src.api.cache_layers import CacheLayers
+from src.api.coalesce import SingleFlight
+from src.api.hedge import Hedger
+from src.api.metrics import ClientMetrics
 from src.api.models import VINDecodeResult
+from src.api.ratelimit import RateLimiter, is_overload_status
+from src.api.retry import RetryPolicy, TransientError, parse_retry_after
+from src.api.results import (
+    Builder,
+    Outcome,
+    RawResult,
+    build_result,
+    chunked,
+    decode_chunk,
+    distinct,
+    index_batch_results,
+    normalize_many,
+    raise_first_error,
+    projection,
+    raise_for_error_code,
+    raw_from_response,
+    result_builder,
+)
+from src.api.stats import ClientStats
+from src.api.timing import DecodeTimings, StageTimer, cache_outcome
+from src.cache.base import DecodeCache
+from src.cache.memory import MemoryCache
+from src.cache.pattern import PatternCache
 from src.config import (
     CACHE_SIZE,
+    DECODE_VIN_BATCH_ENDPOINT,
     DECODE_VIN_EXT_ENDPOINT,
     DEFAULT_FORMAT,
+    MAX_RETRIES,
+    METRICS_ENV,
+    METRICS_PORT_ENV,
+    NEGATIVE_CACHE_SIZE,
+    NEGATIVE_CACHE_TTL,
     NHTSA_BASE_URL,
+    POOL_SIZE,
     REQUEST_TIMEOUT,
+    RETRY_BACKOFF,
 )
 from src.exceptions import APIError, NetworkError
 from src.validation.vin import validate_and_normalize_vin
 
 
-@lru_cache(maxsize=CACHE_SIZE)
-def decode_vin_values_extended(vin: str) -> VINDecodeResult:
+def _charge_request(
+    timer: StageTimer, spent: float, resp: Optional[requests.Response]
+) -> None:
+    """Split an attempt's time into request (until headers) and download"""
+    if resp is None:
+        timer.add("request", spent)
+        return
+    headers = resp.elapsed.total_seconds()
+    timer.add("request", headers)
+    timer.add("download", max(0.0, spent - headers))
+
+
+class VINDecoderClient(DecoderBackend):
+    """
+    Synchronous VIN decode client backed by a pooled, keep-alive session.
+
+    Reusing one client across calls avoids a fresh TCP+TLS handshake per
+    request. Transient failures (connection errors, timeouts and
+    429/502/503/504 responses) are retried with jittered exponential backoff
+    by a RetryPolicy. A CircuitBreaker watches the upstream error rate and,
+    during an outage, fails requests immediately with CircuitOpenError
+    instead of letting every caller wait out the timeout; cached VINs are
+    still served from the cache meanwhile. Safe to share between threads.
+
+    An optional DecodeCache stores raw results keyed by normalized VIN;
+    results with critical error codes are never cached. An optional
+    PatternCache additionally shares clean decodes between VINs that differ
+    only in check digit and serial number, and makes batch decoding send one
+    representative per pattern. An optional negative cache remembers critical
+    API errors (400+) so resubmitted junk VINs fail without a request. In
+    strict mode, VINs with a wrong check digit fail with CheckDigitError
+    before any cache lookup or request.
+
+    Concurrent decodes of the same normalized VIN that miss the cache are
+    coalesced into a single upstream request whose outcome they all share.
+
+    Every upstream request, single or batch, passes through a RateLimiter:
+    a token bucket caps the request rate and the concurrency limit halves
+    when vPIC answers 429/5xx or times out, then grows back one request at
+    a time. Pass the same limiter to several clients to share one budget.
+
+    With an optional Hedger, an attempt still unanswered after the hedge
+    delay is sent a second time and the first answer wins, trimming tail
+    latency at a bounded cost in extra requests.
+
+    With DecodeTimings, each decode() call is timed by stage (validation,
+    cache, rate limiter wait, request, download, JSON parsing, model
+    building, error-code checks) and reported to its hooks and histograms.
+    With ClientMetrics, decode outcomes, upstream latency and response
+    sizes, and the cache and limiter statistics are exposed as Prometheus
+    metrics.
+    """
+
+    def __init__(
+        self,
+        base_url: str = NHTSA_BASE_URL,
+        timeout: float = REQUEST_TIMEOUT,
+        pool_size: int = POOL_SIZE,
+        retries: int = MAX_RETRIES,
+        backoff_factor: float = RETRY_BACKOFF,
+        session: Optional[requests.Session] = None,
+        cache: Optional[DecodeCache] = None,
+        pattern_cache: Optional[PatternCache] = None,
+        negative_cache: Optional[DecodeCache] = None,
+        strict: bool = False,
+        limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        hedge: Optional[Hedger] = None,
+        timings: Optional[DecodeTimings] = None,
+        metrics: Optional[ClientMetrics] = None,
+    ) -> None:
+        """
+        Args:
+            base_url: vPIC API base URL (override to point at a stub server)
+            timeout: Per-request timeout in seconds
+            pool_size: Maximum keep-alive connections kept per host, and the
+                default limiter's maximum concurrency
+            retries: Retries for transient failures (0 disables); ignored
+                when retry is given
+            backoff_factor: Base delay in seconds for exponential backoff;
+                ignored when retry is given
+            session: Optional pre-configured session to use instead
+            cache: Optional cache backend for raw results
+            pattern_cache: Optional pattern-level cache (opt-in)
+            negative_cache: Optional cache of critical API errors, normally
+                with a shorter TTL than the result cache
+            strict: Reject VINs with a wrong check digit before any request
+            limiter: Rate and concurrency limiter (a private one by default)
+            retry: Retry policy for transient failures
+            breaker: Circuit breaker (a private one by default)
+            hedge: Optional Hedger that duplicates slow requests
+            timings: Optional per-stage timing of decode() calls
+            metrics: Optional decode, cache and upstream metrics
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.strict = strict
+        self.retry = retry or RetryPolicy(retries=retries, backoff=backoff_factor)
+        self.breaker = breaker or CircuitBreaker()
+        self._caches = CacheLayers(cache, pattern_cache, negative_cache)
+        self._inflight = SingleFlight()
+        self.limiter = limiter or RateLimiter(max_concurrency=pool_size)
+        self.session = session or self._build_session(pool_size)
+        self.hedge = hedge
+        self.timings = timings
+        self.metrics = metrics
+        self._pool_size = pool_size
+        self._hedge_pool: Optional[ThreadPoolExecutor] = None
+        self._hedge_lock = threading.Lock()
+        if metrics is not None:
+            metrics.bind(self)
+
+    @staticmethod
+    def _build_session(pool_size: int) -> requests.Session:
+        """Create a session with a pooled keep-alive adapter and gzip enabled"""
+        # Retries happen in _request, where the breaker and limiter see them
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(
+            {
+                "Accept": "application/json",
+                "Accept-Encoding": "gzip, deflate",
+                "Connection": "keep-alive",
+            }
+        )
+        return session
+
+    def __enter__(self) -> "VINDecoderClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close pooled connections"""
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=False)
+        self.session.close()
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        timer: Optional[StageTimer] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        Send one request and return the JSON body.
+
+        Transient failures are retried as the retry policy allows.
+        """
+        attempt = 0
+        while True:
+            try:
+                return self._hedged(method, url, timer, **kwargs)
+            except TransientError as e:
+                if attempt >= self.retry.retries:
+                    raise
+                pause = self.retry.delay(attempt, e.retry_after)
+                time.sleep(pause)
+                if timer is not None:
+                    timer.add("backoff", pause)
+                attempt += 1
+
+    def _hedged(
+        self, method: str, url: str, timer: Optional[StageTimer], **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Make one attempt, duplicating it if it is slower than the hedge delay"""
+        delay = self.hedge.begin() if self.hedge else None
+        if delay is None:
+            started = time.monotonic()
+            data = self._attempt(method, url, timer, **kwargs)
+            if self.hedge:
+                self.hedge.observe(time.monotonic() - started)
+            return data
+
+        with self._hedge_lock:
+            if self._hedge_pool is None:
+                # One primary per pooled connection, plus the budgeted hedges
+                self._hedge_pool = ThreadPoolExecutor(
+                    max_workers=self.hedge.attempts_for(self._pool_size),
+                    thread_name_prefix="pyvin-hedge",
+                )
+        started = time.monotonic()
+
+        def observe(future: Future) -> None:
+            if future.exception() is None:
+                self.hedge.observe(time.monotonic() - started)
+
+        # Each attempt times itself; only the one whose outcome is used counts
+        timers: Dict[Future, Optional[StageTimer]] = {}
+
+        def submit() -> Future:
+            child = timer.child() if timer is not None else None
+            future = self._hedge_pool.submit(
+                self._attempt, method, url, child, **kwargs
+            )
+            timers[future] = child
+            return future
+
+        primary = submit()
+        primary.add_done_callback(observe)
+        if wait([primary], timeout=delay).not_done and self.hedge.try_hedge():
+            submit()
+
+        failed: Optional[Future] = None
+        # The slower attempt cannot be cancelled; it finishes in the background
+        for future in as_completed(list(timers)):
+            if future.exception() is not None:
+                failed = failed or future
+                continue
+            if future is not primary:
+                self.hedge.won()
+            if timer is not None:
+                timer.merge(timers[future])
+            return future.result()
+        if timer is not None:
+            timer.merge(timers[failed])
+        raise failed.exception()
+
+    def _attempt(
+        self,
+        method: str,
+        url: str,
+        timer: Optional[StageTimer] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Send one request through the circuit breaker and rate limiter"""
+        measured = timer is not None or self.metrics is not None
+        started = time.perf_counter() if timer is not None else 0.0
+        self.breaker.check()
+        ticket = self.limiter.acquire()
+        if measured:
+            sent = time.perf_counter()
+            if timer is not None:
+                timer.add("queue", sent - started)
+        failed: Optional[bool] = None  # unknown until vPIC answers or fails
+        resp: Optional[requests.Response] = None
+        try:
+            resp = self.session.request(method, url, timeout=self.timeout, **kwargs)
+            failed = is_overload_status(resp.status_code)
+            resp.raise_for_status()
+        except (requests.Timeout, requests.ConnectionError) as e:
+            failed = True
+            raise TransientError(f"Failed to reach NHTSA API: {e}")
+        except requests.HTTPError as e:
+            message = f"Failed to reach NHTSA API: {e}"
+            if resp.status_code in self.retry.statuses:
+                retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                raise TransientError(message, retry_after)
+            raise NetworkError(message)
+        except requests.RequestException as e:
+            raise NetworkError(f"Failed to reach NHTSA API: {e}")
+        finally:
+            self.limiter.release(ticket, bool(failed))
+            if failed is not None:
+                self.breaker.record(failed)
+            if measured:
+                self._measure(method, timer, time.perf_counter() - sent, resp)
+        if timer is None:
+            return resp.json()
+        parsing = time.perf_counter()
+        data = resp.json()
+        timer.add("parse", time.perf_counter() - parsing)
+        return data
+
+    def _measure(
+        self,
+        method: str,
+        timer: Optional[StageTimer],
+        spent: float,
+        resp: Optional[requests.Response],
+    ) -> None:
+        """Charge one attempt's time to the stage timer and metrics"""
+        if timer is not None:
+            _charge_request(timer, spent, resp)
+        if self.metrics is not None:
+            self.metrics.upstream(method, resp, spent)
+
+    def decode(
+        self, vin: str, fields: Optional[Iterable[str]] = None
+    ) -> VINDecodeResult:
+        """
+        Decode a single VIN. See decode_vin_values_extended.
+
+        Args:
+            vin: 17-character VIN (use * for wildcards)
+            fields: Only parse and keep these VINDecodeResult fields (the
+                others are None); the cache still stores the full result
+
+        Raises:
+            ValueError: Unknown field name
+            InvalidVINError: VIN format is invalid
+            NetworkError: Network/connection error
+            APIError: Critical API error (400+ error codes)
+        """
+        projected = projection(fields) if fields is not None else None
+        if self.timings is None and self.metrics is None:
+            return self._decode(vin, None, projected)
+        timer = self.timings.start(vin) if self.timings is not None else None
+        try:
+            result = self._decode(vin, timer, projected)
+        except BaseException as e:
+            self._finish(timer, e)
+            raise
+        self._finish(timer, None, result.error_code)
+        return result
+
+    def _finish(
+        self,
+        timer: Optional[StageTimer],
+        error: Optional[BaseException],
+        error_code: Optional[str] = None,
+    ) -> None:
+        """Record a finished decode() call"""
+        if timer is not None and self.timings is not None:
+            self.timings.finish(timer, error, error_code)
+        if self.metrics is not None:
+            self.metrics.decoded(error)
+
+    def _decode(
+        self,
+        vin: str,
+        timer: Optional[StageTimer],
+        fields: Optional[Tuple[str, ...]] = None,
+    ) -> VINDecodeResult:
+        normalized_vin = validate_and_normalize_vin(vin, self.strict)
+        if timer is not None:
+            timer.mark("validate")
+
+        build = build_result if fields is None else result_builder(fields=fields)
+        cached = self._caches.lookup([normalized_vin], build)
+        if timer is not None:
+            timer.mark("cache")
+        if cached:
+            if timer is not None:
+                timer.cache = cache_outcome(cached[normalized_vin])
+            raise_first_error(cached, return_exceptions=False)
+            return cached[normalized_vin]
+
+        # Only calls with the same projection can share a result
+        key = normalized_vin if fields is None else f"{normalized_vin}:{fields}"
+        result, shared = self._inflight.do(
+            key, lambda: self._fetch(normalized_vin, timer, build)
+        )
+        if shared and timer is not None:
+            timer.cache = "coalesced"
+            timer.mark("coalesced")
+        # Each caller gets its own model instance
+        return result.model_copy() if shared else result
+
+    def _fetch(
+        self,
+        normalized_vin: str,
+        timer: Optional[StageTimer] = None,
+        build: Builder = build_result,
+    ) -> VINDecodeResult:
+        """Decode a normalized VIN upstream and cache the raw result"""
+        url = f"{self.base_url}/{DECODE_VIN_EXT_ENDPOINT}/{normalized_vin}"
+        params = {"format": DEFAULT_FORMAT}
+
+        data = self._request("GET", url, timer=timer, params=params)
+        if timer is not None:
+            timer.lap()  # the request stages were charged by _attempt
+        try:
+            raw = raw_from_response(data)
+            result = VINDecodeResult(**raw) if build is build_result else build(raw)
+            if timer is not None:
+                timer.mark("build")
+            raise_for_error_code(result)
+            if timer is not None:
+                timer.mark("error_check")
+        except APIError as e:
+            if timer is not None:
+                timer.mark("error_check")
+            self._caches.store_error(normalized_vin, e)
+            raise
+        self._caches.store(normalized_vin, raw)
+        if timer is not None:
+            timer.mark("store")
+        return result
+
+    @property
+    def cache(self) -> Optional[DecodeCache]:
+        return self._caches.cache
+
+    @property
+    def pattern_cache(self) -> Optional[PatternCache]:
+        return self._caches.pattern_cache
+
+    @property
+    def negative_cache(self) -> Optional[DecodeCache]:
+        return self._caches.negative_cache
+
+    def stats(self) -> ClientStats:
+        """Snapshot of coalescing, cache, limiter, breaker and hedge statistics"""
+        return ClientStats.collect(
+            self._inflight, self._caches, self.limiter, self.breaker, self.hedge
+        )
+
+    def _post_batch(self, vins: List[str]) -> Dict[str, RawResult]:
+        """POST one chunk of normalized VINs to the batch endpoint, keyed by VIN"""
+        url = f"{self.base_url}/{DECODE_VIN_BATCH_ENDPOINT}/"
+        data = {"format": DEFAULT_FORMAT, "data": ";".join(vins)}
+
+        return index_batch_results(
+            self._request("POST", url, data=data).get("Results") or []
+        )
+
+    def _send_batches(
+        self,
+        vins: List[str],
+        decoded: Dict[str, Outcome],
+        return_exceptions: bool,
+        build: Builder,
+    ) -> None:
+        """Decode uncached VINs via the batch endpoint into decoded"""
+        for chunk in chunked(vins):
+            try:
+                raw_by_vin = self._post_batch(chunk)
+            except NetworkError as e:
+                if not return_exceptions:
+                    raise
+                decoded.update((vin, e) for vin in chunk)
+                continue
+            chunk_decoded = decode_chunk(chunk, raw_by_vin, build)
+            self._caches.store_decoded(chunk_decoded, raw_by_vin)
+            raise_first_error(chunk_decoded, return_exceptions)
+            decoded.update(chunk_decoded)
+
+    def decode_batch(
+        self,
+        vins: Iterable[str],
+        return_exceptions: bool = False,
+        result_type: str = "model",
+        fields: Optional[Iterable[str]] = None,
+    ) -> List[Outcome]:
+        """
+        Decode many VINs via the batch endpoint. See decode_vins_batch.
+
+        result_type picks what each decoded VIN is returned as: "model"
+        (VINDecodeResult), "lean" (LeanResult, no Pydantic validation) or
+        "raw" (the vPIC result dict). Critical API errors are raised or
+        returned the same way for all three. fields projects each result
+        onto those VINDecodeResult fields, as in decode().
+        """
+        build = result_builder(result_type, fields)
+        if self.metrics is None:
+            return self._decode_batch(vins, return_exceptions, build)
+        try:
+            results = self._decode_batch(vins, return_exceptions, build)
+        except BaseException as e:
+            self.metrics.decoded(e)
+            raise
+        self.metrics.decoded_many(results)
+        return results
+
+    def _decode_batch(
+        self, vins: Iterable[str], return_exceptions: bool, build: Builder
+    ) -> List[Outcome]:
+        outcomes = normalize_many(vins, return_exceptions, self.strict)
+        vins = distinct(outcomes)
+
+        decoded = self._caches.lookup(vins, build)
+        raise_first_error(decoded, return_exceptions)
+
+        send, followers = self._caches.plan([v for v in vins if v not in decoded])
+        self._send_batches(send, decoded, return_exceptions, build)
+        if followers:
+            shared = self._caches.lookup_shared(followers, build)
+            raise_first_error(shared, return_exceptions)
+            decoded.update(shared)
+            self._send_batches(
+                [v for v in followers if v not in decoded],
+                decoded,
+                return_exceptions,
+                build,
+            )
+
+        return [decoded[o] if isinstance(o, str) else o for o in outcomes]
+
+
+_default_client: Optional[DecoderBackend] = None
+_default_client_lock = threading.Lock()
+
+
+def _default_metrics() -> Optional[ClientMetrics]:
+    """Metrics for the default client, if the environment asks for them"""
+    enabled = os.environ.get(METRICS_ENV, "").strip().lower()
+    if enabled in ("1", "true", "yes", "on") or os.environ.get(METRICS_PORT_ENV):
+        return ClientMetrics(name="default")
+    return None
+
+
+def get_default_client() -> DecoderBackend:
+    """
+    Return the shared client used by the module-level decode functions.
+
+    The default client caches up to CACHE_SIZE results in memory, keyed by
+    normalized VIN, so differently formatted inputs share one entry, and
+    remembers critical API errors for NEGATIVE_CACHE_TTL seconds. Metrics
+    are off unless PYVIN_METRICS=1 (or PYVIN_METRICS_PORT) is set when it
+    is created; they then go to the process-wide src.metrics.REGISTRY.
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = VINDecoderClient(
+                    cache=MemoryCache(CACHE_SIZE),
+                    negative_cache=MemoryCache(
+                        NEGATIVE_CACHE_SIZE, ttl=NEGATIVE_CACHE_TTL
+                    ),
+                    metrics=_default_metrics(),
+                )
+    return _default_client
+
+
+def set_default_client(client: Optional[DecoderBackend]) -> None:
+    """
+    Replace the shared client used by the module-level decode functions.
+
+    Any DecoderBackend works, e.g. an OfflineDecoder on air-gapped nodes.
+
+    Passing None resets it so a fresh default client is created on next use.
+    """
+    global _default_client
+    with _default_client_lock:
+        _default_client = client
+
+
+def decode_vin_values_extended(
+    vin: str, fields: Optional[Iterable[str]] = None
+) -> VINDecodeResult:
     """
     Decode VIN using NHTSA API. Returns Pydantic model.
 
@@ -24,54 +602,92 @@ def decode_vin_values_extended(vin: str) -> VINDecodeResult:
     This function returns results for warnings but raises APIError for critical errors.
     Check result.error_text and result.suggested_vin for additional information.
 
+    Requests go through the shared, pooled client (see get_default_client),
+    whose cache is keyed by normalized VIN: "5uxwx7c50ba123456" and
+    " 5UXWX7C50BA123456 " share one entry.
+
     Args:
         vin: 17-character VIN (use * for wildcards)
+        fields: Only parse and keep these VINDecodeResult fields (the
+            others are None)
 
     Returns:
         VINDecodeResult with decoded data (may include warnings in error_text)
 
     Raises:
+        ValueError: Unknown field name
         InvalidVINError: VIN format is invalid
         NetworkError: Network/connection error
         APIError: Critical API error (400+ error codes)
     """
-    normalized_vin = validate_and_normalize_vin(vin)
+    return get_default_client().decode(vin, fields)
 
-    url = f"{NHTSA_BASE_URL}/{DECODE_VIN_EXT_ENDPOINT}/{normalized_vin}"
-    params = {"format": DEFAULT_FORMAT}
 
-    try:
-        resp = requests.get(url, params=params, timeout=REQUEST_TIMEOUT)
-        resp.raise_for_status()
-    except requests.RequestException as e:
-        raise NetworkError(f"Failed to reach NHTSA API: {e}")
+class CacheInfo(NamedTuple):
+    """Cache statistics in the shape of functools.lru_cache's cache_info()"""
 
-    data = resp.json()
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
 
-    if not data.get("Results"):
-        raise APIError("No results returned from API")
 
-    result = VINDecodeResult(**data["Results"][0])
+def _cache_info() -> CacheInfo:
+    """Report the default client's cache statistics"""
+    cache = get_default_client().cache
+    if cache is None:
+        return CacheInfo(0, 0, None, 0)
+    stats = cache.stats()
+    return CacheInfo(
+        stats.hits, stats.misses, getattr(cache, "max_entries", None), stats.size
+    )
 
-    # Only raise error for critical errors (400+), not warnings (0-99)
-    if result.error_code:
-        try:
-            error_code_int = int(
-                result.error_code.split()[0].split(",")[0]
-            )  # Handle "1,11,14" format
-            if error_code_int >= 400:
-                # Critical error - raise exception
-                msg = f"API Error: {result.error_text}"
-                if result.suggested_vin:
-                    msg += f"\nSuggested VIN: {result.suggested_vin}"
-                if result.possible_values:
-                    msg += f"\nPossible values: {result.possible_values}"
-                raise APIError(msg)
-            # else: warning codes (0-99) - return result with warnings in error_text
-        except (ValueError, AttributeError):
-            # If we can't parse error code, treat error_code "0" as success
-            if result.error_code != "0":
-                # Unknown error format - raise to be safe
-                raise APIError(f"API Error: {result.error_text}")
-
-    return result
+
+def _cache_clear() -> None:
+    """Clear the default client's caches and their statistics"""
+    client = get_default_client()
+    for cache in (client.cache, client.negative_cache):
+        if cache is not None:
+            cache.clear()
+
+
+# Keep the lru_cache-style helpers callers already use
+decode_vin_values_extended.cache_info = _cache_info
+decode_vin_values_extended.cache_clear = _cache_clear
+
+
+def decode_vins_batch(
+    vins: Iterable[str],
+    return_exceptions: bool = False,
+    result_type: str = "model",
+    fields: Optional[Iterable[str]] = None,
+) -> List[Outcome]:
+    """
+    Decode many VINs using the NHTSA DecodeVINValuesBatch endpoint.
+
+    VINs are validated and normalized up front, de-duplicated, and sent in
+    chunks of BATCH_SIZE per POST request. Results are returned in input order
+    and each one goes through the same error-code classification as
+    decode_vin_values_extended.
+
+    Args:
+        vins: VINs to decode (use * for wildcards)
+        return_exceptions: If True, per-VIN failures are returned in place of
+            the result instead of being raised (like asyncio.gather)
+        result_type: "model" (VINDecodeResult), "lean" (LeanResult) or "raw"
+            (the vPIC result dict)
+        fields: Only keep these VINDecodeResult fields of each result
+
+    Returns:
+        List of results (or VINDecoderError when return_exceptions=True),
+        one per input VIN, in input order
+
+    Raises:
+        ValueError: Unknown result_type or field name
+        InvalidVINError: VIN format is invalid
+        NetworkError: Network/connection error
+        APIError: Critical API error (400+ error codes) or missing result
+    """
+    return get_default_client().decode_batch(
+        vins, return_exceptions, result_type, fields
+    )
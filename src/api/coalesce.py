@@ -0,0 +1,124 @@
+"""Single-flight request coalescing for concurrent identical lookups."""
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class CoalesceStats:
+    """Counters for coalesced calls"""
+
+    executed: int = 0  # calls that ran the underlying function
+    coalesced: int = 0  # calls that waited on another caller's execution
+    in_flight: int = 0  # keys currently executing
+
+
+class _Call:
+    """An execution shared by every caller of the same key"""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls with the same key into one execution (threads).
+
+    The first caller for a key runs the function; callers arriving while it
+    runs block until it finishes and receive the same result or exception.
+    Nothing is remembered afterwards, so this complements (not replaces) a cache.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], T]) -> Tuple[T, bool]:
+        """
+        Run fn for key, or wait for the execution already in flight.
+
+        Returns:
+            (result, shared) where shared is True if another caller ran fn
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._executed += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+            return call.result, False
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> CoalesceStats:
+        with self._lock:
+            return CoalesceStats(self._executed, self._coalesced, len(self._calls))
+
+
+class AsyncSingleFlight:
+    """
+    Collapse concurrent awaits with the same key into one task (asyncio).
+
+    The shared task is shielded, so one waiter being cancelled does not
+    cancel the lookup for the others.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Dict[str, "asyncio.Future[Any]"] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """
+        Await fn() for key, or join the task already in flight.
+
+        Returns:
+            (result, shared) where shared is True if another caller started it
+        """
+        task = self._tasks.get(key)
+        shared = task is not None
+        if shared:
+            self._coalesced += 1
+        else:
+            task = self._tasks[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda t: self._finish(key, t))
+            self._executed += 1
+        return await asyncio.shield(task), shared
+
+    def _finish(self, key: str, task: "asyncio.Future[Any]") -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved even if every waiter went away
+
+    def stats(self) -> CoalesceStats:
+        return CoalesceStats(self._executed, self._coalesced, len(self._tasks))
+
+
+__all__ = ["AsyncSingleFlight", "CoalesceStats", "SingleFlight"]
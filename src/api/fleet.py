@@ -0,0 +1,181 @@
+"""Columnar, dictionary-encoded collection of decode results."""
+
+from array import array
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+from src.api.lean import ALIASES, FIELDS, LeanResult
+from src.api.models import VINDecodeResult
+
+FleetRow = Union[VINDecodeResult, LeanResult, Mapping[str, Any]]
+
+# Narrowest array typecode able to hold codes up to each limit
+_TYPECODES: Tuple[Tuple[str, int], ...] = (
+    ("B", 0xFF),
+    ("H", 0xFFFF),
+    ("I", 0xFFFFFFFF),
+)
+
+
+class _Column:
+    """One field: an array of codes into a list of distinct values"""
+
+    __slots__ = ("codes", "values", "index", "_limit")
+
+    def __init__(self) -> None:
+        self.codes = array(_TYPECODES[0][0])
+        self.values: List[Any] = [None]  # code 0 is None
+        self.index: Dict[Any, int] = {None: 0}
+        self._limit = _TYPECODES[0][1]
+
+    def add(self, value: Any) -> int:
+        """Code for a value not seen before"""
+        code = self.index[value] = len(self.values)
+        self.values.append(value)
+        if code > self._limit:
+            self._widen(code)
+        return code
+
+    def discard_last(self) -> None:
+        """Forget the value added last (its code must not be in use)"""
+        del self.index[self.values.pop()]
+
+    def _widen(self, code: int) -> None:
+        typecode, self._limit = next(
+            (typecode, limit) for typecode, limit in _TYPECODES if code <= limit
+        )
+        self.codes = array(typecode, self.codes)
+
+
+def _field_values(result: FleetRow) -> Iterable[Any]:
+    """Declared field values of a result, in FIELDS order"""
+    if isinstance(result, VINDecodeResult):
+        return (getattr(result, name) for name in FIELDS)
+    if isinstance(result, LeanResult):
+        return result.as_dict().values()
+    # Blank strings to None, as LeanResult does
+    return [
+        None if v == "" or (isinstance(v, str) and v.isspace()) else v
+        for v in map(result.get, ALIASES)
+    ]
+
+
+class DecodedFleet(Sequence[VINDecodeResult]):
+    """
+    Decode results stored column by column, dictionary encoded.
+
+    Each declared VINDecodeResult field is an array of integer codes into
+    that field's distinct values, so a make, country or body class shared
+    by a million results is stored once and costs each result one to four
+    bytes. Indexing builds the VINDecodeResult for a row on demand without
+    validating it; undeclared vPIC keys are not kept.
+
+    Accepts VINDecodeResult, LeanResult or raw vPIC result dicts. Values
+    of raw dicts are kept as given, apart from blank strings becoming None
+    as in LeanResult, so they are never validated by Pydantic.
+    """
+
+    def __init__(self, results: Iterable[FleetRow] = ()):
+        self._columns: Dict[str, _Column] = {name: _Column() for name in FIELDS}
+        self._length = 0
+        self.extend(results)
+
+    def append(self, result: FleetRow) -> None:
+        """
+        Add one result.
+
+        A result that cannot be stored (e.g. one with an unhashable value)
+        is rolled back from the columns it reached, leaving the fleet as it
+        was.
+        """
+        added: List[_Column] = []
+        try:
+            # Per-column lookup inlined: this loop is the whole cost of an append
+            for column, value in zip(self._columns.values(), _field_values(result)):
+                code = column.index.get(value)
+                if code is None:
+                    code = column.add(value)
+                    added.append(column)
+                column.codes.append(code)
+        except BaseException:
+            for column in self._columns.values():
+                del column.codes[self._length :]
+            for column in added:
+                column.discard_last()
+            raise
+        self._length += 1
+
+    def extend(self, results: Iterable[FleetRow]) -> None:
+        """Add results in order"""
+        for result in results:
+            self.append(result)
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Declared fields of a row by field name, nulls included"""
+        index = range(self._length)[index]
+        return {
+            name: column.values[column.codes[index]]
+            for name, column in self._columns.items()
+        }
+
+    def column(self, name: str) -> List[Any]:
+        """Every row's value of one field"""
+        column = self._column(name)
+        values = column.values
+        return [values[code] for code in column.codes]
+
+    def value_counts(self, name: str) -> Dict[Any, int]:
+        """Rows per distinct value of one field, None included"""
+        column = self._column(name)
+        counts = [0] * len(column.values)
+        for code in column.codes:
+            counts[code] += 1
+        return {value: count for value, count in zip(column.values, counts) if count}
+
+    def cardinality(self, name: str) -> int:
+        """Number of distinct non-null values of one field"""
+        return len(self._column(name).values) - 1
+
+    def _column(self, name: str) -> _Column:
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise KeyError(f"Unknown VINDecodeResult field: {name}") from None
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> VINDecodeResult: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[VINDecodeResult]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[VINDecodeResult, List[VINDecodeResult]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(self._length)[index]]
+        # Not validated: only rows appended as models ever were; lean and raw
+        # rows hold the vPIC values as given, with blanks turned into None
+        return VINDecodeResult.model_construct(**self.row(index))
+
+    def __iter__(self) -> Iterator[VINDecodeResult]:
+        for index in range(self._length):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"DecodedFleet({self._length} results)"
+
+
+__all__ = ["DecodedFleet", "FleetRow"]
@@ -0,0 +1,122 @@
+"""Hedged requests: re-issue slow requests to cut tail latency."""
+
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Optional
+
+from src.config import HEDGE_BUDGET, HEDGE_MIN_SAMPLES, HEDGE_PERCENTILE, HEDGE_WINDOW
+
+
+@dataclass
+class HedgeStats:
+    """Snapshot of a hedger's counters"""
+
+    requests: int  # primary requests started
+    hedged: int  # duplicate requests sent
+    wins: int  # hedges that answered before their primary
+    delay: Optional[float]  # current hedge delay in seconds (None: warming up)
+
+
+class Hedger:
+    """
+    Decides when a slow upstream request gets a duplicate.
+
+    A request still unanswered after delay seconds is sent again and the
+    first answer wins. Without a fixed delay, the delay tracks the given
+    percentile of recently observed latencies, so only the slowest few
+    percent of requests are hedged; until min_samples latencies are known
+    nothing is hedged. Hedges are capped at budget times the number of
+    primary requests, which bounds the extra load on vPIC even when every
+    request is slow. Safe to share between clients and threads.
+
+    Args:
+        delay: Fixed hedge delay in seconds (None to track latencies)
+        percentile: Latency percentile used as the adaptive delay
+        budget: Maximum hedges per primary request (0.05 is 5% extra load)
+        min_samples: Latencies needed before adaptive hedging starts
+        window: Number of recent latencies the percentile covers
+    """
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        percentile: float = HEDGE_PERCENTILE,
+        budget: float = HEDGE_BUDGET,
+        min_samples: int = HEDGE_MIN_SAMPLES,
+        window: int = HEDGE_WINDOW,
+    ):
+        if delay is not None and delay < 0:
+            raise ValueError("delay must not be negative")
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        if budget < 0:
+            raise ValueError("budget must not be negative")
+        self.fixed_delay = delay
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._requests = 0
+        self._hedged = 0
+        self._wins = 0
+
+    def _delay(self) -> Optional[float]:
+        if self.fixed_delay is not None:
+            return self.fixed_delay
+        if len(self._latencies) < max(1, self.min_samples):
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[int(self.percentile * (len(ordered) - 1))]
+
+    def begin(self) -> Optional[float]:
+        """
+        Count a primary request.
+
+        Returns:
+            Seconds to wait before hedging it, or None to not hedge
+        """
+        with self._lock:
+            self._requests += 1
+            return self._delay()
+
+    def try_hedge(self) -> bool:
+        """Claim budget for one hedge; False once the budget is spent"""
+        with self._lock:
+            if self._hedged + 1 > self.budget * self._requests:
+                return False
+            self._hedged += 1
+            return True
+
+    def observe(self, latency: float) -> None:
+        """Record the latency of a successful primary request"""
+        with self._lock:
+            self._latencies.append(latency)
+
+    def won(self) -> None:
+        """Record a hedge that answered first"""
+        with self._lock:
+            self._wins += 1
+
+    def attempts_for(self, concurrency: int) -> int:
+        """
+        Concurrent attempts needed by concurrency primary requests.
+
+        One slot per primary plus the hedges the budget allows on top of
+        them (at least one, so a hedge can always start).
+        """
+        return concurrency + max(1, math.ceil(concurrency * self.budget))
+
+    def stats(self) -> HedgeStats:
+        with self._lock:
+            return HedgeStats(
+                requests=self._requests,
+                hedged=self._hedged,
+                wins=self._wins,
+                delay=self._delay(),
+            )
+
+
+__all__ = ["HedgeStats", "Hedger"]
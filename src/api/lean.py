@@ -0,0 +1,90 @@
+"""Slotted, tuple-backed decode result that skips Pydantic validation."""
+
+from typing import Any, Dict, Optional, Tuple
+
+from src.api.models import VINDecodeResult
+
+RawResult = Dict[str, Any]
+
+# Declared VINDecodeResult fields, and the vPIC key each is read from
+FIELDS: Tuple[str, ...] = tuple(VINDecodeResult.model_fields)
+ALIASES: Tuple[str, ...] = tuple(
+    field.alias or name for name, field in VINDecodeResult.model_fields.items()
+)
+
+
+def _clean(value: Any) -> Any:
+    """Blank strings to None, as VINDecodeResult's validator does"""
+    if value == "" or (isinstance(value, str) and value.isspace()):
+        return None
+    return value
+
+
+class LeanResult:
+    """
+    Read-only decode result backed by a tuple of its declared fields.
+
+    Has the same attributes as VINDecodeResult (make, model_year, ...)
+    with blank strings turned into None, but building one is a single
+    pass over the declared vPIC keys: no validators run and the ~100
+    undeclared keys are not copied. Undeclared keys are still readable by
+    their vPIC name from the raw result it keeps. to_model() builds the
+    full VINDecodeResult on demand, once.
+    """
+
+    __slots__ = ("_values", "_raw", "_model")
+
+    def __init__(self, raw: RawResult):
+        # _clean inlined: this line is the whole construction cost
+        self._values: Tuple[Any, ...] = tuple(
+            [
+                None if v == "" or (isinstance(v, str) and v.isspace()) else v
+                for v in map(raw.get, ALIASES)
+            ]
+        )
+        self._raw = raw
+        self._model: Optional[VINDecodeResult] = None
+
+    @property
+    def raw(self) -> RawResult:
+        """The vPIC result this was built from"""
+        return self._raw
+
+    def to_model(self) -> VINDecodeResult:
+        """The equivalent VINDecodeResult, validated on first use"""
+        if self._model is None:
+            self._model = VINDecodeResult(**self._raw)
+        return self._model
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Declared fields by field name, nulls included"""
+        return dict(zip(FIELDS, self._values))
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names that are not declared fields
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return _clean(self._raw[name])
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LeanResult):
+            return self._values == other._values
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LeanResult(vin={self.vin!r}, make={self.make!r}, model={self.model!r})"
+
+
+def _field(index: int) -> property:
+    return property(lambda self: self._values[index])
+
+
+for _index, _name in enumerate(FIELDS):
+    setattr(LeanResult, _name, _field(_index))
+del _index, _name
+
+
+__all__ = ["ALIASES", "FIELDS", "LeanResult"]
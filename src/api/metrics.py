@@ -0,0 +1,198 @@
+"""Decode, cache and upstream metrics for the decode clients."""
+
+import weakref
+from dataclasses import fields
+from typing import Any, Iterable, List, Optional
+
+from src.api.stats import ClientStats
+from src.config import PAYLOAD_BUCKETS, TIMING_BUCKETS
+from src.metrics.registry import REGISTRY, MetricFamily, MetricsRegistry
+
+# ClientStats cache field -> tier label
+_CACHE_TIERS = {
+    "cache": "result",
+    "pattern_cache": "pattern",
+    "negative_cache": "negative",
+}
+
+# Cache counter field -> (metric name, help)
+_CACHE_COUNTERS = {
+    "hits": ("pyvin_cache_hits_total", "Cache lookups that found an entry"),
+    "misses": ("pyvin_cache_misses_total", "Cache lookups that found nothing"),
+    "evictions": ("pyvin_cache_evictions_total", "Entries evicted to make room"),
+    "expirations": ("pyvin_cache_expirations_total", "Entries dropped after TTL"),
+}
+
+
+def _endpoint(method: str) -> str:
+    return "batch" if method == "POST" else "decode"
+
+
+def stats_families(client: str, stats: ClientStats) -> List[MetricFamily]:
+    """Metric families for a snapshot of a client's component statistics"""
+    families = {
+        name: MetricFamily(name, "counter", help, ("client", "tier"))
+        for name, help in _CACHE_COUNTERS.values()
+    }
+    entries = MetricFamily(
+        "pyvin_cache_entries", "gauge", "Entries in the cache", ("client", "tier")
+    )
+    for attr, tier in _CACHE_TIERS.items():
+        cache = getattr(stats, attr)
+        if cache is None:
+            continue
+        for field in fields(cache):
+            if field.name in _CACHE_COUNTERS:
+                name = _CACHE_COUNTERS[field.name][0]
+                families[name].samples[(client, tier)] = getattr(cache, field.name)
+        entries.samples[(client, tier)] = cache.size
+
+    result = [*families.values(), entries]
+
+    def gauge(name: str, help: str, value: float) -> None:
+        result.append(
+            MetricFamily(name, "gauge", help, ("client",), {(client,): value})
+        )
+
+    def counter(name: str, help: str, value: float) -> None:
+        result.append(
+            MetricFamily(name, "counter", help, ("client",), {(client,): value})
+        )
+
+    counter(
+        "pyvin_coalesced_total",
+        "Decodes that shared another caller's upstream request",
+        stats.coalesce.coalesced,
+    )
+    gauge(
+        "pyvin_coalesce_in_flight",
+        "Distinct VINs being fetched upstream",
+        stats.coalesce.in_flight,
+    )
+    if stats.limiter is not None:
+        gauge(
+            "pyvin_upstream_in_flight",
+            "Upstream requests in flight",
+            stats.limiter.in_flight,
+        )
+        gauge(
+            "pyvin_upstream_queued",
+            "Requests waiting for the rate limiter",
+            stats.limiter.queued,
+        )
+        gauge(
+            "pyvin_upstream_concurrency_limit",
+            "Current adaptive concurrency limit",
+            stats.limiter.limit,
+        )
+    if stats.breaker is not None:
+        gauge(
+            "pyvin_breaker_open",
+            "1 while the circuit breaker rejects upstream requests",
+            int(stats.breaker.state == "open"),
+        )
+        counter(
+            "pyvin_breaker_rejected_total",
+            "Requests rejected by the open circuit breaker",
+            stats.breaker.rejected,
+        )
+    if stats.hedge is not None:
+        counter(
+            "pyvin_hedged_requests_total",
+            "Duplicate requests sent for slow attempts",
+            stats.hedge.hedged,
+        )
+    return result
+
+
+def track_client(registry: MetricsRegistry, client: Any, name: str) -> None:
+    """
+    Expose a client's stats() in registry at every scrape.
+
+    The client is held weakly, and tracking another client under the same
+    name replaces it.
+    """
+    ref = weakref.ref(client)
+
+    def collect() -> Iterable[MetricFamily]:
+        tracked = ref()
+        return stats_families(name, tracked.stats()) if tracked is not None else []
+
+    registry.register_collector(f"client:{name}", collect)
+
+
+class ClientMetrics:
+    """
+    Metrics for one decode client.
+
+    Pass one to a client (VINDecoderClient(metrics=ClientMetrics())) to
+    count decoded VINs by outcome and error class, and to record the
+    latency and response size of every upstream request. Cache hits,
+    misses and evictions per tier, requests in flight and circuit breaker
+    state are read from the client's stats() at each scrape. All series
+    carry a client label, so several clients can share a registry.
+
+    Args:
+        registry: Registry to record into (the process-wide one by default)
+        name: Value of the client label
+    """
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY, name: str = "default"):
+        self.registry = registry
+        self.name = name
+        self.decodes = registry.counter(
+            "pyvin_decodes_total",
+            "Decoded VINs by outcome (ok or error) and error class",
+            ("client", "outcome", "error"),
+        )
+        self.upstream_latency = registry.histogram(
+            "pyvin_upstream_request_seconds",
+            "Upstream request latency by endpoint and HTTP status",
+            ("client", "endpoint", "status"),
+            TIMING_BUCKETS,
+        )
+        self.payload_size = registry.histogram(
+            "pyvin_upstream_response_bytes",
+            "Upstream response body size by endpoint",
+            ("client", "endpoint"),
+            PAYLOAD_BUCKETS,
+        )
+
+    def bind(self, client: Any) -> None:
+        """Expose the client's component statistics (called by the client)"""
+        track_client(self.registry, client, self.name)
+
+    def decoded(self, outcome: object) -> None:
+        """Count one decoded VIN: a result or the exception it raised"""
+        if isinstance(outcome, BaseException):
+            self.decodes.inc(
+                client=self.name, outcome="error", error=type(outcome).__name__
+            )
+        else:
+            self.decodes.inc(client=self.name, outcome="ok", error="")
+
+    def decoded_many(self, outcomes: Iterable[object]) -> None:
+        for outcome in outcomes:
+            self.decoded(outcome)
+
+    def upstream(self, method: str, response: Optional[Any], seconds: float) -> None:
+        """
+        Record one upstream attempt.
+
+        Args:
+            method: HTTP method (GET for single decodes, POST for batches)
+            response: The requests or httpx response (None if none arrived)
+            seconds: Time from sending the request to the end of the body
+        """
+        endpoint = _endpoint(method)
+        status = str(response.status_code) if response is not None else "error"
+        self.upstream_latency.observe(
+            seconds, client=self.name, endpoint=endpoint, status=status
+        )
+        if response is not None:
+            self.payload_size.observe(
+                len(response.content), client=self.name, endpoint=endpoint
+            )
+
+
+__all__ = ["ClientMetrics", "stats_families", "track_client"]
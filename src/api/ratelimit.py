@@ -0,0 +1,234 @@
+"""Token-bucket rate limiting with adaptive (AIMD) concurrency."""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from src.config import (
+    MAX_CONCURRENCY,
+    RATE_BURST,
+    RATE_DECREASE_FACTOR,
+    RATE_LIMIT,
+)
+
+
+def is_overload_status(status: int) -> bool:
+    """Whether an HTTP status means the upstream is shedding load"""
+    return status == 429 or status >= 500
+
+
+@dataclass
+class LimiterStats:
+    """Snapshot of a rate limiter's state"""
+
+    rate: Optional[float]  # token refill rate in requests/s (None: unlimited)
+    limit: int  # current concurrency limit
+    max_limit: int  # ceiling the limit grows back to
+    in_flight: int  # requests holding a permit
+    queued: int  # callers waiting for a permit
+    decreases: int  # multiplicative decreases since creation
+
+
+class _AIMDState:
+    """
+    Token bucket plus an additive-increase/multiplicative-decrease limit.
+
+    Pure bookkeeping shared by the thread and asyncio limiters; callers
+    hold the limiter's lock. The limit grows by 1/limit per success (one
+    per window of successful requests) and is multiplied by decrease_factor
+    on overload. Overloads only count once per window: a request admitted
+    before the last decrease cannot decrease the limit again, so a burst of
+    failures from one congestion event halves the limit once, not per
+    failure.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float],
+        burst: Optional[int],
+        max_concurrency: int,
+        min_concurrency: int,
+        decrease_factor: float,
+        clock: Callable[[], float],
+    ):
+        if max_concurrency < 1 or not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError("need 1 <= min_concurrency <= max_concurrency")
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive (or None for unlimited)")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate or 1))
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.decrease_factor = decrease_factor
+        self.clock = clock
+        self.limit = float(max_concurrency)
+        self.tokens = float(self.burst)
+        self.updated = clock()
+        self.in_flight = 0
+        self.queued = 0
+        self.decreases = 0
+        self.generation = 0
+
+    def _refill(self, now: float) -> None:
+        if self.rate is not None:
+            elapsed = now - self.updated
+            self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+        self.updated = now
+
+    def try_acquire(self) -> Optional[float]:
+        """
+        Take a permit if one is available.
+
+        Returns:
+            None if acquired, otherwise seconds until a token accrues (0.0
+            when waiting on a concurrency slot instead)
+        """
+        self._refill(self.clock())
+        if self.in_flight >= int(self.limit):
+            return 0.0
+        if self.rate is not None and self.tokens < 1:
+            return (1 - self.tokens) / self.rate
+        if self.rate is not None:
+            self.tokens -= 1
+        self.in_flight += 1
+        return None
+
+    def release(self, generation: int, overloaded: bool) -> None:
+        self.in_flight -= 1
+        if not overloaded:
+            self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+        elif generation == self.generation:
+            self.limit = max(self.min_concurrency, self.limit * self.decrease_factor)
+            self.decreases += 1
+            self.generation += 1
+
+    def stats(self) -> LimiterStats:
+        return LimiterStats(
+            rate=self.rate,
+            limit=int(self.limit),
+            max_limit=self.max_concurrency,
+            in_flight=self.in_flight,
+            queued=self.queued,
+            decreases=self.decreases,
+        )
+
+
+class RateLimiter:
+    """
+    Thread-safe rate and concurrency limiter for the synchronous client.
+
+    Share one instance between clients to give them a common budget. Wrap
+    each upstream request in acquire()/release(), reporting whether the
+    upstream signalled overload (429, 5xx or a timeout).
+
+    Args:
+        rate: Sustained requests per second (None for no rate limit)
+        burst: Tokens available at once (defaults to one second of rate)
+        max_concurrency: Upper bound for the adaptive concurrency limit
+        min_concurrency: Lower bound for the adaptive concurrency limit
+        decrease_factor: Multiplier applied to the limit on overload
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = RATE_LIMIT,
+        burst: Optional[int] = RATE_BURST,
+        max_concurrency: int = MAX_CONCURRENCY,
+        min_concurrency: int = 1,
+        decrease_factor: float = RATE_DECREASE_FACTOR,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._state = _AIMDState(
+            rate, burst, max_concurrency, min_concurrency, decrease_factor, clock
+        )
+        self._cond = threading.Condition()
+
+    def acquire(self) -> int:
+        """
+        Block until a request may be sent.
+
+        Returns:
+            Ticket to pass to release()
+        """
+        with self._cond:
+            self._state.queued += 1
+            try:
+                while True:
+                    wait = self._state.try_acquire()
+                    if wait is None:
+                        return self._state.generation
+                    self._cond.wait(wait or None)
+            finally:
+                self._state.queued -= 1
+
+    def release(self, ticket: int, overloaded: bool = False) -> None:
+        """Return a permit, adjusting the concurrency limit"""
+        with self._cond:
+            self._state.release(ticket, overloaded)
+            self._cond.notify_all()
+
+    def stats(self) -> LimiterStats:
+        with self._cond:
+            return self._state.stats()
+
+
+class AsyncRateLimiter:
+    """
+    Rate and concurrency limiter for asyncio clients.
+
+    Same behaviour and arguments as RateLimiter, for use within one event
+    loop.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = RATE_LIMIT,
+        burst: Optional[int] = RATE_BURST,
+        max_concurrency: int = MAX_CONCURRENCY,
+        min_concurrency: int = 1,
+        decrease_factor: float = RATE_DECREASE_FACTOR,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._state = _AIMDState(
+            rate, burst, max_concurrency, min_concurrency, decrease_factor, clock
+        )
+        self._cond: Optional[asyncio.Condition] = None
+
+    async def acquire(self) -> int:
+        """Wait until a request may be sent; returns a ticket for release()"""
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        async with self._cond:
+            self._state.queued += 1
+            try:
+                while True:
+                    wait = self._state.try_acquire()
+                    if wait is None:
+                        return self._state.generation
+                    try:
+                        await asyncio.wait_for(self._cond.wait(), wait or None)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                self._state.queued -= 1
+
+    async def release(self, ticket: int, overloaded: bool = False) -> None:
+        """Return a permit, adjusting the concurrency limit"""
+        self._state.release(ticket, overloaded)
+        async with self._cond:
+            self._cond.notify_all()
+
+    def stats(self) -> LimiterStats:
+        return self._state.stats()
+
+
+__all__ = [
+    "AsyncRateLimiter",
+    "LimiterStats",
+    "RateLimiter",
+    "is_overload_status",
+]
@@ -0,0 +1,229 @@
+"""Input normalization, parsing and error classification of vPIC results."""
+
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from src.api.lean import ALIASES, FIELDS, LeanResult
+from src.api.models import VINDecodeResult
+from src.config import BATCH_SIZE
+from src.exceptions import APIError, VINDecoderError
+from src.validation.vin import validate_and_normalize_vin
+
+RawResult = Dict[str, Any]
+# decode_batch results: the default model, or a lean / raw result_type
+Outcome = Union[VINDecodeResult, LeanResult, RawResult, VINDecoderError]
+Builder = Callable[[RawResult], Any]
+
+
+def is_critical_error_code(error_code: Optional[str]) -> bool:
+    """Whether a vPIC ErrorCode (e.g. "400" or "1,11,14") starts with a 400+ code"""
+    try:
+        return int(error_code.split()[0].split(",")[0]) >= 400
+    except (AttributeError, IndexError, ValueError):
+        return False
+
+
+def raise_for_error_code(result: Union[VINDecodeResult, LeanResult]) -> None:
+    """
+    Raise APIError if the result carries a critical NHTSA error code.
+
+    Error codes 0-99 are warnings and are left on the result; 400+ are critical.
+    """
+    if not result.error_code:
+        return
+    try:
+        error_code_int = int(
+            result.error_code.split()[0].split(",")[0]
+        )  # Handle "1,11,14" format
+        if error_code_int >= 400:
+            # Critical error - raise exception
+            msg = f"API Error: {result.error_text}"
+            if result.suggested_vin:
+                msg += f"\nSuggested VIN: {result.suggested_vin}"
+            if result.possible_values:
+                msg += f"\nPossible values: {result.possible_values}"
+            raise APIError(msg, result.error_code)
+        # else: warning codes (0-99) - return result with warnings in error_text
+    except (ValueError, AttributeError):
+        # If we can't parse error code, treat error_code "0" as success
+        if result.error_code != "0":
+            # Unknown error format - raise to be safe
+            raise APIError(f"API Error: {result.error_text}", result.error_code)
+
+
+def build_result(raw: RawResult) -> VINDecodeResult:
+    """Build a VINDecodeResult from a raw vPIC result, applying error classification"""
+    result = VINDecodeResult(**raw)
+    raise_for_error_code(result)
+    return result
+
+
+def build_lean(raw: RawResult) -> LeanResult:
+    """Build a LeanResult (no Pydantic validation), applying error classification"""
+    result = LeanResult(raw)
+    raise_for_error_code(result)
+    return result
+
+
+def _classify_raw(raw: RawResult) -> None:
+    """Apply error classification to a raw vPIC result"""
+    if raw.get("ErrorCode") not in (None, "", "0"):
+        raise_for_error_code(LeanResult(raw))
+
+
+def build_raw(raw: RawResult) -> RawResult:
+    """
+    Copy of the raw vPIC result, applying error classification.
+
+    The raw result is usually a cache entry shared by every later decode
+    of the VIN, so callers get their own dict to change.
+    """
+    _classify_raw(raw)
+    return dict(raw)
+
+
+# decode_batch result_type -> builder
+RESULT_TYPES: Dict[str, Builder] = {
+    "model": build_result,
+    "lean": build_lean,
+    "raw": build_raw,
+}
+
+
+# Result type -> constructor from a projected raw result (no error checks)
+_PROJECTED: Dict[str, Builder] = {
+    "model": lambda subset: VINDecodeResult(**subset),
+    "lean": LeanResult,
+    "raw": lambda subset: subset,
+}
+
+# VINDecodeResult field name -> vPIC key
+FIELD_ALIASES: Dict[str, str] = dict(zip(FIELDS, ALIASES))
+
+
+def projection(fields: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Validate the field names of a fields= projection.
+
+    Raises:
+        ValueError: A name is not a VINDecodeResult field
+    """
+    fields = tuple(fields)
+    unknown = [name for name in fields if name not in FIELD_ALIASES]
+    if unknown:
+        raise ValueError(f"Unknown VINDecodeResult fields: {', '.join(unknown)}")
+    return fields
+
+
+def result_builder(
+    result_type: str = "model", fields: Optional[Iterable[str]] = None
+) -> Builder:
+    """
+    Builder for a result_type, optionally projected onto some fields.
+
+    A projected builder classifies errors on the full raw result, then
+    keeps only the vPIC keys of the requested fields, so the result skips
+    parsing and holding everything else. The raw result itself (e.g. the
+    cache entry) is left whole.
+
+    Raises:
+        ValueError: Unknown result_type or field name
+    """
+    if result_type not in RESULT_TYPES:
+        raise ValueError(f"result_type must be one of {', '.join(RESULT_TYPES)}")
+    if fields is None:
+        return RESULT_TYPES[result_type]
+    aliases = [FIELD_ALIASES[name] for name in projection(fields)]
+    make = _PROJECTED[result_type]
+
+    def build_projected(raw: RawResult) -> Any:
+        _classify_raw(raw)
+        return make({key: raw[key] for key in aliases if key in raw})
+
+    return build_projected
+
+
+def raw_from_response(data: Dict[str, Any]) -> RawResult:
+    """Extract the raw result from a single-VIN endpoint response body"""
+    if not data.get("Results"):
+        raise APIError("No results returned from API")
+
+    return data["Results"][0]
+
+
+def index_batch_results(results: List[RawResult]) -> Dict[str, RawResult]:
+    """Key raw batch results by (uppercased) VIN"""
+    return {(raw.get("VIN") or "").upper(): raw for raw in results}
+
+
+def decode_chunk(
+    vins: List[str], raw_by_vin: Mapping[str, RawResult], build: Builder = build_result
+) -> Dict[str, Outcome]:
+    """Build the outcome for each VIN from its raw result, collecting APIErrors"""
+    decoded: Dict[str, Outcome] = {}
+    for vin in vins:
+        try:
+            raw = raw_by_vin.get(vin)
+            if raw is None:
+                raise APIError(f"No results returned from API for VIN {vin}")
+            decoded[vin] = build(raw)
+        except APIError as e:
+            decoded[vin] = e
+    return decoded
+
+
+def raise_first_error(decoded: Dict[str, Outcome], return_exceptions: bool) -> None:
+    """Raise the first failure in decoded unless failures are returned in place"""
+    if return_exceptions:
+        return
+    for outcome in decoded.values():
+        if isinstance(outcome, VINDecoderError):
+            raise outcome
+
+
+def normalize_many(
+    vins: Iterable[str], return_exceptions: bool, strict: bool = False
+) -> List[Union[str, VINDecoderError]]:
+    """Validate and normalize VINs, keeping failures in place if requested"""
+    outcomes: List[Union[str, VINDecoderError]] = []
+    for vin in vins:
+        try:
+            outcomes.append(validate_and_normalize_vin(vin, strict))
+        except VINDecoderError as e:
+            if not return_exceptions:
+                raise
+            outcomes.append(e)
+    return outcomes
+
+
+def distinct(outcomes: List[Union[str, VINDecoderError]]) -> List[str]:
+    """Distinct normalized VINs in first-seen order"""
+    # dict preserves first-seen order; duplicates cost a single lookup
+    return list(dict.fromkeys(o for o in outcomes if isinstance(o, str)))
+
+
+def chunked(vins: List[str]) -> List[List[str]]:
+    """Split VINs into batch-endpoint sized chunks"""
+    return [vins[i : i + BATCH_SIZE] for i in range(0, len(vins), BATCH_SIZE)]
+
+
+__all__ = [
+    "Builder",
+    "FIELD_ALIASES",
+    "Outcome",
+    "RESULT_TYPES",
+    "RawResult",
+    "build_lean",
+    "build_raw",
+    "build_result",
+    "chunked",
+    "decode_chunk",
+    "distinct",
+    "projection",
+    "index_batch_results",
+    "is_critical_error_code",
+    "normalize_many",
+    "raise_first_error",
+    "raise_for_error_code",
+    "raw_from_response",
+    "result_builder",
+]
@@ -0,0 +1,76 @@
+"""Retry policy with capped exponential backoff and full jitter."""
+
+import random
+from dataclasses import dataclass, field
+from typing import Callable, FrozenSet, Optional
+
+from src.config import MAX_RETRIES, RETRY_BACKOFF, RETRY_MAX_BACKOFF
+from src.exceptions import NetworkError
+
+
+class TransientError(NetworkError):
+    """A failed attempt that the retry policy may retry"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    When and how long to wait before retrying an upstream request.
+
+    Shared by the sync and async clients. Only transient failures are
+    retried: connection errors, timeouts and the statuses in statuses. Both
+    vPIC endpoints are read-only lookups, so the batch POST is retried too.
+
+    Delays grow as backoff * 2**attempt up to max_backoff. With jitter, each
+    delay is drawn uniformly from [0, delay] ("full jitter") so that clients
+    failing together do not retry together. A numeric Retry-After header
+    raises the delay, still capped at max_backoff.
+
+    Args:
+        retries: Retries after the first attempt (0 disables)
+        backoff: Base delay in seconds
+        max_backoff: Upper bound for one delay in seconds
+        jitter: Randomize delays
+        statuses: HTTP statuses worth retrying
+    """
+
+    retries: int = MAX_RETRIES
+    backoff: float = RETRY_BACKOFF
+    max_backoff: float = RETRY_MAX_BACKOFF
+    jitter: bool = True
+    statuses: FrozenSet[int] = frozenset({429, 502, 503, 504})
+    random: Callable[[], float] = field(default=random.random, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.retries < 0 or self.backoff < 0 or self.max_backoff < 0:
+            raise ValueError("retries, backoff and max_backoff must not be negative")
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Seconds to wait before retry number attempt + 1.
+
+        Args:
+            attempt: Zero-based number of the attempt that just failed
+            retry_after: Delay requested by the server, if any
+        """
+        delay = min(self.max_backoff, self.backoff * 2**attempt)
+        if self.jitter:
+            delay *= self.random()
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_backoff))
+        return delay
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds from a Retry-After header (HTTP dates are ignored)"""
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
+
+
+__all__ = ["RetryPolicy", "TransientError", "parse_retry_after"]
@@ -0,0 +1,57 @@
+"""Statistics snapshots reported by the decode clients."""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from src.api.breaker import BreakerStats
+from src.api.coalesce import CoalesceStats
+from src.api.hedge import HedgeStats
+from src.api.ratelimit import LimiterStats
+from src.cache.base import CacheStats
+
+if TYPE_CHECKING:
+    from src.api.breaker import CircuitBreaker
+    from src.api.cache_layers import CacheLayers
+    from src.api.coalesce import AsyncSingleFlight, SingleFlight
+    from src.api.hedge import Hedger
+    from src.api.ratelimit import AsyncRateLimiter, RateLimiter
+
+
+@dataclass
+class ClientStats:
+    """Snapshot of a decode client's counters, one field per component"""
+
+    coalesce: CoalesceStats
+    cache: Optional[CacheStats] = None
+    pattern_cache: Optional[CacheStats] = None
+    negative_cache: Optional[CacheStats] = None
+    limiter: Optional[LimiterStats] = None
+    breaker: Optional[BreakerStats] = None
+    hedge: Optional[HedgeStats] = None
+
+    @classmethod
+    def collect(
+        cls,
+        inflight: "SingleFlight | AsyncSingleFlight",
+        caches: "CacheLayers",
+        limiter: "RateLimiter | AsyncRateLimiter | None" = None,
+        breaker: "CircuitBreaker | None" = None,
+        hedge: "Hedger | None" = None,
+    ) -> "ClientStats":
+        """Gather a snapshot from a client's components"""
+        return cls(
+            coalesce=inflight.stats(),
+            cache=caches.cache.stats() if caches.cache else None,
+            pattern_cache=caches.pattern_cache.stats()
+            if caches.pattern_cache
+            else None,
+            negative_cache=(
+                caches.negative_cache.stats() if caches.negative_cache else None
+            ),
+            limiter=limiter.stats() if limiter else None,
+            breaker=breaker.stats() if breaker else None,
+            hedge=hedge.stats() if hedge else None,
+        )
+
+
+__all__ = ["ClientStats"]
@@ -0,0 +1,200 @@
+"""Per-stage timing of decode calls, with hooks and latency histograms."""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.config import TIMING_BUCKETS
+from src.exceptions import VINDecoderError
+from src.metrics.registry import Histogram, HistogramSnapshot
+
+logger = logging.getLogger("pyVIN.timing")
+
+# Stages a decode can spend time in, in pipeline order
+STAGES: Tuple[str, ...] = (
+    "validate",  # validate_and_normalize_vin
+    "cache",  # cache lookups
+    "coalesced",  # waiting for another caller's identical request
+    "queue",  # circuit breaker check and rate limiter wait
+    "connect",  # DNS, TCP and TLS setup (async client only)
+    "request",  # sending the request until response headers arrive
+    "download",  # reading the response body
+    "parse",  # JSON parsing
+    "backoff",  # sleeping between retries
+    "build",  # VINDecodeResult (Pydantic) validation
+    "error_check",  # classifying vPIC error codes
+    "store",  # cache writes
+)
+
+
+class StageTimer:
+    """
+    Stopwatch for one decode call.
+
+    mark() charges the time since the previous mark to a stage; add()
+    charges a separately measured duration and is followed by lap() so the
+    next mark does not count it twice. Concurrent hedged attempts each get
+    a child() timer and only the one whose answer is used is merge()d.
+    Stages that repeat, such as retried requests, accumulate.
+    """
+
+    __slots__ = ("vin", "cache", "stages", "started", "_last")
+
+    def __init__(self, vin: str):
+        self.vin = vin
+        self.cache = "miss"
+        self.stages: Dict[str, float] = {}
+        self.started = self._last = time.perf_counter()
+
+    def mark(self, stage: str) -> None:
+        now = time.perf_counter()
+        self.stages[stage] = self.stages.get(stage, 0.0) + now - self._last
+        self._last = now
+
+    def add(self, stage: str, seconds: float) -> None:
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def lap(self) -> None:
+        self._last = time.perf_counter()
+
+    def child(self) -> "StageTimer":
+        """Empty timer for one of several concurrent attempts"""
+        return StageTimer(self.vin)
+
+    def merge(self, other: Optional["StageTimer"]) -> None:
+        """Add the stages of a child timer, if any"""
+        if other is not None:
+            for stage, seconds in other.stages.items():
+                self.add(stage, seconds)
+
+
+def cache_outcome(cached: object) -> str:
+    """Cache outcome of a decode served from cache: a result or an API error"""
+    return "negative" if isinstance(cached, VINDecoderError) else "hit"
+
+
+@dataclass
+class DecodeTiming:
+    """Where one decode call spent its time, as passed to timing hooks"""
+
+    vin: str  # VIN as passed in
+    cache: str  # "hit", "negative" (cached API error), "coalesced" or "miss"
+    stages: Dict[str, float]  # seconds per stage (only stages it reached)
+    total: float  # seconds for the whole call
+    error: Optional[str]  # exception class name if the call failed
+    error_code: Optional[str] = None  # vPIC ErrorCode of the result or APIError
+
+
+@dataclass
+class TimingStats:
+    """Snapshot of a DecodeTimings"""
+
+    stages: Dict[str, HistogramSnapshot]  # per stage, plus "total"
+    cache: Dict[str, int]  # calls per cache outcome
+    errors: int  # calls that raised
+
+
+TimingHook = Callable[[DecodeTiming], None]
+
+
+class DecodeTimings:
+    """
+    Per-stage timing for a client's decode() calls.
+
+    Pass one to a client (VINDecoderClient(timings=DecodeTimings())) to
+    time each decode by stage and cache outcome. Every finished call is
+    added to one histogram per stage and passed to each hook; a hook that
+    raises is logged and skipped. Clients without timings skip all of
+    this, so instrumentation costs nothing when it is off.
+
+    Args:
+        hooks: Callables receiving a DecodeTiming per decode call
+        buckets: Histogram bucket upper bounds in seconds
+    """
+
+    def __init__(
+        self,
+        hooks: Iterable[TimingHook] = (),
+        buckets: Iterable[float] = TIMING_BUCKETS,
+    ):
+        self.buckets = tuple(sorted(buckets))
+        self._hooks: List[TimingHook] = list(hooks)
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Histogram] = {}
+        self._cache: Dict[str, int] = {}
+        self._errors = 0
+
+    def add_hook(self, hook: TimingHook) -> None:
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: TimingHook) -> None:
+        self._hooks.remove(hook)
+
+    def start(self, vin: str) -> StageTimer:
+        return StageTimer(vin)
+
+    def finish(
+        self,
+        timer: StageTimer,
+        error: Optional[BaseException] = None,
+        error_code: Optional[str] = None,
+    ) -> DecodeTiming:
+        """
+        Record a finished call and run the hooks.
+
+        Args:
+            timer: The call's timer from start()
+            error: Exception the call raised, if any
+            error_code: vPIC ErrorCode of the result (taken from the error
+                when it carries one)
+        """
+        if error_code is None:
+            error_code = getattr(error, "error_code", None)
+        timing = DecodeTiming(
+            vin=timer.vin,
+            cache=timer.cache,
+            stages=dict(timer.stages),
+            total=time.perf_counter() - timer.started,
+            error=type(error).__name__ if error is not None else None,
+            error_code=error_code,
+        )
+        with self._lock:
+            self._cache[timing.cache] = self._cache.get(timing.cache, 0) + 1
+            self._errors += error is not None
+            for stage in (*timing.stages, "total"):
+                if stage not in self._histograms:
+                    self._histograms[stage] = Histogram(self.buckets)
+        for stage, seconds in timing.stages.items():
+            self._histograms[stage].observe(seconds)
+        self._histograms["total"].observe(timing.total)
+        for hook in list(self._hooks):
+            try:
+                hook(timing)
+            except Exception:
+                logger.warning("Timing hook %r failed", hook, exc_info=True)
+        return timing
+
+    def snapshot(self) -> TimingStats:
+        """Histograms and counters so far"""
+        with self._lock:
+            histograms = dict(self._histograms)
+            cache = dict(self._cache)
+            errors = self._errors
+        return TimingStats(
+            stages={name: h.snapshot() for name, h in histograms.items()},
+            cache=cache,
+            errors=errors,
+        )
+
+
+__all__ = [
+    "STAGES",
+    "DecodeTiming",
+    "DecodeTimings",
+    "StageTimer",
+    "TimingHook",
+    "TimingStats",
+    "cache_outcome",
+]
@@ -0,0 +1,6 @@
+from src.cache.base import CacheStats, DecodeCache
+from src.cache.memory import MemoryCache
+from src.cache.pattern import PatternCache
+from src.cache.sqlite import SQLiteCache
+
+__all__ = ["CacheStats", "DecodeCache", "MemoryCache", "PatternCache", "SQLiteCache"]
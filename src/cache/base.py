@@ -0,0 +1,68 @@
+"""Cache interface shared by all decode cache backends."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+RawResult = Dict[str, Any]
+
+
+@dataclass
+class CacheStats:
+    """Counters describing cache effectiveness"""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 when unused)"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class DecodeCache(ABC):
+    """
+    Cache of raw vPIC results keyed by normalized VIN.
+
+    Backends store the raw result dict (not the Pydantic model) so entries
+    stay valid across model changes and can be shared between processes.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[RawResult]:
+        """Return the cached raw result, or None on a miss or expired entry"""
+
+    @abstractmethod
+    def set(self, key: str, value: RawResult) -> None:
+        """Store a raw result, evicting old entries if the cache is full"""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove an entry if present"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries and reset statistics"""
+
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache statistics"""
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, RawResult]:
+        """Return cached raw results for the keys that are present"""
+        found = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def close(self) -> None:
+        """Release any resources held by the backend"""
+
+
+__all__ = ["CacheStats", "DecodeCache", "RawResult"]
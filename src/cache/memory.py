@@ -0,0 +1,74 @@
+"""In-process LRU decode cache."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from src.cache.base import CacheStats, DecodeCache, RawResult
+from src.config import CACHE_SIZE
+
+
+class MemoryCache(DecodeCache):
+    """
+    Thread-safe in-memory LRU cache with optional TTL.
+
+    Args:
+        max_entries: Maximum number of entries kept (least recently used evicted)
+        ttl: Seconds an entry stays valid (None for no expiry)
+    """
+
+    def __init__(self, max_entries: int = CACHE_SIZE, ttl: Optional[float] = None):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, RawResult]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def get(self, key: str) -> Optional[RawResult]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            stored_at, value = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return value
+
+    def set(self, key: str, value: RawResult) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stats = CacheStats()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                expirations=self._stats.expirations,
+                size=len(self._entries),
+            )
+
+
+__all__ = ["MemoryCache"]
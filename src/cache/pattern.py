@@ -0,0 +1,80 @@
+"""Pattern-level cache sharing decodes across VINs with the same squish key."""
+
+import threading
+from typing import Optional
+
+from src.cache.base import CacheStats, DecodeCache, RawResult
+from src.cache.memory import MemoryCache
+from src.config import PATTERN_CACHE_SIZE
+from src.validation.vin import has_valid_check_digit, squish_vin
+
+
+class PatternCache(DecodeCache):
+    """
+    Cache that reuses one VIN's decode for every VIN with the same pattern.
+
+    Entries are stored under the squish key (see squish_vin) in a backend
+    cache, and returned with the VIN field swapped for the requested VIN.
+    To stay exact, only clean decodes (error code "0") are stored, and only
+    fully specified VINs with a correct check digit are served; anything
+    else misses so vPIC can report its own warnings for that VIN.
+
+    Args:
+        backend: Cache holding representative results (defaults to a MemoryCache)
+    """
+
+    def __init__(self, backend: Optional[DecodeCache] = None):
+        self.backend = backend or MemoryCache(PATTERN_CACHE_SIZE)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def key_for(vin: str) -> Optional[str]:
+        """Squish key for a normalized VIN, or None if it cannot share a decode"""
+        if not has_valid_check_digit(vin):
+            return None
+        return squish_vin(vin)
+
+    def get(self, key: str) -> Optional[RawResult]:
+        pattern = self.key_for(key)
+        raw = self.backend.get(pattern) if pattern is not None else None
+        with self._lock:
+            if raw is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        return {**raw, "VIN": key}
+
+    def set(self, key: str, value: RawResult) -> None:
+        pattern = self.key_for(key)
+        if pattern is not None and value.get("ErrorCode") == "0":
+            self.backend.set(pattern, value)
+
+    def delete(self, key: str) -> None:
+        pattern = self.key_for(key)
+        if pattern is not None:
+            self.backend.delete(pattern)
+
+    def clear(self) -> None:
+        self.backend.clear()
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> CacheStats:
+        backend = self.backend.stats()
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=backend.evictions,
+                expirations=backend.expirations,
+                size=backend.size,
+            )
+
+    def close(self) -> None:
+        self.backend.close()
+
+
+__all__ = ["PatternCache"]
@@ -0,0 +1,187 @@
+"""Persistent SQLite-backed decode cache."""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from src.cache.base import CacheStats, DecodeCache, RawResult
+from src.config import CACHE_TTL, SQLITE_CACHE_MAX_ENTRIES
+
+logger = logging.getLogger("pyVIN.cache")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS decode_cache (
+    vin TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS decode_cache_accessed_at
+    ON decode_cache (accessed_at);
+"""
+
+# SQLite's default limit on host parameters in a single statement
+_MAX_PARAMS = 999
+
+
+class SQLiteCache(DecodeCache):
+    """
+    Durable decode cache stored in a SQLite database in WAL mode.
+
+    Entries survive restarts and can be shared by several processes on the
+    same host. Expired entries are dropped on read; when the table grows past
+    max_entries the least recently accessed entries are evicted. SQLite
+    errors are logged and treated as misses so a broken cache never breaks
+    decoding.
+
+    Args:
+        path: Database file path (":memory:" for a private in-memory database)
+        ttl: Seconds an entry stays valid (None for no expiry)
+        max_entries: Maximum number of entries kept (None for unbounded)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: Optional[float] = CACHE_TTL,
+        max_entries: Optional[int] = SQLITE_CACHE_MAX_ENTRIES,
+    ):
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._size = self._count()
+
+    def _count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM decode_cache").fetchone()[0]
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl is not None and now - created_at > self.ttl
+
+    def get(self, key: str) -> Optional[RawResult]:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, RawResult]:
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, RawResult] = {}
+        now = time.time()
+        with self._lock:
+            try:
+                expired = []
+                for start in range(0, len(keys), _MAX_PARAMS):
+                    chunk = keys[start : start + _MAX_PARAMS]
+                    marks = ",".join("?" * len(chunk))
+                    rows = self._conn.execute(
+                        "SELECT vin, payload, created_at FROM decode_cache "
+                        f"WHERE vin IN ({marks})",
+                        chunk,
+                    ).fetchall()
+                    for vin, payload, created_at in rows:
+                        if self._is_expired(created_at, now):
+                            expired.append(vin)
+                        else:
+                            found[vin] = json.loads(payload)
+                with self._conn:
+                    if found:
+                        self._conn.executemany(
+                            "UPDATE decode_cache SET accessed_at = ? WHERE vin = ?",
+                            [(now, vin) for vin in found],
+                        )
+                    if expired:
+                        self._conn.executemany(
+                            "DELETE FROM decode_cache WHERE vin = ?",
+                            [(vin,) for vin in expired],
+                        )
+                        self._size -= len(expired)
+            except sqlite3.Error as e:
+                logger.warning("SQLite cache read failed: %s", e)
+                found = {}
+                expired = []
+            self._stats.hits += len(found)
+            self._stats.misses += len(keys) - len(found)
+            self._stats.expirations += len(expired)
+        return found
+
+    def set(self, key: str, value: RawResult) -> None:
+        now = time.time()
+        payload = json.dumps(value, separators=(",", ":"))
+        with self._lock:
+            try:
+                with self._conn:
+                    inserted = self._conn.execute(
+                        "INSERT OR IGNORE INTO decode_cache VALUES (?, ?, ?, ?)",
+                        (key, payload, now, now),
+                    ).rowcount
+                    if not inserted:
+                        self._conn.execute(
+                            "UPDATE decode_cache "
+                            "SET payload = ?, created_at = ?, accessed_at = ? "
+                            "WHERE vin = ?",
+                            (payload, now, now, key),
+                        )
+                    self._size += inserted
+                    if self.max_entries is not None and self._size > self.max_entries:
+                        self._evict()
+            except sqlite3.Error as e:
+                logger.warning("SQLite cache write failed: %s", e)
+
+    def _evict(self) -> None:
+        """Evict least recently accessed entries down to max_entries"""
+        # Other processes may share the file, so re-count before evicting
+        self._size = self._count()
+        excess = self._size - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM decode_cache WHERE vin IN ("
+                "SELECT vin FROM decode_cache ORDER BY accessed_at LIMIT ?)",
+                (excess,),
+            )
+            self._size -= excess
+            self._stats.evictions += excess
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            try:
+                with self._conn:
+                    self._size -= self._conn.execute(
+                        "DELETE FROM decode_cache WHERE vin = ?", (key,)
+                    ).rowcount
+            except sqlite3.Error as e:
+                logger.warning("SQLite cache delete failed: %s", e)
+
+    def clear(self) -> None:
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute("DELETE FROM decode_cache")
+                self._size = 0
+            except sqlite3.Error as e:
+                logger.warning("SQLite cache clear failed: %s", e)
+            self._stats = CacheStats()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                expirations=self._stats.expirations,
+                size=self._size,
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+__all__ = ["SQLiteCache"]
@@ -0,0 +1,5 @@
+import sys
+
+from src.cli.main import main
+
+sys.exit(main())
@@ -0,0 +1,53 @@
+"""Resumable progress markers for long-running decode jobs."""
+
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass
+class Checkpoint:
+    """
+    How far a decode job got: input rows written and the writer's position.
+
+    Saved atomically next to the output, so a job killed at any point
+    resumes from the last saved state without decoding those rows again.
+    """
+
+    path: str
+    input: str
+    output: str
+    rows: int = 0
+    writer: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["Checkpoint"]:
+        """Read a checkpoint, or None if there is none at path"""
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        return cls(path=path, **data)
+
+    def save(self) -> None:
+        """Write the checkpoint atomically (write a temp file, then rename)"""
+        data = asdict(self)
+        del data["path"]
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+    def remove(self) -> None:
+        """Delete the checkpoint once the job has finished"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+__all__ = ["Checkpoint"]
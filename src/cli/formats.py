@@ -0,0 +1,260 @@
+"""Streaming VIN readers and result writers for the pyvin CLI."""
+
+import csv
+import io
+import json
+import os
+import sys
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = pq = None
+
+from src.api.models import VINDecodeResult
+from src.formatting.response import result_row
+
+STDIO = "-"
+PARQUET_ROW_GROUP = 10_000  # rows buffered per Parquet part file
+
+# Every output row: the VIN as given, the failure (if any), then the result
+COLUMNS = ["input", "error", *VINDecodeResult.model_fields]
+
+Row = Dict[str, Optional[str]]
+
+
+def output_columns(fields: Optional[Sequence[str]] = None) -> List[str]:
+    """Columns of rows restricted to fields, or all of COLUMNS"""
+    return list(COLUMNS) if fields is None else ["input", "error", *fields]
+
+
+def detect_format(path: str, choices: List[str], default: str) -> str:
+    """Format named by the file extension, or default"""
+    ext = os.path.splitext(path)[1].lstrip(".").lower()
+    ext = {"ndjson": "jsonl", "txt": "text"}.get(ext, ext)
+    return ext if ext in choices else default
+
+
+def read_vins(path: str, fmt: str, column: str) -> Iterator[str]:
+    """
+    Stream VINs from a file (or stdin for "-"), one per input row.
+
+    Args:
+        path: Input file, or "-" for stdin
+        fmt: "text" (one VIN per line), "csv" or "jsonl"
+        column: CSV column or JSON key holding the VIN (case-insensitive)
+    """
+    f = sys.stdin if path == STDIO else open(path, newline="", encoding="utf-8")
+    try:
+        if fmt == "text":
+            for line in f:
+                yield line.rstrip("\r\n")
+        elif fmt == "csv":
+            reader = csv.reader(f)
+            header = next(reader, [])
+            index = _find_column(header, column)
+            for record in reader:
+                yield record[index] if index < len(record) else ""
+        else:
+            key = None
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if key is None:
+                    key = list(record)[_find_column(list(record), column)]
+                value = record.get(key)
+                # Numbers and other JSON values become error rows, not crashes
+                yield "" if value is None else str(value)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def _find_column(names: List[str], column: str) -> int:
+    lowered = [name.strip().lower() for name in names]
+    try:
+        return lowered.index(column.lower())
+    except ValueError:
+        raise ValueError(f"Input has no {column!r} column (found: {names})")
+
+
+class RowWriter(ABC):
+    """
+    Incremental output sink.
+
+    checkpoint() makes everything written so far durable and returns the
+    state needed to reopen the output at exactly that point.
+    """
+
+    @abstractmethod
+    def write(self, rows: List[Row]) -> None:
+        """Append rows"""
+
+    @abstractmethod
+    def checkpoint(self) -> Dict[str, int]:
+        """Persist written rows and return the resume state"""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Flush and close the output"""
+
+
+class _TextRowWriter(RowWriter):
+    """Line-oriented file writer that resumes by truncating to a byte offset"""
+
+    def __init__(
+        self,
+        path: str,
+        state: Optional[Dict[str, int]] = None,
+        columns: Sequence[str] = COLUMNS,
+    ):
+        self.columns = list(columns)
+        self._stdout = path == STDIO
+        if self._stdout:
+            self._f = sys.stdout
+        elif state:
+            self._f = open(path, "r+", newline="", encoding="utf-8")
+            self._f.truncate(state["offset"])
+            self._f.seek(state["offset"])
+            return
+        else:
+            self._f = open(path, "w", newline="", encoding="utf-8")
+        self._start()
+
+    def _start(self) -> None:
+        """Write any preamble to a new output"""
+
+    def checkpoint(self) -> Dict[str, int]:
+        self._f.flush()
+        if self._stdout:
+            return {}
+        os.fsync(self._f.fileno())
+        return {"offset": self._f.tell()}
+
+    def close(self) -> None:
+        self._f.flush()
+        if not self._stdout:
+            self._f.close()
+
+
+class CSVRowWriter(_TextRowWriter):
+    """CSV with a header row and one column per entry of columns"""
+
+    def __init__(
+        self,
+        path: str,
+        state: Optional[Dict[str, int]] = None,
+        columns: Sequence[str] = COLUMNS,
+    ):
+        super().__init__(path, state, columns)
+        self._csv = csv.DictWriter(self._f, self.columns, extrasaction="ignore")
+
+    def _start(self) -> None:
+        csv.DictWriter(self._f, self.columns).writeheader()
+
+    def write(self, rows: List[Row]) -> None:
+        self._csv.writerows(rows)
+
+
+class JSONLRowWriter(_TextRowWriter):
+    """One JSON object per line"""
+
+    def write(self, rows: List[Row]) -> None:
+        buf = io.StringIO()
+        for row in rows:
+            buf.write(json.dumps(row, separators=(",", ":")))
+            buf.write("\n")
+        self._f.write(buf.getvalue())
+
+
+class ParquetRowWriter(RowWriter):
+    """
+    Parquet dataset directory of part files.
+
+    Rows are buffered and written as a new part once row_group rows are
+    waiting, and at every checkpoint, so memory stays bounded whether or
+    not the job checkpoints. Resuming drops parts written after the last
+    saved checkpoint.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        state: Optional[Dict[str, int]] = None,
+        row_group: int = PARQUET_ROW_GROUP,
+        columns: Sequence[str] = COLUMNS,
+    ):
+        if row_group < 1:
+            raise ValueError("row_group must be at least 1")
+        if pa is None:  # pragma: no cover - optional dependency
+            raise ImportError(
+                "Parquet output requires pyarrow: pip install 'pyVIN-UI[parquet]'"
+            )
+        self.path = path
+        self.row_group = row_group
+        self.columns = list(columns)
+        self._parts = state["parts"] if state else 0
+        self._rows: List[Row] = []
+        self._schema = pa.schema([(name, pa.string()) for name in self.columns])
+        os.makedirs(path, exist_ok=True)
+        for name in os.listdir(path):
+            if name.startswith("part-") and self._part_index(name) >= self._parts:
+                os.remove(os.path.join(path, name))
+
+    @staticmethod
+    def _part_index(name: str) -> int:
+        return int(name[len("part-") :].split(".")[0])
+
+    def write(self, rows: List[Row]) -> None:
+        self._rows.extend(rows)
+        if len(self._rows) >= self.row_group:
+            self._flush()
+
+    def checkpoint(self) -> Dict[str, int]:
+        self._flush()
+        return {"parts": self._parts}
+
+    def _flush(self) -> None:
+        """Write the buffered rows as the next part file"""
+        if self._rows:
+            columns = {
+                name: [_as_text(row.get(name)) for row in self._rows]
+                for name in self.columns
+            }
+            table = pa.table(columns, schema=self._schema)
+            part = os.path.join(self.path, f"part-{self._parts:05d}.parquet")
+            pq.write_table(table, part)
+            self._parts += 1
+            self._rows = []
+
+    def close(self) -> None:
+        self.checkpoint()
+
+
+def _as_text(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+WRITERS = {
+    "csv": CSVRowWriter,
+    "jsonl": JSONLRowWriter,
+    "parquet": ParquetRowWriter,
+}
+
+__all__ = [
+    "COLUMNS",
+    "PARQUET_ROW_GROUP",
+    "WRITERS",
+    "CSVRowWriter",
+    "JSONLRowWriter",
+    "ParquetRowWriter",
+    "RowWriter",
+    "detect_format",
+    "output_columns",
+    "read_vins",
+    "result_row",
+]
@@ -0,0 +1,317 @@
+"""pyvin command line interface."""
+
+import argparse
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Deque, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from src.api.backend import DecoderBackend
+from src.api.client import VINDecoderClient
+from src.api.results import Outcome, projection
+from src.cache.memory import MemoryCache
+from src.cache.sqlite import SQLiteCache
+from src.cli.checkpoint import Checkpoint
+from src.cli.formats import (
+    PARQUET_ROW_GROUP,
+    STDIO,
+    WRITERS,
+    RowWriter,
+    detect_format,
+    output_columns,
+    read_vins,
+    result_row,
+)
+from src.config import (
+    BATCH_SIZE,
+    CACHE_SIZE,
+    MAX_CONCURRENCY,
+    NEGATIVE_CACHE_SIZE,
+    NEGATIVE_CACHE_TTL,
+    NHTSA_BASE_URL,
+)
+from src.exceptions import NetworkError
+
+CHECKPOINT_EVERY = 10_000  # rows between checkpoints
+PROGRESS_INTERVAL = 5.0  # seconds between progress lines
+
+
+class Progress:
+    """Periodic progress and throughput lines on stderr"""
+
+    def __init__(
+        self,
+        stream: TextIO,
+        interval: float = PROGRESS_INTERVAL,
+        start_row: int = 0,
+    ):
+        self.stream = stream
+        self.interval = interval
+        self.start_row = start_row
+        self.rows = start_row
+        self.errors = 0
+        self._started = self._last = time.monotonic()
+
+    def update(self, rows: int, errors: int) -> None:
+        self.rows += rows
+        self.errors += errors
+        now = time.monotonic()
+        if now - self._last >= self.interval:
+            self._last = now
+            self._report(now)
+
+    def finish(self) -> None:
+        self._report(time.monotonic(), done=True)
+
+    def _report(self, now: float, done: bool = False) -> None:
+        elapsed = now - self._started
+        decoded = self.rows - self.start_row
+        rate = decoded / elapsed if elapsed > 0 else 0.0
+        label = "done" if done else "rows"
+        print(
+            f"{label} {self.rows:,} | {rate:,.0f} rows/s | errors {self.errors:,} "
+            f"| {elapsed:,.1f}s",
+            file=self.stream,
+            flush=True,
+        )
+
+
+def _blocks(vins: Iterator[str], size: int) -> Iterator[List[str]]:
+    while True:
+        block = list(islice(vins, size))
+        if not block:
+            return
+        yield block
+
+
+def decode_stream(
+    backend: DecoderBackend,
+    vins: Iterator[str],
+    writer: RowWriter,
+    checkpoint: Optional[Checkpoint] = None,
+    batch_size: int = BATCH_SIZE,
+    concurrency: int = MAX_CONCURRENCY,
+    checkpoint_every: int = CHECKPOINT_EVERY,
+    progress: Optional[Progress] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> int:
+    """
+    Decode a stream of VINs into writer with bounded memory.
+
+    Batches of batch_size VINs are decoded on concurrency threads. At most
+    2 * concurrency batches are in flight and results are written in input
+    order, so memory does not grow with the input. Invalid VINs and API
+    errors become error rows; a network error stops the job, leaving the
+    last checkpoint in place so the job can be resumed. With fields, only
+    those result fields are decoded and written.
+
+    Returns:
+        Number of rows written by this call
+    """
+    written = since_checkpoint = 0
+    pending: Deque[Tuple[List[str], Future]] = deque()
+
+    def drain_one() -> None:
+        nonlocal written, since_checkpoint
+        block, future = pending.popleft()
+        outcomes: List[Outcome] = future.result()
+        failed = next((o for o in outcomes if isinstance(o, NetworkError)), None)
+        if failed is not None:
+            raise failed
+        writer.write([result_row(v, o, fields) for v, o in zip(block, outcomes)])
+        written += len(block)
+        since_checkpoint += len(block)
+        if progress is not None:
+            progress.update(
+                len(block), sum(1 for o in outcomes if isinstance(o, Exception))
+            )
+        if checkpoint is not None and since_checkpoint >= checkpoint_every:
+            save_checkpoint()
+
+    def save_checkpoint() -> None:
+        nonlocal since_checkpoint
+        checkpoint.writer = writer.checkpoint()
+        checkpoint.rows += since_checkpoint
+        checkpoint.save()
+        since_checkpoint = 0
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        try:
+            for block in _blocks(vins, batch_size):
+                future = pool.submit(backend.decode_batch, block, True, "model", fields)
+                pending.append((block, future))
+                if len(pending) >= 2 * concurrency:
+                    drain_one()
+            while pending:
+                drain_one()
+        except BaseException:
+            for _, future in pending:
+                future.cancel()
+            raise
+    if checkpoint is not None and since_checkpoint:
+        save_checkpoint()
+    return written
+
+
+def _build_backend(args: argparse.Namespace) -> DecoderBackend:
+    if args.offline:
+        from src.offline import OfflineDecoder
+
+        return OfflineDecoder(args.offline, strict=args.strict)
+    cache = SQLiteCache(args.cache) if args.cache else MemoryCache(CACHE_SIZE)
+    return VINDecoderClient(
+        base_url=args.base_url,
+        pool_size=args.concurrency,
+        cache=cache,
+        negative_cache=MemoryCache(NEGATIVE_CACHE_SIZE, ttl=NEGATIVE_CACHE_TTL),
+        strict=args.strict,
+    )
+
+
+def _decode_command(args: argparse.Namespace) -> int:
+    input_format = args.input_format or detect_format(
+        args.input, ["text", "csv", "jsonl"], "text"
+    )
+    output_format = args.output_format or detect_format(
+        args.output, list(WRITERS), "jsonl"
+    )
+    if args.output == STDIO and output_format == "parquet":
+        print("pyvin: parquet output needs a directory path", file=sys.stderr)
+        return 2
+
+    checkpoint = None
+    if args.output != STDIO and not args.no_checkpoint:
+        path = args.checkpoint or f"{args.output}.checkpoint"
+        checkpoint = Checkpoint.load(path)
+        if checkpoint is not None and (
+            checkpoint.input != args.input or checkpoint.output != args.output
+        ):
+            print(
+                f"pyvin: checkpoint {path} belongs to another job "
+                f"({checkpoint.input} -> {checkpoint.output})",
+                file=sys.stderr,
+            )
+            return 2
+        if checkpoint is not None:
+            print(f"Resuming after row {checkpoint.rows:,}", file=sys.stderr)
+        else:
+            checkpoint = Checkpoint(path, input=args.input, output=args.output)
+
+    state = checkpoint.writer if checkpoint and checkpoint.rows else None
+    skip = checkpoint.rows if checkpoint else 0
+    vins = islice(read_vins(args.input, input_format, args.column), skip, None)
+    progress = (
+        None
+        if args.quiet
+        else Progress(sys.stderr, args.progress_interval, start_row=skip)
+    )
+
+    backend = _build_backend(args)
+    options = {"row_group": args.row_group} if output_format == "parquet" else {}
+    columns = output_columns(args.fields)
+    writer = WRITERS[output_format](args.output, state, columns=columns, **options)
+    try:
+        decode_stream(
+            backend,
+            vins,
+            writer,
+            checkpoint,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+            checkpoint_every=args.checkpoint_every,
+            progress=progress,
+            fields=args.fields,
+        )
+    except NetworkError as e:
+        print(f"pyvin: {e}; rerun the same command to resume", file=sys.stderr)
+        return 1
+    finally:
+        writer.close()
+        backend.close()
+    if progress is not None:
+        progress.finish()
+    if checkpoint is not None:
+        checkpoint.remove()
+    return 0
+
+
+def _comma_list(text: str) -> List[str]:
+    return [name.strip() for name in text.split(",") if name.strip()]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="pyvin", description="Decode VINs in bulk.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    decode = commands.add_parser(
+        "decode",
+        help="decode a file of VINs",
+        description="Stream VINs from INPUT, decode them and write results "
+        "incrementally to OUTPUT. Interrupted jobs resume from their checkpoint.",
+    )
+    decode.add_argument("input", help="CSV, JSONL or text file; - for stdin")
+    decode.add_argument(
+        "-o", "--output", default=STDIO, help="CSV/JSONL file or Parquet directory"
+    )
+    decode.add_argument("--input-format", choices=["text", "csv", "jsonl"])
+    decode.add_argument("--output-format", choices=list(WRITERS))
+    decode.add_argument(
+        "--column", default="vin", help="CSV column or JSON key with the VIN"
+    )
+    decode.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    decode.add_argument("--concurrency", type=int, default=MAX_CONCURRENCY)
+    decode.add_argument("--base-url", default=NHTSA_BASE_URL, help="vPIC API URL")
+    decode.add_argument("--cache", help="SQLite cache file shared across runs")
+    decode.add_argument("--offline", metavar="SNAPSHOT", help="decode from a snapshot")
+    decode.add_argument(
+        "--strict", action="store_true", help="reject bad check digits locally"
+    )
+    decode.add_argument(
+        "--fields",
+        type=_comma_list,
+        help="comma-separated result fields to decode and write (default: all)",
+    )
+    decode.add_argument(
+        "--checkpoint", help="checkpoint file (default OUTPUT.checkpoint)"
+    )
+    decode.add_argument("--checkpoint-every", type=int, default=CHECKPOINT_EVERY)
+    decode.add_argument("--no-checkpoint", action="store_true")
+    decode.add_argument(
+        "--row-group",
+        type=int,
+        default=PARQUET_ROW_GROUP,
+        help="rows per Parquet part file",
+    )
+    decode.add_argument("--progress-interval", type=float, default=PROGRESS_INTERVAL)
+    decode.add_argument("-q", "--quiet", action="store_true")
+    decode.set_defaults(run=_decode_command)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point of the pyvin console script"""
+    args = build_parser().parse_args(argv)
+    if args.batch_size < 1 or args.batch_size > BATCH_SIZE:
+        print(f"pyvin: --batch-size must be 1-{BATCH_SIZE}", file=sys.stderr)
+        return 2
+    if args.row_group < 1:
+        print("pyvin: --row-group must be at least 1", file=sys.stderr)
+        return 2
+    if args.concurrency < 1:
+        print("pyvin: --concurrency must be at least 1", file=sys.stderr)
+        return 2
+    if args.fields == []:
+        print("pyvin: --fields needs at least one field name", file=sys.stderr)
+        return 2
+    if args.fields:
+        try:
+            projection(args.fields)
+        except ValueError as e:
+            print(f"pyvin: --fields: {e}", file=sys.stderr)
+            return 2
+    return args.run(args)
+
+
+__all__ = ["main", "decode_stream", "Progress", "build_parser"]
@@ -1,17 +1,99 @@
 """Configuration constants for the VIN decoder application."""
 
-from typing import Final
+from typing import Final, Tuple
 
 NHTSA_BASE_URL: Final[str] = "https://vpic.nhtsa.dot.gov/api/vehicles"
 DECODE_VIN_EXT_ENDPOINT: Final[str] = "DecodeVinValuesExtended"
+DECODE_VIN_BATCH_ENDPOINT: Final[str] = "DecodeVINValuesBatch"
 DEFAULT_FORMAT: Final[str] = "json"
 REQUEST_TIMEOUT: Final[int] = 10
 CACHE_SIZE: Final[int] = 256
+CACHE_TTL: Final[int] = 30 * 24 * 60 * 60  # decodes rarely change; 30 days
+SQLITE_CACHE_MAX_ENTRIES: Final[int] = 1_000_000
+PATTERN_CACHE_SIZE: Final[int] = 10_000
+NEGATIVE_CACHE_SIZE: Final[int] = 10_000
+NEGATIVE_CACHE_TTL: Final[int] = 60 * 60  # junk VINs get retried; vPIC may fix data
+BATCH_SIZE: Final[int] = 50  # vPIC batch endpoint accepts at most 50 VINs
+MAX_CONCURRENCY: Final[int] = 10
+MICRO_BATCH_WAIT: Final[float] = 0.005  # seconds a single decode waits for a batch
+POOL_SIZE: Final[int] = 10  # keep-alive connections per host
+MAX_RETRIES: Final[int] = 3
+RETRY_BACKOFF: Final[float] = 0.5  # seconds, doubled on each retry
+RETRY_MAX_BACKOFF: Final[float] = 8.0  # cap on a single backoff delay
+BREAKER_FAILURE_RATE: Final[float] = 0.5  # failure share that opens the circuit
+BREAKER_WINDOW: Final[int] = 20  # recent upstream calls the failure rate covers
+BREAKER_MIN_CALLS: Final[int] = 10  # calls needed before the circuit can open
+BREAKER_RESET_TIMEOUT: Final[float] = 30.0  # seconds open before a probe call
+HEDGE_PERCENTILE: Final[float] = 0.95  # latency percentile that triggers a hedge
+HEDGE_BUDGET: Final[float] = 0.05  # at most 5% extra requests from hedging
+HEDGE_MIN_SAMPLES: Final[int] = 20  # latencies observed before hedging starts
+HEDGE_WINDOW: Final[int] = 200  # recent latencies the percentile covers
+# Upper bounds (seconds) of the decode stage timing histogram buckets
+TIMING_BUCKETS: Final[Tuple[float, ...]] = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)  # fmt: skip
+# Upper bounds (bytes) of the upstream response size histogram buckets
+PAYLOAD_BUCKETS: Final[Tuple[float, ...]] = (
+    256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304,
+)  # fmt: skip
+LOG_FILE: Final[str] = "pyVIN.log"  # file written by setup_logger
+LOG_MAX_BYTES: Final[int] = 2 * 1024 * 1024  # rotate the log file at this size
+LOG_BACKUP_COUNT: Final[int] = 5  # rotated log files kept
+LOG_DEBUG_SAMPLE: Final[int] = 10  # keep 1 in N DEBUG records per call site
+# Environment variable naming the port of the web interface's metrics endpoint
+METRICS_PORT_ENV: Final[str] = "PYVIN_METRICS_PORT"
+# Environment variable that turns on metrics for the default client ("1")
+METRICS_ENV: Final[str] = "PYVIN_METRICS"
+RATE_LIMIT: Final[float] = 20.0  # sustained upstream requests per second
+RATE_BURST: Final[int] = 40  # requests allowed at once above the sustained rate
+RATE_DECREASE_FACTOR: Final[float] = 0.5  # concurrency multiplier on overload
+OFFLINE_SCHEMA_CACHE_SIZE: Final[int] = 4096  # compiled VIN schemas kept in memory
+SERVICE_CACHE_SIZE: Final[int] = 100_000  # results cached by the HTTP service
+SERVICE_MAX_BODY: Final[int] = 10 * 1024 * 1024  # largest batch request body
+SERVICE_STREAM_CHUNK: Final[int] = 500  # VINs decoded per streamed slice
 
 __all__ = [
     "NHTSA_BASE_URL",
     "DECODE_VIN_EXT_ENDPOINT",
+    "DECODE_VIN_BATCH_ENDPOINT",
     "DEFAULT_FORMAT",
     "REQUEST_TIMEOUT",
     "CACHE_SIZE",
+    "CACHE_TTL",
+    "SQLITE_CACHE_MAX_ENTRIES",
+    "PATTERN_CACHE_SIZE",
+    "NEGATIVE_CACHE_SIZE",
+    "NEGATIVE_CACHE_TTL",
+    "BATCH_SIZE",
+    "MAX_CONCURRENCY",
+    "MICRO_BATCH_WAIT",
+    "POOL_SIZE",
+    "MAX_RETRIES",
+    "RETRY_BACKOFF",
+    "RETRY_MAX_BACKOFF",
+    "BREAKER_FAILURE_RATE",
+    "BREAKER_WINDOW",
+    "BREAKER_MIN_CALLS",
+    "BREAKER_RESET_TIMEOUT",
+    "HEDGE_PERCENTILE",
+    "HEDGE_BUDGET",
+    "HEDGE_MIN_SAMPLES",
+    "HEDGE_WINDOW",
+    "TIMING_BUCKETS",
+    "PAYLOAD_BUCKETS",
+    "METRICS_PORT_ENV",
+    "METRICS_ENV",
+    "LOG_FILE",
+    "LOG_MAX_BYTES",
+    "LOG_BACKUP_COUNT",
+    "LOG_DEBUG_SAMPLE",
+    "RATE_LIMIT",
+    "RATE_BURST",
+    "RATE_DECREASE_FACTOR",
+    "OFFLINE_SCHEMA_CACHE_SIZE",
+    "SERVICE_CACHE_SIZE",
+    "SERVICE_MAX_BODY",
+    "SERVICE_STREAM_CHUNK",
 ]
@@ -1,3 +1,6 @@
+from typing import Optional
+
+
 class VINDecoderError(Exception):
     """Base exception for VIN decoder"""
 
@@ -10,10 +13,18 @@ class InvalidVINError(VINDecoderError):
     pass
 
 
+class CheckDigitError(InvalidVINError):
+    """VIN check digit (position 9) does not match the computed value"""
+
+    pass
+
+
 class APIError(VINDecoderError):
     """NHTSA API returned an error"""
 
-    pass
+    def __init__(self, message: str = "", error_code: Optional[str] = None):
+        super().__init__(message)
+        self.error_code = error_code  # vPIC ErrorCode, when the API sent one
 
 
 class NetworkError(VINDecoderError):
@@ -22,9 +33,17 @@ class NetworkError(VINDecoderError):
     pass
 
 
+class CircuitOpenError(NetworkError):
+    """Upstream is failing; the request was rejected without being sent"""
+
+    pass
+
+
 __all__ = [
     "VINDecoderError",
     "InvalidVINError",
+    "CheckDigitError",
     "APIError",
     "NetworkError",
+    "CircuitOpenError",
 ]
@@ -1,3 +1,4 @@
-from src.formatting.response import filter_non_null
+from src.formatting.response import filter_non_null, result_fields, result_row
+from src.formatting.table import results_table_html
 
-__all__ = ["filter_non_null"]
+__all__ = ["filter_non_null", "result_fields", "result_row", "results_table_html"]
@@ -1,5 +1,8 @@
+from src.api.lean import LeanResult
 from src.api.models import VINDecodeResult
-from typing import Dict, Any
+from src.api.results import Outcome
+from src.exceptions import VINDecoderError
+from typing import Dict, Any, Optional, Sequence, Union
 
 
 def filter_non_null(result: VINDecodeResult) -> Dict[str, Any]:
@@ -17,4 +20,30 @@ def filter_non_null(result: VINDecodeResult) -> Dict[str, Any]:
     }
 
 
-__all__ = ["filter_non_null"]
+def result_fields(
+    result: Union[VINDecodeResult, LeanResult],
+    fields: Optional[Sequence[str]] = None,
+) -> Dict[str, Optional[str]]:
+    """Declared fields (or just fields) of a result by field name, nulls included"""
+    if fields is not None:
+        return {name: getattr(result, name) for name in fields}
+    if isinstance(result, LeanResult):
+        return result.as_dict()
+    return {name: getattr(result, name) for name in VINDecodeResult.model_fields}
+
+
+def result_row(
+    vin: str, outcome: Outcome, fields: Optional[Sequence[str]] = None
+) -> Dict[str, Optional[str]]:
+    """
+    Flatten one decode outcome into a row: the VIN as given, the failure
+    (if any), then the result's declared fields (or just fields)
+    """
+    if isinstance(outcome, VINDecoderError):
+        return {"input": vin, "error": f"{type(outcome).__name__}: {outcome}"}
+    if isinstance(outcome, dict):
+        outcome = LeanResult(outcome)
+    return {"input": vin, "error": None, **result_fields(outcome, fields)}
+
+
+__all__ = ["filter_non_null", "result_fields", "result_row"]
@@ -0,0 +1,32 @@
+"""HTML rendering of decode results for the web interface."""
+
+from typing import Any, Dict
+
+from src.formatting.fields import FIELD_DESCRIPTIONS, FIELD_LABELS
+
+
+def results_table_html(filtered_data: Dict[str, Any]) -> str:
+    """
+    Render decode results as an HTML table with field tooltips
+
+    Args:
+        filtered_data: Dictionary of field names to values (non-null only)
+
+    Returns:
+        A <table class="results-table"> with one Field/Value row per field
+    """
+    parts = ['<table class="results-table">', "<tr><th>Field</th><th>Value</th></tr>"]
+    for field_name, value in filtered_data.items():
+        label = FIELD_LABELS.get(field_name, field_name.replace("_", " ").title())
+        description = FIELD_DESCRIPTIONS.get(field_name, "")
+
+        # Create field name with tooltip using HTML title attribute
+        if description:
+            label = f'<span title="{description}">{label}</span>'
+
+        parts.append(f"<tr><td>{label}</td><td>{value}</td></tr>")
+    parts.append("</table>")
+    return "".join(parts)
+
+
+__all__ = ["results_table_html"]
@@ -1,3 +1,15 @@
-from src.logs.logs import setup_logger
+from src.logs.logs import (
+    DebugSampler,
+    JSONFormatter,
+    log_decode,
+    setup_logger,
+    shutdown_logging,
+)
 
-__all__ = ["setup_logger"]
+__all__ = [
+    "DebugSampler",
+    "JSONFormatter",
+    "log_decode",
+    "setup_logger",
+    "shutdown_logging",
+]
@@ -1,28 +1,209 @@
+"""Queue-based logging setup with JSON file output and debug sampling."""
+
+import atexit
+import copy
+import json
 import logging
 import logging.handlers
+import os
+import queue
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from src.api.timing import DecodeTiming
+from src.config import LOG_BACKUP_COUNT, LOG_DEBUG_SAMPLE, LOG_FILE, LOG_MAX_BYTES
+
+# Record attributes (set with extra=...) copied into JSON log lines
+DECODE_FIELDS: Tuple[str, ...] = ("vin", "latency", "cache", "error_code", "error")
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+decode_logger = logging.getLogger("pyVIN.decode")
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per record, with any per-decode fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: Dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for name in DECODE_FIELDS:
+            value = getattr(record, name, None)
+            if value is not None:
+                data[name] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exc_info"] = record.exc_text
+        return json.dumps(data, default=str)
+
+
+class DebugSampler(logging.Filter):
+    """
+    Keep one in every `every` DEBUG records per call site.
+
+    Records above DEBUG always pass, so sampling thins out high-volume
+    events such as per-decode traces without hiding warnings or errors.
+    The first record from each call site is always kept.
+    """
+
+    def __init__(self, every: int = LOG_DEBUG_SAMPLE):
+        super().__init__()
+        self.every = every
+        self._seen: Dict[Tuple[str, int], int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.every <= 1:
+            return True
+        key = (record.pathname, record.lineno)
+        with self._lock:
+            count = self._seen.get(key, 0)
+            self._seen[key] = count + 1
+        return count % self.every == 0
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that keeps extra fields and the traceback apart from the message"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_handler: Optional[logging.Handler] = None
+_config: Optional[Tuple[int, int, str, int]] = None
+_setup_lock = threading.Lock()
 
 
 def setup_logger(
-    fh_lev: int = logging.DEBUG, ch_lev: int = logging.ERROR
+    fh_lev: int = logging.DEBUG,
+    ch_lev: int = logging.ERROR,
+    filename: str = LOG_FILE,
+    debug_sample: int = LOG_DEBUG_SAMPLE,
 ) -> logging.Logger:
+    """
+    Configure the "pyVIN" logger and return it.
+
+    Records are put on a queue by the calling thread and written by a
+    background QueueListener: JSON lines to a rotating file and plain text
+    to the console, so logging never blocks a request on disk I/O. DEBUG
+    records are sampled (see DebugSampler). Calling again with the same
+    arguments keeps the running setup; different arguments replace it
+    instead of adding handlers. Queued records are flushed first and at
+    interpreter exit.
+
+    Args:
+        fh_lev: Level of the JSON log file
+        ch_lev: Level of the console output
+        filename: Log file path
+        debug_sample: Keep 1 in this many DEBUG records per call site
+            (1 keeps all)
+
+    Returns:
+        The "pyVIN" logger
+    """
+    global _listener, _handler, _config
     logger = logging.getLogger("pyVIN")
-    logger.setLevel(logging.DEBUG)
-    # create a file handler which logs even debug messages
-    max_size = 2 * 1024 * 1024
-    fh = logging.handlers.RotatingFileHandler(
-        "pyVIN.log", maxBytes=max_size, backupCount=5
-    )
-    fh.setLevel(fh_lev)
-    # create a console handler with a higher log level
-    ch = logging.StreamHandler()
-    ch.setLevel(ch_lev)
-    # create a formatter and add it to the handlers
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-    fh.setFormatter(formatter)
-    ch.setFormatter(formatter)
-    # add the handlers to the logger
-    logger.addHandler(fh)
-    logger.addHandler(ch)
+    config = (fh_lev, ch_lev, os.path.abspath(filename), debug_sample)
+    with _setup_lock:
+        if _listener is not None and config == _config:
+            return logger
+        _shutdown()
+        logger.setLevel(logging.DEBUG)
+        fh = logging.handlers.RotatingFileHandler(
+            filename, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT
+        )
+        fh.setLevel(fh_lev)
+        fh.setFormatter(JSONFormatter())
+        ch = logging.StreamHandler()
+        ch.setLevel(ch_lev)
+        ch.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+        records: "queue.Queue[logging.LogRecord]" = queue.Queue()
+        _handler = _QueueHandler(records)
+        _handler.setLevel(min(fh_lev, ch_lev))
+        _handler.addFilter(DebugSampler(debug_sample))
+        _listener = logging.handlers.QueueListener(
+            records, fh, ch, respect_handler_level=True
+        )
+        _listener.start()
+        logger.addHandler(_handler)
+        _config = config
     return logger
+
+
+def listener() -> Optional[logging.handlers.QueueListener]:
+    """The running background writer, if setup_logger has been called"""
+    return _listener
+
+
+def _shutdown() -> None:
+    """Flush and remove the current setup (callers hold _setup_lock)"""
+    global _listener, _handler, _config
+    _config = None
+    if _handler is not None:
+        logging.getLogger("pyVIN").removeHandler(_handler)
+        _handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+def shutdown_logging() -> None:
+    """Write out queued records and close the log handlers"""
+    with _setup_lock:
+        _shutdown()
+
+
+atexit.register(shutdown_logging)
+
+
+def log_decode(timing: DecodeTiming) -> None:
+    """
+    TimingHook logging each decode with structured fields.
+
+    Use with DecodeTimings(hooks=[log_decode]). Successful decodes are
+    logged at DEBUG (and so sampled), failures at INFO; both carry vin,
+    latency (seconds), cache, error_code and error fields.
+    """
+    decode_logger.log(
+        logging.INFO if timing.error else logging.DEBUG,
+        "Decoded %s in %.1f ms (%s)",
+        timing.vin,
+        timing.total * 1000,
+        timing.error or timing.cache,
+        extra={
+            "vin": timing.vin,
+            "latency": round(timing.total, 6),
+            "cache": timing.cache,
+            "error_code": timing.error_code,
+            "error": timing.error,
+        },
+    )
+
+
+__all__ = [
+    "DECODE_FIELDS",
+    "DebugSampler",
+    "JSONFormatter",
+    "listener",
+    "log_decode",
+    "setup_logger",
+    "shutdown_logging",
+]
@@ -0,0 +1,17 @@
+from src.metrics.exporter import start_http_server
+from src.metrics.registry import (
+    REGISTRY,
+    Counter,
+    Gauge,
+    HistogramMetric,
+    MetricsRegistry,
+)
+
+__all__ = [
+    "REGISTRY",
+    "Counter",
+    "Gauge",
+    "HistogramMetric",
+    "MetricsRegistry",
+    "start_http_server",
+]
@@ -0,0 +1,62 @@
+"""Standalone HTTP endpoint serving a metrics registry."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Tuple
+
+from src.metrics.registry import CONTENT_TYPE, REGISTRY, MetricsRegistry
+
+_servers: Dict[Tuple[str, int], ThreadingHTTPServer] = {}
+_servers_lock = threading.Lock()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.server.registry.exposition().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _MetricsServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], registry: MetricsRegistry):
+        super().__init__(address, _MetricsHandler)
+        self.registry = registry
+
+
+def start_http_server(
+    port: int, addr: str = "127.0.0.1", registry: MetricsRegistry = REGISTRY
+) -> ThreadingHTTPServer:
+    """
+    Serve GET /metrics for registry on a background thread.
+
+    Calling again with the same address returns the running server, so
+    scripts that are re-executed (like Streamlit pages) can call this on
+    every run. Use port 0 to pick a free port (see server.server_address).
+
+    Returns:
+        The running server; call shutdown() to stop it
+    """
+    with _servers_lock:
+        server = _servers.get((addr, port))
+        if server is None:
+            server = _MetricsServer((addr, port), registry)
+            threading.Thread(
+                target=server.serve_forever, name="pyvin-metrics", daemon=True
+            ).start()
+            if port:
+                _servers[(addr, port)] = server
+        return server
+
+
+__all__ = ["start_http_server"]
@@ -0,0 +1,326 @@
+"""In-process metrics registry with Prometheus text exposition."""
+
+import math
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+
+from src.config import TIMING_BUCKETS
+
+Labels = Tuple[str, ...]
+
+
+@dataclass
+class HistogramSnapshot:
+    """Counts of observations at or below each bucket bound"""
+
+    buckets: Tuple[float, ...]
+    counts: Tuple[int, ...]  # cumulative; one more than buckets (+Inf)
+    sum: float
+    count: int
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile (None if empty)"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        for bound, count in zip(self.buckets, self.counts):
+            if count >= rank:
+                return bound
+        return math.inf
+
+
+class Histogram:
+    """Thread-safe fixed-bucket histogram"""
+
+    def __init__(self, buckets: Iterable[float] = TIMING_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        cumulative = []
+        running = 0
+        for count in counts:
+            running += count
+            cumulative.append(running)
+        return HistogramSnapshot(self.buckets, tuple(cumulative), total, running)
+
+
+@dataclass
+class MetricFamily:
+    """All samples of one metric name, as exposed at a scrape"""
+
+    name: str
+    kind: str  # "counter", "gauge" or "histogram"
+    help: str
+    labelnames: Labels = ()
+    # label values -> value (HistogramSnapshot for histograms)
+    samples: Dict[Labels, object] = field(default_factory=dict)
+
+
+class _Metric:
+    """A named metric with one child per combination of label values"""
+
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames: Labels = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Labels:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} takes labels {self.labelnames}")
+        try:
+            return tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError:
+            raise ValueError(f"{self.name} takes labels {self.labelnames}") from None
+
+    def collect(self) -> MetricFamily:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count, e.g. decodes by outcome"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError("Counters only go up")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def collect(self) -> MetricFamily:
+        with self._lock:
+            samples: Dict[Labels, object] = dict(self._values)
+        return MetricFamily(self.name, self.kind, self.help, self.labelnames, samples)
+
+
+class Gauge(Counter):
+    """Value that goes up and down, e.g. requests in flight"""
+
+    kind = "gauge"
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class HistogramMetric(_Metric):
+    """Distribution of observed values, e.g. upstream latency"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Iterable[float] = TIMING_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._children: Dict[Labels, Histogram] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, Histogram(self.buckets))
+        child.observe(value)
+
+    def snapshot(self, **labels: str) -> HistogramSnapshot:
+        child = self._children.get(self._key(labels))
+        return (child or Histogram(self.buckets)).snapshot()
+
+    def collect(self) -> MetricFamily:
+        with self._lock:
+            children = dict(self._children)
+        samples: Dict[Labels, object] = {
+            key: child.snapshot() for key, child in children.items()
+        }
+        return MetricFamily(self.name, self.kind, self.help, self.labelnames, samples)
+
+
+Collector = Callable[[], Iterable[MetricFamily]]
+M = TypeVar("M", bound=_Metric)
+
+
+class MetricsRegistry:
+    """
+    Named metrics plus collectors, rendered in Prometheus text format.
+
+    Metrics updated as events happen (counters, gauges, histograms) are
+    created with counter(), gauge() and histogram(); asking again for the
+    same name returns the existing metric. Values that already live
+    elsewhere, such as cache statistics, are read at scrape time by
+    collectors registered under a key; registering the same key again
+    replaces the previous collector. Safe to share between threads.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: Dict[str, Collector] = {}
+
+    def _get(self, cls: Type[M], name: str, *args: Any) -> M:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args)
+            elif type(metric) is not cls:
+                raise ValueError(f"{name} is already a {metric.kind}")
+            return cast(M, metric)
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get(Counter, name, help, labelnames)
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get(Gauge, name, help, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Iterable[float] = TIMING_BUCKETS,
+    ) -> HistogramMetric:
+        return self._get(HistogramMetric, name, help, labelnames, buckets)
+
+    def register_collector(self, key: str, collector: Collector) -> None:
+        with self._lock:
+            self._collectors[key] = collector
+
+    def unregister_collector(self, key: str) -> None:
+        with self._lock:
+            self._collectors.pop(key, None)
+
+    def collect(self) -> List[MetricFamily]:
+        """Every metric family, with samples from collectors merged by name"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors.values())
+        families: Dict[str, MetricFamily] = {}
+        for family in [m.collect() for m in metrics] + [
+            family for collector in collectors for family in collector()
+        ]:
+            merged = families.setdefault(family.name, family)
+            if merged is not family:
+                merged.samples.update(family.samples)
+        return sorted(families.values(), key=lambda f: f.name)
+
+    def exposition(self) -> str:
+        """All metrics in the Prometheus text exposition format (0.0.4)"""
+        lines: List[str] = []
+        for family in self.collect():
+            lines.append(f"# HELP {family.name} {_escape_help(family.help)}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            for key, value in sorted(family.samples.items()):
+                labels = list(zip(family.labelnames, key))
+                if isinstance(value, HistogramSnapshot):
+                    lines.extend(_histogram_lines(family.name, labels, value))
+                else:
+                    lines.append(f"{family.name}{_labels(labels)} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _histogram_lines(
+    name: str, labels: List[Tuple[str, str]], snapshot: HistogramSnapshot
+) -> List[str]:
+    bounds = [*snapshot.buckets, math.inf]
+    lines = [
+        f"{name}_bucket{_labels(labels + [('le', _number(bound))])} {count}"
+        for bound, count in zip(bounds, snapshot.counts)
+    ]
+    lines.append(f"{name}_sum{_labels(labels)} {_number(snapshot.sum)}")
+    lines.append(f"{name}_count{_labels(labels)} {snapshot.count}")
+    return lines
+
+
+def _labels(labels: List[Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_value(value)}"' for name, value in labels)
+    return "{" + pairs + "}"
+
+
+def _escape_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _number(value: object) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+# Process-wide registry used by the default client and the exporter
+REGISTRY = MetricsRegistry()
+
+
+__all__ = [
+    "CONTENT_TYPE",
+    "REGISTRY",
+    "Collector",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "HistogramMetric",
+    "HistogramSnapshot",
+    "MetricFamily",
+    "MetricsRegistry",
+]
@@ -0,0 +1,4 @@
+from src.offline.decoder import OfflineDecoder
+from src.offline.snapshot import build_snapshot
+
+__all__ = ["OfflineDecoder", "build_snapshot"]
@@ -0,0 +1,299 @@
+"""Decode VINs locally from a vPIC snapshot built by build_snapshot."""
+
+import os
+import re
+import sqlite3
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Tuple
+
+from src.api.backend import DecoderBackend
+from src.api.models import VINDecodeResult
+from src.api.results import (
+    Outcome,
+    RawResult,
+    distinct,
+    normalize_many,
+    result_builder,
+)
+from src.config import OFFLINE_SCHEMA_CACHE_SIZE
+from src.exceptions import VINDecoderError
+from src.validation.vin import (
+    has_valid_check_digit,
+    model_year_candidates,
+    validate_and_normalize_vin,
+)
+
+# vPIC error codes and texts the offline decoder can produce
+ERROR_TEXT = {
+    "0": "0 - VIN decoded clean. Check Digit (9th position) is correct",
+    "1": "1 - Check Digit (9th position) does not calculate properly",
+    "6": "6 - Incomplete VIN",
+    "7": "7 - Manufacturer is not registered with NHTSA for sale or importation "
+    "in the U.S. for use on U.S roadways; Please contact the manufacturer "
+    "directly for more information",
+    "8": "8 - No detailed data available currently",
+    "11": "11 - Incorrect Model Year - decoded data may not be accurate",
+}
+
+# Codes meaning the snapshot has nothing to say about the VIN
+NO_DATA_CODES = frozenset({"7", "8"})
+
+# Lookup elements whose attribute id vPIC also reports, under the keys
+# VINDecodeResult reads them from (vPIC itself spells it "ManufacturerId")
+ID_FIELDS = {"Make": "MakeID", "Model": "ModelID", "Manufacturer": "ManufacturerID"}
+
+CompiledPattern = Tuple[Pattern[str], int, str, Optional[str], Optional[str]]
+
+
+def compile_keys(keys: str) -> Tuple[Pattern[str], int]:
+    """
+    Compile a vPIC pattern key into a prefix regex and its specificity.
+
+    Keys are matched against VIN positions 4-8, "|", then positions 10-17.
+    "*" matches any character and "[...]" a set or range; every other
+    character must match exactly. Specificity counts 2 per literal and 1 per
+    set so the most specific matching pattern wins.
+    """
+    parts: List[str] = []
+    specificity = 0
+    i = 0
+    while i < len(keys):
+        char = keys[i]
+        if char == "[":
+            end = keys.index("]", i)
+            parts.append(keys[i : end + 1])
+            specificity += 1
+            i = end + 1
+            continue
+        if char == "*":
+            parts.append(".")
+        else:
+            parts.append(re.escape(char))
+            specificity += 2
+        i += 1
+    return re.compile("".join(parts)), specificity
+
+
+def wmi_for(vin: str) -> str:
+    """WMI of a normalized VIN (six characters for small manufacturers)"""
+    return vin[:3] + vin[11:14] if vin[2] == "9" else vin[:3]
+
+
+class OfflineDecoder(DecoderBackend):
+    """
+    VIN decoder backed by a local vPIC snapshot, with no network access.
+
+    Produces the same VINDecodeResult and error classification as the HTTP
+    clients and can replace one as the default client. VINs the snapshot
+    knows nothing about (error codes 7 and 8) are decoded with the optional
+    fallback backend instead, e.g. a VINDecoderClient on connected nodes.
+
+    Args:
+        path: Snapshot database created by build_snapshot
+        fallback: Optional backend for VINs missing from the snapshot
+        schema_cache_size: Number of compiled VIN schemas kept in memory
+        strict: Reject VINs with a wrong check digit, as the HTTP clients do
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fallback: Optional[DecoderBackend] = None,
+        schema_cache_size: int = OFFLINE_SCHEMA_CACHE_SIZE,
+        strict: bool = False,
+    ):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"vPIC snapshot not found: {path}")
+        self.path = path
+        self.fallback = fallback
+        self.strict = strict
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            f"file:{path}?mode=ro", uri=True, check_same_thread=False
+        )
+        self._patterns = lru_cache(maxsize=schema_cache_size)(self._load_patterns)
+
+    def __enter__(self) -> "OfflineDecoder":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the snapshot database"""
+        with self._lock:
+            self._conn.close()
+
+    def _query(self, sql: str, params: tuple) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _load_patterns(self, schema_id: int) -> List[CompiledPattern]:
+        """Compiled patterns of one VIN schema"""
+        rows = self._query(
+            "SELECT keys, code, value, value_id FROM pattern "
+            "WHERE schema_id = ? ORDER BY rowid",
+            (schema_id,),
+        )
+        return [
+            (*compile_keys(keys), code, value, value_id)
+            for keys, code, value, value_id in rows
+        ]
+
+    def decode_raw(self, vin: str) -> RawResult:
+        """
+        Decode a normalized VIN into a raw vPIC-style result.
+
+        Unlike decode, critical error codes are not raised here.
+        """
+        codes: List[str] = []
+        raw: RawResult = {"VIN": vin}
+        if "*" in vin:
+            codes.append("6")
+        elif not has_valid_check_digit(vin):
+            codes.append("1")
+
+        wmi_rows = self._query(
+            "SELECT manufacturer, manufacturer_id, make, make_id, vehicle_type "
+            "FROM wmi WHERE wmi = ?",
+            (wmi_for(vin),),
+        )
+        if not wmi_rows:
+            codes.append("7")
+            return self._finish(raw, codes)
+        manufacturer, manufacturer_id, make, make_id, vehicle_type = wmi_rows[0]
+        raw.update(
+            Manufacturer=manufacturer,
+            ManufacturerID=manufacturer_id,
+            Make=make,
+            MakeID=make_id,
+            VehicleType=vehicle_type,
+        )
+
+        year, schema_ids = self._schemas_for(vin, codes)
+        if year is not None:
+            raw["ModelYear"] = str(year)
+
+        key = f"{vin[3:8]}|{vin[9:]}"
+        best: Dict[str, Tuple[int, Optional[str], Optional[str]]] = {}
+        for schema_id in schema_ids:
+            for regex, specificity, code, value, value_id in self._patterns(schema_id):
+                if regex.match(key) and specificity > best.get(code, (-1,))[0]:
+                    best[code] = (specificity, value, value_id)
+        if not best and "8" not in codes:
+            codes.append("8")
+        for code, (_, value, value_id) in best.items():
+            raw[code] = value
+            if value_id is not None and code in ID_FIELDS:
+                raw[ID_FIELDS[code]] = value_id
+        return self._finish(raw, codes)
+
+    def _schemas_for(
+        self, vin: str, codes: List[str]
+    ) -> Tuple[Optional[int], List[int]]:
+        """Model year and the VIN schemas that apply to it, noting errors in codes"""
+        rows = self._query(
+            "SELECT schema_id, year_from, year_to FROM wmi_schema WHERE wmi = ?",
+            (wmi_for(vin),),
+        )
+        years = model_year_candidates(vin)
+        if not years:
+            codes.append("11")
+            return None, []
+        for year in years:
+            schema_ids = [
+                schema_id
+                for schema_id, year_from, year_to in rows
+                if (year_from is None or year_from <= year)
+                and (year_to is None or year <= year_to)
+            ]
+            if schema_ids:
+                return year, schema_ids
+        codes.append("8")
+        return years[0], []
+
+    @staticmethod
+    def _finish(raw: RawResult, codes: List[str]) -> RawResult:
+        codes = codes or ["0"]
+        raw["ErrorCode"] = ",".join(codes)
+        raw["ErrorText"] = "; ".join(ERROR_TEXT[code] for code in codes)
+        return raw
+
+    def _needs_fallback(self, raw: RawResult) -> bool:
+        return self.fallback is not None and bool(
+            NO_DATA_CODES.intersection(raw["ErrorCode"].split(","))
+        )
+
+    def decode(
+        self, vin: str, fields: Optional[Iterable[str]] = None
+    ) -> VINDecodeResult:
+        """
+        Decode a single VIN from the snapshot.
+
+        Args:
+            vin: 17-character VIN (use * for wildcards)
+            fields: Only keep these VINDecodeResult fields (the others are None)
+
+        Returns:
+            VINDecodeResult with decoded data (may include warnings in error_text)
+
+        Raises:
+            ValueError: Unknown field name
+            InvalidVINError: VIN format is invalid
+            CheckDigitError: strict and the check digit does not match
+            APIError: Critical error code (400+) in the result
+        """
+        build = result_builder(fields=fields)
+        normalized_vin = validate_and_normalize_vin(vin, self.strict)
+        raw = self.decode_raw(normalized_vin)
+        if self._needs_fallback(raw):
+            return self.fallback.decode(normalized_vin, fields)
+        return build(raw)
+
+    def decode_batch(
+        self,
+        vins: Iterable[str],
+        return_exceptions: bool = False,
+        result_type: str = "model",
+        fields: Optional[Iterable[str]] = None,
+    ) -> List[Outcome]:
+        """
+        Decode many VINs from the snapshot, in input order.
+
+        VINs missing from the snapshot go to the fallback in one decode_batch
+        call.
+
+        Args:
+            vins: VINs to decode
+            return_exceptions: Return per-VIN failures in place instead of raising
+            result_type: "model", "lean" or "raw", as in VINDecoderClient
+            fields: Only keep these VINDecodeResult fields of each result
+
+        Returns:
+            One result (or error) per input VIN, in input order
+        """
+        build = result_builder(result_type, fields)
+        outcomes = normalize_many(vins, return_exceptions, self.strict)
+        decoded: Dict[str, Outcome] = {}
+        missing: List[str] = []
+        for vin in distinct(outcomes):
+            raw = self.decode_raw(vin)
+            if self._needs_fallback(raw):
+                missing.append(vin)
+                continue
+            try:
+                decoded[vin] = build(raw)
+            except VINDecoderError as e:
+                if not return_exceptions:
+                    raise
+                decoded[vin] = e
+        if missing:
+            fallback = self.fallback.decode_batch(
+                missing, return_exceptions, result_type, fields
+            )
+            decoded.update(zip(missing, fallback))
+        return [decoded[o] if isinstance(o, str) else o for o in outcomes]
+
+
+__all__ = ["OfflineDecoder", "compile_keys", "wmi_for", "ERROR_TEXT"]
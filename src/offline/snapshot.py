@@ -0,0 +1,161 @@
+"""Build a local, indexed snapshot of the vPIC decoding tables."""
+
+import csv
+import os
+import sqlite3
+import time
+from typing import Dict, Iterator, Optional
+
+SCHEMA = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE wmi (
+    wmi TEXT PRIMARY KEY,
+    manufacturer TEXT,
+    manufacturer_id TEXT,
+    make TEXT,
+    make_id TEXT,
+    vehicle_type TEXT
+);
+CREATE TABLE wmi_schema (
+    wmi TEXT NOT NULL,
+    schema_id INTEGER NOT NULL,
+    year_from INTEGER,
+    year_to INTEGER
+);
+CREATE INDEX wmi_schema_wmi ON wmi_schema (wmi);
+CREATE TABLE pattern (
+    schema_id INTEGER NOT NULL,
+    keys TEXT NOT NULL,
+    code TEXT NOT NULL,
+    value TEXT,
+    value_id TEXT
+);
+CREATE INDEX pattern_schema_id ON pattern (schema_id);
+"""
+
+SNAPSHOT_VERSION = "1"
+
+
+def _rows(source_dir: str, table: str) -> Iterator[Dict[str, str]]:
+    """Rows of one exported vPIC table (<table>.csv with a header row)"""
+    path = os.path.join(source_dir, f"{table}.csv")
+    with open(path, newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+
+def _names(source_dir: str, table: str) -> Dict[str, str]:
+    """Id -> Name for a vPIC lookup table"""
+    return {row["Id"]: row["Name"] for row in _rows(source_dir, table)}
+
+
+def _year(value: Optional[str]) -> Optional[int]:
+    return int(value) if value else None
+
+
+def build_snapshot(source_dir: str, path: str) -> None:
+    """
+    Ingest exported vPIC standalone tables into a SQLite snapshot.
+
+    source_dir holds one CSV per vPIC table, named after the table and
+    exported with its column names as the header:
+
+    - Wmi: Id, Wmi, ManufacturerId, MakeId, VehicleTypeId
+    - Wmi_VinSchema: WmiId, VinSchemaId, YearFrom, YearTo
+    - Pattern: VinSchemaId, Keys, ElementId, AttributeId
+    - Element: Id, Code, LookupTable
+    - Manufacturer, Make, VehicleType and every table named in
+      Element.LookupTable: Id, Name
+
+    Lookup values are resolved at build time, so decoding needs two indexed
+    queries per VIN. An existing snapshot at path is replaced.
+
+    Args:
+        source_dir: Directory with the exported CSV files
+        path: Snapshot database file to create
+    """
+    manufacturers = _names(source_dir, "Manufacturer")
+    makes = _names(source_dir, "Make")
+    vehicle_types = _names(source_dir, "VehicleType")
+    elements = {row["Id"]: row for row in _rows(source_dir, "Element")}
+    lookups = {
+        table: _names(source_dir, table)
+        for table in {e["LookupTable"] for e in elements.values()}
+        if table
+    }
+    wmi_by_id = {}
+
+    if os.path.exists(path):
+        os.remove(path)
+    conn = sqlite3.connect(path)
+    try:
+        with conn:
+            conn.executescript(SCHEMA)
+            for row in _rows(source_dir, "Wmi"):
+                wmi_by_id[row["Id"]] = row["Wmi"].upper()
+                conn.execute(
+                    "INSERT INTO wmi VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        row["Wmi"].upper(),
+                        manufacturers.get(row["ManufacturerId"]),
+                        row["ManufacturerId"] or None,
+                        makes.get(row["MakeId"]),
+                        row["MakeId"] or None,
+                        vehicle_types.get(row["VehicleTypeId"]),
+                    ),
+                )
+            conn.executemany(
+                "INSERT INTO wmi_schema VALUES (?, ?, ?, ?)",
+                (
+                    (
+                        wmi_by_id[row["WmiId"]],
+                        int(row["VinSchemaId"]),
+                        _year(row["YearFrom"]),
+                        _year(row["YearTo"]),
+                    )
+                    for row in _rows(source_dir, "Wmi_VinSchema")
+                    if row["WmiId"] in wmi_by_id
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO pattern VALUES (?, ?, ?, ?, ?)",
+                (
+                    _pattern_row(row, elements[row["ElementId"]], lookups)
+                    for row in _rows(source_dir, "Pattern")
+                    if row["ElementId"] in elements
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO meta VALUES (?, ?)",
+                [
+                    ("version", SNAPSHOT_VERSION),
+                    ("source", os.path.abspath(source_dir)),
+                    ("built_at", str(int(time.time()))),
+                ],
+            )
+    finally:
+        conn.close()
+
+
+def _pattern_row(
+    row: Dict[str, str], element: Dict[str, str], lookups: Dict[str, Dict[str, str]]
+) -> tuple:
+    """Pattern row with its attribute resolved through the element's lookup table"""
+    attribute = row["AttributeId"]
+    table = element["LookupTable"]
+    if table:
+        value, value_id = lookups[table].get(attribute), attribute
+    else:
+        value, value_id = attribute, None
+    return (
+        int(row["VinSchemaId"]),
+        row["Keys"].upper(),
+        element["Code"],
+        value,
+        value_id,
+    )
+
+
+__all__ = ["build_snapshot", "SCHEMA", "SNAPSHOT_VERSION"]
@@ -0,0 +1,3 @@
+from src.service.app import DecodeService, create_app
+
+__all__ = ["DecodeService", "create_app"]
@@ -0,0 +1,28 @@
+"""Run the decode service: python -m src.service [--host H] [--port P]"""
+
+import argparse
+
+try:
+    import uvicorn
+except ImportError:  # pragma: no cover - optional dependency
+    uvicorn = None
+
+from src.config import NHTSA_BASE_URL
+from src.service.app import DecodeService
+
+
+def main() -> None:
+    if uvicorn is None:
+        raise ImportError(
+            "The decode service requires uvicorn: pip install 'pyVIN-UI[service]'"
+        )
+    parser = argparse.ArgumentParser(prog="python -m src.service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--base-url", default=NHTSA_BASE_URL, help="vPIC API URL")
+    args = parser.parse_args()
+    uvicorn.run(DecodeService(base_url=args.base_url), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
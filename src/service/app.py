@@ -0,0 +1,310 @@
+"""ASGI application serving VIN decodes over HTTP."""
+
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote
+
+from src.api.async_client import AsyncVINDecoderClient
+from src.api.metrics import ClientMetrics, track_client
+from src.api.results import projection
+from src.cache.memory import MemoryCache
+from src.config import (
+    NEGATIVE_CACHE_SIZE,
+    NEGATIVE_CACHE_TTL,
+    NHTSA_BASE_URL,
+    SERVICE_CACHE_SIZE,
+    SERVICE_MAX_BODY,
+    SERVICE_STREAM_CHUNK,
+)
+from src.exceptions import (
+    APIError,
+    CircuitOpenError,
+    InvalidVINError,
+    NetworkError,
+    VINDecoderError,
+)
+from src.formatting.response import result_fields, result_row
+from src.metrics.registry import CONTENT_TYPE, MetricsRegistry
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+Handler = Callable[[Scope, Receive, Send], Awaitable[int]]
+
+# HTTP status for each failure, most specific class first
+ERROR_STATUS: List[Tuple[type, int]] = [
+    (InvalidVINError, 400),
+    (APIError, 422),
+    (CircuitOpenError, 503),
+    (NetworkError, 502),
+    (VINDecoderError, 500),
+]
+
+NDJSON = "application/x-ndjson"
+
+
+class HTTPError(Exception):
+    """A request the service answers with an error status"""
+
+    def __init__(self, status: int, error: str, detail: str):
+        super().__init__(detail)
+        self.status = status
+        self.error = error
+        self.detail = detail
+
+
+def status_for(error: VINDecoderError) -> int:
+    """HTTP status for a decode failure"""
+    return next(status for cls, status in ERROR_STATUS if isinstance(error, cls))
+
+
+class DecodeService:
+    """
+    Minimal ASGI app around AsyncVINDecoderClient.
+
+    Routes:
+        GET  /decode/{vin}  one result, or an error with a matching status
+        POST /decode        {"vins": [...]} (or a bare list); one row per
+                            input VIN, streamed as a JSON array, or as NDJSON
+                            when the request accepts application/x-ndjson
+        GET  /healthz       liveness and circuit breaker state
+        GET  /metrics       Prometheus metrics of the client and the service
+
+    Both decode routes take ?fields=make,model (or "fields": [...] in the
+    POST body) to parse and return only those result fields.
+
+    Results are cached in memory by the client, and concurrent GET
+    /decode/{vin} requests for the same VIN share one upstream call. POST
+    /decode is not coalesced across requests: overlapping batches send
+    their uncached VINs upstream separately. Large batches are decoded and
+    streamed stream_chunk VINs at a time, so memory stays flat.
+
+    Args:
+        client: Client to decode with (one with in-memory result and
+            negative caches is created by default, and closed on shutdown)
+        base_url: vPIC API base URL for the default client (e.g. a stub)
+        registry: Registry served at /metrics (a private one by default);
+            pass the registry of a client's own ClientMetrics to include them
+        stream_chunk: VINs decoded per streamed batch slice
+        max_body: Largest accepted request body in bytes
+    """
+
+    def __init__(
+        self,
+        client: Optional[AsyncVINDecoderClient] = None,
+        base_url: str = NHTSA_BASE_URL,
+        registry: Optional[MetricsRegistry] = None,
+        stream_chunk: int = SERVICE_STREAM_CHUNK,
+        max_body: int = SERVICE_MAX_BODY,
+    ):
+        self.registry = registry or MetricsRegistry()
+        self._owns_client = client is None
+        self.client = client or AsyncVINDecoderClient(
+            base_url=base_url,
+            cache=MemoryCache(SERVICE_CACHE_SIZE),
+            negative_cache=MemoryCache(NEGATIVE_CACHE_SIZE, ttl=NEGATIVE_CACHE_TTL),
+            metrics=ClientMetrics(self.registry, "service"),
+        )
+        if self.client.metrics is None:
+            track_client(self.registry, self.client, "service")
+        self.stream_chunk = stream_chunk
+        self.max_body = max_body
+        self.requests = self.registry.counter(
+            "pyvin_http_requests_total",
+            "HTTP requests served by route and status",
+            ("route", "status"),
+        )
+        self._routes: Dict[str, Dict[str, Handler]] = {
+            "/healthz": {"GET": self._healthz},
+            "/metrics": {"GET": self._metrics},
+            "/decode": {"POST": self._decode_batch},
+            "/decode/{vin}": {"GET": self._decode_one},
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":  # pragma: no cover - websockets unsupported
+            return
+        route, handler = self._route(scope)
+        try:
+            status = await handler(scope, receive, send)
+        except HTTPError as e:
+            status = e.status
+            await _send_json(send, e.status, {"error": e.error, "detail": e.detail})
+        self.requests.inc(route=route, status=str(status))
+
+    def _route(self, scope: Scope) -> Tuple[str, Handler]:
+        """Route template and handler for a request"""
+        method, path = scope["method"], scope["path"].rstrip("/") or "/"
+        route = "/decode/{vin}" if path.startswith("/decode/") else path
+        handlers = self._routes.get(route)
+        if not handlers or path.count("/") > 2:
+            return "other", _error_handler(404, "NotFound", f"No route for {path}")
+        if method not in handlers:
+            allowed = ", ".join(sorted(handlers))
+            return route, _error_handler(405, "MethodNotAllowed", f"Use {allowed}")
+        return route, handlers[method]
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.aclose()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def aclose(self) -> None:
+        """Close the client if the service created it"""
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def _decode_one(self, scope: Scope, receive: Receive, send: Send) -> int:
+        vin = unquote(scope["path"].rstrip("/").rsplit("/", 1)[-1])
+        fields = _query_fields(scope)
+        try:
+            result = await self.client.decode(vin, fields=fields)
+        except VINDecoderError as e:
+            raise HTTPError(status_for(e), type(e).__name__, str(e))
+        await _send_json(send, 200, result_fields(result, fields))
+        return 200
+
+    async def _decode_batch(self, scope: Scope, receive: Receive, send: Send) -> int:
+        vins, fields = _parse_vins(await self._read_body(receive))
+        if fields is None:
+            fields = _query_fields(scope)
+        ndjson = NDJSON in _header(scope, b"accept")
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (
+                        b"content-type",
+                        NDJSON.encode() if ndjson else b"application/json",
+                    )
+                ],
+            }
+        )
+        first = True
+        if not ndjson:
+            await _send_chunk(send, b"[")
+        for start in range(0, len(vins), self.stream_chunk):
+            chunk = vins[start : start + self.stream_chunk]
+            outcomes = await self.client.decode_batch(
+                chunk, return_exceptions=True, result_type="lean", fields=fields
+            )
+            rows = [
+                json.dumps(result_row(v, o, fields)) for v, o in zip(chunk, outcomes)
+            ]
+            if ndjson:
+                body = "".join(f"{row}\n" for row in rows)
+            else:
+                body = ("" if first else ",") + ",".join(rows)
+            first = False
+            await _send_chunk(send, body.encode())
+        await _send_chunk(send, b"" if ndjson else b"]", more_body=False)
+        return 200
+
+    async def _read_body(self, receive: Receive) -> bytes:
+        body = bytearray()
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if len(body) > self.max_body:
+                raise HTTPError(
+                    413, "PayloadTooLarge", f"Limit is {self.max_body} bytes"
+                )
+            if not message.get("more_body"):
+                return bytes(body)
+
+    async def _healthz(self, scope: Scope, receive: Receive, send: Send) -> int:
+        await _send_json(
+            send, 200, {"status": "ok", "upstream": self.client.breaker.state}
+        )
+        return 200
+
+    async def _metrics(self, scope: Scope, receive: Receive, send: Send) -> int:
+        body = self.registry.exposition().encode()
+        await _send(send, 200, CONTENT_TYPE.encode(), body)
+        return 200
+
+
+def _error_handler(status: int, error: str, detail: str) -> Handler:
+    async def handler(scope: Scope, receive: Receive, send: Send) -> int:
+        raise HTTPError(status, error, detail)
+
+    return handler
+
+
+def _parse_vins(body: bytes) -> Tuple[List[str], Optional[Tuple[str, ...]]]:
+    """VINs and the fields projection (if any) of a batch request body"""
+    try:
+        data = json.loads(body)
+    except ValueError as e:
+        raise HTTPError(400, "InvalidJSON", str(e))
+    vins = data.get("vins") if isinstance(data, dict) else data
+    if not isinstance(vins, list) or not all(isinstance(v, str) for v in vins):
+        raise HTTPError(400, "InvalidRequest", 'Expected {"vins": ["..."]}')
+    fields = data.get("fields") if isinstance(data, dict) else None
+    if fields is not None and (
+        not isinstance(fields, list) or not all(isinstance(f, str) for f in fields)
+    ):
+        raise HTTPError(400, "InvalidRequest", 'Expected "fields": ["..."]')
+    return vins, _fields(fields)
+
+
+def _query_fields(scope: Scope) -> Optional[Tuple[str, ...]]:
+    """The ?fields=a,b projection of a request, if any"""
+    query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+    if "fields" not in query:
+        return None
+    return _fields([f for value in query["fields"] for f in value.split(",") if f])
+
+
+def _fields(fields: Optional[List[str]]) -> Optional[Tuple[str, ...]]:
+    if fields is None:
+        return None
+    try:
+        return projection(fields)
+    except ValueError as e:
+        raise HTTPError(400, "InvalidFields", str(e))
+
+
+def _header(scope: Scope, name: bytes) -> str:
+    return next(
+        (value.decode("latin-1") for key, value in scope["headers"] if key == name), ""
+    )
+
+
+async def _send(send: Send, status: int, content_type: bytes, body: bytes) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", content_type),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _send_json(send: Send, status: int, data: Any) -> None:
+    await _send(send, status, b"application/json", json.dumps(data).encode())
+
+
+async def _send_chunk(send: Send, body: bytes, more_body: bool = True) -> None:
+    await send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+
+def create_app(base_url: str = NHTSA_BASE_URL) -> DecodeService:
+    """App factory, e.g. uvicorn --factory src.service:create_app"""
+    return DecodeService(base_url=base_url)
+
+
+__all__ = ["DecodeService", "create_app", "status_for", "ERROR_STATUS"]
@@ -0,0 +1,4 @@
+from src.testing.cassette import Cassette
+from src.testing.stub import StubVPICServer, lognormal_latency
+
+__all__ = ["Cassette", "StubVPICServer", "lognormal_latency"]
@@ -0,0 +1,64 @@
+"""
+Run a local vPIC stub, or record a cassette for it.
+
+    python -m src.testing serve --port 8081 --cassette fleet.json \
+        --latency 0.05 --p99 0.5 --error-rate 0.01 --rate-limit 20
+    python -m src.testing record vins.txt -o fleet.json
+"""
+
+import argparse
+
+from src.config import NHTSA_BASE_URL
+from src.testing.cassette import Cassette
+from src.testing.stub import StubVPICServer, lognormal_latency
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m src.testing")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="run the stub vPIC server")
+    serve.add_argument("--port", type=int, default=8081)
+    serve.add_argument("--cassette", help="cassette file to replay")
+    serve.add_argument("--latency", type=float, default=0.0, help="median seconds")
+    serve.add_argument("--p99", type=float, help="99th percentile latency seconds")
+    serve.add_argument("--error-rate", type=float, default=0.0)
+    serve.add_argument("--error-status", type=int, default=503)
+    serve.add_argument("--rate-limit", type=float, help="requests per second")
+    serve.add_argument("--seed", type=int)
+
+    record = commands.add_parser("record", help="record a cassette from vPIC")
+    record.add_argument("vins", help="text file with one VIN per line")
+    record.add_argument("-o", "--output", required=True)
+    record.add_argument("--base-url", default=NHTSA_BASE_URL)
+
+    args = parser.parse_args()
+    if args.command == "record":
+        with open(args.vins, encoding="utf-8") as f:
+            vins = [line.strip() for line in f if line.strip()]
+        cassette = Cassette.record(vins, base_url=args.base_url)
+        cassette.save(args.output)
+        print(f"Recorded {len(cassette)} results to {args.output}")
+        return
+
+    latency = args.latency
+    if args.p99 is not None:
+        latency = lognormal_latency(args.latency, args.p99, seed=args.seed)
+    stub = StubVPICServer(
+        cassette=Cassette.load(args.cassette) if args.cassette else None,
+        latency=latency,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        rate_limit=args.rate_limit,
+        seed=args.seed,
+        port=args.port,
+    )
+    print(f"Stub vPIC API at {stub.base_url}")
+    try:
+        stub.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
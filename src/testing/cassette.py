@@ -0,0 +1,129 @@
+"""Record/replay cassettes of vPIC results for offline tests and benchmarks."""
+
+import json
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+import requests
+
+from src.config import (
+    BATCH_SIZE,
+    DECODE_VIN_BATCH_ENDPOINT,
+    DEFAULT_FORMAT,
+    REQUEST_TIMEOUT,
+    NHTSA_BASE_URL,
+)
+
+CASSETTE_VERSION = 1
+
+
+class Cassette:
+    """
+    Raw vPIC result entries keyed by VIN, as the API returned them.
+
+    A cassette is recorded once from the real API (or built from canned
+    responses) and replayed by StubVPICServer, so tests and benchmarks see
+    real payloads without network access. On disk it is a JSON document:
+
+        {"version": 1, "source": "...", "recorded": "...",
+         "results": [{"VIN": "...", "Make": "...", ...}, ...]}
+
+    Args:
+        results: Entries of a Results array (each needs a VIN)
+        source: Where the results came from, for reference
+    """
+
+    def __init__(
+        self,
+        results: Iterable[Dict[str, Any]] = (),
+        source: Optional[str] = None,
+    ):
+        self.source = source
+        self._results: Dict[str, Dict[str, Any]] = {}
+        for result in results:
+            self.add(result)
+
+    def __contains__(self, vin: str) -> bool:
+        return vin.upper() in self._results
+
+    def __getitem__(self, vin: str) -> Dict[str, Any]:
+        return self._results[vin.upper()]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._results)
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def add(self, result: Dict[str, Any]) -> None:
+        """Add (or replace) one result entry"""
+        self._results[result["VIN"].upper()] = result
+
+    def add_response(self, response: Dict[str, Any]) -> None:
+        """Add every entry of a vPIC response body's Results array"""
+        for result in response.get("Results") or []:
+            self.add(result)
+
+    @classmethod
+    def record(
+        cls,
+        vins: Iterable[str],
+        base_url: str = NHTSA_BASE_URL,
+        timeout: float = REQUEST_TIMEOUT,
+        session: Optional[requests.Session] = None,
+    ) -> "Cassette":
+        """
+        Record results for VINs from the batch endpoint.
+
+        Args:
+            vins: VINs to record (sent as given, BATCH_SIZE per request)
+            base_url: vPIC API base URL
+            timeout: Request timeout in seconds
+            session: Session to send requests with
+
+        Raises:
+            requests.RequestException: A request failed
+        """
+        cassette = cls(source=base_url)
+        http = session or requests.Session()
+        url = f"{base_url.rstrip('/')}/{DECODE_VIN_BATCH_ENDPOINT}/"
+        pending = list(dict.fromkeys(vin.upper() for vin in vins))
+        try:
+            for start in range(0, len(pending), BATCH_SIZE):
+                data = {
+                    "format": DEFAULT_FORMAT,
+                    "data": ";".join(pending[start : start + BATCH_SIZE]),
+                }
+                response = http.post(url, data=data, timeout=timeout)
+                response.raise_for_status()
+                cassette.add_response(response.json())
+        finally:
+            if session is None:
+                http.close()
+        return cassette
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        """Read a cassette file"""
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version: {data.get('version')}")
+        return cls(data["results"], source=data.get("source"))
+
+    def save(self, path: str) -> None:
+        """Write the cassette atomically (write a temp file, then rename)"""
+        data = {
+            "version": CASSETTE_VERSION,
+            "source": self.source,
+            "recorded": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "results": list(self._results.values()),
+        }
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1)
+        os.replace(tmp, path)
+
+
+__all__ = ["Cassette", "CASSETTE_VERSION"]
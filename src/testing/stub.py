@@ -0,0 +1,227 @@
+"""Local stand-in for the vPIC API, for tests and offline load testing."""
+
+import json
+import math
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import parse_qs, urlparse
+
+from src.testing.cassette import Cassette
+
+# Seconds to wait before answering: a constant or a sampler
+Latency = Union[float, Callable[[], float]]
+
+# z-score of the 99th percentile of a standard normal distribution
+_Z99 = 2.326
+
+
+def lognormal_latency(
+    median: float, p99: float, seed: Optional[int] = None
+) -> Callable[[], float]:
+    """
+    Latency sampler with a long right tail, like real API response times.
+
+    Args:
+        median: Median latency in seconds
+        p99: 99th percentile latency in seconds (at least the median)
+        seed: Seed for reproducible samples
+
+    Returns:
+        Function returning one latency in seconds per call
+    """
+    if median <= 0 or p99 < median:
+        raise ValueError("need 0 < median <= p99")
+    sigma = math.log(p99 / median) / _Z99
+    rng = random.Random(seed)
+    return lambda: rng.lognormvariate(math.log(median), sigma)
+
+
+class _StubVPICHandler(BaseHTTPRequestHandler):
+    """Serves the single-VIN and batch endpoints from the stub's state"""
+
+    protocol_version = "HTTP/1.1"  # allow keep-alive connections
+    # Headers and body are separate writes; with Nagle's algorithm the body
+    # waits for the client's delayed ACK, adding ~40 ms to every response
+    disable_nagle_algorithm = True
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _reply(self, results: List[Dict[str, Any]]) -> None:
+        stub = self.server.stub
+        stub.calls.append(self.path)
+        stub.connections.add(self.client_address)
+        retry_after = stub._throttle()
+        if retry_after is not None:
+            self._send(429, {"Message": "Too many requests"}, retry_after)
+            return
+        delay = stub._next_delay()
+        if delay:
+            time.sleep(delay)
+        if stub._inject_error():
+            self._send(stub.error_status, {"Message": "Injected failure"})
+            return
+        body = {"Count": len(results), "Message": stub.message, "Results": results}
+        self._send(stub.status, body)
+
+    def _send(
+        self, status: int, payload: Dict[str, Any], retry_after: Optional[int] = None
+    ) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if retry_after is not None:
+            self.send_header("Retry-After", str(retry_after))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        vin = urlparse(self.path).path.rstrip("/").rsplit("/", 1)[-1]
+        self._reply([self.server.stub.result_for(vin)])
+
+    def do_POST(self) -> None:
+        stub = self.server.stub
+        length = int(self.headers.get("Content-Length", 0))
+        form = parse_qs(self.rfile.read(length).decode())
+        vins = form.get("data", [""])[0].split(";")
+        stub.batch_vins.append(vins)
+        self._reply([stub.result_for(vin) for vin in vins if vin])
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], stub: "StubVPICServer"):
+        super().__init__(address, _StubVPICHandler)
+        self.stub = stub
+
+
+class StubVPICServer:
+    """
+    Local HTTP server answering like vPIC, on 127.0.0.1.
+
+    Serves DecodeVinValuesExtended (GET) and DecodeVINValuesBatch (POST).
+    Results come from results, then the cassette, then a clean BMW decode.
+    Every request is recorded in calls (and batch requests in batch_vins)
+    so tests can assert on upstream traffic.
+
+    Latency is a constant or a sampler such as lognormal_latency(); delays
+    queued in delays are used first, one per request. A fraction
+    error_rate of requests fails with error_status, and with rate_limit
+    set, requests beyond rate_limit per second (after a burst of as many)
+    get 429 and a Retry-After header, like the real API under load.
+
+        with StubVPICServer(latency=lognormal_latency(0.05, 0.5)) as stub:
+            client = VINDecoderClient(base_url=stub.base_url)
+
+    Args:
+        cassette: Recorded results to replay
+        latency: Seconds to wait before each answer
+        error_rate: Fraction of requests answered with error_status
+        error_status: HTTP status of injected failures
+        rate_limit: Requests per second served before throttling
+        seed: Seed for error injection
+        port: Port to listen on (0 picks a free one)
+    """
+
+    def __init__(
+        self,
+        cassette: Optional[Cassette] = None,
+        latency: Latency = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        rate_limit: Optional[float] = None,
+        seed: Optional[int] = None,
+        port: int = 0,
+    ):
+        if not 0 <= error_rate <= 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        if rate_limit is not None and rate_limit <= 0:
+            raise ValueError("rate_limit must be positive")
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.cassette = cassette
+        self.delay = latency
+        self.delays: List[float] = []  # per-request delays, used before delay
+        self.status = 200
+        self.message = "Results returned successfully"
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.rate_limit = rate_limit
+        self.calls: List[str] = []
+        self.connections: Set[Tuple[str, int]] = set()
+        self.batch_vins: List[List[str]] = []
+        self.throttled = 0
+        self.injected_errors = 0
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._burst = max(1.0, rate_limit or 0.0)
+        self._tokens = self._burst
+        self._refilled = time.monotonic()
+        self._httpd = _StubHTTPServer(("127.0.0.1", port), self)
+        self.base_url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+
+    def __enter__(self) -> "StubVPICServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def result_for(self, vin: str) -> Dict[str, Any]:
+        """Result for a VIN (a clean BMW decode unless overridden)"""
+        if vin in self.results:
+            return self.results[vin]
+        if self.cassette is not None and vin in self.cassette:
+            return self.cassette[vin]
+        return {"VIN": vin, "Make": "BMW", "Model": "X3", "ErrorCode": "0"}
+
+    def _next_delay(self) -> float:
+        with self._lock:
+            if self.delays:
+                return self.delays.pop(0)
+            return self.delay() if callable(self.delay) else self.delay
+
+    def _inject_error(self) -> bool:
+        with self._lock:
+            if self.error_rate and self._random.random() < self.error_rate:
+                self.injected_errors += 1
+                return True
+            return False
+
+    def _throttle(self) -> Optional[int]:
+        """Take a token; whole seconds to wait instead if none is left"""
+        if self.rate_limit is None:
+            return None
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._burst,
+                self._tokens + (now - self._refilled) * self.rate_limit,
+            )
+            self._refilled = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return None
+            self.throttled += 1
+            return math.ceil((1 - self._tokens) / self.rate_limit)
+
+    def start(self) -> None:
+        """Serve requests on a background thread"""
+        threading.Thread(
+            target=self._httpd.serve_forever, args=(0.05,), daemon=True
+        ).start()
+
+    def serve_forever(self) -> None:
+        """Serve requests on the calling thread until interrupted"""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+__all__ = ["StubVPICServer", "Latency", "lognormal_latency"]
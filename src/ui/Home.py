@@ -1,9 +1,17 @@
 """pyVIN - Vehicle Identification Number Decoder"""
 
+import os
+
 import streamlit as st
+from src.config import METRICS_PORT_ENV
+from src.metrics import start_http_server
 
 st.set_page_config(page_title="Home - pyVIN", page_icon="🚗", layout="wide")
 
+# Prometheus endpoint for the app's decode metrics (started once per process)
+if os.environ.get(METRICS_PORT_ENV):
+    start_http_server(int(os.environ[METRICS_PORT_ENV]), addr="0.0.0.0")
+
 # Header
 st.title("🚗 pyVIN")
 st.subheader("Vehicle Identification Number Decoder")
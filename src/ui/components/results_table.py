@@ -3,7 +3,7 @@
 from typing import Any, Dict
 
 import streamlit as st
-from src.formatting.fields import FIELD_LABELS, FIELD_DESCRIPTIONS
+from src.formatting.table import results_table_html
 
 
 def display_results_table(filtered_data: Dict[str, Any]) -> None:
@@ -17,21 +17,6 @@ def display_results_table(filtered_data: Dict[str, Any]) -> None:
         st.warning("No data to display")
         return
 
-    # Build display data with clean labels and tooltips
-    display_rows = []
-    for field_name, value in filtered_data.items():
-        label = FIELD_LABELS.get(field_name, field_name.replace("_", " ").title())
-        description = FIELD_DESCRIPTIONS.get(field_name, "")
-
-        # Create field name with tooltip using HTML title attribute
-        if description:
-            field_with_tooltip = f'<span title="{description}">{label}</span>'
-        else:
-            field_with_tooltip = label
-
-        display_rows.append({"Field": field_with_tooltip, "Value": str(value)})
-
-    # Create DataFrame
     # Display as HTML table to support tooltips
     st.markdown(
         """
@@ -66,16 +51,7 @@ def display_results_table(filtered_data: Dict[str, Any]) -> None:
         unsafe_allow_html=True,
     )
 
-    # Generate HTML table
-    table_html = '<table class="results-table">'
-    table_html += "<tr><th>Field</th><th>Value</th></tr>"
-
-    for row in display_rows:
-        table_html += f"<tr><td>{row['Field']}</td><td>{row['Value']}</td></tr>"
-
-    table_html += "</table>"
-
-    st.markdown(table_html, unsafe_allow_html=True)
+    st.markdown(results_table_html(filtered_data), unsafe_allow_html=True)
 
 
 __all__ = ["display_results_table"]
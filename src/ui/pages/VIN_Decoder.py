@@ -1,10 +1,12 @@
 """VIN Decoder page for pyVIN application"""
 
 import streamlit as st
-from src.api.client import decode_vin_values_extended
+from src.api.client import decode_vin_values_extended, get_default_client
+from src.config import METRICS_ENV
 from src.formatting.response import filter_non_null
 from src.ui.components.results_table import display_results_table
 from src.exceptions import VINDecoderError
+from src.metrics import REGISTRY
 
 st.set_page_config(page_title="VIN Decoder - pyVIN", layout="wide")
 
@@ -60,6 +62,13 @@ if st.button("Decode VIN", type="primary", use_container_width=False):
     else:
         st.warning("⚠️ Please enter a VIN")
 
+# Decode, cache and upstream metrics of this app process
+with st.expander("📈 Metrics"):
+    if getattr(get_default_client(), "metrics", None) is None:
+        st.caption(f"Start the app with {METRICS_ENV}=1 to collect metrics.")
+    else:
+        st.code(REGISTRY.exposition(), language="text")
+
 # Footer with helpful info
 st.divider()
 st.caption("Data provided by the NHTSA vPIC API")
@@ -1,3 +1,21 @@
-from src.validation.vin import validate_and_normalize_vin
+from src.validation.bulk import BulkValidation, ValidationCode, validate_many
+from src.validation.vin import (
+    compute_check_digit,
+    has_valid_check_digit,
+    model_year_candidates,
+    squish_vin,
+    typo_candidates,
+    validate_and_normalize_vin,
+)
 
-__all__ = ["validate_and_normalize_vin"]
+__all__ = [
+    "validate_and_normalize_vin",
+    "compute_check_digit",
+    "has_valid_check_digit",
+    "typo_candidates",
+    "model_year_candidates",
+    "squish_vin",
+    "validate_many",
+    "BulkValidation",
+    "ValidationCode",
+]
@@ -0,0 +1,143 @@
+"""Vectorized validation of large VIN columns with NumPy."""
+
+from enum import IntEnum
+from typing import Iterable, NamedTuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from src.validation.vin import TRANSLITERATION, WEIGHTS
+
+VIN_LENGTH = 17
+_CHECK_CHARS = "0123456789X"
+
+
+class ValidationCode(IntEnum):
+    """Per-row outcome of validate_many, mirroring validate_and_normalize_vin"""
+
+    VALID = 0
+    EMPTY = 1
+    BAD_LENGTH = 2
+    BAD_CHARACTER = 3
+    BAD_CHECK_DIGIT = 4
+
+
+class BulkValidation(NamedTuple):
+    """
+    Result of validate_many, one entry per input row.
+
+    Attributes:
+        vins: Normalized VINs ("" where invalid)
+        valid: True where the VIN passed validation
+        codes: ValidationCode values (uint8)
+    """
+
+    vins: "np.ndarray"
+    valid: "np.ndarray"
+    codes: "np.ndarray"
+
+
+def _tables():
+    """Lookup tables over ASCII code points: uppercase, allowed and digit value"""
+    upper = np.arange(128, dtype=np.uint8)
+    upper[ord("a") : ord("z") + 1] -= 32
+    allowed = np.zeros(128, dtype=bool)
+    values = np.zeros(128, dtype=np.int32)
+    for char, value in TRANSLITERATION.items():
+        allowed[ord(char)] = True
+        values[ord(char)] = value
+    allowed[ord("*")] = True
+    return upper, allowed, values
+
+
+def _is_null(value) -> bool:
+    """True for None and missing-value markers such as NaN, NaT and pd.NA"""
+    if value is None:
+        return True
+    try:
+        return bool(value != value)
+    except TypeError:  # pd.NA != pd.NA is pd.NA, whose truth value is ambiguous
+        return True
+
+
+def _as_strings(vins: Union[Iterable[str], "np.ndarray"]) -> "np.ndarray":
+    """Flatten vins into a string array, with null entries as empty strings"""
+    if isinstance(vins, np.ndarray) and vins.dtype.kind in "US":
+        return vins.astype(np.str_, copy=False).reshape(-1)
+    items = np.asarray(
+        vins if isinstance(vins, np.ndarray) else list(vins), dtype=object
+    )
+    items = items.reshape(-1)
+    nulls = np.fromiter(
+        (type(v) is not str and _is_null(v) for v in items), bool, len(items)
+    )
+    items[nulls] = ""
+    return items.astype(np.str_)
+
+
+def validate_many(
+    vins: Union[Iterable[str], "np.ndarray"], strict: bool = False
+) -> BulkValidation:
+    """
+    Validate and normalize a column of VINs in one pass without raising.
+
+    Applies the same rules as validate_and_normalize_vin (strip, uppercase,
+    exactly 17 characters from A-Z minus I/O/Q, 0-9 and *) with array
+    operations over code points instead of a regex per row. Rows that
+    contain non-ASCII characters are rare and are uppercased in Python so
+    the outcome matches the scalar validator exactly. The one difference:
+    NumPy string arrays cannot hold trailing NUL characters, so those are
+    dropped like trailing whitespace. None and NaN entries (missing values
+    in a DataFrame column) are EMPTY rather than the text "None" or "nan".
+
+    Args:
+        vins: Sequence or array of VIN strings, possibly with nulls
+        strict: Also flag wrong check digits as BAD_CHECK_DIGIT (VINs with
+            wildcards are not checked)
+
+    Returns:
+        BulkValidation with normalized VINs, a validity mask and error codes
+    """
+    if np is None:  # pragma: no cover - optional dependency
+        raise ImportError("validate_many requires numpy: pip install 'pyVIN-UI[bulk]'")
+
+    raw = _as_strings(vins)
+    n = raw.shape[0]
+    stripped = np.char.strip(raw)
+    lengths = np.char.str_len(stripped)
+
+    codes = np.full(n, ValidationCode.VALID, dtype=np.uint8)
+    codes[lengths == 0] = ValidationCode.EMPTY
+    codes[(lengths != 0) & (lengths != VIN_LENGTH)] = ValidationCode.BAD_LENGTH
+    full = lengths == VIN_LENGTH
+
+    # One row of 17 UCS-4 code points per VIN; shorter rows are zero padded.
+    # Code points above ASCII clip to 127 (DEL), which is never allowed.
+    wide = stripped.astype(f"U{VIN_LENGTH}").view(np.uint32).reshape(n, VIN_LENGTH)
+    upper, allowed, values = _tables()
+    points = upper[np.minimum(wide, 127).astype(np.uint8)]
+
+    for i in np.flatnonzero(full & (wide > 127).any(axis=1)):
+        upper_vin = str(stripped[i]).upper()
+        if len(upper_vin) == VIN_LENGTH:
+            points[i] = [min(ord(c), 127) for c in upper_vin]
+        else:
+            points[i] = 127  # e.g. "ß" -> "SS": a character error, as in the regex
+
+    codes[full & ~allowed[points].all(axis=1)] = ValidationCode.BAD_CHARACTER
+
+    if strict:
+        checkable = (codes == ValidationCode.VALID) & (points != ord("*")).all(axis=1)
+        remainder = (values[points] @ np.array(WEIGHTS, dtype=np.int32)) % 11
+        expected = np.frombuffer(_CHECK_CHARS.encode(), dtype=np.uint8)[remainder]
+        codes[checkable & (points[:, 8] != expected)] = ValidationCode.BAD_CHECK_DIGIT
+
+    valid = codes == ValidationCode.VALID
+    points[~valid] = 0
+    normalized = points.astype(np.uint32).view(f"U{VIN_LENGTH}").reshape(n)
+    return BulkValidation(vins=normalized, valid=valid, codes=codes)
+
+
+__all__ = ["BulkValidation", "ValidationCode", "validate_many"]
@@ -1,10 +1,26 @@
 import re
-from src.exceptions import InvalidVINError
+from typing import List
+
+from src.exceptions import CheckDigitError, InvalidVINError
 
 VIN_PATTERN = re.compile(r"^[A-HJ-NPR-Z0-9*]{17}$")  # * allowed for wildcards
 
+# ISO 3779 / FMVSS 115 check digit: letter transliteration and position weights
+TRANSLITERATION = {
+    **{str(d): d for d in range(10)},
+    **dict(zip("ABCDEFGH", range(1, 9))),
+    **dict(zip("JKLMN", range(1, 6))),
+    "P": 7,
+    "R": 9,
+    **dict(zip("STUVWXYZ", range(2, 10))),
+}
+WEIGHTS = (8, 7, 6, 5, 4, 3, 2, 10, 0, 9, 8, 7, 6, 5, 4, 3, 2)
+
+# Position-10 model year codes, repeating every 30 years from 1980
+MODEL_YEAR_CODES = "ABCDEFGHJKLMNPRSTVWXY123456789"
+
 
-def validate_and_normalize_vin(vin: str) -> str:
+def validate_and_normalize_vin(vin: str, strict: bool = False) -> str:
     """
     Validate and normalize VIN. Returns uppercase VIN.
 
@@ -12,27 +28,32 @@ def validate_and_normalize_vin(vin: str) -> str:
 
     Args:
         vin: VIN string to validate (must be 17 characters)
+        strict: Also reject a wrong check digit (VINs with wildcards are
+            not checked)
 
     Returns:
         Normalized (uppercase, stripped) VIN
 
     Raises:
         InvalidVINError: If VIN format is invalid
+        CheckDigitError: If strict and the check digit does not match
     """
     if not vin:
         raise InvalidVINError("VIN cannot be empty")
 
-    normalized = vin.upper().strip()
+    stripped = vin.strip()
+    normalized = stripped.upper()
 
     if not normalized:
         raise InvalidVINError("VIN cannot be empty")
 
     # Regex handles both length (exactly 17) and valid characters
-    if not VIN_PATTERN.match(normalized):
-        # Figure out if it's length or character issue for better error message
-        if len(normalized) != 17:
+    if not VIN_PATTERN.match(normalized) or len(stripped) != 17:
+        # Figure out if it's length or character issue for better error message.
+        # Length is taken before upper() since e.g. "ß".upper() == "SS".
+        if len(stripped) != 17:
             raise InvalidVINError(
-                f"VIN must be exactly 17 characters (got {len(normalized)}). "
+                f"VIN must be exactly 17 characters (got {len(stripped)}). "
                 "Use * as wildcard for unknown positions."
             )
         else:
@@ -41,7 +62,118 @@ def validate_and_normalize_vin(vin: str) -> str:
                 "Only A-Z, 0-9, and * allowed. Letters I, O, and Q are not valid."
             )
 
+    if strict and "*" not in normalized:
+        expected = compute_check_digit(normalized)
+        if normalized[8] != expected:
+            raise CheckDigitError(
+                f"Invalid check digit in VIN {normalized}: "
+                f"expected {expected}, got {normalized[8]}"
+            )
+
     return normalized
 
 
-__all__ = ["validate_and_normalize_vin", "VIN_PATTERN"]
+def compute_check_digit(vin: str) -> str:
+    """
+    Compute the position-9 check digit for a normalized 17-character VIN.
+
+    Returns "0"-"9" or "X". Wildcards (*) cannot be checked.
+
+    Raises:
+        InvalidVINError: VIN contains wildcards or is not normalized
+    """
+    try:
+        total = sum(TRANSLITERATION[c] * w for c, w in zip(vin, WEIGHTS))
+    except KeyError:
+        raise InvalidVINError(f"Cannot compute check digit for VIN: {vin}")
+    remainder = total % 11
+    return "X" if remainder == 10 else str(remainder)
+
+
+def has_valid_check_digit(vin: str) -> bool:
+    """
+    Whether a normalized VIN's position-9 check digit matches.
+
+    VINs with wildcards (*) cannot be checked and return False.
+    """
+    return "*" not in vin and vin[8] == compute_check_digit(vin)
+
+
+def typo_candidates(vin: str) -> List[str]:
+    """
+    List VINs one character away from a normalized VIN that pass the check digit.
+
+    A wrong check digit is usually a single mistyped character. The corrected
+    check digit comes first, followed by single substitutions in positions
+    other than 9, in position order. Only characters valid in a VIN are tried;
+    the result can be empty. A VIN that already passes is returned unchanged
+    as the only candidate.
+
+    Raises:
+        InvalidVINError: VIN contains wildcards or is not normalized
+    """
+    expected = compute_check_digit(vin)
+    if vin[8] == expected:
+        return [vin]
+
+    candidates = [vin[:8] + expected + vin[9:]]
+    # Otherwise the typo may be elsewhere: find substitutions whose weighted
+    # sum reaches the check digit as written (X means 10)
+    if vin[8] == "X":
+        target = 10
+    elif vin[8].isdigit():
+        target = int(vin[8])
+    else:
+        return candidates
+    total = sum(TRANSLITERATION[c] * w for c, w in zip(vin, WEIGHTS))
+    for i, (current, weight) in enumerate(zip(vin, WEIGHTS)):
+        if weight == 0:
+            continue
+        base = total - TRANSLITERATION[current] * weight
+        for char, value in TRANSLITERATION.items():
+            if char != current and (base + value * weight) % 11 == target:
+                candidates.append(vin[:i] + char + vin[i + 1 :])
+    return candidates
+
+
+def model_year_candidates(vin: str) -> List[int]:
+    """
+    Model years a normalized VIN's position-10 code can stand for, most likely first.
+
+    The code repeats every 30 years. For light vehicles a letter in position
+    7 marks the 2010-2039 cycle and a digit the 1980-2009 cycle, so the
+    cycle it points to comes first. Returns [] for codes that are not
+    model years (0, U, Z or a wildcard).
+    """
+    index = MODEL_YEAR_CODES.find(vin[9])
+    if index < 0:
+        return []
+    years = [1980 + index, 2010 + index]
+    return years[::-1] if vin[6].isalpha() else years
+
+
+def squish_vin(vin: str) -> str:
+    """
+    Return the pattern ("squish") key for a normalized VIN.
+
+    vPIC decodes depend on positions 1-8 (WMI and VDS) and 10-11 (model year
+    and plant); the check digit and serial number do not change the decoded
+    attributes. Manufacturers building fewer than 1,000 vehicles a year use
+    "9" in position 3 and continue their identifier in positions 12-14, so
+    those positions are kept for them.
+    """
+    key = vin[:8] + vin[9:11]
+    if vin[2] == "9":
+        key += vin[11:14]
+    return key
+
+
+__all__ = [
+    "validate_and_normalize_vin",
+    "compute_check_digit",
+    "has_valid_check_digit",
+    "typo_candidates",
+    "model_year_candidates",
+    "squish_vin",
+    "VIN_PATTERN",
+]
@@ -1,7 +1,18 @@
 """Pytest configuration and shared fixtures"""
 
 import pytest
+from src.api.client import set_default_client
 from src.api.models import VINDecodeResult
+from src.testing.stub import StubVPICServer
+from src.validation.vin import compute_check_digit
+
+
+@pytest.fixture(autouse=True)
+def fresh_default_client():
+    """Give each test its own default client (and so an empty default cache)"""
+    set_default_client(None)
+    yield
+    set_default_client(None)
 
 
 @pytest.fixture
@@ -46,6 +57,17 @@ def invalid_vin_with_q():
     return "5UXWX7C50BQ123456"
 
 
+@pytest.fixture
+def make_vin():
+    """Build a VIN with a correct check digit from a pattern and serial"""
+
+    def _make_vin(serial: int, prefix: str = "1GCHK23U", year_plant: str = "4F"):
+        vin = f"{prefix}0{year_plant}{serial:06d}"
+        return vin[:8] + compute_check_digit(vin) + vin[9:]
+
+    return _make_vin
+
+
 @pytest.fixture
 def sample_api_response():
     """Sample NHTSA API response data"""
@@ -125,3 +147,12 @@ def sample_vin_result_with_nulls():
         doors="4",
         engine_cylinders="6",
     )
+
+
+@pytest.fixture
+def stub_vpic():
+    """Running local vPIC stub server"""
+    server = StubVPICServer()
+    server.start()
+    yield server
+    server.stop()
@@ -0,0 +1,527 @@
+"""Tests for async API client module"""
+
+import asyncio
+
+import pytest
+from src.api.async_client import (
+    AsyncVINDecoderClient,
+    async_decode_vin_values_extended,
+    async_decode_vins_batch,
+)
+from src.api.models import VINDecodeResult
+from src.api.breaker import CircuitBreaker
+from src.api.hedge import Hedger
+from src.api.ratelimit import AsyncRateLimiter
+from src.api.retry import RetryPolicy
+from src.cache.memory import MemoryCache
+from src.cache.pattern import PatternCache
+from src.exceptions import (
+    APIError,
+    CheckDigitError,
+    CircuitOpenError,
+    InvalidVINError,
+    NetworkError,
+)
+
+NO_RETRY = RetryPolicy(retries=0)
+
+
+def run(coro):
+    """Run a coroutine to completion on a fresh event loop"""
+    return asyncio.run(coro)
+
+
+async def _decode(stub, vin, **kwargs):
+    async with AsyncVINDecoderClient(base_url=stub.base_url, **kwargs) as client:
+        return await client.decode(vin)
+
+
+class TestAsyncDecode:
+    """Tests for AsyncVINDecoderClient.decode"""
+
+    def test_successful_decode(self, stub_vpic, valid_vin):
+        """Test successful VIN decode against the stub server"""
+        result = run(_decode(stub_vpic, valid_vin))
+
+        assert isinstance(result, VINDecodeResult)
+        assert result.vin == valid_vin
+        assert result.make == "BMW"
+
+    def test_decode_normalizes_vin(self, stub_vpic, valid_vin_lowercase):
+        """Test that VIN is normalized before the request"""
+        run(_decode(stub_vpic, f" {valid_vin_lowercase} "))
+
+        assert stub_vpic.calls[0].startswith(
+            f"/DecodeVinValuesExtended/{valid_vin_lowercase.upper()}?"
+        )
+
+    def test_invalid_vin_raises_error(self, stub_vpic, invalid_vin_short):
+        """Test that invalid VIN raises InvalidVINError without a request"""
+        with pytest.raises(InvalidVINError):
+            run(_decode(stub_vpic, invalid_vin_short))
+        assert stub_vpic.calls == []
+
+    def test_http_error(self, stub_vpic, valid_vin):
+        """Test that HTTP error status codes raise NetworkError"""
+        stub_vpic.status = 500
+
+        with pytest.raises(NetworkError, match="Failed to reach NHTSA API"):
+            run(_decode(stub_vpic, valid_vin))
+
+    def test_connection_error(self, valid_vin):
+        """Test that an unreachable server raises NetworkError"""
+
+        async def go():
+            async with AsyncVINDecoderClient(
+                base_url="http://127.0.0.1:9", retry=NO_RETRY
+            ) as c:
+                return await c.decode(valid_vin)
+
+        with pytest.raises(NetworkError, match="Failed to reach NHTSA API"):
+            run(go())
+
+    def test_timeout(self, stub_vpic, valid_vin):
+        """Test that a slow response raises NetworkError after the timeout"""
+        stub_vpic.delay = 0.5
+
+        with pytest.raises(NetworkError, match="Failed to reach NHTSA API"):
+            run(_decode(stub_vpic, valid_vin, timeout=0.05, retry=NO_RETRY))
+
+    def test_critical_error_code_raises(self, stub_vpic, valid_vin):
+        """Test that critical error codes (400+) raise APIError"""
+        stub_vpic.results[valid_vin] = {
+            "VIN": valid_vin,
+            "ErrorCode": "400",
+            "ErrorText": "Invalid Characters Present",
+        }
+
+        with pytest.raises(APIError, match="Invalid Characters Present"):
+            run(_decode(stub_vpic, valid_vin))
+
+    def test_invalid_concurrency(self):
+        """Test that max_concurrency must be positive"""
+        with pytest.raises(ValueError):
+            AsyncVINDecoderClient(max_concurrency=0)
+
+    def test_module_function_with_client(self, stub_vpic, valid_vin):
+        """Test the module-level function with a shared client"""
+
+        async def go():
+            async with AsyncVINDecoderClient(base_url=stub_vpic.base_url) as c:
+                return await async_decode_vin_values_extended(valid_vin, client=c)
+
+        assert run(go()).vin == valid_vin
+
+    def test_module_function_without_client(self, mocker, valid_vin):
+        """Test that the module-level function creates its own client"""
+        decode = mocker.patch.object(
+            AsyncVINDecoderClient, "decode", return_value=VINDecodeResult(vin=valid_vin)
+        )
+
+        result = run(
+            async_decode_vin_values_extended(valid_vin, timeout=3, fields=["make"])
+        )
+
+        assert result.vin == valid_vin
+        decode.assert_called_once_with(valid_vin, 3, ["make"])
+
+
+class TestAsyncStrict:
+    """Tests for strict check digit validation in the async client"""
+
+    def test_strict_rejects_bad_check_digit(self, stub_vpic, valid_vin):
+        """Test that strict mode fails bad check digits without a request"""
+        with pytest.raises(CheckDigitError):
+            run(_decode(stub_vpic, valid_vin, strict=True))
+        assert stub_vpic.calls == []
+
+
+class TestAsyncDecodeMany:
+    """Tests for AsyncVINDecoderClient.decode_many"""
+
+    def test_results_in_input_order(self, stub_vpic):
+        """Test that results come back in input order and duplicates share a call"""
+        vins = ["5UXWX7C50BA123456", "1GCHK23U64F177548", "5uxwx7c50ba123456"]
+
+        async def go():
+            async with AsyncVINDecoderClient(base_url=stub_vpic.base_url) as c:
+                return await c.decode_many(vins)
+
+        results = run(go())
+
+        assert [r.vin for r in results] == [v.upper() for v in vins]
+        assert len(stub_vpic.calls) == 2
+
+    def test_concurrency_is_bounded(self, stub_vpic):
+        """Test that no more than max_concurrency requests are in flight"""
+        stub_vpic.delay = 0.05
+        vins = [f"5UXWX7C50BA{i:06d}" for i in range(6)]
+
+        async def go():
+            async with AsyncVINDecoderClient(
+                base_url=stub_vpic.base_url, max_concurrency=2
+            ) as c:
+                start = asyncio.get_running_loop().time()
+                await c.decode_many(vins)
+                return asyncio.get_running_loop().time() - start
+
+        # 6 requests, 2 at a time, 50ms each -> at least 3 rounds
+        assert run(go()) >= 0.15
+
+    def test_return_exceptions(self, stub_vpic, valid_vin, invalid_vin_short):
+        """Test that failures are returned in place with return_exceptions"""
+        other = "1GCHK23U64F177548"
+        stub_vpic.results[other] = {"VIN": other, "ErrorCode": "400"}
+
+        async def go():
+            async with AsyncVINDecoderClient(base_url=stub_vpic.base_url) as c:
+                return await c.decode_many(
+                    [valid_vin, invalid_vin_short, other], return_exceptions=True
+                )
+
+        results = run(go())
+
+        assert results[0].vin == valid_vin
+        assert isinstance(results[1], InvalidVINError)
+        assert isinstance(results[2], APIError)
+
+    def test_failure_cancels_remaining(self, stub_vpic, valid_vin):
+        """Test that the first failure is raised and pending lookups cancelled"""
+        other = "1GCHK23U64F177548"
+        stub_vpic.results[other] = {"VIN": other, "ErrorCode": "400"}
+
+        async def go():
+            async with AsyncVINDecoderClient(
+                base_url=stub_vpic.base_url, max_concurrency=1
+            ) as c:
+                vins = [other] + [f"5UXWX7C50BA{i:06d}" for i in range(5)]
+                return await c.decode_many(vins)
+
+        with pytest.raises(APIError):
+            run(go())
+        assert len(stub_vpic.calls) < 6
+
+    def test_caller_cancellation(self, stub_vpic):
+        """Test that cancelling the caller cancels in-flight lookups"""
+        stub_vpic.delay = 0.2
+        vins = [f"5UXWX7C50BA{i:06d}" for i in range(4)]
+
+        async def go():
+            async with AsyncVINDecoderClient(base_url=stub_vpic.base_url) as c:
+                task = asyncio.ensure_future(c.decode_many(vins))
+                await asyncio.sleep(0.05)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+
+        run(go())
+
+
+class TestAsyncDecodeBatch:
+    """Tests for the async batch endpoint path"""
+
+    def test_batch_chunks_concurrently(self, stub_vpic):
+        """Test that chunks are sent to the batch endpoint in input order"""
+        vins = [f"5UXWX7C50BA{i:06d}" for i in range(120)]
+
+        async def go():
+            async with AsyncVINDecoderClient(base_url=stub_vpic.base_url) as c:
+                return await c.decode_batch(vins)
+
+        results = run(go())
+
+        assert [r.vin for r in results] == vins
+        assert len(stub_vpic.calls) == 3
+        assert all(c.startswith("/DecodeVINValuesBatch/") for c in stub_vpic.calls)
+
+    def test_batch_http_error_returned(self, stub_vpic, valid_vin):
+        """Test that a failed chunk marks each of its VINs with the error"""
+        stub_vpic.status = 503
+
+        async def go():
+            async with AsyncVINDecoderClient(
+                base_url=stub_vpic.base_url, retry=NO_RETRY
+            ) as c:
+                return await c.decode_batch([valid_vin], return_exceptions=True)
+
+        assert isinstance(run(go())[0], NetworkError)
+
+    def test_batch_http_error_raises(self, stub_vpic, valid_vin):
+        """Test that a failed chunk raises NetworkError"""
+        stub_vpic.status = 503
+
+        async def go():
+            async with AsyncVINDecoderClient(
+                base_url=stub_vpic.base_url, retry=NO_RETRY
+            ) as c:
+                return await c.decode_batch([valid_vin])
+
+        with pytest.raises(NetworkError):
+            run(go())
+
+    def test_module_function(self, mocker, valid_vin):
+        """Test the module-level batch function delegates to a client"""
+        decode_batch = mocker.patch.object(
+            AsyncVINDecoderClient, "decode_batch", return_value=[]
+        )
+
+        assert (
+            run(
+                async_decode_vins_batch(
+                    [valid_vin], max_concurrency=2, result_type="lean", fields=["make"]
+                )
+            )
+            == []
+        )
+        decode_batch.assert_called_once_with([valid_vin], False, None, "lean", ["make"])
+
+
+class TestAsyncCache:
+    """Tests for the async client's cache integration"""
+
+    def test_decode_and_batch_use_cache(self, stub_vpic, valid_vin):
+        """Test that cached VINs skip the network on both paths"""
+        other = "1GCHK23U64F177548"
+        cache = MemoryCache()
+
+        async def go():
+            async with AsyncVINDecoderClient(
+                base_url=stub_vpic.base_url, cache=cache
+            ) as c:
+                await c.decode(valid_vin)
+                await c.decode(valid_vin)
+                return await c.decode_batch([valid_vin, other])
+
+        results = run(go())
+
+        assert [r.vin for r in results] == [valid_vin, other]
+        assert len(stub_vpic.calls) == 2
+        assert stub_vpic.batch_vins == [[other]]
+        assert cache.get(other) is not None
+
+
+class TestAsyncNegativeCache:
+    """Tests for the async client's negative cache"""
+
+    def test_bad_vin_rejected_from_cache(self, stub_vpic, valid_vin):
+        """Test that a known-bad VIN skips the network on both paths"""
+        stub_vpic.results[valid_vin] = {"VIN": valid_vin, "ErrorCode": "400"}
+        negative = MemoryCache()
+
+        async def go():
+            async with AsyncVINDecoderClient(
+                base_url=stub_vpic.base_url, negative_cache=negative
+            ) as c:
+                with pytest.raises(APIError):
+                    await c.decode(valid_vin)
+                with pytest.raises(APIError):
+                    await c.decode(valid_vin)
+                return await c.decode_batch([valid_vin], return_exceptions=True)
+
+        results = run(go())
+
+        assert isinstance(results[0], APIError)
+        assert len(stub_vpic.calls) == 1
+        assert stub_vpic.batch_vins == []
+        assert negative.stats().hits == 2
+
+
+class TestAsyncPatternCache:
+    """Tests for the async client's pattern cache integration"""
+
+    def test_batch_groups_by_pattern(self, stub_vpic, make_vin):
+        """Test that only one representative per pattern is sent"""
+        fleet = [make_vin(i) for i in range(60)]
+        stub_vpic.results[fleet[59]] = {"VIN": fleet[59], "ErrorCode": "400"}
+
+        async def go():
+            async with AsyncVINDecoderClient(
+                base_url=stub_vpic.base_url, pattern_cache=PatternCache()
+            ) as c:
+                batch = await c.decode_batch(fleet, return_exceptions=True)
+                single = await c.decode(make_vin(999))
+                return batch, single
+
+        batch, single = run(go())
+
+        # fleet[59] is served from the pattern cache: vPIC never sees it
+        assert [r.vin for r in batch] == fleet
+        assert single.vin == make_vin(999)
+        assert stub_vpic.batch_vins == [[fleet[0]]]
+        assert len(stub_vpic.calls) == 1
+
+    def test_batch_followers_fall_back(self, stub_vpic, make_vin):
+        """Test that followers are sent when the representative fails"""
+        fleet = [make_vin(i) for i in range(2)]
+        stub_vpic.results[fleet[0]] = {"VIN": fleet[0], "ErrorCode": "400"}
+
+        async def go():
+            async with AsyncVINDecoderClient(
+                base_url=stub_vpic.base_url, pattern_cache=PatternCache()
+            ) as c:
+                return await c.decode_batch(fleet, return_exceptions=True)
+
+        results = run(go())
+
+        assert isinstance(results[0], APIError)
+        assert results[1].vin == fleet[1]
+        assert stub_vpic.batch_vins == [[fleet[0]], [fleet[1]]]
+
+
+class TestAsyncCoalescing:
+    """Tests for in-flight coalescing in the async client"""
+
+    def test_concurrent_decodes_share_one_request(self, stub_vpic, valid_vin):
+        """Test that concurrent decodes of one VIN make a single upstream call"""
+        stub_vpic.delay = 0.05
+
+        async def go():
+            async with AsyncVINDecoderClient(
+                base_url=stub_vpic.base_url, cache=MemoryCache()
+            ) as c:
+                results = await asyncio.gather(*(c.decode(valid_vin) for _ in range(6)))
+                return results, c.stats()
+
+        results, stats = run(go())
+
+        assert len(stub_vpic.calls) == 1
+        assert len({id(r) for r in results}) == 6
+        assert (stats.coalesce.executed, stats.coalesce.coalesced) == (1, 5)
+        assert stats.cache.size == 1
+        assert stats.pattern_cache is None
+
+
+class TestAsyncRateLimiter:
+    """Tests for rate limiting and adaptive concurrency in the async client"""
+
+    def test_server_errors_decrease_limit(self, stub_vpic, valid_vin):
+        stub_vpic.status = 502
+
+        async def go():
+            async with AsyncVINDecoderClient(
+                base_url=stub_vpic.base_url, max_concurrency=4, retry=NO_RETRY
+            ) as c:
+                with pytest.raises(NetworkError):
+                    await c.decode(valid_vin)
+                return c.stats().limiter
+
+        stats = run(go())
+
+        assert (stats.limit, stats.max_limit, stats.decreases) == (2, 4, 1)
+
+    def test_timeout_decreases_limit(self, stub_vpic, valid_vin):
+        stub_vpic.delay = 0.5
+
+        async def go():
+            async with AsyncVINDecoderClient(
+                base_url=stub_vpic.base_url, retry=NO_RETRY
+            ) as c:
+                with pytest.raises(NetworkError):
+                    await c.decode(valid_vin, timeout=0.05)
+                return c.stats().limiter
+
+        assert run(go()).decreases == 1
+
+    def test_shared_limiter(self, stub_vpic):
+        """Test that a caller-supplied limiter bounds the batch requests"""
+        vins = [f"5UXWX7C50BA{i:06d}" for i in range(120)]
+        limiter = AsyncRateLimiter(rate=None, max_concurrency=1)
+
+        async def go():
+            async with AsyncVINDecoderClient(
+                base_url=stub_vpic.base_url, limiter=limiter
+            ) as c:
+                return await c.decode_batch(vins)
+
+        assert len(run(go())) == len(vins)
+        assert limiter.stats().in_flight == 0
+
+
+class TestAsyncResilience:
+    """Tests for retries and the circuit breaker in the async client"""
+
+    def test_retries_transient_status(self, stub_vpic, valid_vin):
+        stub_vpic.status = 503
+
+        async def go():
+            async with AsyncVINDecoderClient(
+                base_url=stub_vpic.base_url, retry=RetryPolicy(retries=2, backoff=0)
+            ) as c:
+                with pytest.raises(NetworkError):
+                    await c.decode(valid_vin)
+
+        run(go())
+
+        assert len(stub_vpic.calls) == 3
+
+    def test_open_circuit_fails_fast(self, stub_vpic, valid_vin):
+        """Test that an open circuit rejects requests without sending them"""
+        stub_vpic.status = 500
+
+        async def go():
+            async with AsyncVINDecoderClient(
+                base_url=stub_vpic.base_url,
+                retry=NO_RETRY,
+                breaker=CircuitBreaker(min_calls=1, window=1),
+            ) as c:
+                with pytest.raises(NetworkError):
+                    await c.decode(valid_vin)
+                with pytest.raises(CircuitOpenError):
+                    await c.decode(valid_vin)
+                return c.stats().breaker
+
+        stats = run(go())
+
+        assert len(stub_vpic.calls) == 1
+        assert (stats.state, stats.rejected) == ("open", 1)
+
+
+class TestAsyncHedging:
+    """Tests for hedged requests in the async client"""
+
+    def test_slow_request_is_hedged(self, stub_vpic, valid_vin):
+        """Test that the hedge wins and the stalled attempt is cancelled"""
+        stub_vpic.delays = [1.0, 0.0]
+
+        async def go():
+            async with AsyncVINDecoderClient(
+                base_url=stub_vpic.base_url, hedge=Hedger(delay=0.05, budget=1)
+            ) as c:
+                result = await c.decode(valid_vin)
+                return result, c.stats()
+
+        result, stats = run(go())
+
+        assert result.make == "BMW"
+        assert (stats.hedge.hedged, stats.hedge.wins) == (1, 1)
+        assert stats.limiter.in_flight == 0
+
+    def test_adaptive_delay_warms_up(self, stub_vpic, make_vin):
+        async def go():
+            async with AsyncVINDecoderClient(
+                base_url=stub_vpic.base_url, hedge=Hedger(min_samples=1, budget=1)
+            ) as c:
+                for serial in range(3):
+                    await c.decode(make_vin(serial))
+                return c.stats().hedge
+
+        stats = run(go())
+
+        assert stats.requests == 3
+        assert stats.delay is not None
+
+    def test_both_attempts_fail(self, stub_vpic, valid_vin):
+        """Test that the primary's error is raised when every attempt fails"""
+        stub_vpic.status = 404
+        stub_vpic.delay = 0.1
+
+        async def go():
+            async with AsyncVINDecoderClient(
+                base_url=stub_vpic.base_url, hedge=Hedger(delay=0.01, budget=1)
+            ) as c:
+                with pytest.raises(NetworkError, match="404"):
+                    await c.decode(valid_vin)
+
+        run(go())
+
+        assert len(stub_vpic.calls) == 2
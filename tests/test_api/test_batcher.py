@@ -0,0 +1,148 @@
+"""Tests for the micro-batching aggregator"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from src.api.batcher import MicroBatcher
+from src.api.client import (
+    VINDecoderClient,
+    decode_vin_values_extended,
+    set_default_client,
+)
+from src.cache.memory import MemoryCache
+from src.exceptions import APIError, InvalidVINError
+
+
+class _FailingBackend(VINDecoderClient):
+    def decode_batch(self, vins, return_exceptions=False, **kwargs):
+        raise RuntimeError("backend down")
+
+
+class _InterruptedBackend(VINDecoderClient):
+    def decode_batch(self, vins, return_exceptions=False, **kwargs):
+        raise KeyboardInterrupt
+
+
+class TestMicroBatcher:
+    """Tests for MicroBatcher"""
+
+    def test_concurrent_decodes_share_batches(self, stub_vpic, make_vin):
+        """Test that concurrent single decodes go out as batch requests"""
+        vins = [make_vin(serial) for serial in range(20)]
+        client = VINDecoderClient(base_url=stub_vpic.base_url)
+
+        with MicroBatcher(client, max_wait=0.2) as batcher:
+            with ThreadPoolExecutor(max_workers=20) as pool:
+                results = list(pool.map(batcher.decode, vins))
+            stats = batcher.stats()
+
+        assert [r.vin for r in results] == vins
+        assert all(c.startswith("/DecodeVINValuesBatch/") for c in stub_vpic.calls)
+        batched = [vin for batch in stub_vpic.batch_vins for vin in batch]
+        assert sorted(batched) == sorted(vins)
+        assert stats.batches == len(stub_vpic.batch_vins) < 20
+        assert stats.mean_batch_size == 20 / stats.batches
+
+    def test_max_batch_splits(self, stub_vpic, make_vin):
+        vins = [make_vin(serial) for serial in range(5)]
+
+        with MicroBatcher(
+            VINDecoderClient(base_url=stub_vpic.base_url), max_wait=1, max_batch=2
+        ) as batcher:
+            futures = [batcher.submit(vin) for vin in vins]
+            results = [f.result() for f in futures]
+
+        assert [r.vin for r in results] == vins
+        assert [len(b) for b in stub_vpic.batch_vins] == [2, 2, 1]
+
+    def test_errors_go_to_their_caller(self, stub_vpic, make_vin):
+        """Test that a critical error fails only the VIN it belongs to"""
+        bad, good = make_vin(1), make_vin(2)
+        stub_vpic.results[bad] = {
+            "VIN": bad,
+            "ErrorCode": "400",
+            "ErrorText": "400 - Invalid Characters Present",
+        }
+
+        with MicroBatcher(
+            VINDecoderClient(base_url=stub_vpic.base_url), max_wait=0.5
+        ) as batcher:
+            bad_future, good_future = batcher.submit(bad), batcher.submit(good)
+
+            with pytest.raises(APIError, match="Invalid Characters"):
+                bad_future.result()
+            assert good_future.result().vin == good
+        assert len(stub_vpic.batch_vins) == 1
+
+    def test_duplicates_get_own_results(self, stub_vpic, valid_vin):
+        with MicroBatcher(
+            VINDecoderClient(base_url=stub_vpic.base_url), max_wait=0.5
+        ) as batcher:
+            first, second = batcher.submit(valid_vin), batcher.submit(valid_vin)
+            results = [first.result(), second.result()]
+
+        assert results[0] == results[1]
+        assert results[0] is not results[1]
+        assert stub_vpic.batch_vins == [[valid_vin]]
+
+    def test_invalid_vin_fails_before_queueing(self, stub_vpic):
+        with MicroBatcher(VINDecoderClient(base_url=stub_vpic.base_url)) as batcher:
+            with pytest.raises(InvalidVINError):
+                batcher.decode("TOO-SHORT")
+            assert batcher.stats().calls == 0
+
+    def test_backend_failure_reaches_every_caller(self):
+        with MicroBatcher(_FailingBackend(), max_wait=0.5) as batcher:
+            futures = [batcher.submit("1GCHK23U64F177548") for _ in range(3)]
+
+            for future in futures:
+                with pytest.raises(RuntimeError, match="backend down"):
+                    future.result()
+
+    def test_base_exception_reaches_every_caller(self):
+        """Test that callers are released when the backend raises BaseException"""
+        with MicroBatcher(_InterruptedBackend(), max_wait=0.5) as batcher:
+            futures = [batcher.submit("1GCHK23U64F177548") for _ in range(3)]
+
+            for future in futures:
+                with pytest.raises(KeyboardInterrupt):
+                    future.result(timeout=5)
+
+    def test_close_flushes_queue(self, stub_vpic, valid_vin):
+        """Test that close decodes queued VINs and refuses new ones"""
+        batcher = MicroBatcher(
+            VINDecoderClient(base_url=stub_vpic.base_url), max_wait=60
+        )
+        future = batcher.submit(valid_vin)
+
+        batcher.close()
+
+        assert future.result(timeout=0).vin == valid_vin
+        with pytest.raises(RuntimeError, match="closed"):
+            batcher.submit(valid_vin)
+
+    def test_serves_module_functions(self, stub_vpic, valid_vin):
+        """Test that callers of decode_vin_values_extended need no changes"""
+        cache = MemoryCache()
+        batcher = MicroBatcher(
+            VINDecoderClient(base_url=stub_vpic.base_url, cache=cache), max_wait=0
+        )
+        set_default_client(batcher)
+        try:
+            assert decode_vin_values_extended(valid_vin).make == "BMW"
+            assert decode_vin_values_extended.cache_info().currsize == 1
+            assert batcher.cache is cache
+            assert batcher.decode_batch([valid_vin])[0].make == "BMW"
+            assert batcher.decode_batch([valid_vin], result_type="raw")[0]["Make"] == (
+                "BMW"
+            )
+        finally:
+            set_default_client(None)
+            batcher.close()
+
+        assert stub_vpic.batch_vins == [[valid_vin]]
+
+    @pytest.mark.parametrize("kwargs", [{"max_wait": -1}, {"max_batch": 0}])
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            MicroBatcher(VINDecoderClient(), **kwargs)
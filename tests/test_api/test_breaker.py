@@ -0,0 +1,124 @@
+"""Tests for the circuit breaker"""
+
+import pytest
+from src.api.breaker import CircuitBreaker
+from src.exceptions import CircuitOpenError, NetworkError
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _breaker(clock, **kwargs):
+    options = {"failure_rate": 0.5, "window": 10, "min_calls": 4, "reset_timeout": 30}
+    options.update(kwargs)
+    return CircuitBreaker(clock=clock, **options)
+
+
+def _call(breaker, failed):
+    breaker.check()
+    breaker.record(failed)
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions"""
+
+    def test_opens_at_failure_rate(self):
+        """Test that the circuit opens once enough calls fail"""
+        breaker = _breaker(FakeClock())
+        for failed in (False, True, False):
+            _call(breaker, failed)
+        assert breaker.state == "closed"
+
+        _call(breaker, True)
+
+        stats = breaker.stats()
+        assert (stats.state, stats.opened) == ("open", 1)
+
+    def test_needs_minimum_calls(self):
+        breaker = _breaker(FakeClock())
+        for _ in range(3):
+            _call(breaker, True)
+
+        assert breaker.state == "closed"
+        assert breaker.stats().failure_rate == 1.0
+
+    def test_open_circuit_fails_fast(self):
+        """Test that an open circuit rejects calls with CircuitOpenError"""
+        breaker = _breaker(FakeClock(), min_calls=1)
+        _call(breaker, True)
+
+        with pytest.raises(CircuitOpenError, match="suspended for 30s"):
+            breaker.check()
+        assert breaker.stats().rejected == 1
+        assert issubclass(CircuitOpenError, NetworkError)
+
+    def test_successful_probe_closes(self):
+        """Test that one probe is admitted after the reset timeout"""
+        clock = FakeClock()
+        breaker = _breaker(clock, min_calls=1)
+        _call(breaker, True)
+        clock.now += 30
+
+        breaker.check()
+        assert breaker.state == "half_open"
+        with pytest.raises(CircuitOpenError, match="probe in progress"):
+            breaker.check()
+
+        breaker.record(False)
+        assert breaker.state == "closed"
+        assert breaker.stats().calls == 0
+
+    def test_failed_probe_reopens(self):
+        clock = FakeClock()
+        breaker = _breaker(clock, min_calls=1)
+        _call(breaker, True)
+        clock.now += 30
+
+        _call(breaker, True)
+
+        assert breaker.state == "open"
+        assert breaker.stats().opened == 2
+
+    def test_lost_probe_expires(self):
+        """Test that a probe which never reports back does not block forever"""
+        clock = FakeClock()
+        breaker = _breaker(clock, min_calls=1)
+        _call(breaker, True)
+        clock.now += 30
+        breaker.check()
+
+        clock.now += 30
+        breaker.check()
+
+        assert breaker.state == "half_open"
+
+    def test_stragglers_ignored_while_open(self):
+        breaker = _breaker(FakeClock(), min_calls=1)
+        _call(breaker, True)
+        breaker.record(False)
+
+        assert breaker.state == "open"
+
+    def test_window_forgets_old_failures(self):
+        """Test that only the most recent window of calls counts"""
+        breaker = _breaker(FakeClock(), window=4, failure_rate=0.75)
+        for failed in (True, True, False, False, False, True):
+            _call(breaker, failed)
+
+        assert breaker.state == "closed"
+        assert breaker.stats().failure_rate == 0.25
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"failure_rate": 0}, {"failure_rate": 1.5}, {"min_calls": 0}, {"window": 2}],
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            _breaker(FakeClock(), **kwargs)
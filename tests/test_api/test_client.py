@@ -1,11 +1,37 @@
 """Tests for API client module"""
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+import requests
 import responses
+from responses import matchers
 from requests.exceptions import Timeout, ConnectionError
-from src.api.client import decode_vin_values_extended
+from src.api.client import (
+    VINDecoderClient,
+    decode_vin_values_extended,
+    decode_vins_batch,
+    get_default_client,
+    set_default_client,
+)
+from src.api.lean import LeanResult
 from src.api.models import VINDecodeResult
-from src.exceptions import APIError, NetworkError, InvalidVINError
+from src.api.breaker import CircuitBreaker
+from src.api.hedge import Hedger
+from src.api.timing import DecodeTimings
+from src.api.ratelimit import RateLimiter
+from src.api.retry import RetryPolicy
+from src.cache.memory import MemoryCache
+from src.cache.pattern import PatternCache
+from src.cache.sqlite import SQLiteCache
+from src.exceptions import (
+    APIError,
+    CheckDigitError,
+    CircuitOpenError,
+    NetworkError,
+    InvalidVINError,
+)
 
 
 class TestDecodeVINValuesExtended:
@@ -48,23 +74,37 @@ class TestDecodeVINValuesExtended:
         with pytest.raises(InvalidVINError):
             decode_vin_values_extended(invalid_vin_short)
 
-    def test_api_timeout(self, valid_vin, mocker):
+    @responses.activate
+    def test_api_timeout(self, valid_vin, monkeypatch):
         """Test handling of API timeout"""
+        monkeypatch.setattr(RetryPolicy, "delay", lambda *args: 0.0)
         # Clear cache first
         decode_vin_values_extended.cache_clear()
 
-        mocker.patch("requests.get", side_effect=Timeout("Connection timeout"))
+        responses.add(
+            responses.GET,
+            f"https://vpic.nhtsa.dot.gov/api/vehicles/DecodeVinValuesExtended/{valid_vin}",
+            body=Timeout("Connection timeout"),
+        )
 
         with pytest.raises(NetworkError, match="Failed to reach NHTSA API"):
             decode_vin_values_extended(valid_vin)
+        assert len(responses.calls) == RetryPolicy().retries + 1
 
-    def test_api_connection_error(self, valid_vin, mocker):
+    @responses.activate
+    def test_api_connection_error(self, valid_vin, monkeypatch):
         """Test handling of connection error"""
+        monkeypatch.setattr(RetryPolicy, "delay", lambda *args: 0.0)
         decode_vin_values_extended.cache_clear()
-        mocker.patch("requests.get", side_effect=ConnectionError("Connection refused"))
+        responses.add(
+            responses.GET,
+            f"https://vpic.nhtsa.dot.gov/api/vehicles/DecodeVinValuesExtended/{valid_vin}",
+            body=ConnectionError("Connection refused"),
+        )
 
         with pytest.raises(NetworkError, match="Failed to reach NHTSA API"):
             decode_vin_values_extended(valid_vin)
+        assert len(responses.calls) == RetryPolicy().retries + 1
 
     @responses.activate
     def test_api_http_error(self, valid_vin):
@@ -239,3 +279,753 @@ class TestCacheClearing:
         decode_vin_values_extended(valid_vin)
         cache_info = decode_vin_values_extended.cache_info()
         assert cache_info.hits == 1
+
+    @responses.activate
+    def test_cache_keyed_on_normalized_vin(self, valid_vin, sample_api_response):
+        """Test that case and whitespace variants share one cache entry"""
+        responses.add(
+            responses.GET,
+            f"https://vpic.nhtsa.dot.gov/api/vehicles/DecodeVinValuesExtended/{valid_vin}",
+            json=sample_api_response,
+            status=200,
+        )
+
+        for vin in (
+            valid_vin.lower(),
+            f" {valid_vin} ",
+            valid_vin,
+            "5uXwX7c50bA123456",
+        ):
+            assert decode_vin_values_extended(vin).vin == valid_vin
+
+        assert len(responses.calls) == 1
+        cache_info = decode_vin_values_extended.cache_info()
+        assert (cache_info.hits, cache_info.misses, cache_info.currsize) == (3, 1, 1)
+        assert cache_info.maxsize == 256
+
+    def test_cache_info_without_cache(self):
+        """Test cache helpers when the default client has no cache"""
+        set_default_client(VINDecoderClient())
+
+        decode_vin_values_extended.cache_clear()
+        assert decode_vin_values_extended.cache_info() == (0, 0, None, 0)
+
+
+BATCH_URL = "https://vpic.nhtsa.dot.gov/api/vehicles/DecodeVINValuesBatch/"
+
+
+def _batch_response(*vins, **overrides):
+    """Build a batch endpoint payload with one result per VIN"""
+    results = []
+    for vin in vins:
+        raw = {"VIN": vin, "Make": "BMW", "Model": "X3", "ErrorCode": "0"}
+        raw.update(overrides.get(vin, {}))
+        results.append(raw)
+    return {"Count": len(results), "Results": results}
+
+
+class TestDecodeVINsBatch:
+    """Tests for decode_vins_batch function"""
+
+    @responses.activate
+    def test_batch_returns_results_in_input_order(self):
+        """Test that results map back to input order, not response order"""
+        vins = ["5UXWX7C50BA123456", "1GCHK23U64F177548"]
+        responses.add(
+            responses.POST,
+            BATCH_URL,
+            json=_batch_response(*reversed(vins)),
+            status=200,
+            match=[
+                matchers.urlencoded_params_matcher(
+                    {"format": "json", "data": ";".join(vins)}
+                )
+            ],
+        )
+
+        results = decode_vins_batch(vins)
+
+        assert [r.vin for r in results] == vins
+        assert all(isinstance(r, VINDecodeResult) for r in results)
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_batch_normalizes_and_deduplicates(self, valid_vin):
+        """Test that equivalent VINs are sent once and fanned back out"""
+        responses.add(
+            responses.POST,
+            BATCH_URL,
+            json=_batch_response(valid_vin),
+            status=200,
+            match=[
+                matchers.urlencoded_params_matcher(
+                    {"format": "json", "data": valid_vin}
+                )
+            ],
+        )
+
+        results = decode_vins_batch([valid_vin, f" {valid_vin.lower()} "])
+
+        assert [r.vin for r in results] == [valid_vin, valid_vin]
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_batch_chunks_requests(self):
+        """Test that inputs are split into requests of at most 50 VINs"""
+        vins = [f"5UXWX7C50BA{i:06d}" for i in range(120)]
+        responses.add(
+            responses.POST, BATCH_URL, json=_batch_response(*vins), status=200
+        )
+
+        results = decode_vins_batch(vins)
+
+        assert len(results) == 120
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_batch_result_type(self, valid_vin):
+        """Test that result_type reaches the default client's decode_batch"""
+        responses.add(
+            responses.POST, BATCH_URL, json=_batch_response(valid_vin), status=200
+        )
+
+        (lean,) = decode_vins_batch([valid_vin], result_type="lean")
+        (raw,) = decode_vins_batch([valid_vin], result_type="raw")
+
+        assert isinstance(lean, LeanResult) and lean.vin == valid_vin
+        assert raw["VIN"] == valid_vin
+
+    def test_batch_empty_input(self):
+        """Test that an empty input makes no requests"""
+        assert decode_vins_batch([]) == []
+
+    def test_batch_invalid_vin_raises(self, invalid_vin_short):
+        """Test that invalid VINs raise before any request is made"""
+        with pytest.raises(InvalidVINError):
+            decode_vins_batch([invalid_vin_short])
+
+    def test_batch_invalid_vin_returned(self, valid_vin, invalid_vin_short):
+        """Test that invalid VINs are returned in place with return_exceptions"""
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.POST, BATCH_URL, json=_batch_response(valid_vin), status=200
+            )
+            results = decode_vins_batch(
+                [invalid_vin_short, valid_vin], return_exceptions=True
+            )
+
+        assert isinstance(results[0], InvalidVINError)
+        assert results[1].vin == valid_vin
+
+    @responses.activate
+    def test_batch_warning_code_returns_result(self, valid_vin):
+        """Test that warning codes are returned like the single-VIN path"""
+        responses.add(
+            responses.POST,
+            BATCH_URL,
+            json=_batch_response(
+                valid_vin, **{valid_vin: {"ErrorCode": "1", "ErrorText": "Bad"}}
+            ),
+            status=200,
+        )
+
+        (result,) = decode_vins_batch([valid_vin])
+        assert result.error_code == "1"
+
+    @responses.activate
+    def test_batch_critical_error_code_raises(self, valid_vin):
+        """Test that critical error codes raise APIError"""
+        responses.add(
+            responses.POST,
+            BATCH_URL,
+            json=_batch_response(
+                valid_vin,
+                **{
+                    valid_vin: {
+                        "ErrorCode": "400",
+                        "ErrorText": "Invalid Characters Present",
+                    }
+                },
+            ),
+            status=200,
+        )
+
+        with pytest.raises(APIError, match="Invalid Characters Present"):
+            decode_vins_batch([valid_vin])
+
+    @responses.activate
+    def test_batch_critical_error_code_returned(self, valid_vin):
+        """Test that critical errors do not fail the rest of the batch"""
+        other = "1GCHK23U64F177548"
+        responses.add(
+            responses.POST,
+            BATCH_URL,
+            json=_batch_response(valid_vin, other, **{other: {"ErrorCode": "400"}}),
+            status=200,
+        )
+
+        results = decode_vins_batch([valid_vin, other], return_exceptions=True)
+
+        assert results[0].vin == valid_vin
+        assert isinstance(results[1], APIError)
+
+    @responses.activate
+    def test_batch_missing_result(self, valid_vin):
+        """Test that a VIN missing from the response raises APIError"""
+        responses.add(responses.POST, BATCH_URL, json={"Results": []}, status=200)
+
+        with pytest.raises(APIError, match="No results returned from API for VIN"):
+            decode_vins_batch([valid_vin])
+
+    @responses.activate
+    def test_batch_http_error(self, valid_vin):
+        """Test that HTTP errors raise NetworkError"""
+        responses.add(responses.POST, BATCH_URL, status=500)
+
+        with pytest.raises(NetworkError, match="Failed to reach NHTSA API"):
+            decode_vins_batch([valid_vin])
+
+    @responses.activate
+    def test_batch_http_error_returned(self, valid_vin):
+        """Test that a failed chunk marks each of its VINs with the error"""
+        responses.add(responses.POST, BATCH_URL, status=500)
+
+        results = decode_vins_batch([valid_vin, valid_vin], return_exceptions=True)
+
+        assert all(isinstance(r, NetworkError) for r in results)
+
+
+class TestVINDecoderClient:
+    """Tests for the pooled VINDecoderClient"""
+
+    def test_session_is_pooled_and_retrying(self):
+        """Test that the session is pooled and the client owns the retries"""
+        client = VINDecoderClient(pool_size=4, retries=2)
+        adapter = client.session.get_adapter("https://vpic.nhtsa.dot.gov")
+
+        assert adapter._pool_maxsize == 4
+        assert adapter.max_retries.total == 0
+        assert client.retry.retries == 2
+        assert 503 in client.retry.statuses
+        assert "gzip" in client.session.headers["Accept-Encoding"]
+
+    def test_connections_are_reused(self, stub_vpic, valid_vin):
+        """Test that consecutive decodes share one keep-alive connection"""
+        with VINDecoderClient(base_url=stub_vpic.base_url) as client:
+            client.decode(valid_vin)
+            client.decode("1GCHK23U64F177548")
+            client.decode_batch([valid_vin])
+
+        assert len(stub_vpic.calls) == 3
+        assert len(stub_vpic.connections) == 1
+
+    @responses.activate
+    def test_retries_transient_status(self, valid_vin, sample_api_response):
+        """Test that 503 responses are retried before succeeding"""
+        url = f"https://vpic.nhtsa.dot.gov/api/vehicles/DecodeVinValuesExtended/{valid_vin}"
+        responses.add(responses.GET, url, status=503)
+        responses.add(responses.GET, url, json=sample_api_response, status=200)
+
+        client = VINDecoderClient(backoff_factor=0)
+        result = client.decode(valid_vin)
+
+        assert result.make == "BMW"
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_retries_exhausted(self, valid_vin):
+        """Test that exhausted retries raise NetworkError"""
+        url = f"https://vpic.nhtsa.dot.gov/api/vehicles/DecodeVinValuesExtended/{valid_vin}"
+        responses.add(responses.GET, url, status=503)
+
+        client = VINDecoderClient(retries=1, backoff_factor=0)
+        with pytest.raises(NetworkError, match="Failed to reach NHTSA API"):
+            client.decode(valid_vin)
+
+    def test_custom_session(self):
+        """Test that a caller-provided session is used as-is"""
+        session = requests.Session()
+        assert VINDecoderClient(session=session).session is session
+
+    def test_strict_rejects_bad_check_digit_offline(self, stub_vpic, valid_vin):
+        """Test that strict mode fails bad check digits without a request"""
+        client = VINDecoderClient(base_url=stub_vpic.base_url, strict=True)
+
+        with pytest.raises(CheckDigitError):
+            client.decode(valid_vin)
+        results = client.decode_batch(
+            [valid_vin, "1GCHK23U64F177548"], return_exceptions=True
+        )
+
+        assert isinstance(results[0], CheckDigitError)
+        assert results[1].make == "BMW"
+        assert stub_vpic.batch_vins == [["1GCHK23U64F177548"]]
+        assert len(stub_vpic.calls) == 1
+
+    def test_default_client(self):
+        """Test that module functions share a replaceable default client"""
+        original = get_default_client()
+        assert get_default_client() is original
+
+        replacement = VINDecoderClient()
+        set_default_client(replacement)
+        try:
+            assert get_default_client() is replacement
+        finally:
+            set_default_client(None)
+
+        assert get_default_client() is not replacement
+
+
+class TestClientCache:
+    """Tests for the client's pluggable cache layer"""
+
+    def test_decode_uses_cache(self, stub_vpic, valid_vin, valid_vin_lowercase):
+        """Test that a repeated decode is served from the cache"""
+        cache = MemoryCache()
+        client = VINDecoderClient(base_url=stub_vpic.base_url, cache=cache)
+
+        first = client.decode(valid_vin)
+        second = client.decode(valid_vin_lowercase)
+
+        assert first == second
+        assert len(stub_vpic.calls) == 1
+        assert cache.stats().hits == 1
+
+    def test_critical_errors_not_cached(self, stub_vpic, valid_vin):
+        """Test that results with critical error codes are not cached"""
+        stub_vpic.results[valid_vin] = {"VIN": valid_vin, "ErrorCode": "400"}
+        cache = MemoryCache()
+        client = VINDecoderClient(base_url=stub_vpic.base_url, cache=cache)
+
+        with pytest.raises(APIError):
+            client.decode(valid_vin)
+        assert cache.stats().size == 0
+
+    def test_persistent_cache_survives_restart(self, stub_vpic, valid_vin, tmp_path):
+        """Test that a new client on the same SQLite file skips the network"""
+        path = str(tmp_path / "cache.sqlite3")
+        VINDecoderClient(base_url=stub_vpic.base_url, cache=SQLiteCache(path)).decode(
+            valid_vin
+        )
+
+        restarted = VINDecoderClient(
+            base_url=stub_vpic.base_url, cache=SQLiteCache(path)
+        )
+        assert restarted.decode(valid_vin).make == "BMW"
+        assert len(stub_vpic.calls) == 1
+
+    def test_batch_only_sends_misses(self, stub_vpic, valid_vin):
+        """Test that batch decoding skips cached VINs and caches new ones"""
+        other = "1GCHK23U64F177548"
+        bad = "5UXWX7C50BA000000"
+        stub_vpic.results[bad] = {"VIN": bad, "ErrorCode": "400"}
+        cache = MemoryCache()
+        client = VINDecoderClient(base_url=stub_vpic.base_url, cache=cache)
+        client.decode(valid_vin)
+
+        results = client.decode_batch([valid_vin, other, bad], return_exceptions=True)
+
+        assert [r.vin for r in results[:2]] == [valid_vin, other]
+        assert isinstance(results[2], APIError)
+        assert stub_vpic.batch_vins == [[other, bad]]
+        assert cache.get(other) is not None
+        assert cache.get(bad) is None
+
+
+class TestClientNegativeCache:
+    """Tests for negative caching of critical API errors"""
+
+    def test_repeated_bad_vin_skips_network(self, stub_vpic, valid_vin):
+        """Test that a known-bad VIN is rejected again without a request"""
+        stub_vpic.results[valid_vin] = {
+            "VIN": valid_vin,
+            "ErrorCode": "400",
+            "ErrorText": "400 - Invalid characters present",
+        }
+        negative = MemoryCache(ttl=60)
+        client = VINDecoderClient(base_url=stub_vpic.base_url, negative_cache=negative)
+
+        for _ in range(3):
+            with pytest.raises(APIError, match="Invalid characters present"):
+                client.decode(valid_vin)
+
+        assert len(stub_vpic.calls) == 1
+        assert negative.stats().hits == 2
+
+    def test_negative_entry_expires(self, stub_vpic, valid_vin, mocker):
+        """Test that the VIN is retried upstream once its entry expires"""
+        clock = mocker.patch("src.cache.memory.time.monotonic", return_value=100.0)
+        stub_vpic.results[valid_vin] = {"VIN": valid_vin, "ErrorCode": "400"}
+        client = VINDecoderClient(
+            base_url=stub_vpic.base_url, negative_cache=MemoryCache(ttl=60)
+        )
+        with pytest.raises(APIError):
+            client.decode(valid_vin)
+
+        del stub_vpic.results[valid_vin]
+        clock.return_value = 161.0
+
+        assert client.decode(valid_vin).make == "BMW"
+        assert len(stub_vpic.calls) == 2
+
+    def test_network_errors_not_cached(self, stub_vpic, valid_vin):
+        """Test that transient failures are never negatively cached"""
+        stub_vpic.status = 500
+        negative = MemoryCache()
+        client = VINDecoderClient(
+            base_url=stub_vpic.base_url, retries=0, negative_cache=negative
+        )
+
+        with pytest.raises(NetworkError):
+            client.decode(valid_vin)
+        assert negative.stats().size == 0
+
+    def test_batch_uses_negative_cache(self, stub_vpic, valid_vin):
+        """Test that batch decoding records and reuses critical errors"""
+        bad = "5UXWX7C50BA000000"
+        stub_vpic.results[bad] = {"VIN": bad, "ErrorCode": "400"}
+        client = VINDecoderClient(
+            base_url=stub_vpic.base_url, negative_cache=MemoryCache()
+        )
+
+        client.decode_batch([valid_vin, bad], return_exceptions=True)
+        results = client.decode_batch([bad], return_exceptions=True)
+
+        assert isinstance(results[0], APIError)
+        assert stub_vpic.batch_vins == [[valid_vin, bad]]
+        with pytest.raises(APIError):
+            client.decode_batch([bad])
+        with pytest.raises(APIError):
+            client.decode(bad)
+        assert len(stub_vpic.calls) == 1
+
+    def test_missing_batch_result_not_cached(self, stub_vpic, valid_vin):
+        """Test that a VIN left out of a batch response is retried, not cached"""
+        missing = "5UXWX7C50BA000000"
+        # The response carries a result for some other VIN instead
+        stub_vpic.results[missing] = {"VIN": "5UXWX7C50BA999999", "ErrorCode": "0"}
+        negative = MemoryCache()
+        client = VINDecoderClient(base_url=stub_vpic.base_url, negative_cache=negative)
+
+        with pytest.raises(APIError, match="No results returned"):
+            client.decode_batch([missing])
+        with pytest.raises(APIError, match="No results returned"):
+            client.decode_batch([missing])
+
+        assert stub_vpic.batch_vins == [[missing], [missing]]
+        assert negative.stats().size == 0
+
+    def test_default_client_has_negative_cache(self):
+        """Test that the default client remembers critical errors"""
+        assert get_default_client().negative_cache is not None
+
+
+class TestClientPatternCache:
+    """Tests for the opt-in pattern cache in the sync client"""
+
+    def test_decode_reuses_pattern(self, stub_vpic, make_vin):
+        """Test that a second serial of the same pattern skips the network"""
+        client = VINDecoderClient(
+            base_url=stub_vpic.base_url, pattern_cache=PatternCache()
+        )
+
+        client.decode(make_vin(1))
+        result = client.decode(make_vin(2))
+
+        assert result.vin == make_vin(2)
+        assert result.make == "BMW"
+        assert len(stub_vpic.calls) == 1
+
+    def test_batch_sends_one_representative_per_pattern(self, stub_vpic, make_vin):
+        """Test that a fleet of identical trucks costs one VIN upstream"""
+        fleet = [make_vin(i) for i in range(200)]
+        other_model = make_vin(1, prefix="1FTFW1E5")
+        client = VINDecoderClient(
+            base_url=stub_vpic.base_url, pattern_cache=PatternCache()
+        )
+
+        results = client.decode_batch(fleet + [other_model])
+
+        assert [r.vin for r in results] == fleet + [other_model]
+        assert stub_vpic.batch_vins == [[fleet[0], other_model]]
+
+    def test_batch_followers_sent_when_representative_has_warnings(
+        self, stub_vpic, make_vin
+    ):
+        """Test that followers are decoded themselves if nothing can be shared"""
+        fleet = [make_vin(i) for i in range(3)]
+        stub_vpic.results[fleet[0]] = {"VIN": fleet[0], "ErrorCode": "8"}
+        client = VINDecoderClient(
+            base_url=stub_vpic.base_url, pattern_cache=PatternCache()
+        )
+
+        results = client.decode_batch(fleet)
+
+        assert [r.vin for r in results] == fleet
+        assert stub_vpic.batch_vins == [[fleet[0]], fleet[1:]]
+
+
+class TestClientCoalescing:
+    """Tests for in-flight coalescing in the sync client"""
+
+    def test_concurrent_decodes_share_one_request(self, stub_vpic, valid_vin):
+        """Test that a stampede on one VIN makes a single upstream call"""
+        stub_vpic.delay = 0.2
+        client = VINDecoderClient(base_url=stub_vpic.base_url)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(client.decode, [valid_vin] * 8))
+
+        assert len(stub_vpic.calls) == 1
+        assert all(r == results[0] for r in results)
+        assert len({id(r) for r in results}) == 8
+        stats = client.stats().coalesce
+        assert (stats.executed, stats.coalesced) == (1, 7)
+
+    def test_concurrent_failures_shared(self, stub_vpic, valid_vin):
+        """Test that coalesced callers all receive the upstream error"""
+        stub_vpic.delay = 0.2
+        stub_vpic.status = 500
+        client = VINDecoderClient(base_url=stub_vpic.base_url, retries=0)
+
+        def decode():
+            with pytest.raises(NetworkError):
+                client.decode(valid_vin)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda _: decode(), range(4)))
+
+        assert len(stub_vpic.calls) == 1
+
+    def test_stats_include_caches(self):
+        """Test that client stats report each configured cache"""
+        client = VINDecoderClient(
+            cache=MemoryCache(),
+            pattern_cache=PatternCache(),
+            negative_cache=MemoryCache(),
+        )
+        stats = client.stats()
+
+        assert stats.cache.size == 0
+        assert stats.pattern_cache.size == 0
+        assert stats.negative_cache.size == 0
+        assert VINDecoderClient().stats().cache is None
+
+
+class TestClientRateLimiter:
+    """Tests for rate limiting and adaptive concurrency in the sync client"""
+
+    def test_default_limiter_follows_pool_size(self):
+        client = VINDecoderClient(pool_size=4)
+
+        assert client.stats().limiter.max_limit == 4
+
+    def test_server_errors_decrease_limit(self, stub_vpic, valid_vin):
+        """Test that a 5xx answer halves the concurrency limit"""
+        stub_vpic.status = 503
+        client = VINDecoderClient(base_url=stub_vpic.base_url, retries=0)
+
+        with pytest.raises(NetworkError):
+            client.decode(valid_vin)
+
+        stats = client.stats().limiter
+        assert (stats.limit, stats.decreases, stats.in_flight) == (5, 1, 0)
+
+    def test_each_attempt_is_limited(self, stub_vpic, valid_vin):
+        """Test that every retry attempt passes through the limiter"""
+        stub_vpic.status = 429
+        client = VINDecoderClient(
+            base_url=stub_vpic.base_url, retries=1, backoff_factor=0
+        )
+
+        with pytest.raises(NetworkError):
+            client.decode(valid_vin)
+
+        assert len(stub_vpic.calls) == 2
+        assert client.stats().limiter.decreases == 2
+
+    def test_connection_error_decreases_limit(self, valid_vin):
+        client = VINDecoderClient(base_url="http://127.0.0.1:9", retries=0)
+
+        with pytest.raises(NetworkError):
+            client.decode(valid_vin)
+
+        assert client.stats().limiter.decreases == 1
+
+    def test_shared_limiter(self, stub_vpic, valid_vin):
+        """Test that clients sharing a limiter share its budget"""
+        limiter = RateLimiter(rate=None, max_concurrency=2)
+        clients = [
+            VINDecoderClient(base_url=stub_vpic.base_url, limiter=limiter)
+            for _ in range(2)
+        ]
+        stub_vpic.status = 500
+        with pytest.raises(NetworkError):
+            clients[0].decode_batch([valid_vin])
+
+        assert clients[1].stats().limiter.limit == 1
+
+
+class TestClientResilience:
+    """Tests for retries and the circuit breaker in the sync client"""
+
+    @responses.activate
+    def test_retries_connection_error(self, valid_vin, sample_api_response):
+        url = f"https://vpic.nhtsa.dot.gov/api/vehicles/DecodeVinValuesExtended/{valid_vin}"
+        responses.add(responses.GET, url, body=ConnectionError("reset"))
+        responses.add(responses.GET, url, json=sample_api_response, status=200)
+
+        client = VINDecoderClient(retry=RetryPolicy(backoff=0))
+
+        assert client.decode(valid_vin).make == "BMW"
+        assert len(responses.calls) == 2
+
+    def test_client_errors_not_retried(self, stub_vpic, valid_vin):
+        """Test that a non-transient status fails on the first attempt"""
+        stub_vpic.status = 404
+        client = VINDecoderClient(base_url=stub_vpic.base_url, backoff_factor=0)
+
+        with pytest.raises(NetworkError):
+            client.decode(valid_vin)
+
+        assert len(stub_vpic.calls) == 1
+        assert client.stats().breaker.failure_rate == 0.0
+
+    def test_open_circuit_fails_fast(self, stub_vpic, valid_vin, make_vin):
+        """Test that an outage opens the circuit and stops upstream calls"""
+        stub_vpic.status = 503
+        client = VINDecoderClient(
+            base_url=stub_vpic.base_url,
+            retries=0,
+            breaker=CircuitBreaker(min_calls=2, window=2),
+        )
+        for serial in range(2):
+            with pytest.raises(NetworkError):
+                client.decode(make_vin(serial))
+
+        with pytest.raises(CircuitOpenError):
+            client.decode(valid_vin)
+        results = client.decode_batch([valid_vin], return_exceptions=True)
+
+        assert isinstance(results[0], CircuitOpenError)
+        assert len(stub_vpic.calls) == 2
+        stats = client.stats().breaker
+        assert (stats.state, stats.opened, stats.rejected) == ("open", 1, 2)
+
+    def test_open_circuit_serves_cache(self, stub_vpic, valid_vin, make_vin):
+        """Test that cached VINs are still decoded while the circuit is open"""
+        client = VINDecoderClient(
+            base_url=stub_vpic.base_url,
+            retries=0,
+            cache=MemoryCache(),
+            breaker=CircuitBreaker(min_calls=1, window=1),
+        )
+        client.decode(valid_vin)
+        stub_vpic.status = 500
+        with pytest.raises(NetworkError):
+            client.decode(make_vin(1))
+
+        assert client.decode(valid_vin).make == "BMW"
+        with pytest.raises(CircuitOpenError):
+            client.decode(make_vin(2))
+
+    def test_shared_breaker(self, stub_vpic, valid_vin):
+        """Test that clients sharing a breaker fail fast together"""
+        breaker = CircuitBreaker(min_calls=1, window=1)
+        first, second = (
+            VINDecoderClient(base_url=stub_vpic.base_url, retries=0, breaker=breaker)
+            for _ in range(2)
+        )
+        stub_vpic.status = 502
+        with pytest.raises(NetworkError):
+            first.decode(valid_vin)
+
+        with pytest.raises(CircuitOpenError):
+            second.decode(valid_vin)
+
+
+class TestClientHedging:
+    """Tests for hedged requests in the sync client"""
+
+    def test_slow_request_is_hedged(self, stub_vpic, valid_vin):
+        """Test that a duplicate answers when the first request stalls"""
+        stub_vpic.delays = [1.0, 0.0]
+        client = VINDecoderClient(
+            base_url=stub_vpic.base_url, hedge=Hedger(delay=0.05, budget=1)
+        )
+
+        started = time.monotonic()
+        result = client.decode(valid_vin)
+
+        assert result.make == "BMW"
+        assert time.monotonic() - started < 0.9
+        stats = client.stats().hedge
+        assert (stats.requests, stats.hedged, stats.wins) == (1, 1, 1)
+        client.close()
+
+    def test_only_winning_attempt_is_timed(self, stub_vpic, valid_vin, mocker):
+        """Test that the stalled attempt does not write to the call's timer"""
+        stub_vpic.delays = [1.0, 0.0]
+        timings = DecodeTimings()
+        start = mocker.spy(timings, "start")
+        client = VINDecoderClient(
+            base_url=stub_vpic.base_url,
+            hedge=Hedger(delay=0.05, budget=1),
+            timings=timings,
+        )
+
+        client.decode(valid_vin)
+        time.sleep(1.1)  # let the stalled attempt finish in the background
+
+        stages = start.spy_return.stages
+        assert stages["request"] + stages["download"] < 0.9
+        client.close()
+
+    def test_fast_request_not_hedged(self, stub_vpic, valid_vin):
+        client = VINDecoderClient(
+            base_url=stub_vpic.base_url, hedge=Hedger(delay=0.5, budget=1)
+        )
+
+        client.decode_batch([valid_vin])
+
+        assert len(stub_vpic.calls) == 1
+        assert client.stats().hedge.hedged == 0
+
+    def test_budget_exhausted(self, stub_vpic, valid_vin):
+        """Test that no duplicate is sent once the budget is spent"""
+        stub_vpic.delay = 0.1
+        client = VINDecoderClient(
+            base_url=stub_vpic.base_url, hedge=Hedger(delay=0.01, budget=0)
+        )
+
+        client.decode(valid_vin)
+
+        assert len(stub_vpic.calls) == 1
+        assert client.stats().hedge.hedged == 0
+
+    def test_adaptive_delay_warms_up(self, stub_vpic, make_vin):
+        """Test that latencies are observed before hedging starts"""
+        client = VINDecoderClient(
+            base_url=stub_vpic.base_url, hedge=Hedger(min_samples=2, budget=1)
+        )
+        for serial in range(3):
+            client.decode(make_vin(serial))
+
+        stats = client.stats().hedge
+        assert stats.requests == 3
+        assert stats.delay is not None
+
+    def test_both_attempts_fail(self, stub_vpic, valid_vin):
+        stub_vpic.status = 404
+        stub_vpic.delay = 0.1
+        client = VINDecoderClient(
+            base_url=stub_vpic.base_url, hedge=Hedger(delay=0.01, budget=1)
+        )
+
+        with pytest.raises(NetworkError):
+            client.decode(valid_vin)
+        assert len(stub_vpic.calls) == 2
+
+    def test_stats_without_hedging(self):
+        assert VINDecoderClient().stats().hedge is None
@@ -0,0 +1,141 @@
+"""Tests for single-flight request coalescing"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from src.api.coalesce import AsyncSingleFlight, SingleFlight
+
+
+class TestSingleFlight:
+    """Tests for the thread-based SingleFlight"""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test that callers arriving during an execution share its result"""
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            release.wait(5)
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            futures = [pool.submit(flight.do, "A", slow) for _ in range(5)]
+            while flight.stats().coalesced < 4:
+                pass
+            release.set()
+            outcomes = [f.result() for f in futures]
+
+        assert len(calls) == 1
+        assert sorted(shared for _, shared in outcomes) == [
+            False,
+            True,
+            True,
+            True,
+            True,
+        ]
+        assert {result for result, _ in outcomes} == {"result"}
+        stats = flight.stats()
+        assert (stats.executed, stats.coalesced, stats.in_flight) == (1, 4, 0)
+
+    def test_exception_is_shared(self):
+        """Test that waiting callers receive the leader's exception"""
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def failing():
+            release.wait(5)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(flight.do, "A", failing) for _ in range(3)]
+            while flight.stats().coalesced < 2:
+                pass
+            release.set()
+            for future in futures:
+                with pytest.raises(ValueError, match="boom"):
+                    future.result()
+
+    def test_sequential_calls_execute_again(self):
+        """Test that nothing is remembered once a call completes"""
+        flight = SingleFlight()
+
+        assert flight.do("A", lambda: 1) == (1, False)
+        assert flight.do("A", lambda: 2) == (2, False)
+        assert flight.stats().executed == 2
+
+
+class TestAsyncSingleFlight:
+    """Tests for the asyncio AsyncSingleFlight"""
+
+    def test_concurrent_awaits_share_one_task(self):
+        """Test that concurrent awaits for a key run the coroutine once"""
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def slow():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        async def go():
+            return await asyncio.gather(*(flight.do("A", slow) for _ in range(5)))
+
+        outcomes = asyncio.run(go())
+
+        assert len(calls) == 1
+        assert [shared for _, shared in outcomes] == [False, True, True, True, True]
+        stats = flight.stats()
+        assert (stats.executed, stats.coalesced, stats.in_flight) == (1, 4, 0)
+
+    def test_exception_is_shared(self):
+        """Test that every waiter receives the exception"""
+        flight = AsyncSingleFlight()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        async def go():
+            return await asyncio.gather(
+                *(flight.do("A", failing) for _ in range(3)), return_exceptions=True
+            )
+
+        assert all(isinstance(r, ValueError) for r in asyncio.run(go()))
+
+    def test_cancelled_waiter_does_not_cancel_others(self):
+        """Test that cancelling one waiter leaves the shared lookup running"""
+        flight = AsyncSingleFlight()
+
+        async def slow():
+            await asyncio.sleep(0.05)
+            return "result"
+
+        async def go():
+            first = asyncio.ensure_future(flight.do("A", slow))
+            second = asyncio.ensure_future(flight.do("A", slow))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(go()) == ("result", True)
+
+    def test_abandoned_failure_is_retrieved(self):
+        """Test that a failure nobody awaits does not warn as unretrieved"""
+        flight = AsyncSingleFlight()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        async def go():
+            waiter = asyncio.ensure_future(flight.do("A", failing))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.sleep(0.05)
+            return flight.stats().in_flight
+
+        assert asyncio.run(go()) == 0
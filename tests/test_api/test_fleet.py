@@ -0,0 +1,98 @@
+"""Tests for DecodedFleet"""
+
+import pytest
+from src.api.fleet import DecodedFleet
+from src.api.lean import FIELDS, LeanResult
+from src.api.models import VINDecodeResult
+from src.formatting.response import result_fields
+
+
+@pytest.fixture
+def raw(sample_api_response):
+    return {**sample_api_response["Results"][0], "Trim2": "   "}
+
+
+def _raws(raw, count):
+    return [
+        {**raw, "VIN": f"VIN{i:014d}", "ModelYear": str(2000 + i % 3)}
+        for i in range(count)
+    ]
+
+
+class TestDecodedFleet:
+    """Tests for DecodedFleet"""
+
+    def test_rows_match_models(self, raw):
+        raws = _raws(raw, 5)
+        fleet = DecodedFleet(raws)
+
+        assert len(fleet) == 5
+        for result, source in zip(fleet, raws):
+            assert isinstance(result, VINDecodeResult)
+            assert result_fields(result) == result_fields(VINDecodeResult(**source))
+        assert fleet[1].vin == raws[1]["VIN"]
+        assert fleet[-1].vin == raws[-1]["VIN"]
+
+    def test_accepts_every_result_type(self, raw):
+        model = VINDecodeResult(**raw)
+
+        fleet = DecodedFleet([model, LeanResult(raw), raw])
+
+        assert fleet.row(0) == fleet.row(1) == fleet.row(2)
+        assert fleet.row(0) == dict(zip(FIELDS, (getattr(model, n) for n in FIELDS)))
+        assert fleet.row(0)["trim_alt"] is None
+
+    def test_values_stored_once(self, raw):
+        fleet = DecodedFleet(_raws(raw, 30))
+
+        assert fleet.cardinality("make") == 1
+        assert fleet.cardinality("model_year") == 3
+        assert fleet.cardinality("vin") == 30
+        assert fleet.cardinality("trim_alt") == 0
+        assert fleet.value_counts("model_year") == {"2000": 10, "2001": 10, "2002": 10}
+        assert fleet.value_counts("trim_alt") == {None: 30}
+
+    def test_column_and_slice(self, raw):
+        raws = _raws(raw, 4)
+        fleet = DecodedFleet()
+        fleet.extend(raws)
+
+        assert fleet.column("vin") == [r["VIN"] for r in raws]
+        assert [r.vin for r in fleet[1:3]] == fleet.column("vin")[1:3]
+
+    def test_codes_widen(self, raw):
+        fleet = DecodedFleet()
+        for i in range(300):
+            fleet.append({**raw, "VIN": str(i)})
+
+        assert fleet.column("vin") == [str(i) for i in range(300)]
+        assert fleet[299].vin == "299"
+        assert fleet._columns["vin"].codes.typecode == "H"
+        assert fleet._columns["make"].codes.typecode == "B"
+
+    def test_failed_append_leaves_fleet_unchanged(self, raw):
+        """Test that a row failing partway is rolled back from every column"""
+        fleet = DecodedFleet(_raws(raw, 2))
+        before = [fleet.row(i) for i in range(2)]
+        cardinality = {name: fleet.cardinality(name) for name in FIELDS}
+        # New VIN and model year are stored before the unhashable trim fails
+        bad = {**raw, "VIN": "NEW", "ModelYear": "1999", "Trim": ["LX", "EX"]}
+
+        with pytest.raises(TypeError):
+            fleet.append(bad)
+
+        assert len(fleet) == 2
+        assert [fleet.row(i) for i in range(2)] == before
+        assert {name: fleet.cardinality(name) for name in FIELDS} == cardinality
+        assert all(len(c.codes) == 2 for c in fleet._columns.values())
+        fleet.append({**raw, "VIN": "NEW"})
+        assert fleet[2].vin == "NEW" and fleet.cardinality("vin") == 3
+
+    def test_errors(self, raw):
+        fleet = DecodedFleet([raw])
+
+        with pytest.raises(IndexError):
+            fleet[1]
+        with pytest.raises(KeyError, match="colour"):
+            fleet.column("colour")
+        assert repr(fleet) == "DecodedFleet(1 results)"
@@ -0,0 +1,66 @@
+"""Tests for the request hedger"""
+
+import pytest
+from src.api.hedge import Hedger
+
+
+class TestHedger:
+    """Tests for Hedger delays and budget"""
+
+    def test_warms_up_before_hedging(self):
+        """Test that nothing is hedged until enough latencies are known"""
+        hedger = Hedger(min_samples=3)
+        for latency in (0.1, 0.2):
+            assert hedger.begin() is None
+            hedger.observe(latency)
+
+        hedger.observe(0.3)
+        assert hedger.begin() is not None
+
+    def test_delay_tracks_percentile(self):
+        hedger = Hedger(percentile=0.9, min_samples=1)
+        for i in range(1, 101):
+            hedger.observe(i / 100)
+
+        assert hedger.begin() == pytest.approx(0.9, abs=0.01)
+
+    def test_window_forgets_old_latencies(self):
+        hedger = Hedger(percentile=0.5, min_samples=1, window=3)
+        for latency in (5, 5, 5, 0.1, 0.1, 0.1):
+            hedger.observe(latency)
+
+        assert hedger.begin() == 0.1
+
+    def test_fixed_delay(self):
+        assert Hedger(delay=0.25).begin() == 0.25
+
+    def test_budget_caps_hedges(self):
+        """Test that hedges stay within budget times the primary requests"""
+        hedger = Hedger(delay=0, budget=0.1)
+        granted = 0
+        for _ in range(100):
+            hedger.begin()
+            granted += hedger.try_hedge()
+
+        assert granted == 10
+        stats = hedger.stats()
+        assert (stats.requests, stats.hedged, stats.wins) == (100, 10, 0)
+
+    def test_zero_budget_never_hedges(self):
+        hedger = Hedger(delay=0, budget=0)
+        hedger.begin()
+
+        assert not hedger.try_hedge()
+
+    def test_attempts_for(self):
+        """Test that the attempt pool fits the primaries and budgeted hedges"""
+        assert Hedger(budget=0.05).attempts_for(10) == 11
+        assert Hedger(budget=0.5).attempts_for(10) == 15
+        assert Hedger(budget=0).attempts_for(4) == 5
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"delay": -1}, {"percentile": 1}, {"budget": -0.5}]
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            Hedger(**kwargs)
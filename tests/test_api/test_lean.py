@@ -0,0 +1,159 @@
+"""Tests for LeanResult and the lean / raw decode_batch result types"""
+
+import asyncio
+
+import pytest
+from src.api.async_client import AsyncVINDecoderClient
+from src.api.client import VINDecoderClient
+from src.api.lean import FIELDS, LeanResult
+from src.api.models import VINDecodeResult
+from src.api.results import build_lean, build_raw, result_builder
+from src.cache.memory import MemoryCache
+from src.exceptions import APIError
+from src.formatting.response import result_fields, result_row
+
+ERROR_RAW = {
+    "VIN": "1HGBH41JXMN109186",
+    "ErrorCode": "400",
+    "ErrorText": "400 - Invalid Characters Present",
+}
+
+
+@pytest.fixture
+def raw(sample_api_response):
+    return {**sample_api_response["Results"][0], "Trim2": "   ", "Series": "xDrive28i"}
+
+
+class TestLeanResult:
+    """Tests for LeanResult"""
+
+    def test_matches_model(self, raw):
+        lean = LeanResult(raw)
+        model = VINDecodeResult(**raw)
+
+        assert all(getattr(lean, name) == getattr(model, name) for name in FIELDS)
+        assert lean.as_dict() == result_fields(model)
+
+    def test_blank_strings_become_none(self, raw):
+        lean = LeanResult(raw)
+
+        assert lean.trim is None
+        assert lean.trim_alt is None
+        assert lean.model_id is None
+
+    def test_undeclared_keys(self, raw):
+        lean = LeanResult(raw)
+
+        assert lean.Series == "xDrive28i"
+        assert lean.raw is raw
+        with pytest.raises(AttributeError):
+            lean.NotAKey
+        with pytest.raises(AttributeError):
+            lean._private
+
+    def test_to_model_is_built_once(self, raw):
+        lean = LeanResult(raw)
+
+        model = lean.to_model()
+
+        assert isinstance(model, VINDecodeResult)
+        assert model.make == "BMW"
+        assert lean.to_model() is model
+
+    def test_equality_and_repr(self, raw):
+        assert LeanResult(raw) == LeanResult(dict(raw))
+        assert LeanResult(raw) != LeanResult(ERROR_RAW)
+        assert LeanResult(raw) != raw
+        assert repr(LeanResult(raw)) == (
+            "LeanResult(vin='5UXWX7C50BA123456', make='BMW', model='X3')"
+        )
+
+    def test_slotted(self, raw):
+        assert not hasattr(LeanResult(raw), "__dict__")
+
+
+class TestBuilders:
+    """Tests for build_lean, build_raw and result_builder"""
+
+    def test_build_lean(self, raw):
+        assert build_lean(raw).make == "BMW"
+        with pytest.raises(APIError) as excinfo:
+            build_lean(ERROR_RAW)
+        assert excinfo.value.error_code == "400"
+
+    def test_build_raw(self, raw):
+        copy = build_raw(raw)
+        assert copy == raw and copy is not raw
+        assert build_raw({"VIN": "X", "ErrorCode": "1,11"})["VIN"] == "X"
+        with pytest.raises(APIError):
+            build_raw(ERROR_RAW)
+
+    def test_unknown_result_type(self):
+        with pytest.raises(ValueError, match="model, lean, raw"):
+            result_builder("fast")
+
+
+class TestClientResultTypes:
+    """Tests for decode_batch with lean and raw results"""
+
+    def test_sync_lean_and_raw(self, stub_vpic, valid_vin):
+        stub_vpic.results[ERROR_RAW["VIN"]] = ERROR_RAW
+        client = VINDecoderClient(
+            base_url=stub_vpic.base_url,
+            cache=MemoryCache(),
+            negative_cache=MemoryCache(),
+        )
+        vins = [valid_vin, ERROR_RAW["VIN"]]
+
+        lean, error = client.decode_batch(
+            vins, return_exceptions=True, result_type="lean"
+        )
+        # second call is served from the cache
+        raw, _ = client.decode_batch(vins, return_exceptions=True, result_type="raw")
+
+        assert isinstance(lean, LeanResult)
+        assert lean.vin == valid_vin
+        assert isinstance(error, APIError)
+        assert raw["VIN"] == valid_vin
+        assert len(stub_vpic.calls) == 1
+
+    def test_mutating_raw_result_leaves_cache_intact(self, stub_vpic, valid_vin):
+        """Test that a raw result is the caller's own copy of the cache entry"""
+        client = VINDecoderClient(base_url=stub_vpic.base_url, cache=MemoryCache())
+
+        (raw,) = client.decode_batch([valid_vin], result_type="raw")
+        raw["Make"] = "EVIL"
+        (again,) = client.decode_batch([valid_vin], result_type="raw")
+
+        assert again["Make"] == "BMW"
+        assert client.decode(valid_vin).make == "BMW"
+        assert len(stub_vpic.calls) == 1
+
+    def test_sync_unknown_result_type(self, stub_vpic, valid_vin):
+        client = VINDecoderClient(base_url=stub_vpic.base_url)
+
+        with pytest.raises(ValueError):
+            client.decode_batch([valid_vin], result_type="fast")
+        assert stub_vpic.calls == []
+
+    def test_async_lean(self, stub_vpic, valid_vin, make_vin):
+        async def scenario():
+            async with AsyncVINDecoderClient(base_url=stub_vpic.base_url) as client:
+                return await client.decode_batch(
+                    [valid_vin, make_vin(1)], result_type="lean"
+                )
+
+        results = asyncio.run(scenario())
+
+        assert [type(r) for r in results] == [LeanResult, LeanResult]
+        assert results[0].vin == valid_vin
+
+
+class TestResultRow:
+    """Tests for result_row with every result type"""
+
+    def test_same_row_for_all_types(self, raw):
+        expected = result_row("vin", VINDecodeResult(**raw))
+
+        assert result_row("vin", LeanResult(raw)) == expected
+        assert result_row("vin", raw) == expected
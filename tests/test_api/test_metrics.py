@@ -0,0 +1,217 @@
+"""Tests for decode client metrics"""
+
+import asyncio
+import gc
+
+import pytest
+from src.api.async_client import AsyncVINDecoderClient
+from src.api.client import VINDecoderClient, get_default_client
+from src.api.metrics import ClientMetrics
+from src.api.retry import RetryPolicy
+from src.cache.memory import MemoryCache
+from src.exceptions import APIError, InvalidVINError
+from src.config import METRICS_ENV, METRICS_PORT_ENV
+from src.metrics.registry import REGISTRY, MetricsRegistry
+
+
+def _sample(registry, line):
+    """Value of an exposition line starting with line, or None"""
+    for text in registry.exposition().splitlines():
+        if text.startswith(line + " "):
+            return float(text.rsplit(" ", 1)[1])
+    return None
+
+
+class TestClientMetrics:
+    """Tests for metrics recorded by the synchronous client"""
+
+    def test_decode_outcomes(self, stub_vpic, valid_vin):
+        stub_vpic.results["1HGBH41JXMN109186"] = {
+            "VIN": "1HGBH41JXMN109186",
+            "ErrorCode": "400",
+            "ErrorText": "400 - Invalid Characters Present",
+        }
+        metrics = ClientMetrics(MetricsRegistry())
+        client = VINDecoderClient(base_url=stub_vpic.base_url, metrics=metrics)
+
+        client.decode(valid_vin)
+        with pytest.raises(APIError):
+            client.decode("1HGBH41JXMN109186")
+        with pytest.raises(InvalidVINError):
+            client.decode("TOO-SHORT")
+
+        decodes = metrics.decodes
+        assert decodes.value(client="default", outcome="ok", error="") == 1
+        assert decodes.value(client="default", outcome="error", error="APIError") == 1
+        assert (
+            decodes.value(client="default", outcome="error", error="InvalidVINError")
+            == 1
+        )
+
+    def test_upstream_latency_and_size(self, stub_vpic, valid_vin, make_vin):
+        metrics = ClientMetrics(MetricsRegistry(), name="test")
+        client = VINDecoderClient(base_url=stub_vpic.base_url, metrics=metrics)
+
+        client.decode(valid_vin)
+        client.decode_batch([make_vin(1), make_vin(2)])
+
+        single = metrics.upstream_latency.snapshot(
+            client="test", endpoint="decode", status="200"
+        )
+        batch = metrics.upstream_latency.snapshot(
+            client="test", endpoint="batch", status="200"
+        )
+        assert single.count == batch.count == 1
+        assert metrics.payload_size.snapshot(client="test", endpoint="batch").sum > 0
+        assert metrics.decodes.value(client="test", outcome="ok", error="") == 3
+
+    def test_failed_attempts_are_observed(self, stub_vpic, valid_vin):
+        stub_vpic.status = 503
+        metrics = ClientMetrics(MetricsRegistry())
+        client = VINDecoderClient(
+            base_url=stub_vpic.base_url,
+            retry=RetryPolicy(retries=1, backoff=0.01, jitter=False),
+            metrics=metrics,
+        )
+
+        with pytest.raises(Exception):
+            client.decode_batch([valid_vin])
+
+        snapshot = metrics.upstream_latency.snapshot(
+            client="default", endpoint="batch", status="503"
+        )
+        assert snapshot.count == 2
+        assert (
+            metrics.decodes.value(
+                client="default", outcome="error", error="TransientError"
+            )
+            == 1
+        )
+
+    def test_unreachable_upstream(self, valid_vin):
+        metrics = ClientMetrics(MetricsRegistry())
+        client = VINDecoderClient(
+            base_url="http://127.0.0.1:9", retries=0, metrics=metrics
+        )
+
+        with pytest.raises(Exception):
+            client.decode(valid_vin)
+
+        snapshot = metrics.upstream_latency.snapshot(
+            client="default", endpoint="decode", status="error"
+        )
+        assert snapshot.count == 1
+
+    def test_cache_and_limiter_collected(self, stub_vpic, valid_vin):
+        registry = MetricsRegistry()
+        client = VINDecoderClient(
+            base_url=stub_vpic.base_url,
+            cache=MemoryCache(),
+            metrics=ClientMetrics(registry, name="c"),
+        )
+
+        client.decode(valid_vin)
+        client.decode(valid_vin)
+
+        assert (
+            _sample(registry, 'pyvin_cache_hits_total{client="c",tier="result"}') == 1
+        )
+        assert (
+            _sample(registry, 'pyvin_cache_misses_total{client="c",tier="result"}') == 1
+        )
+        assert _sample(registry, 'pyvin_cache_entries{client="c",tier="result"}') == 1
+        assert _sample(registry, 'pyvin_upstream_in_flight{client="c"}') == 0
+        assert _sample(registry, 'pyvin_breaker_open{client="c"}') == 0
+
+    def test_collector_follows_client_lifetime(self, stub_vpic):
+        registry = MetricsRegistry()
+        client = VINDecoderClient(
+            base_url=stub_vpic.base_url, metrics=ClientMetrics(registry, name="gone")
+        )
+        assert "pyvin_upstream_in_flight" in registry.exposition()
+
+        del client
+        gc.collect()
+
+        assert "pyvin_upstream_in_flight" not in registry.exposition()
+
+    def test_default_client_without_metrics(self, monkeypatch):
+        """Test that the default client collects no metrics unless asked to"""
+        monkeypatch.delenv(METRICS_ENV, raising=False)
+        monkeypatch.delenv(METRICS_PORT_ENV, raising=False)
+
+        assert get_default_client().metrics is None
+
+    @pytest.mark.parametrize(
+        "name, value",
+        [(METRICS_ENV, "1"), (METRICS_ENV, "true"), (METRICS_PORT_ENV, "9108")],
+    )
+    def test_default_client_metrics_opt_in(self, monkeypatch, name, value):
+        monkeypatch.delenv(METRICS_ENV, raising=False)
+        monkeypatch.delenv(METRICS_PORT_ENV, raising=False)
+        monkeypatch.setenv(name, value)
+
+        assert get_default_client().metrics is not None
+
+    def test_default_client_uses_global_registry(self, monkeypatch):
+        monkeypatch.setenv(METRICS_ENV, "1")
+        client = get_default_client()
+
+        assert client.metrics.registry is REGISTRY
+        assert 'pyvin_cache_entries{client="default",tier="result"}' in (
+            REGISTRY.exposition()
+        )
+
+    def test_no_metrics_by_default(self, stub_vpic, valid_vin):
+        client = VINDecoderClient(base_url=stub_vpic.base_url)
+
+        assert client.decode(valid_vin).vin == valid_vin
+        assert client.metrics is None
+
+
+class TestAsyncClientMetrics:
+    """Tests for metrics recorded by the async client"""
+
+    def test_decode_and_batch(self, stub_vpic, valid_vin, make_vin):
+        metrics = ClientMetrics(MetricsRegistry(), name="async")
+
+        async def scenario():
+            async with AsyncVINDecoderClient(
+                base_url=stub_vpic.base_url, metrics=metrics
+            ) as client:
+                await client.decode(valid_vin)
+                await client.decode_batch(
+                    [make_vin(1), "TOO-SHORT"], return_exceptions=True
+                )
+
+        asyncio.run(scenario())
+
+        decodes = metrics.decodes
+        assert decodes.value(client="async", outcome="ok", error="") == 2
+        assert (
+            decodes.value(client="async", outcome="error", error="InvalidVINError") == 1
+        )
+        for endpoint in ("decode", "batch"):
+            snapshot = metrics.upstream_latency.snapshot(
+                client="async", endpoint=endpoint, status="200"
+            )
+            assert snapshot.count == 1
+
+    def test_batch_error_is_counted(self, stub_vpic):
+        metrics = ClientMetrics(MetricsRegistry())
+
+        async def scenario():
+            async with AsyncVINDecoderClient(
+                base_url=stub_vpic.base_url, metrics=metrics
+            ) as client:
+                await client.decode_batch(["TOO-SHORT"])
+
+        with pytest.raises(InvalidVINError):
+            asyncio.run(scenario())
+
+        assert (
+            metrics.decodes.value(
+                client="default", outcome="error", error="InvalidVINError"
+            )
+            == 1
+        )
@@ -0,0 +1,157 @@
+"""Tests for fields= projection of decode results"""
+
+import asyncio
+
+import pytest
+from src.api.async_client import AsyncVINDecoderClient
+from src.api.batcher import MicroBatcher
+from src.api.client import (
+    VINDecoderClient,
+    decode_vin_values_extended,
+    decode_vins_batch,
+    set_default_client,
+)
+from src.api.lean import LeanResult
+from src.api.models import VINDecodeResult
+from src.api.results import projection, result_builder
+from src.cache.memory import MemoryCache
+from src.exceptions import APIError
+
+FIELDS = ["make", "model"]
+
+ERROR_RAW = {
+    "VIN": "1HGBH41JXMN109186",
+    "ErrorCode": "400",
+    "ErrorText": "400 - Invalid Characters Present",
+}
+
+
+@pytest.fixture
+def raw(sample_api_response):
+    return sample_api_response["Results"][0]
+
+
+class TestResultBuilder:
+    """Tests for projected result builders"""
+
+    @pytest.mark.parametrize("result_type", ["model", "lean"])
+    def test_keeps_only_fields(self, raw, result_type):
+        result = result_builder(result_type, FIELDS)(raw)
+
+        assert (result.make, result.model) == ("BMW", "X3")
+        assert result.model_year is None
+        assert result.vin is None
+
+    def test_model_and_lean_types(self, raw):
+        assert isinstance(result_builder("model", FIELDS)(raw), VINDecodeResult)
+        assert isinstance(result_builder("lean", FIELDS)(raw), LeanResult)
+
+    def test_raw_subset(self, raw):
+        subset = result_builder("raw", ["make", "model_year"])(raw)
+
+        assert subset == {"Make": "BMW", "ModelYear": raw["ModelYear"]}
+        assert len(raw) > len(subset)
+
+    def test_errors_classified_on_full_result(self):
+        with pytest.raises(APIError) as excinfo:
+            result_builder("lean", FIELDS)(ERROR_RAW)
+        assert excinfo.value.error_code == "400"
+
+    def test_unknown_field(self):
+        with pytest.raises(ValueError, match="Make, colour"):
+            projection(["Make", "colour"])
+        with pytest.raises(ValueError):
+            result_builder("model", ["colour"])
+
+
+class TestClientProjection:
+    """Tests for fields= on the sync and async clients"""
+
+    def test_sync_decode(self, stub_vpic, valid_vin):
+        client = VINDecoderClient(base_url=stub_vpic.base_url, cache=MemoryCache())
+
+        projected = client.decode(valid_vin, fields=FIELDS)
+        # served from the full cache entry
+        full = client.decode(valid_vin)
+        again = client.decode(valid_vin, fields=["model_year"])
+
+        assert (projected.make, projected.model) == ("BMW", "X3")
+        assert projected.vin is None
+        assert full.vin == valid_vin
+        assert again.model_year == full.model_year
+        assert again.make is None
+        assert len(stub_vpic.calls) == 1
+
+    def test_sync_unknown_field(self, stub_vpic, valid_vin):
+        client = VINDecoderClient(base_url=stub_vpic.base_url)
+
+        with pytest.raises(ValueError):
+            client.decode(valid_vin, fields=["colour"])
+        assert stub_vpic.calls == []
+
+    def test_sync_batch(self, stub_vpic, valid_vin, make_vin):
+        client = VINDecoderClient(base_url=stub_vpic.base_url, cache=MemoryCache())
+        vins = [valid_vin, make_vin(1)]
+
+        results = client.decode_batch(vins, result_type="raw", fields=["make"])
+        full = client.decode_batch(vins)
+
+        assert results == [{"Make": "BMW"}, {"Make": "BMW"}]
+        assert [r.vin for r in full] == vins
+        assert len(stub_vpic.calls) == 1
+
+    def test_async(self, stub_vpic, valid_vin, make_vin):
+        async def scenario():
+            async with AsyncVINDecoderClient(
+                base_url=stub_vpic.base_url, cache=MemoryCache()
+            ) as client:
+                one = await client.decode(valid_vin, fields=FIELDS)
+                many = await client.decode_many([valid_vin, make_vin(1)], fields=FIELDS)
+                batch = await client.decode_batch(
+                    [make_vin(2)], result_type="lean", fields=FIELDS
+                )
+                return one, many, batch
+
+        one, many, batch = asyncio.run(scenario())
+
+        assert (one.make, one.vin) == ("BMW", None)
+        assert [r.model for r in many] == ["X3", "X3"]
+        assert all(r.vin is None for r in many)
+        assert isinstance(batch[0], LeanResult)
+        assert batch[0].vin is None
+
+
+class TestBackendProjection:
+    """Tests for fields= through the module functions and the micro-batcher"""
+
+    def test_module_functions(self, stub_vpic, valid_vin, make_vin):
+        set_default_client(VINDecoderClient(base_url=stub_vpic.base_url))
+
+        one = decode_vin_values_extended(valid_vin, fields=FIELDS)
+        (lean,) = decode_vins_batch([make_vin(1)], result_type="lean", fields=FIELDS)
+
+        assert (one.make, one.model, one.vin) == ("BMW", "X3", None)
+        assert isinstance(lean, LeanResult)
+        assert (lean.model, lean.vin) == ("X3", None)
+
+    def test_batcher_projects_per_caller(self, stub_vpic, valid_vin):
+        client = VINDecoderClient(base_url=stub_vpic.base_url)
+        with MicroBatcher(client, max_wait=0.5) as batcher:
+            projected = batcher.submit(valid_vin, fields=FIELDS)
+            full = batcher.submit(valid_vin)
+            one, other = projected.result(), full.result()
+            batches = batcher.stats().batches
+            direct = batcher.decode_batch([valid_vin], fields=["make"])
+
+        assert (one.make, one.vin) == ("BMW", None)
+        assert (other.make, other.vin) == ("BMW", valid_vin)
+        assert (direct[0].make, direct[0].vin) == ("BMW", None)
+        assert batches == 1
+        assert stub_vpic.batch_vins[0] == [valid_vin]
+
+    def test_batcher_unknown_field(self, stub_vpic, valid_vin):
+        client = VINDecoderClient(base_url=stub_vpic.base_url)
+        with MicroBatcher(client) as batcher:
+            with pytest.raises(ValueError):
+                batcher.decode(valid_vin, fields=["colour"])
+            assert batcher.stats().calls == 0
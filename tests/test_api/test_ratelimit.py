@@ -0,0 +1,175 @@
+"""Tests for the token-bucket rate limiter with AIMD concurrency"""
+
+import asyncio
+import threading
+
+import pytest
+from src.api.ratelimit import AsyncRateLimiter, RateLimiter, is_overload_status
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestOverloadStatus:
+    """Tests for is_overload_status"""
+
+    @pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+    def test_overload_statuses(self, status):
+        assert is_overload_status(status)
+
+    @pytest.mark.parametrize("status", [200, 301, 400, 404])
+    def test_other_statuses(self, status):
+        assert not is_overload_status(status)
+
+
+class TestRateLimiter:
+    """Tests for the thread-based RateLimiter"""
+
+    def test_starts_at_max_concurrency(self):
+        limiter = RateLimiter(rate=None, max_concurrency=4)
+        stats = limiter.stats()
+
+        assert (stats.limit, stats.max_limit, stats.in_flight) == (4, 4, 0)
+        assert stats.rate is None
+
+    def test_overload_halves_limit_once_per_window(self):
+        """Test that failures admitted before a decrease do not decrease again"""
+        limiter = RateLimiter(rate=None, max_concurrency=8)
+        tickets = [limiter.acquire() for _ in range(4)]
+
+        for ticket in tickets:
+            limiter.release(ticket, overloaded=True)
+
+        stats = limiter.stats()
+        assert (stats.limit, stats.decreases, stats.in_flight) == (4, 1, 0)
+
+        limiter.release(limiter.acquire(), overloaded=True)
+        assert limiter.stats().limit == 2
+
+    def test_limit_never_below_minimum(self):
+        limiter = RateLimiter(rate=None, max_concurrency=4, min_concurrency=2)
+        for _ in range(5):
+            limiter.release(limiter.acquire(), overloaded=True)
+
+        assert limiter.stats().limit == 2
+
+    def test_success_grows_limit_additively(self):
+        """Test that about a window of successes raises the limit by one"""
+        limiter = RateLimiter(rate=None, max_concurrency=8)
+        limiter.release(limiter.acquire(), overloaded=True)
+        limiter.release(limiter.acquire(), overloaded=True)
+        assert limiter.stats().limit == 2
+
+        for _ in range(3):
+            limiter.release(limiter.acquire())
+        assert limiter.stats().limit == 3
+
+        for _ in range(100):
+            limiter.release(limiter.acquire())
+        assert limiter.stats().limit == 8
+
+    def test_blocks_at_concurrency_limit(self):
+        """Test that a caller waits for a permit and is counted as queued"""
+        limiter = RateLimiter(rate=None, max_concurrency=1)
+        ticket = limiter.acquire()
+        acquired = threading.Event()
+
+        def waiter():
+            limiter.release(limiter.acquire())
+            acquired.set()
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        while limiter.stats().queued < 1:
+            pass
+        assert not acquired.is_set()
+
+        limiter.release(ticket)
+        thread.join(5)
+        assert acquired.is_set()
+        assert limiter.stats().queued == 0
+
+    def test_token_bucket_limits_rate(self):
+        """Test that tokens refill at the configured rate up to the burst"""
+        clock = FakeClock()
+        limiter = RateLimiter(rate=10, burst=2, max_concurrency=10, clock=clock)
+        state = limiter._state
+
+        assert state.try_acquire() is None
+        assert state.try_acquire() is None
+        assert state.try_acquire() == pytest.approx(0.1)
+
+        clock.now += 0.05
+        assert state.try_acquire() == pytest.approx(0.05)
+        clock.now += 10
+        assert [state.try_acquire() for _ in range(3)] == [
+            None,
+            None,
+            pytest.approx(0.1),
+        ]
+
+    def test_acquire_waits_for_token(self):
+        """Test that acquire sleeps until a token accrues"""
+        limiter = RateLimiter(rate=50, burst=1, max_concurrency=4)
+        limiter.release(limiter.acquire())
+        limiter.release(limiter.acquire())
+
+        assert limiter.stats().in_flight == 0
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_concurrency": 0},
+            {"min_concurrency": 5, "max_concurrency": 4},
+            {"rate": 0},
+            {"decrease_factor": 1.0},
+        ],
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            RateLimiter(**kwargs)
+
+
+class TestAsyncRateLimiter:
+    """Tests for AsyncRateLimiter"""
+
+    def test_bounds_concurrency_and_adapts(self):
+        """Test that concurrent tasks never exceed the limit"""
+        limiter = AsyncRateLimiter(rate=None, max_concurrency=3)
+        peak = 0
+
+        async def task(overloaded):
+            nonlocal peak
+            ticket = await limiter.acquire()
+            peak = max(peak, limiter.stats().in_flight)
+            await asyncio.sleep(0.01)
+            await limiter.release(ticket, overloaded)
+
+        async def go():
+            await asyncio.gather(*(task(False) for _ in range(9)))
+            await task(True)
+
+        asyncio.run(go())
+
+        stats = limiter.stats()
+        assert peak == 3
+        assert (stats.limit, stats.decreases, stats.queued) == (1, 1, 0)
+
+    def test_waits_for_token(self):
+        """Test that an empty bucket delays the next acquire"""
+        limiter = AsyncRateLimiter(rate=50, burst=1)
+
+        async def go():
+            for _ in range(2):
+                await limiter.release(await limiter.acquire())
+
+        asyncio.run(go())
+
+        assert limiter.stats().in_flight == 0
@@ -0,0 +1,57 @@
+"""Tests for the retry policy"""
+
+import pytest
+from src.api.retry import RetryPolicy, parse_retry_after
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy delays"""
+
+    def test_exponential_backoff_is_capped(self):
+        policy = RetryPolicy(backoff=0.5, max_backoff=3, jitter=False)
+
+        assert [policy.delay(n) for n in range(5)] == [0.5, 1, 2, 3, 3]
+
+    def test_full_jitter(self):
+        """Test that jitter scales the delay by a uniform draw"""
+        policy = RetryPolicy(backoff=1, random=lambda: 0.25)
+
+        assert policy.delay(2) == 1.0
+
+    def test_jitter_stays_in_range(self):
+        policy = RetryPolicy(backoff=1, max_backoff=4)
+
+        assert all(0 <= policy.delay(n) <= 4 for n in range(10) for _ in range(20))
+
+    def test_retry_after_raises_delay(self):
+        """Test that Retry-After raises but never exceeds max_backoff"""
+        policy = RetryPolicy(backoff=0.5, max_backoff=5, jitter=False)
+
+        assert policy.delay(0, retry_after=2) == 2
+        assert policy.delay(3, retry_after=1) == 4
+        assert policy.delay(0, retry_after=60) == 5
+
+    def test_default_statuses(self):
+        assert RetryPolicy().statuses == {429, 502, 503, 504}
+
+    def test_negative_values_rejected(self):
+        with pytest.raises(ValueError):
+            RetryPolicy(retries=-1)
+
+
+class TestParseRetryAfter:
+    """Tests for parse_retry_after"""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("3", 3.0),
+            ("1.5", 1.5),
+            ("-2", 0.0),
+            (None, None),
+            ("", None),
+            ("Wed, 21 Oct 2026 07:28:00 GMT", None),
+        ],
+    )
+    def test_values(self, value, expected):
+        assert parse_retry_after(value) == expected
@@ -0,0 +1,213 @@
+"""Tests for per-stage decode timing"""
+
+import asyncio
+import logging
+
+import pytest
+from src.api.async_client import AsyncVINDecoderClient
+from src.api.client import VINDecoderClient
+from src.api.retry import RetryPolicy
+from src.api.timing import DecodeTimings, StageTimer
+from src.cache.memory import MemoryCache
+from src.exceptions import APIError, InvalidVINError
+
+UPSTREAM = {"queue", "request", "download", "parse", "build", "error_check"}
+
+
+class TestStageTimer:
+    """Tests for StageTimer"""
+
+    def test_marks_accumulate(self):
+        timer = StageTimer("VIN")
+        timer.mark("a")
+        timer.add("b", 2.0)
+        timer.add("b", 1.0)
+        timer.lap()
+        timer.mark("a")
+
+        assert set(timer.stages) == {"a", "b"}
+        assert timer.stages["b"] == 3.0
+        assert timer.stages["a"] < 1
+
+    def test_child_merge(self):
+        timer = StageTimer("VIN")
+        timer.add("request", 1.0)
+        child = timer.child()
+        child.add("request", 0.5)
+        child.add("parse", 0.25)
+
+        timer.merge(child)
+        timer.merge(None)
+
+        assert child.vin == "VIN"
+        assert timer.stages == {"request": 1.5, "parse": 0.25}
+
+
+class TestDecodeTimings:
+    """Tests for DecodeTimings"""
+
+    def test_finish_aggregates_and_calls_hooks(self):
+        seen = []
+        timings = DecodeTimings(hooks=[seen.append])
+        timer = timings.start("vin")
+        timer.add("validate", 0.001)
+        timer.cache = "hit"
+
+        timing = timings.finish(timer)
+        timings.finish(timings.start("bad"), InvalidVINError("bad"))
+        stats = timings.snapshot()
+
+        assert seen == [timing, seen[1]]
+        assert seen[1].error == "InvalidVINError"
+        assert timing.stages == {"validate": 0.001}
+        assert stats.cache == {"hit": 1, "miss": 1}
+        assert stats.errors == 1
+        assert stats.stages["validate"].count == 1
+        assert stats.stages["total"].count == 2
+
+    def test_failing_hook_is_logged(self, caplog):
+        def broken(timing):
+            raise RuntimeError("hook bug")
+
+        seen = []
+        timings = DecodeTimings(hooks=[broken])
+        timings.add_hook(seen.append)
+
+        with caplog.at_level(logging.WARNING, logger="pyVIN.timing"):
+            timings.finish(timings.start("vin"))
+        timings.remove_hook(seen.append)
+        timings.finish(timings.start("vin"))
+
+        assert len(seen) == 1
+        assert "Timing hook" in caplog.text
+
+
+class TestClientTimings:
+    """Tests for timed decodes with the synchronous client"""
+
+    def test_miss_reports_every_stage(self, stub_vpic, valid_vin):
+        seen = []
+        client = VINDecoderClient(
+            base_url=stub_vpic.base_url,
+            cache=MemoryCache(),
+            timings=DecodeTimings(hooks=[seen.append]),
+        )
+
+        client.decode(valid_vin)
+        client.decode(valid_vin)
+
+        miss, hit = seen
+        assert miss.cache == "miss"
+        assert miss.error_code == hit.error_code == "0"
+        assert set(miss.stages) == {"validate", "cache", "store"} | UPSTREAM
+        assert sum(miss.stages.values()) <= miss.total
+        assert hit.cache == "hit"
+        assert set(hit.stages) == {"validate", "cache"}
+
+    def test_request_stage_covers_server_time(self, stub_vpic, valid_vin):
+        stub_vpic.delay = 0.05
+        seen = []
+        client = VINDecoderClient(
+            base_url=stub_vpic.base_url, timings=DecodeTimings(hooks=[seen.append])
+        )
+
+        client.decode(valid_vin)
+
+        assert seen[0].stages["request"] >= 0.05
+
+    def test_errors_and_negative_cache(self, stub_vpic, valid_vin):
+        stub_vpic.results[valid_vin] = {
+            "VIN": valid_vin,
+            "ErrorCode": "400",
+            "ErrorText": "400 - Invalid Characters Present",
+        }
+        seen = []
+        timings = DecodeTimings(hooks=[seen.append])
+        client = VINDecoderClient(
+            base_url=stub_vpic.base_url,
+            negative_cache=MemoryCache(),
+            timings=timings,
+        )
+
+        for _ in range(2):
+            with pytest.raises(APIError):
+                client.decode(valid_vin)
+        stats = timings.snapshot()
+
+        assert [timing.error_code for timing in seen] == ["400", "400"]
+
+        assert stats.cache == {"miss": 1, "negative": 1}
+        assert stats.errors == 2
+        assert stats.stages["error_check"].count == 1
+
+    def test_retries_report_backoff(self, stub_vpic, valid_vin):
+        stub_vpic.status = 503
+        seen = []
+        client = VINDecoderClient(
+            base_url=stub_vpic.base_url,
+            retry=RetryPolicy(retries=1, backoff=0.01, jitter=False),
+            timings=DecodeTimings(hooks=[seen.append]),
+        )
+
+        with pytest.raises(Exception):
+            client.decode(valid_vin)
+
+        assert seen[0].stages["backoff"] == pytest.approx(0.01)
+        assert seen[0].error == "TransientError"
+        assert seen[0].stages["request"] > 0
+
+    def test_disabled_by_default(self, stub_vpic, valid_vin):
+        client = VINDecoderClient(base_url=stub_vpic.base_url)
+
+        assert client.timings is None
+        assert client.decode(valid_vin).make == "BMW"
+
+
+class TestAsyncClientTimings:
+    """Tests for timed decodes with the async client"""
+
+    def test_miss_reports_connect(self, stub_vpic, valid_vin, make_vin):
+        seen = []
+
+        async def scenario():
+            async with AsyncVINDecoderClient(
+                base_url=stub_vpic.base_url,
+                timings=DecodeTimings(hooks=[seen.append]),
+            ) as client:
+                await client.decode(valid_vin)
+                await client.decode(make_vin(1))
+
+        asyncio.run(scenario())
+
+        first, second = seen
+        assert set(first.stages) == {"validate", "cache", "connect", "store"} | UPSTREAM
+        assert "connect" not in second.stages  # keep-alive connection reused
+
+    def test_coalesced_and_hit(self, stub_vpic, valid_vin):
+        stub_vpic.delay = 0.05
+        timings = DecodeTimings()
+
+        async def scenario():
+            async with AsyncVINDecoderClient(
+                base_url=stub_vpic.base_url, cache=MemoryCache(), timings=timings
+            ) as client:
+                await asyncio.gather(client.decode(valid_vin), client.decode(valid_vin))
+                await client.decode(valid_vin)
+
+        asyncio.run(scenario())
+        stats = timings.snapshot()
+
+        assert stats.cache == {"miss": 1, "coalesced": 1, "hit": 1}
+        assert stats.stages["coalesced"].count == 1
+
+    def test_invalid_vin(self):
+        timings = DecodeTimings()
+
+        async def scenario():
+            async with AsyncVINDecoderClient(timings=timings) as client:
+                await client.decode("TOO-SHORT")
+
+        with pytest.raises(InvalidVINError):
+            asyncio.run(scenario())
+
+        assert timings.snapshot().errors == 1
@@ -0,0 +1,75 @@
+"""Tests for the in-memory LRU cache"""
+
+import pytest
+from src.cache.memory import MemoryCache
+
+
+class TestMemoryCache:
+    """Tests for MemoryCache"""
+
+    def test_get_miss_then_hit(self):
+        """Test that a stored entry is returned and counted as a hit"""
+        cache = MemoryCache()
+        assert cache.get("A") is None
+
+        cache.set("A", {"VIN": "A"})
+
+        assert cache.get("A") == {"VIN": "A"}
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted"""
+        cache = MemoryCache(max_entries=2)
+        cache.set("A", {})
+        cache.set("B", {})
+        cache.get("A")  # B is now least recently used
+        cache.set("C", {})
+
+        assert cache.get("B") is None
+        assert cache.get("A") == {}
+        assert cache.stats().evictions == 1
+
+    def test_ttl_expiry(self, mocker):
+        """Test that entries expire after the TTL"""
+        clock = mocker.patch("src.cache.memory.time.monotonic", return_value=100.0)
+        cache = MemoryCache(ttl=10)
+        cache.set("A", {})
+
+        clock.return_value = 105.0
+        assert cache.get("A") == {}
+
+        clock.return_value = 111.0
+        assert cache.get("A") is None
+        assert cache.stats().expirations == 1
+        assert cache.stats().size == 0
+
+    def test_get_many(self):
+        """Test that get_many returns only present keys"""
+        cache = MemoryCache()
+        cache.set("A", {"VIN": "A"})
+
+        assert cache.get_many(["A", "B"]) == {"A": {"VIN": "A"}}
+
+    def test_delete_and_clear(self):
+        """Test delete and clear"""
+        cache = MemoryCache()
+        cache.set("A", {})
+        cache.set("B", {})
+        cache.delete("A")
+        cache.delete("missing")
+        assert cache.get("A") is None
+
+        cache.clear()
+        assert cache.stats().size == 0
+        assert cache.stats().misses == 0
+
+    def test_invalid_size(self):
+        """Test that max_entries must be positive"""
+        with pytest.raises(ValueError):
+            MemoryCache(max_entries=0)
+
+    def test_unused_hit_rate(self):
+        """Test hit rate before any lookups"""
+        assert MemoryCache().stats().hit_rate == 0.0
@@ -0,0 +1,77 @@
+"""Tests for the squish-VIN pattern cache"""
+
+from src.cache.memory import MemoryCache
+from src.cache.pattern import PatternCache
+
+
+class TestPatternCache:
+    """Tests for PatternCache"""
+
+    def test_shares_decode_across_serials(self, make_vin):
+        """Test that a clean decode is reused for another serial number"""
+        first, second = make_vin(1), make_vin(2)
+        cache = PatternCache()
+        cache.set(first, {"VIN": first, "Make": "CHEVROLET", "ErrorCode": "0"})
+
+        raw = cache.get(second)
+
+        assert raw == {"VIN": second, "Make": "CHEVROLET", "ErrorCode": "0"}
+        assert cache.stats().hits == 1
+
+    def test_does_not_mutate_stored_entry(self, make_vin):
+        """Test that the returned copy does not alias the representative"""
+        cache = PatternCache()
+        cache.set(make_vin(1), {"VIN": make_vin(1), "ErrorCode": "0"})
+
+        cache.get(make_vin(2))
+
+        assert cache.get(make_vin(1))["VIN"] == make_vin(1)
+
+    def test_warnings_not_stored(self, make_vin):
+        """Test that results carrying warnings are not shared"""
+        cache = PatternCache()
+        cache.set(make_vin(1), {"VIN": make_vin(1), "ErrorCode": "1"})
+
+        assert cache.get(make_vin(2)) is None
+        assert cache.stats().size == 0
+
+    def test_bad_check_digit_misses(self, make_vin):
+        """Test that a VIN with a wrong check digit is never served"""
+        cache = PatternCache()
+        cache.set(make_vin(1), {"VIN": make_vin(1), "ErrorCode": "0"})
+        good = make_vin(2)
+        bad = good[:8] + ("0" if good[8] != "0" else "1") + good[9:]
+
+        assert PatternCache.key_for(bad) is None
+        assert cache.get(bad) is None
+        assert cache.stats().misses == 1
+
+    def test_wildcards_are_ineligible(self):
+        """Test that wildcard VINs are neither stored nor served"""
+        cache = PatternCache()
+        cache.set("1GCHK23U*4F177548", {"ErrorCode": "0"})
+
+        assert cache.get("1GCHK23U*4F177548") is None
+        assert cache.stats().size == 0
+
+    def test_different_model_year_misses(self, make_vin):
+        """Test that position 10 (model year) is part of the pattern"""
+        cache = PatternCache()
+        cache.set(make_vin(1), {"VIN": make_vin(1), "ErrorCode": "0"})
+
+        assert cache.get(make_vin(1, year_plant="5F")) is None
+
+    def test_delete_clear_close(self, make_vin):
+        """Test delete, clear and close delegate to the backend"""
+        backend = MemoryCache()
+        cache = PatternCache(backend)
+        cache.set(make_vin(1), {"ErrorCode": "0"})
+        cache.delete(make_vin(2))
+        cache.delete("1GCHK23U*4F177548")
+        assert backend.stats().size == 0
+
+        cache.set(make_vin(1), {"ErrorCode": "0"})
+        cache.get(make_vin(3))
+        cache.clear()
+        assert cache.stats() == backend.stats()
+        cache.close()
@@ -0,0 +1,136 @@
+"""Tests for the persistent SQLite cache"""
+
+import sqlite3
+
+import pytest
+from src.cache.sqlite import SQLiteCache
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    """Path for a throwaway cache database"""
+    return str(tmp_path / "decode-cache.sqlite3")
+
+
+class TestSQLiteCache:
+    """Tests for SQLiteCache"""
+
+    def test_round_trip(self, cache_path, sample_api_response):
+        """Test that raw results are stored and returned unchanged"""
+        raw = sample_api_response["Results"][0]
+        cache = SQLiteCache(cache_path)
+        cache.set("5UXWX7C50BA123456", raw)
+
+        assert cache.get("5UXWX7C50BA123456") == raw
+        assert cache.get("1GCHK23U64F177548") is None
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+    def test_uses_wal_mode(self, cache_path):
+        """Test that the database is opened in WAL mode"""
+        SQLiteCache(cache_path)
+        conn = sqlite3.connect(cache_path)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_persists_across_instances(self, cache_path):
+        """Test that entries survive reopening the database"""
+        first = SQLiteCache(cache_path)
+        first.set("A", {"VIN": "A"})
+        first.close()
+
+        second = SQLiteCache(cache_path)
+        assert second.get("A") == {"VIN": "A"}
+        assert second.stats().size == 1
+
+    def test_overwrite(self, cache_path):
+        """Test that setting an existing key replaces it without growing"""
+        cache = SQLiteCache(cache_path)
+        cache.set("A", {"v": 1})
+        cache.set("A", {"v": 2})
+
+        assert cache.get("A") == {"v": 2}
+        assert cache.stats().size == 1
+
+    def test_ttl_expiry(self, cache_path, mocker):
+        """Test that expired entries are dropped on read"""
+        clock = mocker.patch("src.cache.sqlite.time.time", return_value=1000.0)
+        cache = SQLiteCache(cache_path, ttl=60)
+        cache.set("A", {})
+
+        clock.return_value = 1059.0
+        assert cache.get("A") == {}
+
+        clock.return_value = 1061.0
+        assert cache.get("A") is None
+        stats = cache.stats()
+        assert stats.expirations == 1
+        assert stats.size == 0
+
+    def test_eviction_by_access_time(self, cache_path, mocker):
+        """Test that least recently accessed entries are evicted"""
+        clock = mocker.patch("src.cache.sqlite.time.time", return_value=1.0)
+        cache = SQLiteCache(cache_path, max_entries=2)
+        cache.set("A", {})
+        clock.return_value = 2.0
+        cache.set("B", {})
+        clock.return_value = 3.0
+        cache.get("A")  # B is now least recently accessed
+        clock.return_value = 4.0
+        cache.set("C", {})
+
+        assert cache.get_many(["A", "B", "C"]).keys() == {"A", "C"}
+        assert cache.stats().evictions == 1
+        assert cache.stats().size == 2
+
+    def test_get_many(self, cache_path):
+        """Test that get_many fetches many keys in one pass"""
+        cache = SQLiteCache(cache_path)
+        for i in range(1200):
+            cache.set(f"VIN{i}", {"i": i})
+
+        found = cache.get_many([f"VIN{i}" for i in range(0, 1500, 2)])
+
+        assert len(found) == 600
+        assert cache.stats().misses == 150
+
+    def test_delete_and_clear(self, cache_path):
+        """Test delete and clear"""
+        cache = SQLiteCache(cache_path)
+        cache.set("A", {})
+        cache.set("B", {})
+        cache.delete("A")
+        assert cache.get("A") is None
+        assert cache.stats().size == 1
+
+        cache.clear()
+        assert cache.stats().size == 0
+        assert cache.get("B") is None
+
+    def test_errors_are_misses(self, cache_path):
+        """Test that SQLite failures degrade to cache misses"""
+        cache = SQLiteCache(cache_path)
+        cache.set("A", {})
+        cache._conn.execute("DROP TABLE decode_cache")
+
+        cache.set("B", {})
+        assert cache.get("A") is None
+        assert cache.stats().misses == 1
+
+    def test_delete_and_clear_errors_are_logged(self, cache_path, caplog):
+        """Test that delete and clear on a broken database do not raise"""
+        cache = SQLiteCache(cache_path)
+        cache.set("A", {})
+        cache.get("A")
+        cache._conn.execute("DROP TABLE decode_cache")
+
+        cache.delete("A")
+        cache.clear()
+
+        assert "delete failed" in caplog.text
+        assert "clear failed" in caplog.text
+        assert cache.stats().hits == 0
+
+    def test_invalid_size(self, cache_path):
+        """Test that max_entries must be positive"""
+        with pytest.raises(ValueError):
+            SQLiteCache(cache_path, max_entries=0)
@@ -0,0 +1,90 @@
+"""Tests for pyvin output writers"""
+
+import os
+
+import pyarrow.parquet as pq
+import pytest
+from src.cli.formats import (
+    CSVRowWriter,
+    JSONLRowWriter,
+    ParquetRowWriter,
+    detect_format,
+    result_row,
+)
+from src.api.models import VINDecodeResult
+from src.exceptions import APIError
+
+
+def rows(*vins):
+    return [result_row(vin, VINDecodeResult(VIN=vin)) for vin in vins]
+
+
+class TestRowWriters:
+    """Tests for checkpointed writers"""
+
+    @pytest.mark.parametrize("writer_class", [CSVRowWriter, JSONLRowWriter])
+    def test_resume_truncates_after_checkpoint(self, writer_class, tmp_path):
+        """Test that rows written after the last checkpoint are discarded"""
+        path = str(tmp_path / "out")
+        writer = writer_class(path)
+        writer.write(rows("A", "B"))
+        state = writer.checkpoint()
+        writer.write(rows("LOST"))
+        writer.close()
+
+        resumed = writer_class(path, state)
+        resumed.write(rows("C"))
+        resumed.close()
+
+        with open(path) as f:
+            text = f.read()
+        assert "LOST" not in text
+        last = text.splitlines()[-1]
+        assert last.startswith("C,") or last.startswith('{"input":"C"')
+        assert text.count("\n") == (4 if writer_class is CSVRowWriter else 3)
+
+    def test_parquet_resume_drops_later_parts(self, tmp_path):
+        """Test that parts written after the last checkpoint are removed"""
+        path = str(tmp_path / "out.parquet")
+        writer = ParquetRowWriter(path)
+        writer.write(rows("A"))
+        state = writer.checkpoint()
+        writer.write(rows("LOST"))
+        writer.close()
+        assert len(os.listdir(path)) == 2
+
+        resumed = ParquetRowWriter(path, state)
+        resumed.write(rows("B"))
+        resumed.close()
+
+        assert pq.read_table(path).column("input").to_pylist() == ["A", "B"]
+
+    def test_parquet_flushes_every_row_group(self, tmp_path):
+        """Test that full row groups are written without a checkpoint"""
+        path = str(tmp_path / "out.parquet")
+        writer = ParquetRowWriter(path, row_group=2)
+        writer.write(rows("A"))
+        assert os.listdir(path) == []
+
+        writer.write(rows("B"))
+        assert os.listdir(path) == ["part-00000.parquet"]
+        writer.close()
+
+        assert pq.read_table(path).column("input").to_pylist() == ["A", "B"]
+        with pytest.raises(ValueError):
+            ParquetRowWriter(path, row_group=0)
+
+
+class TestHelpers:
+    """Tests for format helpers"""
+
+    @pytest.mark.parametrize(
+        "path, expected",
+        [("a.CSV", "csv"), ("a.ndjson", "jsonl"), ("a.txt", "text"), ("-", "text")],
+    )
+    def test_detect_format(self, path, expected):
+        assert detect_format(path, ["csv", "jsonl", "text"], "text") == expected
+
+    def test_error_row(self):
+        row = result_row("X", APIError("API Error: boom"))
+        assert row == {"input": "X", "error": "APIError: API Error: boom"}
@@ -0,0 +1,269 @@
+"""Tests for the pyvin command line interface"""
+
+import io
+import json
+import os
+
+import pyarrow.parquet as pq
+import pytest
+from src.api.client import VINDecoderClient
+from src.cli.checkpoint import Checkpoint
+from src.cli.formats import COLUMNS, ParquetRowWriter, read_vins
+from src.cli.main import Progress, main
+from src.exceptions import NetworkError
+
+
+@pytest.fixture
+def vins(make_vin):
+    return [make_vin(i) for i in range(7)]
+
+
+def decode(stub, *args):
+    return main(["decode", "--base-url", stub.base_url, "-q", *args])
+
+
+def read_jsonl(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+class TestReadVINs:
+    """Tests for streaming VIN input"""
+
+    def test_text(self, tmp_path):
+        path = tmp_path / "vins.txt"
+        path.write_text("AAA\r\nBBB\n\nCCC\n")
+        assert list(read_vins(str(path), "text", "vin")) == ["AAA", "BBB", "", "CCC"]
+
+    def test_csv_column_is_case_insensitive(self, tmp_path):
+        path = tmp_path / "vins.csv"
+        path.write_text("id,VIN\n1,AAA\n2\n3,CCC\n")
+        assert list(read_vins(str(path), "csv", "vin")) == ["AAA", "", "CCC"]
+
+    def test_jsonl(self, tmp_path):
+        path = tmp_path / "vins.jsonl"
+        path.write_text('{"Vin": "AAA"}\n\n{"Vin": null}\n{"Vin": 12345}\n')
+        assert list(read_vins(str(path), "jsonl", "vin")) == ["AAA", "", "12345"]
+
+    def test_missing_column(self, tmp_path):
+        path = tmp_path / "vins.csv"
+        path.write_text("id,serial\n1,AAA\n")
+        with pytest.raises(ValueError, match="no 'vin' column"):
+            list(read_vins(str(path), "csv", "vin"))
+
+    def test_stdin(self, mocker):
+        mocker.patch("sys.stdin", io.StringIO("AAA\nBBB\n"))
+        assert list(read_vins("-", "text", "vin")) == ["AAA", "BBB"]
+
+
+class TestDecodeCommand:
+    """Tests for pyvin decode"""
+
+    def test_csv_to_jsonl_in_input_order(self, stub_vpic, vins, tmp_path):
+        """Test batching across threads keeps rows in input order"""
+        source = tmp_path / "in.csv"
+        source.write_text("vin\n" + "\n".join(vins + ["bad"]) + "\n")
+        output = str(tmp_path / "out.jsonl")
+
+        assert decode(stub_vpic, str(source), "-o", output, "--batch-size", "2") == 0
+
+        rows = read_jsonl(output)
+        assert [r["input"] for r in rows] == vins + ["bad"]
+        assert [r["vin"] for r in rows[:-1]] == vins
+        assert rows[-1]["error"].startswith("InvalidVINError")
+        assert all(len(batch) <= 2 for batch in stub_vpic.batch_vins)
+        assert not os.path.exists(output + ".checkpoint")
+
+    def test_non_string_jsonl_values_become_error_rows(self, stub_vpic, vins, tmp_path):
+        """Test that a number in the VIN key does not stop the job"""
+        source = tmp_path / "in.jsonl"
+        source.write_text(
+            f'{{"vin": "{vins[0]}"}}\n{{"vin": 12345}}\n{{"vin": null}}\n'
+        )
+        output = str(tmp_path / "out.jsonl")
+
+        assert decode(stub_vpic, str(source), "-o", output) == 0
+
+        rows = read_jsonl(output)
+        assert [r["input"] for r in rows] == [vins[0], "12345", ""]
+        assert rows[0]["vin"] == vins[0]
+        assert rows[1]["error"].startswith("InvalidVINError")
+        assert rows[2]["error"].startswith("InvalidVINError")
+
+    def test_text_to_csv(self, stub_vpic, vins, tmp_path):
+        source = tmp_path / "in.txt"
+        source.write_text("\n".join(vins) + "\n")
+        output = tmp_path / "out.csv"
+
+        assert decode(stub_vpic, str(source), "-o", str(output)) == 0
+
+        lines = output.read_text().splitlines()
+        assert lines[0].split(",") == COLUMNS
+        assert len(lines) == len(vins) + 1
+
+    @pytest.mark.parametrize("suffix", ["csv", "jsonl", "parquet"])
+    def test_fields(self, stub_vpic, vins, tmp_path, suffix):
+        """Test that --fields restricts the output columns in every format"""
+        source = tmp_path / "in.txt"
+        source.write_text("\n".join(vins[:2] + ["bad"]) + "\n")
+        output = tmp_path / f"out.{suffix}"
+
+        args = [str(source), "-o", str(output), "--fields", "make, model"]
+        assert decode(stub_vpic, *args) == 0
+
+        if suffix == "csv":
+            lines = output.read_text().splitlines()
+            assert lines[0] == "input,error,make,model"
+            assert lines[1] == f"{vins[0]},,BMW,X3"
+        elif suffix == "jsonl":
+            rows = read_jsonl(output)
+            assert rows[0] == {
+                "input": vins[0],
+                "error": None,
+                "make": "BMW",
+                "model": "X3",
+            }
+            assert rows[2]["error"].startswith("InvalidVINError")
+        else:
+            table = pq.read_table(str(output))
+            assert table.column_names == ["input", "error", "make", "model"]
+            assert table.column("make").to_pylist() == ["BMW", "BMW", None]
+
+    def test_parquet_parts(self, stub_vpic, vins, tmp_path):
+        source = tmp_path / "in.txt"
+        source.write_text("\n".join(vins) + "\n")
+        output = tmp_path / "out.parquet"
+
+        assert (
+            decode(
+                stub_vpic,
+                str(source),
+                "-o",
+                str(output),
+                "--batch-size",
+                "3",
+                "--checkpoint-every",
+                "3",
+            )
+            == 0
+        )
+
+        assert sorted(os.listdir(output)) == [
+            "part-00000.parquet",
+            "part-00001.parquet",
+            "part-00002.parquet",
+        ]
+        table = pq.read_table(str(output))
+        assert table.column("vin").to_pylist() == vins
+
+    def test_parquet_buffer_bounded_without_checkpoints(
+        self, stub_vpic, vins, tmp_path, mocker
+    ):
+        """Test that Parquet parts are flushed by size with --no-checkpoint"""
+        source = tmp_path / "in.txt"
+        source.write_text("\n".join(vins) + "\n")
+        output = tmp_path / "out.parquet"
+        buffered = []
+        write = ParquetRowWriter.write
+
+        def spy(self, rows):
+            write(self, rows)
+            buffered.append(len(self._rows))
+
+        mocker.patch.object(ParquetRowWriter, "write", spy)
+
+        assert (
+            decode(
+                stub_vpic,
+                str(source),
+                "-o",
+                str(output),
+                "--no-checkpoint",
+                "--batch-size",
+                "2",
+                "--row-group",
+                "3",
+            )
+            == 0
+        )
+
+        assert max(buffered) < 3
+        assert len(os.listdir(output)) == 2
+        assert not os.path.exists(f"{output}.checkpoint")
+        assert pq.read_table(str(output)).column("vin").to_pylist() == vins
+
+    def test_stdin_to_stdout(self, stub_vpic, vins, mocker, capsys):
+        mocker.patch("sys.stdin", io.StringIO("\n".join(vins[:2]) + "\n"))
+
+        assert decode(stub_vpic, "-") == 0
+
+        rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [r["make"] for r in rows] == ["BMW", "BMW"]
+
+    def test_resume_after_failure(self, stub_vpic, vins, tmp_path, mocker):
+        """Test that a job stopped halfway resumes without re-decoding rows"""
+        source = tmp_path / "in.txt"
+        source.write_text("\n".join(vins) + "\n")
+        output = str(tmp_path / "out.jsonl")
+        args = [str(source), "-o", output, "--batch-size", "2"]
+        args += ["--checkpoint-every", "2", "--concurrency", "1"]
+
+        original = VINDecoderClient.decode_batch
+        calls, fail_at = [], [3]
+
+        def flaky(self, batch, return_exceptions=False, *args):
+            calls.append(batch)
+            if len(calls) in fail_at:
+                return [NetworkError("Failed to reach NHTSA API")] * len(batch)
+            return original(self, batch, return_exceptions, *args)
+
+        mocker.patch.object(VINDecoderClient, "decode_batch", flaky)
+        assert decode(stub_vpic, *args) == 1
+        assert Checkpoint.load(output + ".checkpoint").rows == 4
+
+        calls.clear()
+        fail_at.clear()
+        assert decode(stub_vpic, *args) == 0
+
+        assert [r["input"] for r in read_jsonl(output)] == vins
+        assert calls == [vins[4:6], vins[6:]]
+
+    def test_checkpoint_for_another_job(self, stub_vpic, tmp_path, capsys):
+        output = str(tmp_path / "out.jsonl")
+        Checkpoint(output + ".checkpoint", input="other.csv", output=output).save()
+
+        assert decode(stub_vpic, str(tmp_path / "in.txt"), "-o", output) == 2
+        assert "belongs to another job" in capsys.readouterr().err
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["--batch-size", "51"],
+            ["--concurrency", "0"],
+            ["--output-format", "parquet"],
+            ["--row-group", "0"],
+            ["--fields", "make,colour"],
+            ["--fields", ","],
+        ],
+    )
+    def test_invalid_options(self, stub_vpic, args):
+        assert decode(stub_vpic, "-", *args) == 2
+
+
+class TestProgress:
+    """Tests for progress reporting"""
+
+    def test_reports_rows_rate_and_errors(self, mocker):
+        clock = mocker.patch("src.cli.main.time.monotonic", return_value=0.0)
+        out = io.StringIO()
+        progress = Progress(out, interval=5, start_row=100)
+
+        progress.update(50, 1)
+        clock.return_value = 10.0
+        progress.update(50, 0)
+        progress.finish()
+
+        assert out.getvalue().splitlines() == [
+            "rows 200 | 10 rows/s | errors 1 | 10.0s",
+            "done 200 | 10 rows/s | errors 1 | 10.0s",
+        ]
@@ -0,0 +1,34 @@
+"""Tests for HTML table rendering"""
+
+from src.formatting.fields import FIELD_DESCRIPTIONS, FIELD_LABELS
+from src.formatting.table import results_table_html
+
+
+class TestResultsTableHtml:
+    """Tests for results_table_html"""
+
+    def test_rows_in_order(self):
+        html = results_table_html({"make": "BMW", "model": "X3"})
+
+        assert html.startswith('<table class="results-table">')
+        assert html.endswith("</table>")
+        assert html.count("<tr>") == 3
+        assert html.index("BMW") < html.index("X3")
+
+    def test_label_has_tooltip(self):
+        html = results_table_html({"make": "BMW"})
+
+        tooltip = (
+            f'<span title="{FIELD_DESCRIPTIONS["make"]}">{FIELD_LABELS["make"]}</span>'
+        )
+        assert f"<tr><td>{tooltip}</td><td>BMW</td></tr>" in html
+
+    def test_unknown_field_gets_title_case_label(self):
+        html = results_table_html({"custom_field": 4})
+
+        assert "<tr><td>Custom Field</td><td>4</td></tr>" in html
+
+    def test_empty(self):
+        assert results_table_html({}) == (
+            '<table class="results-table"><tr><th>Field</th><th>Value</th></tr></table>'
+        )
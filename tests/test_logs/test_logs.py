@@ -1,82 +1,193 @@
 """Tests for logging setup"""
 
+import json
 import logging
-from src.logs.logs import setup_logger
+import logging.handlers
+
+import pytest
+from src.api.timing import DecodeTiming
+from src.logs.logs import (
+    DebugSampler,
+    JSONFormatter,
+    listener,
+    log_decode,
+    setup_logger,
+    shutdown_logging,
+)
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    """Path of a log file, with logging torn down after the test"""
+    yield str(tmp_path / "pyVIN.log")
+    shutdown_logging()
+
+
+def _lines(path):
+    shutdown_logging()  # flush the queue
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def _record(level=logging.DEBUG, lineno=1, **extra):
+    record = logging.LogRecord("pyVIN.test", level, "x.py", lineno, "msg", (), None)
+    record.__dict__.update(extra)
+    return record
 
 
 class TestSetupLogger:
     """Tests for setup_logger function"""
 
-    def test_creates_logger(self):
+    def test_creates_logger(self, log_file):
         """Test that logger is created"""
-        logger = setup_logger()
+        logger = setup_logger(filename=log_file)
         assert isinstance(logger, logging.Logger)
         assert logger.name == "pyVIN"
 
-    def test_logger_level_is_debug(self):
+    def test_logger_level_is_debug(self, log_file):
         """Test that logger level is set to DEBUG"""
-        logger = setup_logger()
+        logger = setup_logger(filename=log_file)
         assert logger.level == logging.DEBUG
 
-    def test_has_file_handler(self):
-        """Test that file handler is added"""
-        logger = setup_logger()
-        file_handlers = [
-            h
-            for h in logger.handlers
-            if isinstance(h, logging.handlers.RotatingFileHandler)
-        ]
-        assert len(file_handlers) > 0
+    def test_logger_only_has_queue_handler(self, log_file):
+        """Test that records go through a queue instead of blocking handlers"""
+        logger = setup_logger(filename=log_file)
+        assert len(logger.handlers) == 1
+        assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
 
-    def test_has_console_handler(self):
-        """Test that console handler is added"""
-        logger = setup_logger()
-        console_handlers = [
-            h
-            for h in logger.handlers
-            if isinstance(h, logging.StreamHandler)
-            and not isinstance(h, logging.handlers.RotatingFileHandler)
-        ]
-        assert len(console_handlers) > 0
+    def test_idempotent(self, log_file):
+        """Test that calling again with the same arguments keeps the running setup"""
+        logger = setup_logger(filename=log_file)
+        first = listener()
+        handler = logger.handlers[0]
 
-    def test_custom_file_handler_level(self):
-        """Test custom file handler level"""
-        # Clear existing handlers to avoid interference from previous tests
-        logger = logging.getLogger("pyVIN")
-        logger.handlers.clear()
+        setup_logger(filename=log_file)
 
-        logger = setup_logger(fh_lev=logging.INFO)
-        file_handlers = [
+        assert listener() is first
+        assert logger.handlers == [handler]
+
+    def test_new_arguments_replace_setup(self, log_file):
+        """Test that different arguments rebuild the handlers instead of adding more"""
+        logger = setup_logger(filename=log_file)
+        first = listener()
+
+        setup_logger(fh_lev=logging.INFO, filename=log_file)
+
+        assert len(logger.handlers) == 1
+        assert listener() is not first
+        old_file = next(
             h
-            for h in logger.handlers
+            for h in first.handlers
             if isinstance(h, logging.handlers.RotatingFileHandler)
-        ]
-        assert len(file_handlers) > 0
-        assert file_handlers[-1].level == logging.INFO
+        )
+        assert old_file.stream is None  # the old log file was closed
+
+    def test_setup_after_shutdown(self, log_file):
+        """Test that the same arguments start a new writer after shutdown_logging"""
+        setup_logger(filename=log_file)
+        shutdown_logging()
 
-    def test_custom_console_handler_level(self):
-        """Test custom console handler level"""
-        # Clear existing handlers to avoid interference from previous tests
-        logger = logging.getLogger("pyVIN")
-        logger.handlers.clear()
+        setup_logger(filename=log_file)
 
-        logger = setup_logger(ch_lev=logging.WARNING)
+        assert listener() is not None
+
+    def test_file_and_console_handlers(self, log_file):
+        """Test that the background writer has file and console handlers"""
+        setup_logger(fh_lev=logging.INFO, ch_lev=logging.WARNING, filename=log_file)
+        handlers = listener().handlers
+        file_handlers = [
+            h for h in handlers if isinstance(h, logging.handlers.RotatingFileHandler)
+        ]
         console_handlers = [
             h
-            for h in logger.handlers
+            for h in handlers
             if isinstance(h, logging.StreamHandler)
             and not isinstance(h, logging.handlers.RotatingFileHandler)
         ]
-        assert len(console_handlers) > 0
-        assert console_handlers[-1].level == logging.WARNING
-
-    def test_handlers_have_formatter(self):
-        """Test that handlers have formatters"""
-        logger = setup_logger()
-        for handler in logger.handlers:
-            assert handler.formatter is not None
-
-    def test_returns_logger_instance(self):
-        """Test that function returns a logger instance"""
-        result = setup_logger()
-        assert isinstance(result, logging.Logger)
+        assert file_handlers[0].level == logging.INFO
+        assert isinstance(file_handlers[0].formatter, JSONFormatter)
+        assert console_handlers[0].level == logging.WARNING
+
+    def test_writes_json_lines(self, log_file):
+        """Test that the file gets one JSON object per record"""
+        logger = setup_logger(filename=log_file)
+        logger.warning("hello %s", "world", extra={"vin": "5UXWX7C50BA123456"})
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+
+        first, second = _lines(log_file)
+
+        assert first["message"] == "hello world"
+        assert first["level"] == "WARNING"
+        assert first["logger"] == "pyVIN"
+        assert first["vin"] == "5UXWX7C50BA123456"
+        assert "ValueError: boom" in second["exc_info"]
+        assert "boom" not in second["message"]
+
+    def test_debug_sampling(self, log_file):
+        """Test that DEBUG records from one call site are sampled"""
+        logger = setup_logger(filename=log_file, debug_sample=5)
+        for i in range(10):
+            logger.debug("event %d", i)
+        logger.info("kept")
+
+        lines = _lines(log_file)
+
+        assert [line["message"] for line in lines] == ["event 0", "event 5", "kept"]
+
+
+class TestDebugSampler:
+    """Tests for DebugSampler"""
+
+    def test_samples_per_call_site(self):
+        sampler = DebugSampler(every=3)
+
+        kept = [sampler.filter(_record(lineno=1)) for _ in range(6)]
+
+        assert kept == [True, False, False, True, False, False]
+        assert sampler.filter(_record(lineno=2))
+
+    def test_higher_levels_always_pass(self):
+        sampler = DebugSampler(every=100)
+        sampler.filter(_record())
+
+        assert sampler.filter(_record(level=logging.INFO))
+
+    def test_every_one_keeps_all(self):
+        sampler = DebugSampler(every=1)
+
+        assert all(sampler.filter(_record()) for _ in range(3))
+
+
+class TestJSONFormatter:
+    """Tests for JSONFormatter"""
+
+    def test_includes_decode_fields(self):
+        line = JSONFormatter().format(_record(vin="VIN", latency=0.5, cache=None))
+
+        data = json.loads(line)
+        assert data["vin"] == "VIN"
+        assert data["latency"] == 0.5
+        assert "cache" not in data
+        assert data["time"].endswith("+00:00")
+
+
+class TestLogDecode:
+    """Tests for the log_decode timing hook"""
+
+    def test_success_and_failure(self, caplog):
+        ok = DecodeTiming("VIN1", "hit", {}, 0.002, None, "0")
+        failed = DecodeTiming("VIN2", "miss", {}, 0.2, "APIError", "400")
+
+        with caplog.at_level(logging.DEBUG, logger="pyVIN.decode"):
+            log_decode(ok)
+            log_decode(failed)
+
+        first, second = caplog.records
+        assert first.levelno == logging.DEBUG
+        assert (first.vin, first.cache, first.error_code) == ("VIN1", "hit", "0")
+        assert second.levelno == logging.INFO
+        assert (second.error, second.error_code) == ("APIError", "400")
+        assert second.latency == 0.2
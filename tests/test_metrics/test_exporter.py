@@ -0,0 +1,47 @@
+"""Tests for the standalone metrics endpoint"""
+
+import pytest
+import requests
+from src.metrics.exporter import start_http_server
+from src.metrics.registry import MetricsRegistry
+
+
+@pytest.fixture
+def exporter():
+    registry = MetricsRegistry()
+    registry.counter("jobs_total", "Jobs").inc()
+    server = start_http_server(0, registry=registry)
+    host, port = server.server_address[:2]
+    yield f"http://{host}:{port}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestStartHttpServer:
+    """Tests for start_http_server"""
+
+    def test_serves_metrics(self, exporter):
+        response = requests.get(f"{exporter}/metrics", timeout=5)
+
+        assert response.status_code == 200
+        assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert "jobs_total 1" in response.text
+
+    def test_other_paths(self, exporter):
+        response = requests.get(f"{exporter}/", timeout=5)
+
+        assert response.status_code == 404
+
+    def test_idempotent_per_address(self):
+        registry = MetricsRegistry()
+        probe = start_http_server(0, registry=registry)
+        port = probe.server_address[1]
+        probe.shutdown()
+        probe.server_close()
+
+        server = start_http_server(port, registry=registry)
+        try:
+            assert start_http_server(port, registry=registry) is server
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,160 @@
+"""Tests for the metrics registry and Prometheus text exposition"""
+
+import threading
+
+import pytest
+from src.metrics.registry import Histogram, MetricFamily, MetricsRegistry
+
+
+class TestHistogram:
+    """Tests for Histogram"""
+
+    def test_cumulative_counts(self):
+        histogram = Histogram(buckets=[0.1, 1, 0.01])
+        for value in (0.005, 0.01, 0.5, 3):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+
+        assert snapshot.buckets == (0.01, 0.1, 1)
+        assert snapshot.counts == (2, 2, 3, 4)
+        assert snapshot.count == 4
+        assert snapshot.sum == pytest.approx(3.515)
+
+    def test_quantile(self):
+        histogram = Histogram(buckets=[0.1, 1])
+        assert histogram.snapshot().quantile(0.5) is None
+
+        for value in (0.05, 0.05, 0.5, 5):
+            histogram.observe(value)
+        snapshot = histogram.snapshot()
+
+        assert snapshot.quantile(0.5) == 0.1
+        assert snapshot.quantile(0.75) == 1
+        assert snapshot.quantile(1) == float("inf")
+
+
+class TestMetrics:
+    """Tests for counters, gauges and histogram metrics"""
+
+    def test_counter_by_label(self):
+        counter = MetricsRegistry().counter("jobs_total", "Jobs", ("kind",))
+        counter.inc(kind="a")
+        counter.inc(2, kind="a")
+        counter.inc(kind="b")
+
+        assert counter.value(kind="a") == 3
+        assert counter.value(kind="b") == 1
+        assert counter.value(kind="c") == 0
+
+    def test_counter_rejects_negative(self):
+        counter = MetricsRegistry().counter("jobs_total", "Jobs")
+
+        with pytest.raises(ValueError):
+            counter.inc(-1)
+
+    def test_label_mismatch(self):
+        counter = MetricsRegistry().counter("jobs_total", "Jobs", ("kind",))
+
+        with pytest.raises(ValueError):
+            counter.inc()
+        with pytest.raises(ValueError):
+            counter.inc(other="a")
+
+    def test_gauge(self):
+        gauge = MetricsRegistry().gauge("workers", "Workers")
+        gauge.inc(3)
+        gauge.dec()
+        assert gauge.value() == 2
+
+        gauge.set(7)
+        assert gauge.value() == 7
+
+    def test_histogram_metric(self):
+        histogram = MetricsRegistry().histogram(
+            "latency_seconds", "Latency", ("route",), buckets=[0.1, 1]
+        )
+        histogram.observe(0.05, route="a")
+        histogram.observe(0.5, route="a")
+
+        snapshot = histogram.snapshot(route="a")
+        assert snapshot.counts == (1, 2, 2)
+        assert histogram.snapshot(route="b").count == 0
+
+    def test_concurrent_increments(self):
+        counter = MetricsRegistry().counter("jobs_total", "Jobs")
+
+        def work():
+            for _ in range(1000):
+                counter.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter.value() == 8000
+
+
+class TestMetricsRegistry:
+    """Tests for MetricsRegistry"""
+
+    def test_get_or_create(self):
+        registry = MetricsRegistry()
+
+        first = registry.counter("jobs_total", "Jobs")
+
+        assert registry.counter("jobs_total", "Jobs") is first
+        with pytest.raises(ValueError):
+            registry.gauge("jobs_total", "Jobs")
+
+    def test_exposition(self):
+        registry = MetricsRegistry()
+        registry.counter("jobs_total", "Jobs done", ("kind",)).inc(kind='say "hi"\n')
+        registry.gauge("workers", "Workers").set(1.5)
+
+        text = registry.exposition()
+
+        assert text == (
+            "# HELP jobs_total Jobs done\n"
+            "# TYPE jobs_total counter\n"
+            'jobs_total{kind="say \\"hi\\"\\n"} 1\n'
+            "# HELP workers Workers\n"
+            "# TYPE workers gauge\n"
+            "workers 1.5\n"
+        )
+
+    def test_histogram_exposition(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram("size_bytes", "Sizes", buckets=[100, 1000])
+        histogram.observe(50)
+        histogram.observe(5000)
+
+        lines = registry.exposition().splitlines()
+
+        assert lines[2:] == [
+            'size_bytes_bucket{le="100"} 1',
+            'size_bytes_bucket{le="1000"} 1',
+            'size_bytes_bucket{le="+Inf"} 2',
+            "size_bytes_sum 5050",
+            "size_bytes_count 2",
+        ]
+
+    def test_collectors_merge_by_name(self):
+        registry = MetricsRegistry()
+        registry.gauge("entries", "Entries", ("cache",)).set(1, cache="a")
+
+        def collect():
+            return [
+                MetricFamily("entries", "gauge", "Entries", ("cache",), {("b",): 2})
+            ]
+
+        registry.register_collector("b", collect)
+        registry.register_collector("b", collect)  # replaces, not duplicates
+
+        assert registry.exposition().count('entries{cache="b"} 2') == 1
+        assert 'entries{cache="a"} 1' in registry.exposition()
+
+        registry.unregister_collector("b")
+        assert 'cache="b"' not in registry.exposition()
@@ -0,0 +1,199 @@
+"""Tests for the offline snapshot decoder"""
+
+import json
+import os
+
+import pytest
+from src.api.client import (
+    VINDecoderClient,
+    decode_vin_values_extended,
+    set_default_client,
+)
+from src.api.lean import LeanResult
+from src.api.models import VINDecodeResult
+from src.exceptions import CheckDigitError, InvalidVINError
+from src.offline.decoder import OfflineDecoder, compile_keys, wmi_for
+from src.offline.snapshot import build_snapshot
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+RECORDED_VINS = ["1HGCM82633A004352", "1GCHK23U64F177548", "5UXWX7C50BA123456"]
+
+
+@pytest.fixture(scope="module")
+def snapshot_path(tmp_path_factory):
+    """Snapshot built from the test export of the vPIC tables"""
+    path = str(tmp_path_factory.mktemp("vpic") / "vpic.sqlite3")
+    build_snapshot(os.path.join(DATA_DIR, "vpic_export"), path)
+    return path
+
+
+@pytest.fixture
+def decoder(snapshot_path):
+    with OfflineDecoder(snapshot_path) as decoder:
+        yield decoder
+
+
+def recorded(vin):
+    """Raw result of a recorded DecodeVinValuesExtended response"""
+    with open(os.path.join(DATA_DIR, "recorded", f"{vin}.json")) as f:
+        raw = json.load(f)["Results"][0]
+    # vPIC spells it ManufacturerId; the offline decoder uses the model's alias
+    raw["ManufacturerID"] = raw.pop("ManufacturerId")
+    return raw
+
+
+class TestCompileKeys:
+    """Tests for vPIC pattern key compilation"""
+
+    def test_literals_wildcards_and_sets(self):
+        """Test that keys match as prefixes with * and [...]"""
+        regex, _ = compile_keys("CM8[2-3]*|*A")
+        assert regex.match("CM826|3A004352")
+        assert not regex.match("CM846|3A004352")
+        assert not regex.match("CM826|3B004352")
+
+    def test_specificity(self):
+        """Test that literals outrank sets, which outrank wildcards"""
+        assert compile_keys("CM82")[1] > compile_keys("CM8[2-3]")[1]
+        assert compile_keys("CM8[2-3]")[1] > compile_keys("CM8*")[1]
+
+    def test_wmi_for_small_manufacturer(self):
+        """Test that a 9 in position 3 extends the WMI with positions 12-14"""
+        assert wmi_for("1HGCM82633A004352") == "1HG"
+        assert wmi_for("1M9AB12C3KP042788") == "1M9042"
+
+
+class TestOfflineDecoder:
+    """Tests for OfflineDecoder"""
+
+    @pytest.mark.parametrize("vin", RECORDED_VINS)
+    def test_matches_recorded_api_response(self, decoder, vin):
+        """Test that the raw offline result matches the recorded API result"""
+        expected = recorded(vin)
+        raw = decoder.decode_raw(vin)
+
+        assert {k: expected[k] for k in raw} == raw
+        assert {k for k, v in expected.items() if v} <= set(raw)
+
+    @pytest.mark.parametrize("vin", RECORDED_VINS)
+    def test_decode_matches_recorded_model(self, decoder, vin):
+        """Test that decode fills the model fields the HTTP client would"""
+        result = decoder.decode(vin.lower())
+        expected = VINDecodeResult(**recorded(vin))
+
+        for name in VINDecodeResult.model_fields:
+            assert getattr(result, name) == getattr(expected, name), name
+
+    def test_most_specific_pattern_wins(self, decoder):
+        """Test that CM82 (Coupe) beats the broader CM (Sedan) pattern"""
+        assert decoder.decode("1HGCM82633A004352").body_class == "Coupe"
+        assert decoder.decode("1HGCM56633A004352").body_class == "Sedan/Saloon"
+
+    def test_ids(self, decoder):
+        """Test that make, model and manufacturer ids reach the model"""
+        result = decoder.decode("1HGCM82633A004352")
+        assert (result.make_id, result.manufacturer_id) == ("474", "988")
+        assert result.model_id == "1861"
+
+    def test_schema_selected_by_model_year(self, decoder):
+        """Test that the model year picks the VIN schema"""
+        result = decoder.decode("1HGCM82638A004352")
+        assert (result.model_year, result.model) == ("2008", "Accord Crosstour")
+
+    def test_unknown_wmi(self, decoder):
+        """Test that an unknown manufacturer reports error code 7"""
+        result = decoder.decode("2HGCM82633A004352")
+        assert result.error_code == "1,7"
+        assert result.make is None
+
+    def test_year_without_schema(self, decoder):
+        """Test that a known WMI with no schema for the year reports code 8"""
+        result = decoder.decode("1HGCM82631A004352")
+        assert (result.make, result.model_year) == ("HONDA", "2001")
+        assert result.error_code.split(",")[-1] == "8"
+
+    def test_invalid_model_year_code(self, decoder):
+        """Test that an impossible year code reports code 11"""
+        assert decoder.decode("1HGCM8263UA004352").error_code == "1,11,8"
+
+    def test_wildcard_vin(self, decoder):
+        """Test that partial VINs decode what they can"""
+        result = decoder.decode("1HGCM826*3A******")
+        assert (result.model, result.error_code) == ("Accord", "6")
+
+    def test_invalid_vin(self, decoder, invalid_vin_short):
+        """Test that input validation matches the HTTP client"""
+        with pytest.raises(InvalidVINError):
+            decoder.decode(invalid_vin_short)
+
+    def test_decode_batch(self, decoder, invalid_vin_short):
+        """Test batch decoding in input order with errors in place"""
+        results = decoder.decode_batch(
+            RECORDED_VINS + [invalid_vin_short], return_exceptions=True
+        )
+        assert [r.vin for r in results[:3]] == RECORDED_VINS
+        assert isinstance(results[3], InvalidVINError)
+
+    def test_decode_batch_result_type(self, decoder):
+        """Test that result_type picks the result objects like the HTTP client"""
+        (lean,) = decoder.decode_batch(RECORDED_VINS[:1], result_type="lean")
+        (raw,) = decoder.decode_batch(RECORDED_VINS[:1], result_type="raw")
+
+        assert isinstance(lean, LeanResult) and lean.make == "HONDA"
+        assert raw["Make"] == "HONDA"
+
+    def test_fields(self, decoder):
+        """Test that fields projects results like the HTTP client"""
+        one = decoder.decode(RECORDED_VINS[0], fields=["make", "model"])
+        (raw,) = decoder.decode_batch(
+            RECORDED_VINS[:1], result_type="raw", fields=["make"]
+        )
+
+        assert (one.make, one.model, one.vin) == ("HONDA", "Accord", None)
+        assert raw == {"Make": "HONDA"}
+        with pytest.raises(ValueError):
+            decoder.decode(RECORDED_VINS[0], fields=["colour"])
+
+    def test_strict(self, snapshot_path):
+        """Test that strict rejects a wrong check digit like the HTTP clients"""
+        bad = "1HGCM82643A004352"
+        with OfflineDecoder(snapshot_path, strict=True) as strict:
+            with pytest.raises(CheckDigitError):
+                strict.decode(bad)
+            results = strict.decode_batch(
+                ["1HGCM82633A004352", bad], return_exceptions=True
+            )
+        assert results[0].make == "HONDA"
+        assert isinstance(results[1], CheckDigitError)
+
+    def test_missing_snapshot(self, tmp_path):
+        """Test that a missing snapshot file is reported"""
+        with pytest.raises(FileNotFoundError):
+            OfflineDecoder(str(tmp_path / "missing.sqlite3"))
+
+
+class TestOfflineBackend:
+    """Tests for using the offline decoder as a backend"""
+
+    def test_default_client(self, decoder):
+        """Test that module-level decoding can run fully offline"""
+        set_default_client(decoder)
+
+        assert decode_vin_values_extended("1GCHK23U64F177548").model == "Silverado"
+        assert decode_vin_values_extended.cache_info().currsize == 0
+
+    def test_fallback_for_unknown_vins(self, snapshot_path, stub_vpic):
+        """Test that only VINs missing from the snapshot go upstream"""
+        unknown = "2HGCM82633A004352"
+        fallback = VINDecoderClient(base_url=stub_vpic.base_url)
+        with OfflineDecoder(snapshot_path, fallback=fallback) as decoder:
+            assert decoder.decode(unknown).make == "BMW"
+            results = decoder.decode_batch([RECORDED_VINS[0], unknown])
+            raw = decoder.decode_batch([unknown], result_type="raw")
+            projected = decoder.decode(unknown, fields=["make"])
+
+        assert [r.make for r in results] == ["HONDA", "BMW"]
+        assert raw[0]["Make"] == "BMW"
+        assert (projected.make, projected.vin) == ("BMW", None)
+        assert stub_vpic.batch_vins == [[unknown], [unknown]]
+        assert len(stub_vpic.calls) == 4
@@ -0,0 +1,64 @@
+"""Tests for building vPIC snapshots"""
+
+import os
+import sqlite3
+
+import pytest
+from src.offline.snapshot import SNAPSHOT_VERSION, build_snapshot
+
+EXPORT_DIR = os.path.join(os.path.dirname(__file__), "data", "vpic_export")
+
+
+class TestBuildSnapshot:
+    """Tests for build_snapshot"""
+
+    def test_resolves_lookups(self, tmp_path):
+        """Test that WMI and pattern lookups are stored as names"""
+        path = str(tmp_path / "vpic.sqlite3")
+        build_snapshot(EXPORT_DIR, path)
+
+        conn = sqlite3.connect(path)
+        assert conn.execute(
+            "SELECT make, vehicle_type FROM wmi WHERE wmi = '1HG'"
+        ).fetchone() == ("HONDA", "PASSENGER CAR")
+        assert conn.execute(
+            "SELECT value, value_id FROM pattern WHERE keys = 'CM8[2-3]'"
+        ).fetchone() == ("Accord", "1861")
+        assert conn.execute(
+            "SELECT value, value_id FROM pattern WHERE keys = 'CM826' AND code = 'Trim'"
+        ).fetchone() == ("EX-V6", None)
+        assert dict(conn.execute("SELECT key, value FROM meta"))["version"] == (
+            SNAPSHOT_VERSION
+        )
+        conn.close()
+
+    def test_indexes_lookup_columns(self, tmp_path):
+        """Test that decoding queries are served by indexes"""
+        path = str(tmp_path / "vpic.sqlite3")
+        build_snapshot(EXPORT_DIR, path)
+
+        conn = sqlite3.connect(path)
+        plans = [
+            " ".join(row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}"))
+            for sql in (
+                "SELECT * FROM wmi_schema WHERE wmi = '1HG'",
+                "SELECT * FROM pattern WHERE schema_id = 100",
+            )
+        ]
+        conn.close()
+        assert all("USING INDEX" in plan for plan in plans)
+
+    def test_replaces_existing_snapshot(self, tmp_path):
+        """Test that rebuilding overwrites the previous file"""
+        path = str(tmp_path / "vpic.sqlite3")
+        build_snapshot(EXPORT_DIR, path)
+        build_snapshot(EXPORT_DIR, path)
+
+        conn = sqlite3.connect(path)
+        assert conn.execute("SELECT COUNT(*) FROM wmi").fetchone() == (3,)
+        conn.close()
+
+    def test_missing_table(self, tmp_path):
+        """Test that an incomplete export fails loudly"""
+        with pytest.raises(FileNotFoundError):
+            build_snapshot(str(tmp_path), str(tmp_path / "vpic.sqlite3"))
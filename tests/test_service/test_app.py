@@ -0,0 +1,271 @@
+"""Tests for the ASGI decode service"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from src.api.async_client import AsyncVINDecoderClient
+from src.api.retry import RetryPolicy
+from src.exceptions import APIError, CircuitOpenError, NetworkError
+from src.service.app import DecodeService, create_app, status_for
+
+
+def run(coro):
+    """Run a coroutine to completion on a fresh event loop"""
+    return asyncio.run(coro)
+
+
+def _service(stub, **kwargs):
+    client = AsyncVINDecoderClient(base_url=stub.base_url, retry=RetryPolicy(retries=0))
+    return DecodeService(client=client, **kwargs)
+
+
+async def _call(service, method, path, **kwargs):
+    transport = httpx.ASGITransport(app=service)
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as http:
+        return await http.request(method, path, **kwargs)
+
+
+class TestDecodeRoute:
+    """Tests for GET /decode/{vin}"""
+
+    def test_decode(self, stub_vpic, valid_vin):
+        response = run(_call(_service(stub_vpic), "GET", f"/decode/{valid_vin}"))
+
+        assert response.status_code == 200
+        assert response.json()["make"] == "BMW"
+        assert response.json()["vin"] == valid_vin
+
+    def test_invalid_vin(self, stub_vpic):
+        response = run(_call(_service(stub_vpic), "GET", "/decode/TOO-SHORT"))
+
+        assert response.status_code == 400
+        assert response.json()["error"] == "InvalidVINError"
+        assert stub_vpic.calls == []
+
+    def test_api_error(self, stub_vpic, valid_vin):
+        stub_vpic.results[valid_vin] = {
+            "VIN": valid_vin,
+            "ErrorCode": "400",
+            "ErrorText": "400 - Invalid Characters Present",
+        }
+
+        response = run(_call(_service(stub_vpic), "GET", f"/decode/{valid_vin}"))
+
+        assert response.status_code == 422
+        assert "Invalid Characters" in response.json()["detail"]
+
+    def test_upstream_failure(self, stub_vpic, valid_vin):
+        stub_vpic.status = 500
+
+        response = run(_call(_service(stub_vpic), "GET", f"/decode/{valid_vin}"))
+
+        assert response.status_code == 502
+
+    def test_fields(self, stub_vpic, valid_vin):
+        response = run(
+            _call(_service(stub_vpic), "GET", f"/decode/{valid_vin}?fields=make,model")
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"make": "BMW", "model": "X3"}
+
+    def test_invalid_fields(self, stub_vpic, valid_vin):
+        response = run(
+            _call(_service(stub_vpic), "GET", f"/decode/{valid_vin}?fields=colour")
+        )
+
+        assert response.status_code == 400
+        assert response.json()["error"] == "InvalidFields"
+        assert stub_vpic.calls == []
+
+    def test_concurrent_requests_coalesce(self, stub_vpic, valid_vin):
+        """Test that simultaneous requests for one VIN make one upstream call"""
+        stub_vpic.delay = 0.1
+        service = _service(stub_vpic)
+
+        async def scenario():
+            return await asyncio.gather(
+                *(_call(service, "GET", f"/decode/{valid_vin}") for _ in range(5))
+            )
+
+        responses = run(scenario())
+
+        assert [r.status_code for r in responses] == [200] * 5
+        assert len(stub_vpic.calls) == 1
+
+
+class TestBatchRoute:
+    """Tests for POST /decode"""
+
+    def test_json_array(self, stub_vpic, make_vin):
+        vins = [make_vin(serial) for serial in range(5)] + ["TOO-SHORT"]
+
+        response = run(
+            _call(_service(stub_vpic, stream_chunk=2), "POST", "/decode", json=vins)
+        )
+
+        rows = response.json()
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert [row["input"] for row in rows] == vins
+        assert rows[0]["make"] == "BMW"
+        assert rows[-1]["error"].startswith("InvalidVINError")
+        assert len(stub_vpic.batch_vins) == 3
+
+    def test_ndjson(self, stub_vpic, make_vin):
+        vins = [make_vin(serial) for serial in range(3)]
+
+        response = run(
+            _call(
+                _service(stub_vpic, stream_chunk=2),
+                "POST",
+                "/decode",
+                json={"vins": vins},
+                headers={"Accept": "application/x-ndjson"},
+            )
+        )
+
+        lines = response.text.splitlines()
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert [json.loads(line)["input"] for line in lines] == vins
+
+    def test_fields(self, stub_vpic, make_vin):
+        vins = [make_vin(1), "TOO-SHORT"]
+
+        response = run(
+            _call(
+                _service(stub_vpic),
+                "POST",
+                "/decode",
+                json={"vins": vins, "fields": ["make"]},
+            )
+        )
+
+        ok, failed = response.json()
+        assert ok == {"input": vins[0], "error": None, "make": "BMW"}
+        assert set(failed) == {"input", "error"}
+
+    def test_query_fields(self, stub_vpic, make_vin):
+        response = run(
+            _call(
+                _service(stub_vpic), "POST", "/decode?fields=model", json=[make_vin(1)]
+            )
+        )
+
+        assert response.json()[0]["model"] == "X3"
+        assert "make" not in response.json()[0]
+
+    def test_empty_batch(self, stub_vpic):
+        response = run(_call(_service(stub_vpic), "POST", "/decode", json=[]))
+
+        assert response.json() == []
+
+    @pytest.mark.parametrize(
+        "body, error",
+        [
+            (b"{not json", "InvalidJSON"),
+            (b'{"vins": "1GCHK23U64F177548"}', "InvalidRequest"),
+            (b"[1, 2]", "InvalidRequest"),
+            (b'{"vins": [], "fields": "make"}', "InvalidRequest"),
+            (b'{"vins": [], "fields": ["colour"]}', "InvalidFields"),
+        ],
+    )
+    def test_bad_request(self, stub_vpic, body, error):
+        response = run(_call(_service(stub_vpic), "POST", "/decode", content=body))
+
+        assert response.status_code == 400
+        assert response.json()["error"] == error
+
+    def test_body_too_large(self, stub_vpic, valid_vin):
+        service = _service(stub_vpic, max_body=10)
+
+        response = run(_call(service, "POST", "/decode", json=[valid_vin]))
+
+        assert response.status_code == 413
+        assert stub_vpic.calls == []
+
+
+class TestServiceRoutes:
+    """Tests for health, metrics, routing and lifespan"""
+
+    def test_healthz(self, stub_vpic):
+        response = run(_call(_service(stub_vpic), "GET", "/healthz"))
+
+        assert response.json() == {"status": "ok", "upstream": "closed"}
+
+    def test_metrics(self, stub_vpic, valid_vin):
+        service = _service(stub_vpic)
+
+        async def scenario():
+            await _call(service, "GET", f"/decode/{valid_vin}")
+            await _call(service, "GET", "/decode/TOO-SHORT")
+            return await _call(service, "GET", "/metrics")
+
+        text = run(scenario()).text
+
+        assert "# TYPE pyvin_http_requests_total counter" in text
+        assert 'pyvin_upstream_in_flight{client="service"} 0' in text
+        assert 'pyvin_breaker_open{client="service"} 0' in text
+        assert 'pyvin_http_requests_total{route="/decode/{vin}",status="200"} 1' in text
+        assert 'pyvin_http_requests_total{route="/decode/{vin}",status="400"} 1' in text
+
+    def test_default_client_metrics(self, stub_vpic, valid_vin):
+        """Test that the default client's decodes and upstream calls are exposed"""
+        service = create_app(stub_vpic.base_url)
+
+        async def scenario():
+            await _call(service, "GET", f"/decode/{valid_vin}")
+            await _call(service, "GET", f"/decode/{valid_vin}")
+            response = await _call(service, "GET", "/metrics")
+            await service.aclose()
+            return response
+
+        response = run(scenario())
+
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        text = response.text
+        assert 'pyvin_decodes_total{client="service",outcome="ok",error=""} 2' in text
+        assert 'pyvin_cache_hits_total{client="service",tier="result"} 1' in text
+        assert (
+            'pyvin_upstream_request_seconds_count{client="service",endpoint="decode",'
+            'status="200"} 1' in text
+        )
+
+    def test_unknown_route(self, stub_vpic):
+        service = _service(stub_vpic)
+
+        response = run(_call(service, "GET", "/decode/a/b"))
+
+        assert response.status_code == 404
+        assert service.requests.collect().samples == {("other", "404"): 1}
+
+    def test_wrong_method(self, stub_vpic):
+        service = _service(stub_vpic)
+
+        response = run(_call(service, "GET", "/decode"))
+
+        assert response.status_code == 405
+        assert service.requests.collect().samples == {("/decode", "405"): 1}
+
+    def test_lifespan_closes_owned_client(self, stub_vpic):
+        service = create_app(stub_vpic.base_url)
+        messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message["type"])
+
+        run(service({"type": "lifespan"}, receive, send))
+
+        assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+        assert service.client._http.is_closed
+
+    def test_status_for(self):
+        assert status_for(CircuitOpenError("open")) == 503
+        assert status_for(NetworkError("down")) == 502
+        assert status_for(APIError("bad")) == 422
@@ -0,0 +1,52 @@
+"""Tests for record/replay cassettes"""
+
+import json
+
+import pytest
+from src.testing.cassette import CASSETTE_VERSION, Cassette
+
+
+class TestCassette:
+    """Tests for Cassette"""
+
+    def test_from_response(self, sample_api_response):
+        cassette = Cassette()
+        cassette.add_response(sample_api_response)
+
+        assert len(cassette) == 1
+        assert "5uxwx7c50ba123456" in cassette
+        assert cassette["5UXWX7C50BA123456"]["Make"] == "BMW"
+        assert list(cassette) == ["5UXWX7C50BA123456"]
+
+    def test_save_and_load(self, tmp_path, sample_api_response):
+        path = str(tmp_path / "cassette.json")
+        cassette = Cassette(sample_api_response["Results"], source="unit")
+
+        cassette.save(path)
+        loaded = Cassette.load(path)
+
+        assert loaded.source == "unit"
+        assert loaded["5UXWX7C50BA123456"] == sample_api_response["Results"][0]
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f)["version"] == CASSETTE_VERSION
+
+    def test_unknown_version(self, tmp_path):
+        path = tmp_path / "cassette.json"
+        path.write_text(json.dumps({"version": 99, "results": []}))
+
+        with pytest.raises(ValueError, match="version"):
+            Cassette.load(str(path))
+
+    def test_record_from_batch_endpoint(self, stub_vpic, make_vin):
+        """Test that recording batches VINs and keeps raw payloads"""
+        vins = [make_vin(serial) for serial in range(60)]
+        stub_vpic.results[vins[0]] = {"VIN": vins[0], "Make": "FORD", "Trim": ""}
+
+        cassette = Cassette.record(
+            vins + [vins[0].lower()], base_url=stub_vpic.base_url
+        )
+
+        assert len(cassette) == 60
+        assert cassette[vins[0]] == {"VIN": vins[0], "Make": "FORD", "Trim": ""}
+        assert [len(batch) for batch in stub_vpic.batch_vins] == [50, 10]
+        assert cassette.source == stub_vpic.base_url
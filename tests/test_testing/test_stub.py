@@ -0,0 +1,95 @@
+"""Tests for the local vPIC stub server"""
+
+import statistics
+
+import pytest
+import requests
+from src.api.client import VINDecoderClient
+from src.api.retry import RetryPolicy
+from src.exceptions import NetworkError
+from src.testing.cassette import Cassette
+from src.testing.stub import StubVPICServer, lognormal_latency
+
+
+class TestStubVPICServer:
+    """Tests for StubVPICServer"""
+
+    def test_serves_single_and_batch(self, valid_vin, make_vin):
+        other = make_vin(1)
+        with StubVPICServer() as stub:
+            client = VINDecoderClient(base_url=stub.base_url)
+
+            assert client.decode(valid_vin).make == "BMW"
+            assert [r.vin for r in client.decode_batch([other])] == [other]
+
+        assert stub.batch_vins == [[other]]
+        assert len(stub.calls) == 2
+
+    def test_replays_cassette(self, sample_api_response):
+        """Test that cassette results win over the default decode"""
+        cassette = Cassette()
+        cassette.add_response(sample_api_response)
+        vin = "5UXWX7C50BA123456"
+
+        with StubVPICServer(cassette=cassette) as stub:
+            result = VINDecoderClient(base_url=stub.base_url).decode(vin)
+
+        assert result.plant_city == "Spartanburg"
+        assert result.model_year == "2011"
+
+    def test_error_injection(self, valid_vin):
+        with StubVPICServer(error_rate=1.0, error_status=500) as stub:
+            client = VINDecoderClient(
+                base_url=stub.base_url, retry=RetryPolicy(retries=0)
+            )
+
+            with pytest.raises(NetworkError, match="500"):
+                client.decode(valid_vin)
+
+        assert stub.injected_errors == 1
+
+    def test_throttling(self, valid_vin):
+        """Test that requests beyond the rate get 429 with Retry-After"""
+        with StubVPICServer(rate_limit=2) as stub:
+            url = f"{stub.base_url}/DecodeVinValuesExtended/{valid_vin}"
+            responses = [requests.get(url) for _ in range(3)]
+
+        assert [r.status_code for r in responses] == [200, 200, 429]
+        assert responses[-1].headers["Retry-After"] == "1"
+        assert stub.throttled == 1
+
+    def test_latency_sampler(self, valid_vin):
+        samples = iter([0.05])
+        with StubVPICServer(latency=lambda: next(samples)) as stub:
+            response = requests.get(f"{stub.base_url}/x/{valid_vin}")
+
+        assert response.elapsed.total_seconds() >= 0.05
+
+    @pytest.mark.parametrize("kwargs", [{"error_rate": 2}, {"rate_limit": 0}])
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            StubVPICServer(**kwargs)
+
+
+class TestLognormalLatency:
+    """Tests for lognormal_latency"""
+
+    def test_percentiles(self):
+        sample = lognormal_latency(0.05, 0.5, seed=1)
+        latencies = sorted(sample() for _ in range(20_000))
+
+        assert statistics.median(latencies) == pytest.approx(0.05, rel=0.05)
+        assert latencies[int(0.99 * len(latencies))] == pytest.approx(0.5, rel=0.15)
+
+    def test_seed_is_reproducible(self):
+        first, second = (
+            lognormal_latency(0.1, 1, seed=7),
+            lognormal_latency(0.1, 1, seed=7),
+        )
+
+        assert [first() for _ in range(5)] == [second() for _ in range(5)]
+
+    @pytest.mark.parametrize("median, p99", [(0, 1), (0.5, 0.1)])
+    def test_invalid_arguments(self, median, p99):
+        with pytest.raises(ValueError):
+            lognormal_latency(median, p99)
@@ -0,0 +1,107 @@
+"""Tests for vectorized bulk VIN validation"""
+
+import numpy as np
+import pytest
+from hypothesis import given, strategies as st
+from src.exceptions import CheckDigitError, InvalidVINError
+from src.validation.bulk import ValidationCode, validate_many
+from src.validation.vin import validate_and_normalize_vin
+
+
+def scalar_outcome(vin, strict):
+    """(normalized, code) from the per-row validator"""
+    try:
+        return validate_and_normalize_vin(vin, strict), ValidationCode.VALID
+    except CheckDigitError:
+        return "", ValidationCode.BAD_CHECK_DIGIT
+    except InvalidVINError as e:
+        if "empty" in str(e):
+            return "", ValidationCode.EMPTY
+        if "17 characters" in str(e):
+            return "", ValidationCode.BAD_LENGTH
+        return "", ValidationCode.BAD_CHARACTER
+
+
+class TestValidateMany:
+    """Tests for validate_many"""
+
+    def test_normalizes_and_flags_rows(self, valid_vin):
+        """Test one row of each outcome"""
+        result = validate_many(
+            [f"  {valid_vin.lower()}\n", "", "   ", "ABC", valid_vin[:-1] + "I"]
+        )
+
+        assert result.vins.tolist() == [valid_vin, "", "", "", ""]
+        assert result.valid.tolist() == [True, False, False, False, False]
+        assert result.codes.tolist() == [
+            ValidationCode.VALID,
+            ValidationCode.EMPTY,
+            ValidationCode.EMPTY,
+            ValidationCode.BAD_LENGTH,
+            ValidationCode.BAD_CHARACTER,
+        ]
+
+    def test_strict_flags_check_digit(self, valid_vin):
+        """Test that strict mode flags wrong check digits but not wildcards"""
+        vins = [valid_vin, "1GCHK23U64F177548", "5UXWX7C5*BA123456"]
+
+        assert validate_many(vins).valid.all()
+        assert validate_many(vins, strict=True).codes.tolist() == [
+            ValidationCode.BAD_CHECK_DIGIT,
+            ValidationCode.VALID,
+            ValidationCode.VALID,
+        ]
+
+    def test_accepts_numpy_arrays(self, valid_vin):
+        """Test that a NumPy string column is accepted as is"""
+        result = validate_many(np.array([valid_vin, "x"]))
+        assert result.valid.tolist() == [True, False]
+
+    def test_nulls_are_empty(self, valid_vin):
+        """Test that None and NaN rows are EMPTY rather than BAD_LENGTH"""
+        for vins in (
+            [None, float("nan"), np.nan, valid_vin],
+            np.array([None, np.nan, valid_vin], dtype=object),
+        ):
+            result = validate_many(vins)
+            assert result.codes.tolist()[:-1] == [ValidationCode.EMPTY] * (
+                len(vins) - 1
+            )
+            assert result.vins.tolist()[-1] == valid_vin
+
+    def test_empty_input(self):
+        """Test that no rows produce empty arrays"""
+        result = validate_many([])
+        assert result.vins.shape == result.valid.shape == result.codes.shape == (0,)
+
+    @pytest.mark.parametrize(
+        "vin", ["ſUXWX7C50BA123456", "ßUXWX7C50BA1234", "éUXWX7C50BA123456"]
+    )
+    def test_non_ascii_matches_scalar(self, vin):
+        """Test that Unicode case mapping follows the scalar validator"""
+        result = validate_many([vin])
+        assert (result.vins[0], result.codes[0]) == scalar_outcome(vin, False)
+
+    @given(
+        st.lists(
+            st.one_of(
+                st.text(
+                    alphabet="ABCDEFGHJKLMNPRSTUVWXYZabcxyz0123456789* \tIOQ",
+                    min_size=15,
+                    max_size=19,
+                ),
+                # NumPy strings drop trailing NULs, see validate_many
+                st.text(alphabet=st.characters(exclude_characters="\x00"), max_size=20),
+                st.none(),
+            ),
+            max_size=20,
+        ),
+        st.booleans(),
+    )
+    def test_matches_scalar_validator(self, vins, strict):
+        """Test that every row agrees with validate_and_normalize_vin"""
+        result = validate_many(vins, strict)
+
+        expected = [scalar_outcome(vin, strict) for vin in vins]
+        assert result.vins.tolist() == [vin for vin, _ in expected]
+        assert result.codes.tolist() == [code for _, code in expected]
@@ -1,9 +1,17 @@
 """Tests for VIN validation module"""
 
 import pytest
-from hypothesis import given, strategies as st
-from src.validation.vin import validate_and_normalize_vin, VIN_PATTERN
-from src.exceptions import InvalidVINError
+from hypothesis import assume, given, strategies as st
+from src.validation.vin import (
+    compute_check_digit,
+    has_valid_check_digit,
+    model_year_candidates,
+    squish_vin,
+    typo_candidates,
+    validate_and_normalize_vin,
+    VIN_PATTERN,
+)
+from src.exceptions import CheckDigitError, InvalidVINError
 
 
 class TestValidateAndNormalizeVIN:
@@ -48,6 +56,14 @@ class TestValidateAndNormalizeVIN:
         with pytest.raises(InvalidVINError, match="VIN must be exactly 17 characters"):
             validate_and_normalize_vin(invalid_vin_long)
 
+    def test_length_checked_before_case_folding(self):
+        """Test that characters which expand when uppercased do not pad length"""
+        # "ß".upper() == "SS", which would turn 16 characters into 17
+        with pytest.raises(InvalidVINError, match="VIN must be exactly 17 characters"):
+            validate_and_normalize_vin("000000000000000ß")
+        with pytest.raises(InvalidVINError, match="Invalid VIN format"):
+            validate_and_normalize_vin("0000000000000000ß")
+
     def test_vin_with_invalid_character_i(self, invalid_vin_with_i):
         """Test that VIN with 'I' raises error"""
         with pytest.raises(InvalidVINError, match="Invalid VIN format"):
@@ -124,6 +140,8 @@ class TestValidateAndNormalizeVIN:
     )
     def test_invalid_length_fuzzing(self, vin):
         """Fuzz test with invalid VIN lengths"""
+        # Surrounding whitespace is stripped, so padding a 17-char VIN is valid
+        assume(len(vin.strip()) != 17)
         # After stripping, could be empty or wrong length
         normalized = vin.upper().strip() if vin else ""
 
@@ -170,3 +188,98 @@ class TestVINPattern:
         assert not VIN_PATTERN.match("5UXWX7C50BI123456")
         assert not VIN_PATTERN.match("5UXWX7C50BO123456")
         assert not VIN_PATTERN.match("5UXWX7C50BQ123456")
+
+
+class TestCheckDigit:
+    """Tests for compute_check_digit"""
+
+    @pytest.mark.parametrize(
+        "vin",
+        ["1GCHK23U64F177548", "1HGCM82633A004352", "1M8GDM9AXKP042788"],
+    )
+    def test_known_valid_vins(self, vin):
+        """Test check digits of real VINs (including an X check digit)"""
+        assert compute_check_digit(vin) == vin[8]
+
+    def test_wrong_check_digit(self, valid_vin):
+        """Test that the fixture VIN's check digit does not match"""
+        assert compute_check_digit(valid_vin) == "7"
+        assert valid_vin[8] == "0"
+
+    def test_wildcard_raises(self):
+        """Test that wildcard VINs cannot be checked"""
+        with pytest.raises(InvalidVINError, match="Cannot compute check digit"):
+            compute_check_digit("5UXWX7C*5*B*A****")
+
+
+class TestStrictValidation:
+    """Tests for strict check digit validation and typo candidates"""
+
+    def test_strict_accepts_valid_check_digit(self):
+        """Test that strict mode passes a VIN with a matching check digit"""
+        assert validate_and_normalize_vin(" 1gchk23u64f177548", strict=True) == (
+            "1GCHK23U64F177548"
+        )
+
+    def test_strict_rejects_wrong_check_digit(self, valid_vin):
+        """Test that strict mode raises CheckDigitError with the expected digit"""
+        with pytest.raises(CheckDigitError, match="expected 7, got 0"):
+            validate_and_normalize_vin(valid_vin, strict=True)
+        assert validate_and_normalize_vin(valid_vin) == valid_vin
+
+    def test_strict_skips_wildcards(self):
+        """Test that partial VINs are not check digit validated"""
+        vin = "5UXWX7C5*BA123456"
+        assert validate_and_normalize_vin(vin, strict=True) == vin
+
+    def test_has_valid_check_digit(self, valid_vin):
+        """Test the boolean check digit helper"""
+        assert has_valid_check_digit("1M8GDM9AXKP042788")
+        assert not has_valid_check_digit(valid_vin)
+        assert not has_valid_check_digit("1M8GDM9A*KP042788")
+
+    def test_typo_candidates_recover_original(self):
+        """Test that a single mistyped character is among the candidates"""
+        vin = "1HGCM82633A004352"
+        typo = "1HGCM82633A004358"
+        candidates = typo_candidates(typo)
+
+        assert candidates[0] == "1HGCM82643A004358"
+        assert vin in candidates
+        assert all(has_valid_check_digit(c) for c in candidates)
+        assert all(sum(a != b for a, b in zip(c, typo)) == 1 for c in candidates)
+
+    def test_typo_candidates_valid_vin(self):
+        """Test that a valid VIN is its own only candidate"""
+        assert typo_candidates("1GCHK23U64F177548") == ["1GCHK23U64F177548"]
+
+    def test_typo_candidates_non_digit_check_position(self):
+        """Test that a letter in position 9 only yields the corrected digit"""
+        assert typo_candidates("1GCHK23UA4F177548") == ["1GCHK23U64F177548"]
+
+
+class TestModelYear:
+    """Tests for model_year_candidates"""
+
+    def test_position_7_selects_cycle(self):
+        """Test that a letter in position 7 prefers the 2010-2039 cycle"""
+        assert model_year_candidates("1HGCM82633A004352") == [2003, 2033]
+        assert model_year_candidates("5UXWX7C50BA123456") == [2011, 1981]
+
+    @pytest.mark.parametrize("code", ["0", "U", "Z", "*"])
+    def test_not_a_year_code(self, code):
+        """Test that codes never used for model years give no candidates"""
+        assert model_year_candidates(f"1HGCM8263{code}A004352") == []
+
+
+class TestSquishVIN:
+    """Tests for squish_vin"""
+
+    def test_drops_check_digit_and_serial(self):
+        """Test that only positions 1-8 and 10-11 form the key"""
+        assert squish_vin("1GCHK23U64F177548") == "1GCHK23U4F"
+        assert squish_vin("1GCHK23U04F000001") == "1GCHK23U4F"
+
+    def test_small_manufacturer_keeps_positions_12_to_14(self):
+        """Test that a 9 in position 3 keeps the extended WMI"""
+        assert squish_vin("1M9AB12C3KP042788") == "1M9AB12CKP042"